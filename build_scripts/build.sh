@@ -77,6 +77,20 @@ else
     fi
 fi
 
+# Compile the XPath mappings so the binary does not parse YAML at runtime
+echo -e "${YELLOW}Compiling XPath mappings...${NC}"
+if ! python3 -m panflow.core.mapping_bundle; then
+    echo -e "${RED}Failed to compile XPath mappings${NC}"
+    exit 1
+fi
+
+# Generate the command and help manifests the launchers answer --help from
+echo -e "${YELLOW}Generating command and help manifests...${NC}"
+if ! python3 -m panflow.cli.registry; then
+    echo -e "${RED}Failed to generate the command and help manifests${NC}"
+    exit 1
+fi
+
 # Build the binary
 echo -e "${YELLOW}Building binary...${NC}"
 
@@ -128,6 +142,8 @@ else
     python3 -m PyInstaller --name="$OUTPUT_NAME" --onefile --clean --noupx \
         --add-data="panflow/xpath_mappings:panflow/xpath_mappings" \
         --add-data="panflow/templates:panflow/templates" \
+        --add-data="panflow/cli/command_manifest.json:panflow/cli" \
+        --add-data="panflow/cli/help_manifest.json:panflow/cli" \
         --hidden-import=typer \
         --hidden-import=rich \
         --hidden-import=lxml.etree \
@@ -138,6 +154,7 @@ else
         --hidden-import=panflow.cli.commands \
         --hidden-import=panflow.cli.completion \
         --hidden-import=panflow.cli.completions \
+        --hidden-import=panflow.core._xpath_bundle \
         cli.py
         
     # Check if build was successful
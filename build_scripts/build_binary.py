@@ -24,6 +24,11 @@ def build_binary():
     # Change to project root
     os.chdir(PROJECT_ROOT)
 
+    # Generated CLI manifests are bundled next to the CLI package
+    command_manifest = os.path.join(PROJECT_ROOT, "panflow/cli/command_manifest.json")
+    help_manifest = os.path.join(PROJECT_ROOT, "panflow/cli/help_manifest.json")
+    cli_data_dir = os.path.join("panflow", "cli")
+
     # Check for platform-specific builds
     if platform.system() == "Darwin":  # macOS
         # For macOS, use the spec file to create an app bundle with completion support
@@ -34,10 +39,15 @@ def build_binary():
                 "pyinstaller",
                 spec_file,  # Use the absolute path
                 "--clean",
-                "--workpath", os.path.join(PROJECT_ROOT, "build"),
-                "--distpath", os.path.join(PROJECT_ROOT, "dist"),
+                "--workpath",
+                os.path.join(PROJECT_ROOT, "build"),
+                "--distpath",
+                os.path.join(PROJECT_ROOT, "dist"),
             ]
-            print(f"Building macOS application bundle with completion support using spec: {spec_file}...")
+            print(
+                "Building macOS application bundle with completion support "
+                f"using spec: {spec_file}..."
+            )
         else:
             # Fall back to standard build if spec file doesn't exist
             print("Spec file not found, falling back to standard build...")
@@ -50,6 +60,8 @@ def build_binary():
                 "--noupx",
                 f"--add-data={os.path.join(PROJECT_ROOT, 'panflow/xpath_mappings')}:{os.path.join('panflow', 'xpath_mappings')}",
                 f"--add-data={os.path.join(PROJECT_ROOT, 'panflow/templates')}:{os.path.join('panflow', 'templates')}",
+                f"--add-data={command_manifest}:{cli_data_dir}",
+                f"--add-data={help_manifest}:{cli_data_dir}",
                 "--hidden-import=typer",
                 "--hidden-import=rich",
                 "--hidden-import=lxml.etree",
@@ -60,6 +72,7 @@ def build_binary():
                 "--hidden-import=panflow.cli.common",
                 "--hidden-import=panflow.cli.completion",
                 "--hidden-import=panflow.cli.completions",
+                "--hidden-import=panflow.core._xpath_bundle",
                 entry_point,
             ]
     else:
@@ -77,6 +90,12 @@ def build_binary():
             f"--add-data={os.path.join(PROJECT_ROOT, 'panflow/templates')}:{os.path.join('panflow', 'templates')}".replace(
                 ":", ";" if platform.system() == "Windows" else ":"
             ),
+            f"--add-data={command_manifest}:{cli_data_dir}".replace(
+                ":", ";" if platform.system() == "Windows" else ":"
+            ),
+            f"--add-data={help_manifest}:{cli_data_dir}".replace(
+                ":", ";" if platform.system() == "Windows" else ":"
+            ),
             "--hidden-import=typer",
             "--hidden-import=rich",
             "--hidden-import=lxml.etree",
@@ -87,9 +106,24 @@ def build_binary():
             "--hidden-import=panflow.cli.common",
             "--hidden-import=panflow.cli.completion",
             "--hidden-import=panflow.cli.completions",
+            "--hidden-import=panflow.core._xpath_bundle",
             entry_point,
         ]
 
+    # Compile the XPath mappings so the binary does not parse YAML at runtime
+    try:
+        subprocess.run([sys.executable, "-m", "panflow.core.mapping_bundle"], check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"Error compiling XPath mappings: {e}", file=sys.stderr)
+        return None
+
+    # Generate the command and help manifests the launchers answer --help from
+    try:
+        subprocess.run([sys.executable, "-m", "panflow.cli.registry"], check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"Error generating the command and help manifests: {e}", file=sys.stderr)
+        return None
+
     # Run PyInstaller
     try:
         subprocess.run(cmd, check=True)
@@ -102,7 +136,7 @@ def build_binary():
         # For macOS we build an .app bundle
         app_bundle_path = os.path.join(PROJECT_ROOT, "dist", "PANFlow.app")
         binary_path = os.path.join(app_bundle_path, "Contents", "MacOS", "panflow")
-        
+
         if os.path.exists(app_bundle_path):
             print(f"Successfully created application bundle: {app_bundle_path}")
             # Make sure the binary is executable
@@ -114,16 +148,16 @@ def build_binary():
         binary_name = "panflow"
         if platform.system() == "Windows":
             binary_name += ".exe"
-        
+
         binary_path = os.path.join(PROJECT_ROOT, "dist", binary_name)
-        
+
         if os.path.exists(binary_path):
             print(f"Successfully created binary: {binary_path}")
             # Make the binary executable on Unix
             if platform.system() != "Windows":
                 os.chmod(binary_path, 0o755)
             return binary_path
-    
+
     print("Failed to create binary!", file=sys.stderr)
     return None
 
@@ -132,14 +166,14 @@ def install_dependencies():
     """Install all dependencies required for building."""
     # Change to project root
     os.chdir(PROJECT_ROOT)
-    
+
     # Always ensure PyInstaller is installed first
     print("Installing PyInstaller...")
     subprocess.run(
         [sys.executable, "-m", "pip", "install", "pyinstaller"],
         check=True,
     )
-    
+
     # Check if we can use Poetry
     if shutil.which("poetry"):
         print("Using Poetry to manage dependencies...")
@@ -164,7 +198,7 @@ def install_dependencies():
                 return
             except subprocess.CalledProcessError:
                 print("Failed to install in development mode")
-    
+
     # Fall back to requirements.txt if available
     req_path = os.path.join(PROJECT_ROOT, "requirements.txt")
     if os.path.exists(req_path):
@@ -174,7 +208,9 @@ def install_dependencies():
             check=True,
         )
     else:
-        print("Neither Poetry nor requirements.txt found, installing project in development mode...")
+        print(
+            "Neither Poetry nor requirements.txt found, installing project in development mode..."
+        )
         # Install the project in development mode
         subprocess.run(
             [sys.executable, "-m", "pip", "install", "-e", PROJECT_ROOT],
@@ -185,13 +221,13 @@ def install_dependencies():
 if __name__ == "__main__":
     # Ensure all dependencies are installed
     install_dependencies()
-    
+
     # Build the binary
     binary_path = build_binary()
-    
+
     if binary_path:
         print(f"\nYou can now distribute the standalone application:")
-        
+
         if platform.system() == "Darwin":
             app_bundle = os.path.join(PROJECT_ROOT, "dist", "PANFlow.app")
             print(f"Application bundle: {app_bundle}")
@@ -204,17 +240,17 @@ if __name__ == "__main__":
             print(f"Binary: {binary_path}")
             print("\nTo use it, run:")
             print(f"  {binary_path} --help")
-        
+
         # Run the test_completion.sh script if it exists and we're on macOS
         if platform.system() == "Darwin":
             test_script = os.path.join(PROJECT_ROOT, "test_completion.sh")
             if os.path.exists(test_script):
                 print("\nDo you want to run the completion test script? (y/n)")
                 response = input().strip().lower()
-                if response == 'y':
+                if response == "y":
                     print("\nRunning completion test script...")
                     os.chmod(test_script, 0o755)
                     subprocess.run([test_script], check=False)
     else:
         print("\nFailed to build the application. Please check the error messages above.")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
@@ -6,72 +6,21 @@ This script serves as the entry point for the PANFlow command-line interface.
 """
 
 import sys
-import typer
-from typing import Optional
-from pathlib import Path
-from panflow.cli import app
-from panflow.cli.completion import install_completion, show_completion
-
-
-@app.callback()
-def callback():
-    """
-    PANFlow CLI - Palo Alto Networks Configuration Management Tool.
-    """
-    pass
-
 
-@app.command()
-def completion(
-    shell: Optional[str] = typer.Option(
-        None,
-        "--shell",
-        "-s",
-        help="Shell type (bash, zsh, fish)",
-    ),
-    install: bool = typer.Option(
-        False, "--install", "-i", help="Install completion for the specified shell"
-    ),
-    show: bool = typer.Option(False, "--show", help="Show completion script"),
-    path: Optional[Path] = typer.Option(
-        None, "--path", "-p", help="Custom path to install the completion script"
-    ),
-    # Add a specific parameter to detect completion requests from the shell
-    complete_args: Optional[str] = typer.Argument(None, hidden=True),
-):
-    """
-    Shell completion support.
+# Help and version output is printed from the help manifest without loading the CLI
+from panflow.core.help_manifest import run_help
 
-    Enable tab completion for CLI commands by installing the appropriate
-    script for your shell. Supports Bash, Zsh, and Fish.
+if run_help(sys.argv[1:]):
+    sys.exit(0)
 
-    Examples:
-        # Show completion script for current shell:
-        panflow completion --show
+# Names from the completion index are printed without loading the CLI
+if len(sys.argv) > 1 and sys.argv[1] == "__complete":
+    from panflow.core.completion_index import run_complete
 
-        # Install completion for your shell:
-        panflow completion --install
+    if run_complete(sys.argv[2:]):
+        sys.exit(0)
 
-        # Install completion for a specific shell:
-        panflow completion --install --shell bash
-    """
-    # Special handling for __complete argument which is used by the Typer completion system
-    if complete_args == "__complete" or complete_args is not None and "__complete" in sys.argv:
-        # The shell is requesting completions - let Typer handle this directly
-        # This is crucial for the packaged app to work with shell completion
-        return
-
-    if show:
-        show_completion(shell)
-        raise typer.Exit()
-
-    if install:
-        install_completion(shell, path)
-        raise typer.Exit()
-
-    # If no options provided, show help
-    typer.echo("Use --install to install completion or --show to display completion script")
-    raise typer.Exit(1)
+from panflow.cli import app
 
 
 if __name__ == "__main__":
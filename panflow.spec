@@ -6,6 +6,17 @@ Optimized for performance and fast startup times
 
 block_cipher = None
 
+# Compile the XPath mappings into the precompiled bundle
+from panflow.core.mapping_bundle import write_mapping_bundle
+
+write_mapping_bundle()
+
+# Generate the command and help manifests the launchers answer --help from
+from panflow.cli.registry import write_help_manifest, write_manifest
+
+write_manifest()
+write_help_manifest()
+
 # Create runtime hook file
 with open('runtime_hook.py', 'w') as f:
     f.write("""
@@ -44,6 +55,8 @@ a = Analysis(
     datas=[
         ('panflow/templates', 'panflow/templates'),
         ('panflow/xpath_mappings', 'panflow/xpath_mappings'),
+        ('panflow/cli/command_manifest.json', 'panflow/cli'),
+        ('panflow/cli/help_manifest.json', 'panflow/cli'),
     ],
     hiddenimports=[
         # Core components (essential)
@@ -52,6 +65,7 @@ a = Analysis(
         'panflow.cli.common',
         'panflow.cli.completion',
         'panflow.cli.completions',
+        'panflow.cli.registry',
 
         # Commands (lazy-loaded, but still need to be included)
         'panflow.cli.commands',
@@ -63,10 +77,17 @@ a = Analysis(
         'panflow.cli.commands.nat_commands',
         'panflow.cli.commands.nlq_commands',
         'panflow.cli.commands.query_commands',
+        'panflow.cli.commands.config_commands',
+        'panflow.cli.commands.report_commands',
+        'panflow.cli.commands.batch_commands',
+        'panflow.cli.commands.completion_commands',
+        'panflow.cli.commands.serve_commands',
+        'panflow.cli.commands.pipeline_commands',
 
         # Required core modules
         'panflow.nlq',
         'panflow.core',
+        'panflow.core._xpath_bundle',
         'panflow.core.xml',
         'panflow.modules',
         'panflow.reporting',
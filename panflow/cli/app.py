@@ -1,7 +1,9 @@
 """
 Main CLI application for PANFlow.
 
-This module provides the main Typer application and command group registration.
+This module provides the main Typer application and the command groups that
+command modules register their commands on. Top-level commands are loaded
+lazily through :mod:`panflow.cli.registry`.
 """
 
 import sys
@@ -24,9 +26,12 @@ from .completions import (
     complete_output_formats,
 )
 from .common import CommonOptions
+from .registry import LazyGroup
 
-# Create main Typer app with auto-completion support
+# Create main Typer app with auto-completion support; command modules are
+# imported by the registry when their command is dispatched
 app = typer.Typer(
+    cls=LazyGroup,
     help="PANFlow CLI",
     add_completion=True,
     no_args_is_help=True,
@@ -65,18 +70,6 @@ merge_app = typer.Typer(
     no_args_is_help=True,
 )
 
-# Import the query commands app directly
-from panflow.cli.commands.query_commands import app as query_app
-
-# Add sub-apps to main app
-app.add_typer(object_app, name="object")
-app.add_typer(policy_app, name="policy")
-app.add_typer(group_app, name="group")
-app.add_typer(report_app, name="report")
-app.add_typer(config_app, name="config")
-app.add_typer(merge_app, name="merge")
-app.add_typer(query_app, name="query")
-
 # Get logger
 logger = logging.getLogger("panflow")
 
@@ -174,8 +167,5 @@ def _global_exception_handler(exc_type, exc_value, exc_traceback):
 # Set up the global exception handler
 sys.excepthook = _global_exception_handler
 
-# Note: Individual command modules will register themselves
-# Do not import all commands here to avoid circular imports
-
-# The query commands app is already imported above
-# No additional imports needed here
+# Note: Individual command modules register themselves on the groups above
+# when the registry loads them. Do not import command modules here.
@@ -0,0 +1,131 @@
+"""
+Shell completion commands for PANFlow CLI.
+
+This module provides the completion command, which installs the shell
+completion scripts and builds the completion index of a configuration, and
+the hidden ``__complete`` command the completion scripts call on every TAB.
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from click.shell_completion import ShellComplete
+
+from panflow.core.completion_index import index_path, run_complete, write_completion_index
+
+from ..app import app
+from ..common import ConfigOptions
+from ..completion import install_completion, show_completion
+
+# Get logger
+logger = logging.getLogger("panflow")
+
+# Create completion app
+completion_app = typer.Typer(
+    help="Shell completion support",
+    invoke_without_command=True,
+)
+
+# Register with main app
+app.add_typer(completion_app, name="completion")
+
+
+@completion_app.callback()
+def completion(
+    ctx: typer.Context,
+    shell: Optional[str] = typer.Option(None, "--shell", "-s", help="Shell type (bash, zsh, fish)"),
+    install: bool = typer.Option(
+        False, "--install", "-i", help="Install completion for the specified shell"
+    ),
+    show: bool = typer.Option(False, "--show", help="Show completion script"),
+    path: Optional[Path] = typer.Option(
+        None, "--path", "-p", help="Custom path to install the completion script"
+    ),
+):
+    """
+    Shell completion support.
+
+    Enable tab completion for CLI commands by installing the appropriate
+    script for your shell. Supports Bash, Zsh, and Fish. Device group, vsys,
+    object and rule names are completed from the completion index of the
+    --config file, which is written whenever PANFlow loads the file.
+
+    Examples:
+        # Show completion script for current shell:
+        panflow completion --show
+
+        # Install completion for your shell:
+        panflow completion --install
+
+        # Index the names of a configuration for completion:
+        panflow completion index --config panorama.xml
+    """
+    if ctx.invoked_subcommand is not None:
+        return
+
+    if show:
+        show_completion(shell)
+        raise typer.Exit()
+
+    if install:
+        install_completion(shell, path)
+        raise typer.Exit()
+
+    # If no options provided, show help
+    typer.echo("Use --install to install completion or --show to display completion script")
+    raise typer.Exit(1)
+
+
+@completion_app.command("index")
+def index(
+    config: str = ConfigOptions.config_file(),
+):
+    """
+    Build the completion index of a configuration file.
+
+    The index holds the device group, vsys, template, object and rule names of
+    the configuration and is used until the file changes.
+    """
+    if index_path(config) is None:
+        logger.error("The completion index is disabled (PANFLOW_COMPLETION_CACHE is empty)")
+        raise typer.Exit(1)
+
+    start = time.perf_counter()
+    completion_index = write_completion_index(config)
+    count = sum(
+        len(names)
+        for by_context in completion_index.names.values()
+        for names in by_context.values()
+    )
+    logger.info(
+        f"Indexed {count} names of {config} in {time.perf_counter() - start:.2f}s "
+        f"({index_path(config)})"
+    )
+
+
+@app.command(
+    "__complete",
+    hidden=True,
+    context_settings={"ignore_unknown_options": True, "allow_extra_args": True},
+)
+def complete(
+    ctx: typer.Context,
+    words: Optional[List[str]] = typer.Argument(None),
+):
+    """
+    Print the completions of a command line for the shell completion scripts.
+
+    Names are looked up in the completion index of the --config file; commands
+    and options are completed from the CLI itself.
+    """
+    words = list(words or []) + ctx.args
+    if not words or run_complete(words):
+        return
+
+    root = ctx.find_root().command
+    completer = ShellComplete(root, {}, root.name or "panflow", "")
+    for item in completer.get_completions(words[:-1], words[-1]):
+        typer.echo(f"{item.type},{item.value}")
@@ -0,0 +1,93 @@
+"""
+Configuration management commands for PANFlow CLI.
+
+This module provides commands for exporting PAN-OS configurations to other formats.
+"""
+
+import logging
+import os
+from typing import Optional
+
+import typer
+
+from panflow import PANFlowConfig
+from panflow.core.config_saver import ConfigSaver
+
+from ..app import config_app
+from ..common import ConfigOptions
+
+# Get logger
+logger = logging.getLogger("panflow")
+
+EXPORT_FORMATS = ["json", "jsonl", "snapshot"]
+
+
+@config_app.command("export")
+def export_config(
+    config: str = ConfigOptions.config_file(),
+    output: str = typer.Option(..., "--output", "-o", help="Output file for the exported data"),
+    format: str = typer.Option(
+        "json",
+        "--format",
+        "-f",
+        help=f"Export format ({', '.join(EXPORT_FORMATS)})",
+        autocompletion=lambda: EXPORT_FORMATS,
+    ),
+    indent: Optional[int] = typer.Option(
+        2, "--indent", help="JSON indentation (json format only, 0 for compact output)"
+    ),
+    device_type: str = ConfigOptions.device_type(),
+    version: Optional[str] = ConfigOptions.version(),
+):
+    """
+    Export a configuration to another format.
+
+    The json format writes the whole configuration as a single document. The jsonl
+    format writes one line per object or rule entry, tagged with its type and context.
+    Both are streamed to the output file without building the full document in memory.
+    The snapshot format writes a compact binary file of typed columns (addresses, groups,
+    services, rules, rule members and group references) that can be memory-mapped back
+    with panflow.core.snapshot.ConfigSnapshot for reports and queries without reparsing XML.
+
+    Examples:
+
+        # Export the whole configuration as JSON
+        panflow config export --config firewall.xml --output firewall.json
+
+        # Export objects and rules as JSON Lines
+        panflow config export --config panorama.xml --output panorama.jsonl --format jsonl
+
+        # Export a columnar snapshot for analytics
+        panflow config export --config panorama.xml --output panorama.pfsnap --format snapshot
+    """
+    if format not in EXPORT_FORMATS:
+        logger.error(
+            f"Unsupported export format: {format}. Valid formats: {', '.join(EXPORT_FORMATS)}"
+        )
+        raise typer.Exit(1)
+
+    try:
+        xml_config = PANFlowConfig(config_file=config, device_type=device_type, version=version)
+
+        output_dir, output_name = os.path.split(os.path.abspath(output))
+        saver = ConfigSaver(config_dir=output_dir, create_backup=False)
+
+        if format == "jsonl":
+            saved_path = saver.save_as_json_lines(xml_config.tree, output_name)
+        elif format == "snapshot":
+            saved_path = saver.save_as_snapshot(
+                xml_config.tree,
+                output_name,
+                device_type=xml_config.device_type,
+                version=xml_config.version,
+            )
+        else:
+            saved_path = saver.save_as_json(
+                xml_config.tree, output_name, indent=indent if indent else None
+            )
+
+        logger.info(f"Exported configuration to {saved_path}")
+
+    except Exception as e:
+        logger.error(f"Error exporting configuration: {e}")
+        raise typer.Exit(1)
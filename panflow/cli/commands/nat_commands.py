@@ -18,6 +18,7 @@ from panflow.core.nat_splitter import (
 
 from ..app import policy_app
 from ..common import common_options, ConfigOptions
+from ..completions import complete_rule_names
 
 # Get logger
 logger = logging.getLogger("panflow")
@@ -31,7 +32,11 @@ policy_app.add_typer(nat_app, name="nat")
 def split_bidirectional_command(
     config_file: str = typer.Option(..., "--config", "-c", help="Path to XML configuration file"),
     rule_name: str = typer.Option(
-        ..., "--rule-name", "-r", help="Name of the bidirectional NAT rule to split"
+        ...,
+        "--rule-name",
+        "-r",
+        help="Name of the bidirectional NAT rule to split",
+        autocompletion=complete_rule_names,
     ),
     policy_type: str = typer.Option(
         "nat_rules",
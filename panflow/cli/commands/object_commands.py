@@ -18,6 +18,7 @@ from panflow.core.config_loader import load_config_from_file, save_config, detec
 
 from ..app import object_app
 from ..common import ConfigOptions, ContextOptions, ObjectOptions
+from ..completions import complete_object_names
 
 # Get logger
 logger = logging.getLogger("panflow")
@@ -27,9 +28,7 @@ logger = logging.getLogger("panflow")
 def list_objects(
     config: str = ConfigOptions.config_file(),
     object_type: str = ObjectOptions.object_type(),
-    output: Optional[str] = typer.Option(
-        None, "--output", "-o", help="Output file for results"
-    ),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file for results"),
     format: str = typer.Option(
         "json", "--format", "-f", help="Output format (json, table, text, csv, yaml, html)"
     ),
@@ -142,7 +141,11 @@ def list_objects(
                         header = column.header
 
                         # Special handling for group members
-                        if header == "members" and "static" in obj and isinstance(obj["static"], list):
+                        if (
+                            header == "members"
+                            and "static" in obj
+                            and isinstance(obj["static"], list)
+                        ):
                             values.append(str(len(obj["static"])))
                         else:
                             values.append(str(obj.get(header, "")))
@@ -158,7 +161,9 @@ def list_objects(
             # Text format using common formatter
             from ..common import format_objects_list
 
-            formatted_lines = format_objects_list(object_list, include_header=True, object_type=object_type)
+            formatted_lines = format_objects_list(
+                object_list, include_header=True, object_type=object_type
+            )
             for line in formatted_lines:
                 typer.echo(line)
 
@@ -263,7 +268,9 @@ def list_objects(
                 # If no output file specified, display in text format for console readability
                 from ..common import format_objects_list
 
-                formatted_lines = format_objects_list(object_list, include_header=True, object_type=object_type)
+                formatted_lines = format_objects_list(
+                    object_list, include_header=True, object_type=object_type
+                )
                 for line in formatted_lines:
                     typer.echo(line)
 
@@ -692,7 +699,13 @@ def bulk_delete_objects(
 def find_objects(
     config: str = ConfigOptions.config_file(),
     object_type: str = ObjectOptions.object_type(),
-    name: Optional[str] = typer.Option(None, "--name", "-n", help="Name of the object to find"),
+    name: Optional[str] = typer.Option(
+        None,
+        "--name",
+        "-n",
+        help="Name of the object to find",
+        autocompletion=complete_object_names,
+    ),
     pattern: Optional[str] = typer.Option(
         None, "--pattern", "-p", help="Regex pattern to match object names"
     ),
@@ -1109,9 +1122,11 @@ def find_duplicate_objects(
                 # Execute the query to get matching object names
                 query_results = graph_service.execute_custom_query(
                     xml_config.tree,
-                    query_filter
-                    if "RETURN" in query_filter.upper()
-                    else f"{query_filter} RETURN a.name",
+                    (
+                        query_filter
+                        if "RETURN" in query_filter.upper()
+                        else f"{query_filter} RETURN a.name"
+                    ),
                 )
 
                 # Extract object names from the query results
@@ -0,0 +1,111 @@
+"""
+Pipeline commands for PANFlow CLI.
+
+This module provides the pipeline command, which runs a sequence of PANFlow
+commands against one configuration loaded once, saving it once at the end.
+"""
+
+import json
+import logging
+import sys
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from panflow.core.batch import BatchError, load_pipeline_spec, parse_pipeline_spec
+from panflow.core.session import ConfigSession
+
+from ..app import app
+from ..common import ConfigOptions
+
+# Get logger
+logger = logging.getLogger("panflow")
+
+# Create pipeline app
+pipeline_app = typer.Typer(help="Run a pipeline of commands against one in-memory configuration")
+
+# Register with main app
+app.add_typer(pipeline_app, name="pipeline")
+
+
+@pipeline_app.command("run")
+def run(
+    steps_file: str = typer.Argument(
+        ..., help="YAML pipeline spec or file of command lines ('-' reads standard input)"
+    ),
+    config: str = ConfigOptions.config_file(),
+    output: Optional[str] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write the final configuration here (defaults to the path of the last save)",
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Run every step but do not write the configuration"
+    ),
+    report_file: Optional[str] = typer.Option(
+        None, "--report-file", "-r", help="Write the per-step results and timings as JSON"
+    ),
+    version: Optional[str] = ConfigOptions.version(),
+):
+    """
+    Run a pipeline of commands against one configuration loaded once.
+
+    The configuration is parsed once and every step runs in this process
+    against the same in-memory tree. Saves requested by the steps are
+    deferred, and the configuration is written once after the last step,
+    unless a step fails or --dry-run is given. Steps use the batch pipeline
+    spec format; modifying commands still take --output, which may be
+    "{config}", and a "save" step sets the final output path.
+
+    Examples:
+
+        # Run the steps of a YAML spec and write the result once
+        panflow pipeline run steps.yaml --config panorama.xml --output cleaned.xml
+
+        # Read command lines from standard input and only report the timings
+        printf 'deduplicate merge --type address --output {config}\\n' | \\
+            panflow pipeline run - --config panorama.xml --dry-run
+    """
+    try:
+        if steps_file == "-":
+            steps = parse_pipeline_spec(sys.stdin.read(), "<stdin>")
+        else:
+            steps = load_pipeline_spec(steps_file)
+    except BatchError as e:
+        logger.error(str(e))
+        raise typer.Exit(1)
+
+    try:
+        session = ConfigSession(config, version)
+    except Exception as e:
+        logger.error(f"Failed to load configuration {config}: {e}")
+        raise typer.Exit(1)
+
+    result = session.run(steps, output=output, dry_run=dry_run)
+
+    table = Table(title="Pipeline Steps")
+    table.add_column("#", justify="right")
+    table.add_column("Command")
+    table.add_column("Status")
+    table.add_column("Time (s)", justify="right")
+    for index, step in enumerate(result["steps"], 1):
+        status = "[green]ok[/green]" if step["exit_code"] == 0 else f"[red]{step['error']}[/red]"
+        table.add_row(str(index), step["command"], status, f"{step['duration']:.3f}")
+    if "save_duration" in result:
+        status = "[green]ok[/green]" if result["saved"] else "[red]failed[/red]"
+        table.add_row("", f"save {result['output']}", status, f"{result['save_duration']:.3f}")
+    console = Console()
+    console.print(table)
+    console.print(f"Pipeline finished in {result['duration']:.2f}s")
+
+    if report_file:
+        with open(report_file, "w") as f:
+            json.dump(result, f, indent=2)
+        logger.info(f"Pipeline report written to {report_file}")
+
+    if result["status"] != "ok":
+        logger.error(result.get("error", "Pipeline failed"))
+        raise typer.Exit(1)
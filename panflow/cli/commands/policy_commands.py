@@ -15,6 +15,7 @@ from panflow.core.config_loader import load_config_from_file, save_config, detec
 from panflow.core.graph_utils import ConfigGraph
 from panflow.core.query_language import Query
 from panflow.core.query_engine import QueryExecutor
+from panflow.core.rule_match import RuleMatcher, default_rule, match_flow_file
 
 from ..app import policy_app
 from ..common import common_options, ConfigOptions
@@ -50,32 +51,36 @@ def create_query_for_log_setting(setting: str, value: str) -> str:
 def simplify_query(query_text: str) -> tuple[str, list[str]]:
     """
     Simplify a complex query to basic matching. Used as fallback.
-    
+
     Args:
         query_text: The original query text
-        
+
     Returns:
         Tuple of (simplified_query, conditions)
     """
     # Extract any pattern about action, log settings, etc.
     conditions = []
     simplified = "MATCH (r:security_rule) "
-    
+
     # Look for common patterns
     if "r.action" in query_text:
         import re
+
         match = re.search(r"r\.action\s*==\s*['\"]([^'\"]+)['\"]", query_text)
         if match:
             action = match.group(1)
             simplified += f"WHERE r.action == '{action}' "
             conditions.append(f"action={action}")
-    
+
     if "RETURN" not in simplified:
         simplified += "RETURN r.name"
-        
+
     return simplified, conditions
 
-def execute_policy_query(graph, query_text: str, context_type: Optional[str] = None, device_group: Optional[str] = None) -> List[Dict[str, Any]]:
+
+def execute_policy_query(
+    graph, query_text: str, context_type: Optional[str] = None, device_group: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """
     Execute a policy query with fallback to simple queries if needed.
 
@@ -95,19 +100,21 @@ def execute_policy_query(graph, query_text: str, context_type: Optional[str] = N
             if "device_group" not in query_text and "RETURN" in query_text.upper():
                 # Add device group condition to WHERE clause if one exists
                 if "WHERE" in query_text:
-                    query_text = query_text.replace("WHERE", f"WHERE r.device_group == '{device_group}' AND ")
+                    query_text = query_text.replace(
+                        "WHERE", f"WHERE r.device_group == '{device_group}' AND "
+                    )
                     logger.debug(f"Modified query with WHERE condition: {query_text}")
                 else:
                     # Insert WHERE clause before RETURN
                     return_idx = query_text.upper().find("RETURN")
                     query_text = f"{query_text[:return_idx]} WHERE r.device_group == '{device_group}' {query_text[return_idx:]}"
                     logger.debug(f"Modified query with new WHERE clause: {query_text}")
-        
+
         # Try the original (or modified) query
         query = Query(query_text)
         executor = QueryExecutor(graph)
         results = executor.execute(query)
-        
+
         # Log the number of results for debugging
         logger.debug(f"Query returned {len(results)} results")
         return results
@@ -119,9 +126,9 @@ def execute_policy_query(graph, query_text: str, context_type: Optional[str] = N
         if context_type == "device_group" and device_group:
             basic_query += f"WHERE r.device_group == '{device_group}' "
         basic_query += "RETURN r.name"
-        
+
         logger.debug(f"Using fallback query: {basic_query}")
-        
+
         try:
             query = Query(basic_query)
             executor = QueryExecutor(graph)
@@ -130,7 +137,7 @@ def execute_policy_query(graph, query_text: str, context_type: Optional[str] = N
             return results
         except Exception as e:
             logger.error(f"Basic query also failed: {e}")
-            
+
             # This is a last resort: scan all nodes in the graph for security rules
             try:
                 # Collect all security rule nodes manually
@@ -142,11 +149,11 @@ def execute_policy_query(graph, query_text: str, context_type: Optional[str] = N
                             node_dg = attrs.get("device_group", "")
                             if node_dg != device_group:
                                 continue
-                                
+
                         # Create a result row with the rule name
                         if "name" in attrs:
                             manual_results.append({"r.name": attrs["name"]})
-                
+
                 logger.debug(f"Manual graph scan found {len(manual_results)} security rules")
                 return manual_results
             except Exception as manual_error:
@@ -252,11 +259,7 @@ def list_policies(
             logger.info(f"Filtering policies using query: {query_filter}")
 
             # Build the graph with context parameters
-            graph = ConfigGraph(
-                device_type=device_type,
-                context_type=context,
-                **context_kwargs
-            )
+            graph = ConfigGraph(device_type=device_type, context_type=context, **context_kwargs)
             graph.build_from_xml(tree)
 
             # Prepare a query that returns policy names
@@ -285,10 +288,10 @@ def list_policies(
 
             # Execute the query with fallback, passing context information
             results = execute_policy_query(
-                graph=graph, 
+                graph=graph,
                 query_text=query_text,
                 context_type=context,
-                device_group=device_group if context == "device_group" else None
+                device_group=device_group if context == "device_group" else None,
             )
 
             # Extract policy names from the results
@@ -619,11 +622,7 @@ def filter_policies(
             logger.info(f"Filtering policies using query: {query_filter}")
 
             # Build the graph with context parameters
-            graph = ConfigGraph(
-                device_type=device_type,
-                context_type=context,
-                **context_kwargs
-            )
+            graph = ConfigGraph(device_type=device_type, context_type=context, **context_kwargs)
             graph.build_from_xml(tree)
 
             # Prepare a query that returns policy names
@@ -652,10 +651,10 @@ def filter_policies(
 
             # Execute the query with fallback, passing context information
             results = execute_policy_query(
-                graph=graph, 
+                graph=graph,
                 query_text=query_text,
                 context_type=context,
-                device_group=device_group if context == "device_group" else None
+                device_group=device_group if context == "device_group" else None,
             )
 
             # Extract policy names from the results
@@ -993,11 +992,7 @@ def bulk_update_policies(
             logger.info(f"Using graph query filter: {query_filter}")
 
             # Build the graph with context parameters
-            graph = ConfigGraph(
-                device_type=device_type,
-                context_type=context,
-                **context_kwargs
-            )
+            graph = ConfigGraph(device_type=device_type, context_type=context, **context_kwargs)
             graph.build_from_xml(tree)
 
             # Prepare a query that returns policy names
@@ -1090,11 +1085,7 @@ def bulk_update_policies(
                 logger.info(f"Using graph query filter: {query_filter}")
 
                 # Build the graph with context parameters - we'll store it to avoid rebuilding later
-                graph = ConfigGraph(
-                    device_type=device_type,
-                    context_type=context,
-                    **context_kwargs
-                )
+                graph = ConfigGraph(device_type=device_type, context_type=context, **context_kwargs)
                 graph.build_from_xml(tree)
 
                 # Prepare a query that returns policy names
@@ -1105,10 +1096,10 @@ def bulk_update_policies(
 
                 # Execute the query with fallback
                 results = execute_policy_query(
-                    graph=graph, 
+                    graph=graph,
                     query_text=query_text,
                     context_type=context,
-                    device_group=device_group if context == "device_group" else None
+                    device_group=device_group if context == "device_group" else None,
                 )
 
                 # Extract policy names from the results
@@ -1377,20 +1368,26 @@ def bulk_update_policies(
             # Handle potential issues with device group context by adding debug logging
             if device_group and query_filter:
                 logger.info(f"Processing query filter with device group context: {device_group}")
-                
+
                 # Add debugging info about the device group policies
                 try:
                     dg_xpath = f"/config/devices/entry/device-group/entry[@name='{device_group}']/pre-rulebase/security/rules/entry"
                     dg_policies = [rule.get("name") for rule in tree.xpath(dg_xpath)]
-                    logger.debug(f"Device group {device_group} pre-rulebase policies: {dg_policies}")
-                    
+                    logger.debug(
+                        f"Device group {device_group} pre-rulebase policies: {dg_policies}"
+                    )
+
                     dg_post_xpath = f"/config/devices/entry/device-group/entry[@name='{device_group}']/post-rulebase/security/rules/entry"
                     dg_post_policies = [rule.get("name") for rule in tree.xpath(dg_post_xpath)]
-                    logger.debug(f"Device group {device_group} post-rulebase policies: {dg_post_policies}")
-                    
+                    logger.debug(
+                        f"Device group {device_group} post-rulebase policies: {dg_post_policies}"
+                    )
+
                     if not dg_policies and not dg_post_policies:
-                        logger.warning(f"No security policies found in device group: {device_group}")
-                    
+                        logger.warning(
+                            f"No security policies found in device group: {device_group}"
+                        )
+
                     # If graph query returns no policies but we found policies using XPath, use those directly
                     if criteria is None or "name" not in criteria or not criteria["name"]:
                         all_policies = dg_policies + dg_post_policies
@@ -1399,26 +1396,22 @@ def bulk_update_policies(
                             logger.info(f"Using policies found via XPath: {all_policies}")
                 except Exception as e:
                     logger.error(f"Error querying device group policies: {e}")
-            
+
             # If we created a graph for the query filter, pass it to bulk_update_policies
             graph = None
             if query_filter:
                 # Create the graph once so we can reuse it
                 logger.info("Creating graph for bulk update operations")
-                graph = ConfigGraph(
-                    device_type=device_type,
-                    context_type=context,
-                    **context_kwargs
-                )
+                graph = ConfigGraph(device_type=device_type, context_type=context, **context_kwargs)
                 graph.build_from_xml(tree)
-                
+
             # Perform the bulk update, passing both criteria and query_filter
             updated_count = updater.bulk_update_policies(
-                policy_type, 
-                criteria=criteria, 
+                policy_type,
+                criteria=criteria,
                 operations=operations,
                 query_filter=query_filter,
-                existing_graph=graph
+                existing_graph=graph,
             )
 
             if updated_count > 0:
@@ -1436,3 +1429,102 @@ def bulk_update_policies(
     except Exception as e:
         logger.error(f"Error in bulk update: {e}")
         raise typer.Exit(1)
+
+
+@policy_app.command("match")
+@common_options
+def match_policy(
+    config_file: str = ConfigOptions.config_file(),
+    from_zone: Optional[str] = typer.Option(None, "--from", help="Source zone"),
+    to_zone: Optional[str] = typer.Option(None, "--to", help="Destination zone"),
+    source: Optional[str] = typer.Option(None, "--source", help="Source IP address"),
+    destination: Optional[str] = typer.Option(None, "--destination", help="Destination IP address"),
+    protocol: str = typer.Option("tcp", "--protocol", help="IP protocol (tcp, udp, sctp)"),
+    port: Optional[int] = typer.Option(None, "--port", help="Destination port"),
+    application: Optional[str] = typer.Option(None, "--application", help="Application name"),
+    flows_file: Optional[str] = typer.Option(
+        None,
+        "--flows",
+        help=(
+            "CSV file of flows with a header "
+            "(from,to,source,destination,protocol,port,application)"
+        ),
+    ),
+    output: Optional[str] = typer.Option(
+        None, "--output", "-o", help="Output CSV file for batch results (required with --flows)"
+    ),
+    context: str = typer.Option("shared", "--context", help="Context (shared, device_group, vsys)"),
+    device_group: Optional[str] = typer.Option(
+        None, "--device-group", "--dg", help="Device group name (required for device-group context)"
+    ),
+    vsys: str = typer.Option("vsys1", "--vsys", "-v", help="VSYS name"),
+):
+    """
+    Find the security rule that a flow matches.
+
+    Rules are evaluated in order (Panorama pre-rules, local rules, post-rules);
+    options left out do not constrain the match.
+
+    Examples:
+
+        # Which rule allows HTTPS from a host to a server?
+        python cli.py policy match --config config.xml --context vsys --from trust --to untrust \\
+            --source 10.1.1.5 --destination 203.0.113.10 --port 443
+
+        # Match a CSV of flows and write the matched rule names
+        python cli.py policy match --config config.xml --context device_group --dg DG1 \\
+            --flows flows.csv --output matches.csv
+    """
+    try:
+        # Load the configuration
+        tree, version = load_config_from_file(config_file)
+        device_type = detect_device_type(tree)
+
+        # Prepare context parameters
+        context_kwargs = {}
+        if context == "device_group" and device_group:
+            context_kwargs["device_group"] = device_group
+        elif context == "vsys":
+            context_kwargs["vsys"] = vsys
+
+        matcher = RuleMatcher.from_config(tree, device_type, context, version, **context_kwargs)
+        logger.info(f"Loaded {len(matcher.entries)} enabled security rules")
+
+        if flows_file:
+            if not output:
+                logger.error("--output is required with --flows")
+                raise typer.Exit(1)
+            stats = match_flow_file(matcher, flows_file, output)
+            typer.echo(
+                f"Matched {stats['matched']} of {stats['flows']} flows "
+                f"({stats['invalid']} invalid); results written to {output}"
+            )
+            return
+
+        match = matcher.lookup(
+            from_zone=from_zone,
+            to_zone=to_zone,
+            source=source,
+            destination=destination,
+            protocol=protocol,
+            port=port,
+            application=application,
+        )
+        if match is None:
+            name, action = default_rule(from_zone, to_zone)
+            result = {"rule": name, "rulebase": "default", "action": action}
+        else:
+            rulebase, rule = match
+            result = {
+                "rule": rule.name,
+                "rulebase": rulebase,
+                "position": rule.position,
+                "action": rule.action,
+            }
+        typer.echo(json.dumps(result, indent=2))
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        logger.error(f"Error matching policy: {e}")
+        raise typer.Exit(1)
@@ -0,0 +1,365 @@
+"""
+Report commands for PANFlow CLI.
+
+This module provides commands for generating reports from PAN-OS configurations.
+"""
+
+import logging
+import os
+from typing import List, Optional
+
+import typer
+
+from panflow.core.config_loader import detect_device_type, load_config_from_file
+from panflow.reporting.engine import DEFAULT_BUNDLE_SECTIONS, ReportingEngine
+from panflow.reporting.reports.hit_counts import DEFAULT_STALE_DAYS, HitCountTable
+from panflow.reporting.reports.incremental import IncrementalReportIndex
+
+from ..app import report_app
+from ..common import ConfigOptions, common_options
+
+# Get logger
+logger = logging.getLogger("panflow")
+
+
+@report_app.command("bundle")
+@common_options
+def report_bundle(
+    config_file: str = ConfigOptions.config_file(),
+    output_dir: str = typer.Option(
+        ..., "--output-dir", "-o", help="Directory to write the reports to"
+    ),
+    output_format: str = typer.Option(
+        "json", "--format", "-f", help="Output format (json, csv, html)"
+    ),
+    sections: Optional[str] = typer.Option(
+        None,
+        "--sections",
+        help="Comma-separated section names (default: all; "
+        + ", ".join(section["name"] for section in DEFAULT_BUNDLE_SECTIONS)
+        + ")",
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-w", help="Maximum number of sections generated concurrently"
+    ),
+    processes: bool = typer.Option(
+        False, "--processes", help="Generate sections in worker processes instead of threads"
+    ),
+    state_file: Optional[str] = typer.Option(
+        None,
+        "--state",
+        help=(
+            "Report state file; if it exists only the entries changed since it was saved "
+            "are re-read"
+        ),
+    ),
+    context: str = typer.Option("shared", "--context", help="Context (shared, device_group, vsys)"),
+    device_group: Optional[str] = typer.Option(
+        None, "--device-group", "--dg", help="Device group name (required for device-group context)"
+    ),
+    vsys: str = typer.Option("vsys1", "--vsys", "-v", help="VSYS name"),
+):
+    """
+    Generate a bundle of audit reports concurrently.
+
+    The configuration is loaded once and shared lookups are reused across
+    sections; each report is written to the output directory as soon as it
+    is done.
+
+    Examples:
+
+        # Generate all sections as JSON
+        python cli.py report bundle --config config.xml --output-dir reports
+
+        # Generate the unused object sections as HTML in four worker processes
+        python cli.py report bundle --config config.xml --output-dir reports --format html \\
+            --sections unused-address,unused-service --processes --workers 4
+
+        # Regenerate after a change window, re-reading only the changed entries
+        python cli.py report bundle --config config.xml --output-dir reports \\
+            --state reports/state.json.gz
+    """
+    try:
+        if state_file and processes:
+            logger.error("--state cannot be used with --processes")
+            raise typer.Exit(1)
+
+        # Select the sections
+        selected = DEFAULT_BUNDLE_SECTIONS
+        if sections:
+            by_name = {section["name"]: section for section in DEFAULT_BUNDLE_SECTIONS}
+            names = [name.strip() for name in sections.split(",") if name.strip()]
+            unknown = [name for name in names if name not in by_name]
+            if unknown:
+                logger.error(f"Unknown report sections: {', '.join(unknown)}")
+                raise typer.Exit(1)
+            selected = [by_name[name] for name in names]
+
+        # Load the configuration
+        tree, version = load_config_from_file(config_file)
+        device_type = detect_device_type(tree)
+
+        # Prepare context parameters
+        context_kwargs = {}
+        if context == "device_group" and device_group:
+            context_kwargs["device_group"] = device_group
+        elif context == "vsys":
+            context_kwargs["vsys"] = vsys
+
+        engine = ReportingEngine(tree, device_type, context, version, **context_kwargs)
+
+        # Bring the saved report state up to date with this configuration
+        index = None
+        if state_file:
+            if os.path.exists(state_file):
+                index = IncrementalReportIndex.load(state_file)
+                delta = index.update(tree)
+                changed = sum(
+                    len(section["added"]) + len(section["removed"]) + len(section["changed"])
+                    for section in delta.values()
+                )
+                typer.echo(f"{changed} entries changed in {len(delta)} sections since the last run")
+            else:
+                index = IncrementalReportIndex(tree)
+
+        def on_section(name, data):
+            typer.echo(f"Finished {name}")
+
+        bundle = engine.generate_bundle(
+            sections=selected,
+            output_dir=output_dir,
+            output_format=output_format,
+            max_workers=workers,
+            use_processes=processes,
+            on_section=on_section,
+            index=index,
+        )
+        if index is not None:
+            index.save(state_file)
+
+        for name, error in bundle["errors"].items():
+            logger.error(f"Section {name} failed: {error}")
+        typer.echo(
+            f"Generated {len(bundle['sections'])} of {len(selected)} reports in "
+            f"{bundle['duration']:.2f}s; written to {output_dir}"
+        )
+        if bundle["errors"]:
+            raise typer.Exit(1)
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        logger.error(f"Error generating report bundle: {e}")
+        raise typer.Exit(1)
+
+
+@report_app.command("policy-analysis")
+@common_options
+def report_policy_analysis(
+    config_file: str = ConfigOptions.config_file(),
+    output_file: Optional[str] = typer.Option(
+        None, "--output", "-o", help="Output file for the report"
+    ),
+    output_format: str = typer.Option(
+        "json", "--format", "-f", help="Output format (json, jsonl, csv, html)"
+    ),
+    hit_counts: Optional[List[str]] = typer.Option(
+        None,
+        "--hit-counts",
+        help="Rule hit-count export (CSV or XML, optionally compressed); repeat for each device",
+    ),
+    stale_days: int = typer.Option(
+        DEFAULT_STALE_DAYS, "--stale-days", help="Days without a hit after which a rule is stale"
+    ),
+    policy_type: Optional[str] = typer.Option(
+        None, "--policy-type", help="Security rulebase to analyze (default: by device type)"
+    ),
+    context: str = typer.Option("shared", "--context", help="Context (shared, device_group, vsys)"),
+    device_group: Optional[str] = typer.Option(
+        None, "--device-group", "--dg", help="Device group name (required for device-group context)"
+    ),
+    vsys: str = typer.Option("vsys1", "--vsys", "-v", help="VSYS name"),
+):
+    """
+    Analyze security policies, optionally joined with rule hit counts.
+
+    Hit-count exports of any number of devices are aggregated per rule name;
+    the report then classifies the rules by hit count and by the age of the
+    last hit and lists the rules that are stale.
+
+    Examples:
+
+        # Analyze the policies of a firewall
+        python cli.py report policy-analysis --config firewall.xml --context vsys
+
+        # Join the hit counts of two devices and list rules unused for 180 days
+        python cli.py report policy-analysis --config panorama.xml --context device_group \\
+            --dg branches --hit-counts fw1.xml --hit-counts fw2.csv.gz --stale-days 180 \\
+            --output analysis.json
+    """
+    try:
+        hit_count_data = HitCountTable.from_files(hit_counts) if hit_counts else None
+
+        tree, version = load_config_from_file(config_file)
+        device_type = detect_device_type(tree)
+
+        # Prepare context parameters
+        context_kwargs = {}
+        if context == "device_group" and device_group:
+            context_kwargs["device_group"] = device_group
+        elif context == "vsys":
+            context_kwargs["vsys"] = vsys
+
+        engine = ReportingEngine(tree, device_type, context, version, **context_kwargs)
+        analysis = engine.generate_security_policy_analysis(
+            policy_type=policy_type,
+            include_hit_counts=hit_count_data is not None,
+            hit_count_data=hit_count_data,
+            output_file=output_file,
+            output_format=output_format,
+            stale_days=stale_days,
+        )
+
+        summary = analysis["summary"]
+        typer.echo(
+            f"{summary['total_policies']} policies, {summary['disabled_count']} disabled, "
+            f"{summary['any_source_count']} with any source"
+        )
+        if hit_count_data is not None:
+            typer.echo(
+                f"{summary['stale_count']} rules without hits in {stale_days} days "
+                f"(hit counts of {len(hit_count_data.device_names)} devices)"
+            )
+        if output_file:
+            typer.echo(f"Report written to {output_file}")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        logger.error(f"Error generating policy analysis report: {e}")
+        raise typer.Exit(1)
+
+
+@report_app.command("object-usage")
+@common_options
+def report_object_usage(
+    config_file: str = ConfigOptions.config_file(),
+    object_type: str = typer.Option("address", "--type", "-t", help="Type of object to check"),
+    output_file: Optional[str] = typer.Option(
+        None, "--output", "-o", help="Output file for the report"
+    ),
+    output_format: str = typer.Option(
+        "json", "--format", "-f", help="Output format (json, jsonl, csv)"
+    ),
+):
+    """
+    Report which device groups use each object of a Panorama configuration.
+
+    All rulebases and groups of shared and every device group are read once
+    and each object is listed with the device groups referencing it, along
+    with recommendations to move objects down the hierarchy, consolidate
+    copies defined in several device groups, or remove unused objects.
+
+    Examples:
+
+        python cli.py report object-usage --config panorama.xml --type address \\
+            --output usage.csv --format csv
+    """
+    try:
+        tree, version = load_config_from_file(config_file)
+        device_type = detect_device_type(tree)
+        if device_type.lower() != "panorama":
+            logger.error("The object usage report requires a Panorama configuration")
+            raise typer.Exit(1)
+
+        engine = ReportingEngine(tree, device_type, "shared", version)
+        report = engine.generate_object_usage_report(
+            object_type=object_type, output_file=output_file, output_format=output_format
+        )
+
+        summary = report["summary"]
+        typer.echo(
+            f"{summary['objects']} {object_type} objects, {summary['used_objects']} used across "
+            f"{summary['device_groups']} device groups: {summary['unused_count']} unused, "
+            f"{summary['move_down_count']} to move down, "
+            f"{summary['consolidate_count']} to consolidate"
+        )
+        if output_file:
+            typer.echo(f"Report written to {output_file}")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        logger.error(f"Error generating object usage report: {e}")
+        raise typer.Exit(1)
+
+
+@report_app.command("rule-expansion")
+@common_options
+def report_rule_expansion(
+    config_file: str = ConfigOptions.config_file(),
+    output_file: Optional[str] = typer.Option(
+        None, "--output", "-o", help="Output file for the report"
+    ),
+    output_format: str = typer.Option(
+        "json", "--format", "-f", help="Output format (json, jsonl, csv)"
+    ),
+    approximate: bool = typer.Option(
+        False, "--approximate", help="Estimate the member counts of very large groups"
+    ),
+    top: Optional[int] = typer.Option(
+        None, "--top", help="Only list the N rules with the highest cost"
+    ),
+    context: str = typer.Option("shared", "--context", help="Context (shared, device_group, vsys)"),
+    device_group: Optional[str] = typer.Option(
+        None, "--device-group", "--dg", help="Device group name (required for device-group context)"
+    ),
+    vsys: str = typer.Option("vsys1", "--vsys", "-v", help="VSYS name"),
+):
+    """
+    Report the expanded member counts and expansion cost of security rules.
+
+    The cost of a rule is the product of the distinct leaf members of its
+    zones, addresses, services and applications after groups are expanded.
+    Rules are ranked by cost and the costs are totalled per device group.
+
+    Examples:
+
+        # Rank the rules of every device group
+        python cli.py report rule-expansion --config panorama.xml --top 20
+
+        # Estimate the counts of very large groups
+        python cli.py report rule-expansion --config firewall.xml --context vsys --approximate \\
+            --output cost.csv --format csv
+    """
+    try:
+        tree, version = load_config_from_file(config_file)
+        device_type = detect_device_type(tree)
+
+        # Prepare context parameters
+        context_kwargs = {}
+        if context == "device_group" and device_group:
+            context_kwargs["device_group"] = device_group
+        elif context == "vsys":
+            context_kwargs["vsys"] = vsys
+
+        engine = ReportingEngine(tree, device_type, context, version, **context_kwargs)
+        report = engine.generate_rule_expansion_report(
+            output_file=output_file, output_format=output_format, approximate=approximate, top=top
+        )
+
+        summary = report["summary"]
+        typer.echo(
+            f"{summary['total_rules']} rules, total expansion cost {summary['total_cost']} "
+            f"({summary['mode']})"
+        )
+        for rule in report["rules"][:10]:
+            typer.echo(f"  {rule['cost']:>12}  {rule['context']}/{rule['name']}")
+        if output_file:
+            typer.echo(f"Report written to {output_file}")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        logger.error(f"Error generating rule expansion report: {e}")
+        raise typer.Exit(1)
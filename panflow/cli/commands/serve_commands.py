@@ -0,0 +1,143 @@
+"""
+Daemon commands for PANFlow CLI.
+
+This module provides the serve command, which runs the PANFlow daemon that
+keeps configurations, graphs and report indexes loaded between commands, and
+the api command, which serves PANFlowConfig operations over HTTP.
+"""
+
+import json
+import logging
+from typing import Optional
+
+import typer
+
+from panflow.core.daemon import DaemonError, PANFlowDaemon, send_request, socket_path
+
+from ..app import app
+
+# Get logger
+logger = logging.getLogger("panflow")
+
+
+@app.command("serve")
+def serve(
+    socket: Optional[str] = typer.Option(
+        None,
+        "--socket",
+        help="Unix socket path (defaults to $PANFLOW_SOCKET or the runtime directory)",
+    ),
+    memory_mb: int = typer.Option(
+        2048, "--memory-mb", help="Estimated memory the cached configurations may use, in MiB"
+    ),
+    status: bool = typer.Option(False, "--status", help="Show the status of the running daemon"),
+    stop: bool = typer.Option(False, "--stop", help="Stop the running daemon"),
+):
+    """
+    Run the PANFlow daemon.
+
+    The daemon listens on a Unix socket and keeps parsed configurations, their
+    graphs and report indexes in memory, so repeated commands on the same
+    files skip start-up and parsing. While it runs, panflow commands are
+    forwarded to it automatically; read-only commands run concurrently.
+    Set PANFLOW_SOCKET to an empty string to run commands locally.
+
+    Examples:
+
+        # Start the daemon in the background
+        panflow serve --memory-mb 4096 &
+
+        # Show the cached configurations
+        panflow serve --status
+
+        # Stop the daemon
+        panflow serve --stop
+    """
+    path = socket or socket_path()
+    if not path:
+        logger.error("The PANFlow daemon is disabled (PANFLOW_SOCKET is empty)")
+        raise typer.Exit(1)
+
+    if status or stop:
+        try:
+            response = send_request({"op": "stop" if stop else "status"}, path, timeout=10)
+        except OSError as e:
+            logger.error(f"No PANFlow daemon is listening on {path}: {e}")
+            raise typer.Exit(1)
+        if stop:
+            logger.info(f"Stopping the PANFlow daemon on {path}")
+        else:
+            typer.echo(json.dumps(response, indent=2))
+        return
+
+    from ..registry import COMMANDS
+
+    # Load every command up front so the first request does not pay for it
+    for name, declaration in COMMANDS.items():
+        if name != "serve":
+            declaration.load()
+
+    try:
+        daemon = PANFlowDaemon(path, memory_budget=memory_mb * 1024 * 1024)
+    except (DaemonError, OSError) as e:
+        logger.error(f"Cannot start the PANFlow daemon: {e}")
+        raise typer.Exit(1)
+
+    logger.info(f"PANFlow daemon listening on {path} (memory budget {memory_mb} MiB)")
+    try:
+        daemon.serve()
+    except KeyboardInterrupt:
+        pass
+    logger.info("PANFlow daemon stopped")
+
+
+@app.command("api")
+def api(
+    host: str = typer.Option("127.0.0.1", "--host", help="Address to listen on"),
+    port: int = typer.Option(8780, "--port", "-p", help="TCP port to listen on"),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-w", help="Number of worker threads running operations"
+    ),
+    save: bool = typer.Option(
+        True, "--save/--no-save", help="Save successful writes back to the configuration files"
+    ),
+    token_file: Optional[str] = typer.Option(
+        None,
+        "--token-file",
+        help="File holding the API token, created if missing "
+        "(defaults to $PANFLOW_API_TOKEN_FILE or the runtime directory)",
+    ),
+):
+    """
+    Run the local HTTP/JSON API.
+
+    Serves PANFlowConfig operations as POST /v1/<operation> requests with a
+    JSON body naming the configuration file as "config". Reads are
+    get_objects, get_policies, filter_objects, find_duplicates and query;
+    writes are add_object, update_object, delete_object and bulk_update.
+    Concurrent identical reads are coalesced, and writes are applied one at a
+    time per configuration; pass "expected_revision" to reject a write if the
+    configuration changed since it was read.
+
+    Requests must send the token from the token file as a bearer token and
+    their body as application/json; requests from web browsers are rejected.
+
+    Examples:
+
+        # Start the API on the default port
+        panflow api --token-file ~/.panflow-api.token
+
+        # List address objects
+        curl -H "Authorization: Bearer $(cat ~/.panflow-api.token)" \\
+            -H "Content-Type: application/json" \\
+            -d '{"config": "config.xml", "object_type": "address"}' localhost:8780/v1/get_objects
+    """
+    from panflow.core.api_server import LOOPBACK_HOSTS, APIError, serve_api
+
+    if host not in LOOPBACK_HOSTS:
+        logger.warning(f"The PANFlow API is listening on {host}, reachable from the network")
+    try:
+        serve_api(host, port, workers=workers, save=save, token_file=token_file)
+    except APIError as e:
+        logger.error(f"Cannot start the PANFlow API: {e}")
+        raise typer.Exit(1)
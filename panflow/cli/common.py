@@ -17,6 +17,7 @@ from panflow.core.logging_utils import (
     log_file_callback,
 )
 from panflow.core.conflict_resolver import ConflictStrategy
+from panflow.core.compression import HAVE_ZSTD, detect_compression
 
 # Import autocompletion functions from dedicated module
 from .completions import (
@@ -25,12 +26,25 @@ from .completions import (
     complete_policy_types,
     complete_context_types,
     complete_output_formats,
+    complete_device_groups,
+    complete_templates,
+    complete_vsys,
+    complete_object_names,
 )
 
 # Type variable for callback return type
 T = TypeVar("T")
 
 
+def version_callback(value: bool) -> None:
+    """Print the PANFlow version and exit."""
+    if value:
+        from panflow import __version__
+
+        typer.echo(f"PANFlow v{__version__}")
+        raise typer.Exit()
+
+
 class CommonOptions:
     """Base class for common command options."""
 
@@ -62,6 +76,14 @@ class CommonOptions:
             log_file: Optional[str] = typer.Option(
                 None, "--log-file", "-f", help="Log to file", callback=log_file_callback
             ),
+            version: bool = typer.Option(
+                False,
+                "--version",
+                "-V",
+                help="Show the PANFlow version and exit",
+                callback=version_callback,
+                is_eager=True,
+            ),
         ):
             """PANFlow Utilities CLI"""
             # Configure logging (done by callbacks)
@@ -78,7 +100,8 @@ class ConfigOptions:
             ...,
             "--config",
             "-c",
-            help="Path to XML configuration file",
+            help="Path to XML configuration file (.xml, .xml.gz or .xml.zst)",
+            callback=file_callback,
             autocompletion=complete_config_files,
         )
 
@@ -146,8 +169,8 @@ class ContextOptions:
         return typer.Option(
             None,
             "--device-group",
-            help="Device group name (for Panorama device_group context)"
-            # Note: We could add dynamic completion based on loaded config here
+            help="Device group name (for Panorama device_group context)",
+            autocompletion=complete_device_groups,
         )
 
     @staticmethod
@@ -157,7 +180,7 @@ class ContextOptions:
             "vsys1",
             "--vsys",
             help="VSYS name (for firewall vsys context)",
-            autocompletion=lambda: ["vsys1", "vsys2", "vsys3"],
+            autocompletion=complete_vsys,
         )
 
     @staticmethod
@@ -166,8 +189,8 @@ class ContextOptions:
         return typer.Option(
             None,
             "--template",
-            help="Template name (for Panorama template context)"
-            # Note: We could add dynamic completion based on loaded config here
+            help="Template name (for Panorama template context)",
+            autocompletion=complete_templates,
         )
 
     @staticmethod
@@ -286,8 +309,8 @@ class ObjectOptions:
             ...,
             "--name",
             "-n",
-            help="Name of the object"
-            # Dynamic completion based on loaded config and object type
+            help="Name of the object",
+            autocompletion=complete_object_names,
         )
 
 
@@ -312,7 +335,7 @@ class PolicyOptions:
             ...,
             "--name",
             "-n",
-            help="Name of the policy"
+            help="Name of the policy",
             # Dynamic completion based on loaded config and policy type
         )
 
@@ -332,7 +355,7 @@ class PolicyOptions:
         return typer.Option(
             None,
             "--ref-policy",
-            help="Reference policy for before/after position"
+            help="Reference policy for before/after position",
             # Dynamic completion based on loaded config and policy type
         )
 
@@ -340,7 +363,10 @@ class PolicyOptions:
 # File and output related callbacks
 def file_callback(value: str) -> str:
     """
-    Validate that the specified file exists.
+    Validate that the specified file exists and can be read.
+
+    Gzip and zstd compressed files are accepted; zstd requires Python 3.14+
+    or the zstandard package.
 
     Args:
         value: The file path
@@ -349,10 +375,14 @@ def file_callback(value: str) -> str:
         The validated file path
 
     Raises:
-        typer.BadParameter: If the file does not exist
+        typer.BadParameter: If the file does not exist or uses unsupported compression
     """
     if not os.path.exists(value):
         raise typer.BadParameter(f"File does not exist: {value}")
+    if os.path.isfile(value) and detect_compression(value) == "zstd" and not HAVE_ZSTD:
+        raise typer.BadParameter(
+            f"File {value} is zstd compressed; install the zstandard package to read it"
+        )
     return value
 
 
@@ -557,7 +587,7 @@ def format_object_for_display(obj):
         if len(desc) > 25:  # Truncate long descriptions
             desc = desc[:25] + "..."
         obj_info.append(f"desc:'{desc}'")
-    
+
     # Add context information if available
     if "context" in obj:
         obj_info.append(f"context:{obj['context']}")
@@ -607,36 +637,36 @@ def format_objects_list(objects, include_header=True, object_type=None, count=No
     elif grouped and isinstance(objects, dict):
         # If objects is a dictionary of duplicate groups
         for value, group_objects in objects.items():
-            if value.startswith('_'):  # Skip internal fields
+            if value.startswith("_"):  # Skip internal fields
                 continue
-                
+
             # Format the value key
-            if ':' in value:
-                parts = value.split(':', 1)
+            if ":" in value:
+                parts = value.split(":", 1)
                 value_display = f"{parts[0].capitalize()}: {parts[1]}"
             else:
                 value_display = value
-                
+
             result.append(f"Group: {value_display} ({len(group_objects)} objects)")
-            
+
             # Format each object in the group with proper indentation
             for obj in group_objects:
-                name = obj.get('name', 'unnamed')
-                
+                name = obj.get("name", "unnamed")
+
                 # Add context information if available
                 context = ""
-                if 'context' in obj:
+                if "context" in obj:
                     context = f" - {obj['context']}"
-                elif 'context_type' in obj:
-                    if obj['context_type'] == 'device_group' and 'context_name' in obj:
+                elif "context_type" in obj:
+                    if obj["context_type"] == "device_group" and "context_name" in obj:
                         context = f" - Device Group: {obj['context_name']}"
-                    elif obj['context_type'] == 'vsys' and 'context_name' in obj:
+                    elif obj["context_type"] == "vsys" and "context_name" in obj:
                         context = f" - VSYS: {obj['context_name']}"
-                    elif obj['context_type'] == 'shared':
+                    elif obj["context_type"] == "shared":
                         context = " - Shared"
-                        
+
                 result.append(f"    * {name}{context}")
-            
+
             # Add an extra line between groups for readability
             result.append("")
     else:
@@ -647,6 +677,7 @@ def format_objects_list(objects, include_header=True, object_type=None, count=No
 
     return result
 
+
 def format_duplicate_objects_list(duplicates, include_header=True, object_type=None):
     """
     Create a consistently formatted list of duplicate objects for display,
@@ -661,17 +692,23 @@ def format_duplicate_objects_list(duplicates, include_header=True, object_type=N
         list: List of strings for display
     """
     result = []
-    
+
     # Count total duplicates and unique values
-    total_duplicates = sum(len(objects) - 1 for objects in duplicates.values() 
-                          if not isinstance(objects, dict) and not str(objects).startswith('_'))
-    unique_values = len([k for k in duplicates.keys() if not str(k).startswith('_')])
-    
+    total_duplicates = sum(
+        len(objects) - 1
+        for objects in duplicates.values()
+        if not isinstance(objects, dict) and not str(objects).startswith("_")
+    )
+    unique_values = len([k for k in duplicates.keys() if not str(k).startswith("_")])
+
     # Add header if requested
     if include_header:
         object_type_str = f" {object_type}" if object_type else ""
-        result.append(f"Found {total_duplicates} duplicate{object_type_str} objects across {unique_values} unique values:")
-    
+        result.append(
+            f"Found {total_duplicates} duplicate{object_type_str} objects "
+            f"across {unique_values} unique values:"
+        )
+
     # Format each group of duplicates
     return result + format_objects_list(duplicates, include_header=False, grouped=True)
 
@@ -9,6 +9,7 @@ import os
 import sys
 import typer
 import shlex
+import shutil
 import platform
 import subprocess
 from typing import Optional
@@ -62,16 +63,17 @@ def generate_completion_script(shell: Optional[str] = None) -> str:
         typer.echo(f"Unsupported shell: {shell}", err=True)
         raise typer.Exit(1)
 
+
 def generate_bash_completion() -> str:
     """Generate bash completion script."""
     app_name = "panflow"
-    return f'''
+    return f"""
 # panflow completion script for bash
 _panflow_completion() {{
     local IFS=$'\\n'
     local response
 
-    response=$(env COMP_WORDS="${{COMP_WORDS[*]}}" COMP_CWORD=$COMP_CWORD {app_name} completion)
+    response=$({app_name} __complete "${{COMP_WORDS[@]:1:$COMP_CWORD}}" 2>/dev/null)
 
     for completion in $response; do
         IFS=',' read type value <<< "$completion"
@@ -88,56 +90,50 @@ _panflow_completion() {{
 }}
 
 complete -o nosort -F _panflow_completion {app_name}
-'''
+"""
+
 
 def generate_zsh_completion() -> str:
     """Generate zsh completion script."""
     app_name = "panflow"
-    return f'''
+    return f"""
 #compdef {app_name}
 
 _panflow_completion() {{
     local -a completions
-    local -a completions_with_descriptions
     local -a response
 
-    response=("$({app_name} completion "$words")")
-
-    for key value in $response; do
-        completions+=("$value")
-    done
+    response=("${{(@f)$({app_name} __complete "${{(@)words[2,$CURRENT]}}" 2>/dev/null)}}")
 
-    # Sort the completions case-insensitively
-    for i in $(echo ${{completions}} | sort | uniq); do
-        completions_with_descriptions+=("$i:command description")
+    for completion in $response; do
+        if [[ $completion == file,* ]]; then
+            _files
+            return
+        fi
+        completions+=("${{completion#*,}}")
     done
 
-    _describe -t options "options" completions_with_descriptions
+    compadd -- $completions
 }}
 
 compdef _panflow_completion {app_name}
-'''
+"""
+
 
 def generate_fish_completion() -> str:
     """Generate fish completion script."""
     app_name = "panflow"
-    return f'''
+    return f"""
 function __fish_{app_name}_complete
-    set -l response
+    set -l words (commandline -opc)[2..-1] (commandline -ct)
 
-    for i in (commandline -opc)
-        set -a response $i
-    end
-
-    set -l cmd ({app_name} completion (string join " " $response))
-
-    for i in $cmd
-        echo $i
+    for completion in ({app_name} __complete $words 2>/dev/null)
+        string replace -r '^[a-z]+,' '' -- $completion
     end
 end
 
 complete -f -c {app_name} -a "(__fish_{app_name}_complete)"
-'''
+"""
 
 
 def show_completion(shell: Optional[str] = None):
@@ -350,11 +346,15 @@ def install_completion(shell: Optional[str] = None, custom_path: Optional[Path]
                 for profile in profiles:
                     if (home / profile).exists():
                         profile_exists = True
-                        typer.echo(f"\nTo load completions on startup, add this line to your {profile}:")
+                        typer.echo(
+                            f"\nTo load completions on startup, add this line to your {profile}:"
+                        )
                         typer.echo(f"[[ -f {completion_path} ]] && source {completion_path}")
                         break
                 if not profile_exists:
-                    typer.echo("\nTo load completions on startup, create a .bash_profile file with:")
+                    typer.echo(
+                        "\nTo load completions on startup, create a .bash_profile file with:"
+                    )
                     typer.echo(f"[[ -f {completion_path} ]] && source {completion_path}")
 
         elif shell == "zsh":
@@ -364,7 +364,9 @@ def install_completion(shell: Optional[str] = None, custom_path: Optional[Path]
             # For macOS/Linux, suggest user directory if using system dir
             if not str(completion_path).startswith(str(home)):
                 typer.echo("\nIf you prefer to not modify system directories, you can also use:")
-                typer.echo(f"panflow completion --install --shell zsh --path ~/.zsh/completions/_panflow")
+                typer.echo(
+                    f"panflow completion --install --shell zsh --path ~/.zsh/completions/_panflow"
+                )
 
         elif shell == "fish":
             typer.echo("\nCompletion should be available immediately in fish.")
@@ -385,7 +387,9 @@ def install_completion(shell: Optional[str] = None, custom_path: Optional[Path]
                 custom_suggestion = f"~/.zsh/completions/_panflow"
             elif shell == "fish":
                 custom_suggestion = f"~/.config/fish/completions/panflow.fish"
-            typer.echo(f"   panflow completion --install --shell {shell} --path {custom_suggestion}")
+            typer.echo(
+                f"   panflow completion --install --shell {shell} --path {custom_suggestion}"
+            )
 
         raise typer.Exit(1)
 
@@ -395,7 +399,7 @@ def get_executable_path():
     Get the path to the executable, handling both packaged and non-packaged cases.
     """
     # Check if we're running in a packaged application
-    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
         # PyInstaller creates a temp folder and stores path in _MEIPASS
         # Get the actual executable path
         executable = sys.executable
@@ -2,20 +2,29 @@
 Auto-completion functions for PANFlow CLI.
 
 This module provides common auto-completion functions used across the CLI.
+Names defined in the configuration are completed from the completion index of
+the --config file (see :mod:`panflow.core.completion_index`), never by parsing
+the configuration.
 """
 
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+
+import typer
 
 
 # Autocompletion functions for common parameters
 def complete_config_files() -> List[Path]:
     """
     Auto-complete configuration file paths.
-    Returns XML files in the current directory.
+    Returns XML files, including gzip and zstd compressed ones, in the current directory.
     """
-    return [Path(f) for f in os.listdir(".") if f.endswith((".xml", ".XML")) and os.path.isfile(f)]
+    return [
+        Path(f)
+        for f in os.listdir(".")
+        if f.lower().endswith((".xml", ".xml.gz", ".xml.zst")) and os.path.isfile(f)
+    ]
 
 
 def complete_object_types() -> List[str]:
@@ -68,3 +77,64 @@ def complete_output_formats() -> List[str]:
     Returns the standard supported output formats across all commands.
     """
     return ["json", "table", "text", "csv", "yaml", "html"]
+
+
+def _completion_index(ctx: typer.Context):
+    """Get the completion index of the --config file given on the command line."""
+    config = ctx.params.get("config") or ctx.params.get("config_file")
+    if not config:
+        return None
+    from panflow.core.completion_index import load_completion_index
+
+    return load_completion_index(str(config))
+
+
+def _context_name(ctx: typer.Context) -> Optional[str]:
+    """Get the device group or vsys given on the command line."""
+    return ctx.params.get("device_group") or ctx.params.get("vsys")
+
+
+def complete_device_groups(ctx: typer.Context, incomplete: str) -> List[str]:
+    """
+    Auto-complete device group names from the configuration.
+    """
+    index = _completion_index(ctx)
+    return index.complete("device-group", incomplete, "shared") if index else []
+
+
+def complete_templates(ctx: typer.Context, incomplete: str) -> List[str]:
+    """
+    Auto-complete template names from the configuration.
+    """
+    index = _completion_index(ctx)
+    return index.complete("template", incomplete, "shared") if index else []
+
+
+def complete_vsys(ctx: typer.Context, incomplete: str) -> List[str]:
+    """
+    Auto-complete vsys names from the configuration.
+
+    Falls back to the usual vsys names without a completion index.
+    """
+    index = _completion_index(ctx)
+    if index is None:
+        return [name for name in ("vsys1", "vsys2", "vsys3") if name.startswith(incomplete)]
+    return index.complete("vsys", incomplete, "shared")
+
+
+def complete_object_names(ctx: typer.Context, incomplete: str) -> List[str]:
+    """
+    Auto-complete object names of the --type given, from the configuration.
+    """
+    index = _completion_index(ctx)
+    if index is None:
+        return []
+    return index.complete_objects(ctx.params.get("object_type"), incomplete, _context_name(ctx))
+
+
+def complete_rule_names(ctx: typer.Context, incomplete: str) -> List[str]:
+    """
+    Auto-complete rule names from the configuration.
+    """
+    index = _completion_index(ctx)
+    return index.complete("rule", incomplete, _context_name(ctx)) if index else []
@@ -0,0 +1,335 @@
+"""
+Lazy command registry for the PANFlow CLI.
+
+Top-level commands are declared by name together with the module that
+defines them, and the module is imported only when the command is
+dispatched. ``panflow object list`` therefore loads the object commands but
+not the NLQ, deduplication or merge commands and their dependencies.
+
+The command list shown by ``panflow --help`` and offered by shell completion
+comes from a manifest generated from the declarations, so listing commands
+imports no command module either. The same step renders the help pages of all
+command groups and the version output into the help manifest of
+:mod:`panflow.core.help_manifest`, which the launchers serve without importing
+the CLI. Regenerate both manifests after adding or changing a command::
+
+    python -m panflow.cli.registry
+"""
+
+import importlib
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+import click
+import typer
+import typer.main
+from typer.core import TyperGroup
+
+from panflow.core.help_manifest import (
+    HELP_MANIFEST_FORMAT_VERSION,
+    HELP_MANIFEST_PATH,
+    HELP_WIDTH,
+)
+
+logger = logging.getLogger("panflow")
+
+# Format version of the command manifest
+MANIFEST_FORMAT_VERSION = 1
+
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "command_manifest.json")
+
+
+class LazyCommand:
+    """A top-level command whose module is imported on first use."""
+
+    __slots__ = ("name", "target", "modules")
+
+    def __init__(self, name: str, target: str, modules: Sequence[str] = ()):
+        """
+        Declare a lazily loaded command.
+
+        Args:
+            name: Command name on the command line
+            target: ``module:attribute`` of the Typer app or command function
+            modules: Modules to import first because they register commands on the target
+        """
+        self.name = name
+        self.target = target
+        self.modules = tuple(modules)
+
+    def load(self) -> click.Command:
+        """
+        Import the command's modules and build its Click command.
+
+        Returns:
+            Click group for a Typer app, or Click command for a function
+        """
+        for module in self.modules:
+            importlib.import_module(module)
+        module_name, attribute = self.target.split(":")
+        target = getattr(importlib.import_module(module_name), attribute)
+
+        if isinstance(target, typer.Typer):
+            command = typer.main.get_group(target)
+        else:
+            from .app import app
+
+            # Reuse the registration of the command module to keep its settings
+            wrapper = typer.Typer(add_completion=False)
+            wrapper.registered_commands = [
+                info for info in app.registered_commands if info.callback is target
+            ][:1]
+            if not wrapper.registered_commands:
+                wrapper.command(self.name)(target)
+            command = typer.main.get_command(wrapper)
+        command.name = self.name
+        return command
+
+
+# Top-level commands of the panflow CLI
+COMMANDS: Dict[str, LazyCommand] = {
+    command.name: command
+    for command in (
+        LazyCommand("__complete", "panflow.cli.commands.completion_commands:complete"),
+        LazyCommand("api", "panflow.cli.commands.serve_commands:api"),
+        LazyCommand("batch", "panflow.cli.commands.batch_commands:batch"),
+        LazyCommand("cleanup", "panflow.cli.commands.cleanup_commands:cleanup_app"),
+        LazyCommand("completion", "panflow.cli.commands.completion_commands:completion_app"),
+        LazyCommand(
+            "config", "panflow.cli.app:config_app", modules=["panflow.cli.commands.config_commands"]
+        ),
+        LazyCommand("deduplicate", "panflow.cli.commands.deduplicate_commands:deduplicate_app"),
+        LazyCommand("group", "panflow.cli.app:group_app"),
+        LazyCommand(
+            "merge", "panflow.cli.app:merge_app", modules=["panflow.cli.commands.merge_commands"]
+        ),
+        LazyCommand("nlq", "panflow.cli.commands.nlq_commands:nlq_app"),
+        LazyCommand(
+            "object", "panflow.cli.app:object_app", modules=["panflow.cli.commands.object_commands"]
+        ),
+        LazyCommand("pipeline", "panflow.cli.commands.pipeline_commands:pipeline_app"),
+        LazyCommand(
+            "policy",
+            "panflow.cli.app:policy_app",
+            modules=["panflow.cli.commands.policy_commands", "panflow.cli.commands.nat_commands"],
+        ),
+        LazyCommand("query", "panflow.cli.commands.query_commands:app"),
+        LazyCommand("serve", "panflow.cli.commands.serve_commands:serve"),
+        LazyCommand(
+            "report", "panflow.cli.app:report_app", modules=["panflow.cli.commands.report_commands"]
+        ),
+    )
+}
+
+_manifest: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def build_manifest() -> Dict[str, Any]:
+    """
+    Build the command manifest by loading every declared command.
+
+    Returns:
+        Manifest with the help texts of the top-level commands
+    """
+    commands = {}
+    for name, declaration in sorted(COMMANDS.items()):
+        command = declaration.load()
+        commands[name] = {
+            "help": command.help,
+            "short_help": command.short_help,
+            "hidden": command.hidden,
+        }
+    return {"format_version": MANIFEST_FORMAT_VERSION, "commands": commands}
+
+
+def write_manifest(path: str = MANIFEST_PATH) -> Dict[str, Any]:
+    """
+    Generate the command manifest and write it to a file.
+
+    Args:
+        path: Path of the manifest file
+
+    Returns:
+        The manifest written
+    """
+    manifest = build_manifest()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return manifest
+
+
+def build_help_manifest() -> Dict[str, Any]:
+    """
+    Build the help manifest by rendering the help of every command group.
+
+    The help pages are rendered from the CLI app, without colors, for a
+    terminal of :data:`~panflow.core.help_manifest.HELP_WIDTH` columns.
+
+    Returns:
+        Manifest with the version output and the help pages keyed by command path
+
+    Raises:
+        RuntimeError: If rendering a help page fails
+    """
+    import typer.rich_utils
+    from typer.testing import CliRunner
+
+    from .app import app
+
+    runner = CliRunner()
+
+    def render(args: List[str]) -> str:
+        result = runner.invoke(app, args, prog_name="panflow")
+        if result.exit_code != 0:
+            raise RuntimeError(f"panflow {' '.join(args)} failed: {result.output}")
+        return result.output
+
+    pages: Dict[str, Dict[str, Any]] = {}
+
+    def visit(group: click.Group, path: List[str]) -> None:
+        pages[" ".join(path)] = {
+            "help": render(path + ["--help"]),
+            "no_args_is_help": group.no_args_is_help,
+        }
+        ctx = click.Context(group, info_name=path[-1] if path else "panflow")
+        for name in group.list_commands(ctx):
+            command = group.get_command(ctx, name)
+            if isinstance(command, click.Group) and not command.hidden:
+                visit(command, path + [name])
+
+    saved = typer.rich_utils.MAX_WIDTH, typer.rich_utils.FORCE_TERMINAL
+    typer.rich_utils.MAX_WIDTH, typer.rich_utils.FORCE_TERMINAL = HELP_WIDTH, False
+    try:
+        visit(typer.main.get_command(app), [])
+        version_output = render(["--version"])
+    finally:
+        typer.rich_utils.MAX_WIDTH, typer.rich_utils.FORCE_TERMINAL = saved
+
+    return {
+        "format_version": HELP_MANIFEST_FORMAT_VERSION,
+        "version_output": version_output,
+        "pages": pages,
+    }
+
+
+def write_help_manifest(path: str = HELP_MANIFEST_PATH) -> Dict[str, Any]:
+    """
+    Generate the help manifest and write it to a file.
+
+    Args:
+        path: Path of the manifest file
+
+    Returns:
+        The manifest written
+    """
+    manifest = build_help_manifest()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+    return manifest
+
+
+def load_manifest() -> Dict[str, Dict[str, Any]]:
+    """
+    Get the help texts of the top-level commands.
+
+    The generated manifest is read once per process. If it is missing or does
+    not describe the declared commands, it is rebuilt in memory by loading
+    the commands.
+
+    Returns:
+        Help entries keyed by command name
+    """
+    global _manifest
+    if _manifest is None:
+        commands = None
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("format_version") == MANIFEST_FORMAT_VERSION:
+                commands = manifest.get("commands")
+        except (OSError, ValueError) as e:
+            logger.debug(f"Cannot read command manifest {MANIFEST_PATH}: {e}")
+
+        if not isinstance(commands, dict) or set(commands) != set(COMMANDS):
+            logger.debug("Command manifest is out of date; loading all commands")
+            commands = build_manifest()["commands"]
+        _manifest = commands
+    return _manifest
+
+
+class LazyGroup(TyperGroup):
+    """
+    Typer group that loads declared commands when they are dispatched.
+
+    Commands registered on the Typer app directly are used as usual. While
+    help is formatted or command names are completed, declared commands
+    that are not loaded yet are stood in for by their manifest entries.
+    Command lines from the shell are forwarded to the PANFlow daemon when
+    one is running.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._listing = False
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(COMMANDS))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+
+        declaration = COMMANDS.get(cmd_name)
+        if declaration is None:
+            return None
+
+        if self._listing:
+            entry = load_manifest().get(cmd_name)
+            if entry is not None:
+                return click.Command(
+                    cmd_name,
+                    help=entry["help"],
+                    short_help=entry["short_help"],
+                    hidden=entry["hidden"],
+                )
+
+        command = declaration.load()
+        self.add_command(command, cmd_name)
+        return command
+
+    def main(self, args: Optional[Sequence[str]] = None, *main_args: Any, **kwargs: Any) -> Any:
+        if args is None:
+            # Run the command line in the PANFlow daemon if one is listening
+            from panflow.core.daemon import forward_command
+
+            exit_code = forward_command(sys.argv[1:])
+            if exit_code is not None:
+                sys.exit(exit_code)
+        return super().main(args, *main_args, **kwargs)
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._listing = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+    def shell_complete(self, ctx: click.Context, incomplete: str) -> List[Any]:
+        self._listing = True
+        try:
+            return super().shell_complete(ctx, incomplete)
+        finally:
+            self._listing = False
+
+
+if __name__ == "__main__":
+    written = write_manifest()
+    print(f"Wrote {len(written['commands'])} commands to {MANIFEST_PATH}")
+    written = write_help_manifest()
+    print(f"Wrote {len(written['pages'])} help pages to {HELP_MANIFEST_PATH}")
@@ -0,0 +1,649 @@
+"""
+Local HTTP/JSON API for PANFlow.
+
+``panflow api`` serves :class:`panflow.PANFlowConfig` operations over HTTP on
+the local machine, so automation can call PANFlow without starting a process
+per command. The server is built on asyncio and the standard library only.
+
+Every request is a ``POST /v1/<operation>`` with a JSON object naming the
+configuration file as ``"config"`` and the operation's parameters; ``GET
+/v1/status`` describes the server. Responses carry the configuration's
+``revision``, which starts at 1 when the file is loaded and grows with every
+write.
+
+Requests must carry ``Authorization: Bearer <token>``, with the token read
+from a file only its owner can read (see :func:`token_path`), and POST bodies
+must be sent as ``Content-Type: application/json``. Requests with an
+``Origin`` header or addressed to a host name other than the loopback address
+or the address the server listens on are rejected, so web pages open in a
+browser cannot reach the API, neither directly nor through DNS rebinding.
+
+Configurations stay loaded between requests and the operations run in a
+worker thread pool, keeping the event loop free for other requests:
+
+- Identical read requests against the same revision of a configuration are
+  coalesced: concurrent callers share one execution and its result.
+- Writes go through a per-configuration queue and are applied one at a time
+  to a copy of the configuration, which replaces the current one when the
+  write succeeds. Reads are never blocked by writes and never see a
+  half-applied write. A write may pass ``expected_revision``; it is rejected
+  with 409 Conflict if the configuration has changed since.
+- Successful writes are saved to the configuration file if the server was
+  started with saving enabled. A write may pass ``"save": false`` to keep its
+  change in memory only; it cannot turn saving on.
+"""
+
+import asyncio
+import copy
+import hmac
+import json
+import logging
+import os
+import secrets
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .exceptions import PANFlowError
+
+logger = logging.getLogger("panflow")
+
+API_PREFIX = "/v1/"
+
+# Largest request body accepted, in bytes
+MAX_REQUEST_SIZE = 16 * 1024 * 1024
+
+# Request parameters selecting the configuration context
+CONTEXT_PARAMETERS = ("device_group", "vsys", "template")
+
+# Host names a request may be addressed to, besides the address the server listens on
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+    415: "Unsupported Media Type",
+    422: "Unprocessable Entity",
+    500: "Internal Server Error",
+}
+
+
+class APIError(PANFlowError):
+    """Exception raised for API requests that cannot be served."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def token_path() -> str:
+    """
+    Get the path of the API token file.
+
+    The PANFLOW_API_TOKEN_FILE environment variable overrides the default
+    location in the user runtime directory.
+
+    Returns:
+        Token file path
+    """
+    path = os.environ.get("PANFLOW_API_TOKEN_FILE")
+    if not path:
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(
+            os.path.expanduser("~"), ".cache", "panflow"
+        )
+        path = os.path.join(runtime_dir, "panflow-api.token")
+    return path
+
+
+def load_token(path: str, create: bool = False) -> str:
+    """
+    Read the API token from a file only its owner can read.
+
+    Args:
+        path: Token file path
+        create: Whether to create the file with a new random token if it is missing
+
+    Returns:
+        The token
+
+    Raises:
+        APIError: If the file is missing, empty or readable by other users
+    """
+    if create and not os.path.exists(path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(secrets.token_urlsafe(32) + "\n")
+        logger.info(f"Created API token file {path}")
+
+    try:
+        mode = os.stat(path).st_mode
+        with open(path, encoding="utf-8") as f:
+            token = f.read().strip()
+    except OSError as e:
+        raise APIError(f"Cannot read API token file {path}: {e}")
+    if mode & (stat.S_IRWXG | stat.S_IRWXO):
+        raise APIError(f"API token file {path} must only be accessible by its owner (chmod 600)")
+    if not token:
+        raise APIError(f"API token file {path} is empty")
+    return token
+
+
+def _require(params: Dict[str, Any], name: str) -> Any:
+    if params.get(name) in (None, ""):
+        raise APIError(f"Missing parameter: {name}")
+    return params[name]
+
+
+def _context(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: params[name] for name in CONTEXT_PARAMETERS if params.get(name)}
+
+
+def _get_objects(config, params: Dict[str, Any]) -> Any:
+    return config.get_objects(
+        _require(params, "object_type"), params.get("context_type", "shared"), **_context(params)
+    )
+
+
+def _get_policies(config, params: Dict[str, Any]) -> Any:
+    return config.get_policies(
+        _require(params, "policy_type"), params.get("context_type", "shared"), **_context(params)
+    )
+
+
+def _filter_objects(config, params: Dict[str, Any]) -> Any:
+    return config.filter_objects(
+        _require(params, "object_type"),
+        _require(params, "criteria"),
+        params.get("context_type", "shared"),
+        **_context(params),
+    )
+
+
+def _find_duplicates(config, params: Dict[str, Any]) -> Any:
+    if params.get("by", "value") == "name":
+        duplicates = config.find_duplicate_object_names()
+        return {
+            object_type: {
+                name: [location.to_dict() for location in locations]
+                for name, locations in names.items()
+            }
+            for object_type, names in duplicates.items()
+        }
+    duplicates = config.find_duplicate_object_values(params.get("object_type", "address"))
+    return {
+        value: [location.to_dict() for location in locations]
+        for value, locations in duplicates.items()
+    }
+
+
+def _query(config, params: Dict[str, Any], graphs) -> Any:
+    return graphs.execute_custom_query(
+        config.tree,
+        _require(params, "query"),
+        device_type=config.device_type,
+        context_type=params.get("context_type"),
+        **_context(params),
+    )
+
+
+def _add_object(config, params: Dict[str, Any]) -> Any:
+    return config.add_object(
+        _require(params, "object_type"),
+        _require(params, "name"),
+        _require(params, "properties"),
+        params.get("context_type", "shared"),
+        **_context(params),
+    )
+
+
+def _update_object(config, params: Dict[str, Any]) -> Any:
+    return config.update_object(
+        _require(params, "object_type"),
+        _require(params, "name"),
+        _require(params, "properties"),
+        params.get("context_type", "shared"),
+        **_context(params),
+    )
+
+
+def _delete_object(config, params: Dict[str, Any]) -> Any:
+    return config.delete_object(
+        _require(params, "object_type"),
+        _require(params, "name"),
+        params.get("context_type", "shared"),
+        **_context(params),
+    )
+
+
+def _bulk_update(config, params: Dict[str, Any]) -> Any:
+    from .bulk_operations import ConfigUpdater
+
+    updater = ConfigUpdater(
+        config.tree,
+        config.device_type,
+        params.get("context_type", "shared"),
+        config.version,
+        **_context(params),
+    )
+    updated = updater.bulk_update_policies(
+        _require(params, "policy_type"),
+        criteria=params.get("criteria"),
+        operations=_require(params, "operations"),
+        query_filter=params.get("query_filter"),
+    )
+    return {"updated": updated}
+
+
+# Operations that only read the configuration
+READ_OPERATIONS: Dict[str, Callable] = {
+    "get_objects": _get_objects,
+    "get_policies": _get_policies,
+    "filter_objects": _filter_objects,
+    "find_duplicates": _find_duplicates,
+    "query": _query,
+}
+
+# Operations that modify the configuration
+WRITE_OPERATIONS: Dict[str, Callable] = {
+    "add_object": _add_object,
+    "update_object": _update_object,
+    "delete_object": _delete_object,
+    "bulk_update": _bulk_update,
+}
+
+
+def _file_stamp(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class _ConfigState:
+    """A loaded configuration, its revision and its pending work."""
+
+    def __init__(self, path: str, config, stamp: Tuple[int, int]):
+        from .graph_service import GraphService
+
+        self.path = path
+        self.config = config
+        self.stamp = stamp
+        self.revision = 1
+        self.graphs = GraphService()
+        self.reads: Dict[Tuple, asyncio.Future] = {}
+        self.writes: asyncio.Queue = asyncio.Queue()
+        self.writer: Optional[asyncio.Task] = None
+
+    def replace(self, config) -> None:
+        from .graph_service import GraphService
+
+        self.config = config
+        self.revision += 1
+        self.graphs = GraphService()
+
+
+class PANFlowAPI:
+    """PANFlowConfig operations for concurrent asyncio callers."""
+
+    def __init__(self, workers: Optional[int] = None, save: bool = True):
+        """
+        Initialize the API.
+
+        Args:
+            workers: Number of worker threads running operations (default: executor default)
+            save: Whether successful writes are saved back to the configuration file
+        """
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="panflow-api")
+        self.save = save
+        self.started = time.time()
+        self._states: Dict[str, _ConfigState] = {}
+        self._loading: Dict[str, asyncio.Future] = {}
+        self.stats = {"requests": 0, "executed": 0, "coalesced": 0, "writes": 0, "conflicts": 0}
+
+    async def _run(self, function: Callable, *args) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    async def _state(self, config_file: str) -> _ConfigState:
+        """Get the loaded state of a configuration, loading the file once."""
+        path = os.path.abspath(config_file)
+        if not os.path.isfile(path):
+            raise APIError(f"Configuration file not found: {config_file}", 404)
+
+        state = self._states.get(path)
+        writing = state is not None and state.writer is not None and not state.writer.done()
+        # Files changed by someone else are reloaded unless a write is in progress
+        if state is not None and (writing or _file_stamp(path) == state.stamp):
+            return state
+
+        loading = self._loading.get(path)
+        if loading is None:
+            loading = asyncio.ensure_future(self._load(path, state))
+            self._loading[path] = loading
+            loading.add_done_callback(lambda _: self._loading.pop(path, None))
+        return await asyncio.shield(loading)
+
+    async def _load(self, path: str, state: Optional[_ConfigState]) -> _ConfigState:
+        from panflow import PANFlowConfig
+
+        stamp = _file_stamp(path)
+        config = await self._run(lambda: PANFlowConfig(config_file=path))
+        if state is None:
+            state = _ConfigState(path, config, stamp)
+            self._states[path] = state
+        else:
+            logger.info(f"Configuration {path} changed on disk, reloading it")
+            state.replace(config)
+            state.stamp = stamp
+        return state
+
+    async def call(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run an operation.
+
+        Args:
+            operation: Name of a read or write operation
+            params: Operation parameters, including the "config" file path
+
+        Returns:
+            Dict with the configuration "revision" and the operation's "result"
+
+        Raises:
+            APIError: If the request is invalid or conflicts with another write
+        """
+        self.stats["requests"] += 1
+        if operation not in READ_OPERATIONS and operation not in WRITE_OPERATIONS:
+            raise APIError(f"Unknown operation: {operation}", 404)
+        state = await self._state(_require(params, "config"))
+        if operation in READ_OPERATIONS:
+            return await self._read(state, operation, params)
+        return await self._write(state, operation, params)
+
+    async def _read(
+        self, state: _ConfigState, operation: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        key = (operation, json.dumps(params, sort_keys=True, default=str), state.revision)
+        pending = state.reads.get(key)
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(pending)
+
+        config, graphs, revision = state.config, state.graphs, state.revision
+        function = READ_OPERATIONS[operation]
+        args = (config, params, graphs) if operation == "query" else (config, params)
+
+        def execute() -> Dict[str, Any]:
+            return {"revision": revision, "result": function(*args)}
+
+        pending = asyncio.ensure_future(self._run(execute))
+        state.reads[key] = pending
+        pending.add_done_callback(lambda _: state.reads.pop(key, None))
+        self.stats["executed"] += 1
+        return await asyncio.shield(pending)
+
+    async def _write(
+        self, state: _ConfigState, operation: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        done = asyncio.get_running_loop().create_future()
+        await state.writes.put((operation, params, done))
+        if state.writer is None or state.writer.done():
+            state.writer = asyncio.ensure_future(self._apply_writes(state))
+        return await done
+
+    async def _apply_writes(self, state: _ConfigState) -> None:
+        """Apply the queued writes of a configuration one at a time."""
+        while not state.writes.empty():
+            operation, params, done = await state.writes.get()
+            try:
+                done.set_result(await self._apply(state, operation, params))
+            except Exception as e:
+                done.set_exception(e)
+            finally:
+                state.writes.task_done()
+
+    async def _apply(
+        self, state: _ConfigState, operation: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        expected = params.get("expected_revision")
+        if expected is not None and expected != state.revision:
+            self.stats["conflicts"] += 1
+            raise APIError(f"Configuration is at revision {state.revision}, not {expected}", 409)
+
+        function = WRITE_OPERATIONS[operation]
+        # A client may skip saving a write, but not save on a server started without saving
+        save = self.save and params.get("save", True) is not False
+
+        def execute() -> Tuple[Any, Any, Optional[Tuple[int, int]]]:
+            config = copy.copy(state.config)
+            config.tree = copy.deepcopy(state.config.tree)
+            config.root = config.tree.getroot()
+            result = function(config, params)
+            if result is False:
+                raise APIError(f"{operation} made no changes", 422)
+            stamp = None
+            if save:
+                if not config.save(state.path):
+                    raise APIError(f"Could not save {state.path}", 500)
+                stamp = _file_stamp(state.path)
+            return config, result, stamp
+
+        config, result, stamp = await self._run(execute)
+        state.replace(config)
+        if stamp is not None:
+            state.stamp = stamp
+        self.stats["writes"] += 1
+        return {"revision": state.revision, "result": result}
+
+    def status(self) -> Dict[str, Any]:
+        """Get the server statistics and the loaded configurations."""
+        return {
+            "pid": os.getpid(),
+            "uptime": time.time() - self.started,
+            "operations": {"read": sorted(READ_OPERATIONS), "write": sorted(WRITE_OPERATIONS)},
+            "configs": [
+                {
+                    "path": state.path,
+                    "revision": state.revision,
+                    "pending_writes": state.writes.qsize(),
+                }
+                for state in self._states.values()
+            ],
+            **self.stats,
+        }
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        self.executor.shutdown(wait=False)
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    """Read one HTTP request, returning its method, path, headers and body."""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, target, _ = request_line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise APIError("Malformed request line")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length") or 0)
+    if length > MAX_REQUEST_SIZE:
+        raise APIError("Request body too large", 413)
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target.split("?", 1)[0], headers, body
+
+
+def _host_name(host: str) -> str:
+    """Get the host name of a Host header, without the port and IPv6 brackets."""
+    if host.startswith("["):
+        return host[1:].partition("]")[0]
+    return host.rpartition(":")[0] if host.count(":") == 1 else host
+
+
+def _response(status: int, payload: Dict[str, Any]) -> bytes:
+    body = json.dumps(payload, default=str).encode("utf-8")
+    authenticate = "WWW-Authenticate: Bearer\r\n" if status == 401 else ""
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"{authenticate}"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+class APIServer:
+    """HTTP front end of a :class:`PANFlowAPI`."""
+
+    def __init__(
+        self,
+        api: PANFlowAPI,
+        host: str = "127.0.0.1",
+        port: int = 8780,
+        token: Optional[str] = None,
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            api: API serving the operations
+            host: Address to listen on
+            port: TCP port to listen on, or 0 for any free port
+            token: Bearer token requests must carry; None accepts requests without one
+        """
+        self.api = api
+        self.host = host
+        self.port = port
+        self.token = token
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    def check_request(self, method: str, headers: Dict[str, str]) -> None:
+        """
+        Reject requests that may come from a browser or lack the API token.
+
+        Raises:
+            APIError: If the request is not allowed
+        """
+        if "origin" in headers:
+            raise APIError("Cross-origin requests are not allowed", 403)
+        if _host_name(headers.get("host", "")).lower() not in (*LOOPBACK_HOSTS, self.host):
+            raise APIError(f"Requests to host {headers.get('host')!r} are not allowed", 403)
+        if self.token is not None:
+            scheme, _, token = headers.get("authorization", "").partition(" ")
+            if scheme.lower() != "bearer" or not hmac.compare_digest(
+                token.strip().encode(), self.token.encode()
+            ):
+                raise APIError("Missing or invalid API token", 401)
+        if method == "POST":
+            content_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+            if content_type != "application/json":
+                raise APIError("Request body must be sent as application/json", 415)
+
+    async def handle(
+        self, method: str, path: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        Handle one HTTP request.
+
+        Returns:
+            Tuple of (HTTP status, JSON payload)
+        """
+        self.check_request(method, headers)
+        if not path.startswith(API_PREFIX):
+            raise APIError(f"Not found: {path}", 404)
+        operation = path[len(API_PREFIX) :]
+        if operation == "status":
+            return 200, self.api.status()
+        if method != "POST":
+            raise APIError(f"{operation} requires POST", 405)
+        try:
+            params = json.loads(body or b"{}")
+        except ValueError as e:
+            raise APIError(f"Invalid JSON: {e}")
+        if not isinstance(params, dict):
+            raise APIError("Request body must be a JSON object")
+        return 200, await self.api.call(operation, params)
+
+    async def _connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await _read_request(reader)
+            if request is None:
+                return
+            status, payload = await self.handle(*request)
+        except APIError as e:
+            status, payload = e.status, {"error": str(e)}
+        except (PANFlowError, ValueError, KeyError, TypeError) as e:
+            status, payload = 422, {"error": f"{type(e).__name__}: {e}"}
+        except (ConnectionError, asyncio.IncompleteReadError):
+            writer.close()
+            return
+        except Exception as e:
+            logger.exception("API request failed")
+            status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+        try:
+            writer.write(_response(status, payload))
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def start(self) -> None:
+        """Start listening; with port 0 the chosen port is stored in ``port``."""
+        self.server = await asyncio.start_server(self._connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve(self) -> None:
+        """Listen and serve requests until cancelled."""
+        if self.server is None:
+            await self.start()
+        logger.info(f"PANFlow API listening on http://{self.host}:{self.port}{API_PREFIX}")
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            self.api.close()
+
+
+def serve_api(
+    host: str = "127.0.0.1",
+    port: int = 8780,
+    workers: Optional[int] = None,
+    save: bool = True,
+    token_file: Optional[str] = None,
+) -> None:
+    """
+    Run the PANFlow API server until interrupted.
+
+    Args:
+        host: Address to listen on
+        port: TCP port to listen on
+        workers: Number of worker threads running operations
+        save: Whether successful writes are saved back to the configuration files
+        token_file: File holding the API token, created if missing (default: token_path())
+
+    Raises:
+        APIError: If the token file cannot be used
+    """
+    path = token_file or token_path()
+    token = load_token(path, create=True)
+    logger.info(f"API requests must send 'Authorization: Bearer <token>' with the token in {path}")
+    server = APIServer(PANFlowAPI(workers=workers, save=save), host, port, token=token)
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
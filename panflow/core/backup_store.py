@@ -0,0 +1,471 @@
+"""
+Content-addressed backup store for PANFlow.
+
+This module stores configuration backups as a list of content-addressed
+chunks instead of full file copies. Each backup is split at configuration
+section boundaries (top-level sections, device groups, vsys, templates and
+their object/rulebase sections), every chunk is hashed with SHA-256, and only
+chunks that are not already in the store are written, compressed with zlib.
+A small JSON manifest per backup records the ordered chunk list, so any prior
+version can be rebuilt byte-for-byte on demand.
+
+Large sections such as rulebases are split further before entries chosen by
+a hash of the entry name, not by position, so adding or removing one entry
+only changes the chunks around it.
+
+Backing up touches the chunks it reuses, and garbage collection leaves chunks
+modified within ``GC_MIN_AGE`` seconds in place, so a collection running
+while another process adds a backup does not delete chunks that backup uses.
+
+Store layout::
+
+    <root>/objects/<hash[:2]>/<hash>    zlib-compressed chunk
+    <root>/manifests/<file>/<version>.json
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .exceptions import PANFlowError
+
+logger = logging.getLogger("panflow")
+
+# Chunks larger than this are split further at the next entry boundary
+DEFAULT_MAX_CHUNK_SIZE = 1024 * 1024
+
+# Large sections are cut into chunks of max_chunk_size / AVERAGE_CHUNK_RATIO on average
+AVERAGE_CHUNK_RATIO = 4
+
+# Seconds since their last use before unreferenced chunks are garbage collected
+GC_MIN_AGE = 3600
+
+COMPRESSION_LEVEL = 6
+
+# Markup that is not an element tag and must be skipped while scanning
+_TAG_PATTERN = re.compile(
+    rb"<!--.*?-->|<!\[CDATA\[.*?\]\]>|<[?!][^>]*>"
+    rb"|<(/?)([^\s/>]+)(?:[^>\"']|\"[^\"]*\"|'[^']*')*?(/?)>",
+    re.DOTALL,
+)
+
+# Containers whose direct children start a new chunk
+_SECTION_CONTAINERS = {
+    ("config",),
+    ("config", "devices", "entry"),
+    ("config", "shared"),
+}
+
+# Context containers whose entries, and the sections inside them, start new chunks
+_CONTEXT_TAGS = {"device-group", "vsys", "template", "template-stack"}
+
+_NAME_PATTERN = re.compile(rb"""\sname\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+
+
+class BackupStoreError(PANFlowError):
+    """Exception raised when a backup store operation fails."""
+
+    pass
+
+
+def _is_boundary(path: Tuple[str, ...]) -> bool:
+    """Check whether an element whose parent path is ``path`` starts a chunk."""
+    if path in _SECTION_CONTAINERS:
+        return True
+    if len(path) >= 2 and path[-1] in _CONTEXT_TAGS:
+        return True
+    if len(path) >= 3 and path[-1] == "entry" and path[-2] in _CONTEXT_TAGS:
+        return True
+    return False
+
+
+def _is_entry_cut(start_tag: bytes, entry_size: int, average_size: int) -> bool:
+    """
+    Check whether a chunk boundary falls before an entry inside a section.
+
+    The decision depends only on the entry's name and the size of the entry
+    before it: an entry is chosen with probability ``entry_size / average_size``
+    using a hash of its name, so cuts land every ``average_size`` bytes on
+    average and stay before the same entries when other entries change.
+    """
+    match = _NAME_PATTERN.search(start_tag)
+    name = (match.group(1) or match.group(2)) if match else start_tag
+    digest = int.from_bytes(hashlib.blake2b(name, digest_size=4).digest(), "big")
+    return digest * average_size < entry_size << 32
+
+
+def split_config_chunks(data: bytes, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE) -> List[bytes]:
+    """
+    Split raw configuration bytes at section boundaries.
+
+    The chunks always concatenate back to the original bytes. Boundaries fall
+    before the start tag of each top-level section, each device group, vsys or
+    template entry, and each section inside those entries. Inside sections,
+    boundaries also fall before entries selected by a hash of their name (see
+    ``_is_entry_cut``), so large object or rule sections are spread over chunks
+    of ``max_chunk_size / AVERAGE_CHUNK_RATIO`` bytes on average whose
+    boundaries do not move when entries are added or removed elsewhere. A chunk
+    that still grows past ``max_chunk_size`` is cut before the next entry.
+
+    Args:
+        data: Raw configuration bytes
+        max_chunk_size: Size after which any entry boundary starts a new chunk
+
+    Returns:
+        List of chunks
+    """
+    cuts = [0]
+    stack: List[str] = []
+    average_size = max(1, max_chunk_size // AVERAGE_CHUNK_RATIO)
+    # Start offset of the last entry seen at each nesting depth
+    entry_starts: Dict[int, int] = {}
+
+    for match in _TAG_PATTERN.finditer(data):
+        closing, tag, self_closing = match.group(1), match.group(2), match.group(3)
+        if tag is None:
+            continue
+        tag = tag.decode("utf-8", "replace")
+
+        if closing:
+            if stack:
+                stack.pop()
+            # Entries of the next container are not measured from this one's
+            entry_starts.pop(len(stack) + 1, None)
+            continue
+
+        start = match.start()
+        previous_entry = entry_starts.get(len(stack)) if tag == "entry" else None
+        if tag == "entry":
+            entry_starts[len(stack)] = start
+        if start > cuts[-1]:
+            # Cut at the start of the line so indentation stays with its element
+            line_start = data.rfind(b"\n", cuts[-1], start) + 1 or start
+            cut = line_start if data[line_start:start].strip() == b"" else start
+            if cut > cuts[-1] and (
+                _is_boundary(tuple(stack))
+                or (tag == "entry" and cut - cuts[-1] >= max_chunk_size)
+                or (
+                    previous_entry is not None
+                    and _is_entry_cut(match.group(0), start - previous_entry, average_size)
+                )
+            ):
+                cuts.append(cut)
+
+        if not self_closing:
+            stack.append(tag)
+
+    cuts.append(len(data))
+    return [data[a:b] for a, b in zip(cuts, cuts[1:]) if b > a]
+
+
+class BackupStore:
+    """
+    A content-addressed, deduplicating store of configuration backups.
+
+    Versions are identified by a timestamp string. Each stored file name has its
+    own list of versions; chunks are shared across all files and versions.
+    """
+
+    def __init__(self, root_dir: str, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE):
+        """
+        Initialize the backup store.
+
+        Args:
+            root_dir: Directory that holds the store
+            max_chunk_size: Size after which entry boundaries also start new chunks
+        """
+        self.root_dir = os.path.abspath(root_dir)
+        self.objects_dir = os.path.join(self.root_dir, "objects")
+        self.manifests_dir = os.path.join(self.root_dir, "manifests")
+        self.max_chunk_size = max_chunk_size
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.manifests_dir, exist_ok=True)
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def _manifest_path(self, name: str, version: str) -> str:
+        return os.path.join(self.manifests_dir, name, f"{version}.json")
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp{os.getpid()}"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def _write_chunk(self, digest: str, chunk: bytes) -> bool:
+        """Store a chunk unless it exists, marking an existing chunk as recently used."""
+        object_path = self._object_path(digest)
+        try:
+            os.utime(object_path)
+            return False
+        except FileNotFoundError:
+            self._write_atomic(object_path, zlib.compress(chunk, COMPRESSION_LEVEL))
+            return True
+
+    def add(self, file_path: str, name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Back up a file into the store.
+
+        Args:
+            file_path: Path of the file to back up
+            name: Name to store the backup under (defaults to the file's base name)
+
+        Returns:
+            The manifest of the new backup version
+
+        Raises:
+            BackupStoreError: If the file cannot be read or the store cannot be written
+        """
+        name = name or os.path.basename(file_path)
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            raise BackupStoreError(f"Failed to read {file_path} for backup: {e}")
+
+        chunks = split_config_chunks(data, self.max_chunk_size)
+        digests = []
+        new_chunks = 0
+        new_bytes = 0
+
+        try:
+            for chunk in chunks:
+                digest = hashlib.sha256(chunk).hexdigest()
+                digests.append(digest)
+                if self._write_chunk(digest, chunk):
+                    new_chunks += 1
+                    new_bytes += os.path.getsize(self._object_path(digest))
+
+            version = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            while os.path.exists(self._manifest_path(name, version)):
+                version = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+
+            manifest = {
+                "name": name,
+                "version": version,
+                "source": os.path.abspath(file_path),
+                "created": datetime.now().isoformat(),
+                "size": len(data),
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "chunks": digests,
+            }
+            self._write_atomic(
+                self._manifest_path(name, version), json.dumps(manifest, indent=2).encode("utf-8")
+            )
+            # A garbage collection that started before the manifest was written
+            # may have deleted a reused chunk after it was checked
+            for digest, chunk in zip(digests, chunks):
+                if not os.path.exists(self._object_path(digest)):
+                    self._write_chunk(digest, chunk)
+        except OSError as e:
+            raise BackupStoreError(f"Failed to write backup of {file_path}: {e}")
+
+        logger.debug(
+            f"Backed up {file_path} as {name}@{version}: {len(chunks)} chunks, "
+            f"{new_chunks} new ({new_bytes} bytes stored)"
+        )
+        return manifest
+
+    def list_versions(self, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List stored backup versions, oldest first.
+
+        Args:
+            name: Only list versions of this file name
+
+        Returns:
+            List of manifests
+        """
+        if name is not None:
+            names = [name]
+        elif os.path.isdir(self.manifests_dir):
+            names = os.listdir(self.manifests_dir)
+        else:
+            names = []
+
+        manifests = []
+        for file_name in names:
+            directory = os.path.join(self.manifests_dir, file_name)
+            if not os.path.isdir(directory):
+                continue
+            for manifest_file in os.listdir(directory):
+                if not manifest_file.endswith(".json"):
+                    continue
+                with open(os.path.join(directory, manifest_file), "r") as f:
+                    manifests.append(json.load(f))
+
+        manifests.sort(key=lambda m: (m["version"], m["name"]))
+        return manifests
+
+    def get_manifest(self, name: str, version: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get the manifest of a backup version.
+
+        Args:
+            name: Stored file name
+            version: Version to get (defaults to the latest)
+
+        Returns:
+            Manifest dictionary
+
+        Raises:
+            BackupStoreError: If the version does not exist
+        """
+        if version is None:
+            versions = self.list_versions(name)
+            if not versions:
+                raise BackupStoreError(f"No backups found for {name}")
+            return versions[-1]
+
+        path = self._manifest_path(name, version)
+        if not os.path.exists(path):
+            raise BackupStoreError(f"Backup {name}@{version} not found")
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def iter_chunks(self, name: str, version: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Yield the decompressed chunks of a backup version in order.
+
+        Args:
+            name: Stored file name
+            version: Version to read (defaults to the latest)
+
+        Yields:
+            Chunk bytes
+        """
+        manifest = self.get_manifest(name, version)
+        for digest in manifest["chunks"]:
+            try:
+                with open(self._object_path(digest), "rb") as f:
+                    yield zlib.decompress(f.read())
+            except (OSError, zlib.error) as e:
+                raise BackupStoreError(
+                    f"Backup {name}@{manifest['version']} is missing chunk {digest}: {e}"
+                )
+
+    def read(self, name: str, version: Optional[str] = None) -> bytes:
+        """
+        Rebuild the full contents of a backup version.
+
+        Args:
+            name: Stored file name
+            version: Version to rebuild (defaults to the latest)
+
+        Returns:
+            Original file bytes
+
+        Raises:
+            BackupStoreError: If the rebuilt content does not match the recorded hash
+        """
+        manifest = self.get_manifest(name, version)
+        data = b"".join(self.iter_chunks(name, manifest["version"]))
+        if hashlib.sha256(data).hexdigest() != manifest["sha256"]:
+            raise BackupStoreError(f"Backup {name}@{manifest['version']} failed verification")
+        return data
+
+    def restore(self, name: str, target_path: str, version: Optional[str] = None) -> str:
+        """
+        Rebuild a backup version into a file.
+
+        Args:
+            name: Stored file name
+            target_path: Path to write the rebuilt file to
+            version: Version to restore (defaults to the latest)
+
+        Returns:
+            The target path
+        """
+        data = self.read(name, version)
+        self._write_atomic(os.path.abspath(target_path), data)
+        return target_path
+
+    def remove_version(self, name: str, version: str) -> None:
+        """
+        Remove a backup version's manifest.
+
+        Chunks are left in place until ``collect_garbage`` runs.
+
+        Args:
+            name: Stored file name
+            version: Version to remove
+        """
+        path = self._manifest_path(name, version)
+        if os.path.exists(path):
+            os.remove(path)
+        directory = os.path.dirname(path)
+        if os.path.isdir(directory) and not os.listdir(directory):
+            os.rmdir(directory)
+
+    def collect_garbage(self, min_age: float = GC_MIN_AGE) -> int:
+        """
+        Delete chunks that are no longer referenced by any manifest.
+
+        Chunks written or reused by a backup within the last ``min_age``
+        seconds are kept even if unreferenced, as a backup being added
+        concurrently may not have written its manifest yet.
+
+        Args:
+            min_age: Seconds since their last use before unreferenced chunks are deleted
+
+        Returns:
+            Number of chunks deleted
+        """
+        referenced: Set[str] = set()
+        for manifest in self.list_versions():
+            referenced.update(manifest["chunks"])
+
+        deleted = 0
+        cutoff = time.time() - min_age
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            if not os.path.isdir(prefix_dir):
+                continue
+            for digest in os.listdir(prefix_dir):
+                if digest in referenced:
+                    continue
+                path = os.path.join(prefix_dir, digest)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        deleted += 1
+                except FileNotFoundError:
+                    pass
+
+        logger.debug(f"Backup store garbage collection removed {deleted} chunks")
+        return deleted
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get storage statistics.
+
+        Returns:
+            Dictionary with version and chunk counts, the logical size of all
+            versions and the bytes actually stored on disk
+        """
+        versions = self.list_versions()
+        chunk_count = 0
+        stored_bytes = 0
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            if os.path.isdir(prefix_dir):
+                for digest in os.listdir(prefix_dir):
+                    chunk_count += 1
+                    stored_bytes += os.path.getsize(os.path.join(prefix_dir, digest))
+
+        return {
+            "versions": len(versions),
+            "chunks": chunk_count,
+            "logical_bytes": sum(m["size"] for m in versions),
+            "stored_bytes": stored_bytes,
+        }
@@ -0,0 +1,539 @@
+"""
+Batch processing for PANFlow.
+
+This module runs a pipeline of PANFlow CLI commands over many configuration
+files from a single process pool. Each worker imports PANFlow once and then
+dispatches commands in-process, so the interpreter start-up and import cost is
+paid per worker instead of per command.
+
+A pipeline spec is a YAML file with a list of steps::
+
+    steps:
+      - command: cleanup unused-objects
+        options:
+          type: [address, service]
+          output: "{output_dir}/{stem}.cleaned.xml"
+          report-file: "{output_dir}/{stem}.unused.json"
+      - command: config export
+        options:
+          output: "{output_dir}/{stem}.jsonl"
+          format: jsonl
+
+Each step receives ``--config`` automatically. When a step declares an
+``output`` option and the file exists after the step, later steps use it as
+their input. Commands, option values and arguments may use the placeholders
+``{config}`` (current input), ``{input}`` (original file), ``{name}``,
+``{stem}``, ``{output_dir}`` and ``{step}``; write literal braces as ``{{``
+and ``}}``.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import shlex
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+from .exceptions import PANFlowError
+
+logger = logging.getLogger("panflow")
+
+CHECKPOINT_VERSION = 1
+
+# Placeholders available in pipeline step commands, options and arguments
+PLACEHOLDERS = ("config", "input", "name", "stem", "output_dir", "step")
+
+# Click command built from the Typer app, created once per process
+_cli_command = None
+
+
+class BatchError(PANFlowError):
+    """Exception raised when a batch pipeline cannot be run."""
+
+    pass
+
+
+def load_pipeline_spec(spec_file: str) -> List[Dict[str, Any]]:
+    """
+    Load and validate a pipeline spec.
+
+    Args:
+        spec_file: Path to the YAML pipeline spec
+
+    Returns:
+        List of step dictionaries with ``command``, ``options`` and ``args``
+
+    Raises:
+        BatchError: If the spec cannot be read or is invalid
+    """
+    try:
+        with open(spec_file, "r") as f:
+            text = f.read()
+    except OSError as e:
+        raise BatchError(f"Failed to load pipeline spec {spec_file}: {e}")
+    return parse_pipeline_spec(text, spec_file)
+
+
+def parse_pipeline_spec(text: str, source: str = "<string>") -> List[Dict[str, Any]]:
+    """
+    Parse and validate the text of a pipeline spec.
+
+    Besides the YAML spec format, the text may list one command line per
+    line, e.g. ``object list --type address``; blank lines and lines
+    starting with ``#`` are ignored.
+
+    Args:
+        text: YAML pipeline spec or command lines
+        source: Name of the spec in error messages
+
+    Returns:
+        List of step dictionaries with ``command``, ``options`` and ``args``
+
+    Raises:
+        BatchError: If the spec is invalid
+    """
+    try:
+        spec = yaml.safe_load(text)
+    except yaml.YAMLError as e:
+        raise BatchError(f"Failed to load pipeline spec {source}: {e}")
+
+    if isinstance(spec, str):
+        spec = [
+            line.strip()
+            for line in text.splitlines()
+            if line.strip() and not line.strip().startswith("#")
+        ]
+    steps = spec.get("steps") if isinstance(spec, dict) else spec
+    if not isinstance(steps, list) or not steps:
+        raise BatchError(f"Pipeline spec {source} must define a non-empty list of steps")
+
+    normalized = []
+    for index, step in enumerate(steps, 1):
+        if isinstance(step, str):
+            step = {"command": step}
+        if not isinstance(step, dict) or not step.get("command"):
+            raise BatchError(f"Step {index} in {source} must have a command")
+        options = step.get("options") or {}
+        args = step.get("args") or []
+        if not isinstance(options, dict) or not isinstance(args, list):
+            raise BatchError(f"Step {index} in {source} has invalid options or args")
+        for value in [step["command"], *_option_values(options), *args]:
+            try:
+                _substitute(value, {name: "" for name in PLACEHOLDERS})
+            except BatchError as e:
+                raise BatchError(f"Step {index} in {source}: {e}")
+        normalized.append({"command": str(step["command"]), "options": options, "args": args})
+
+    return normalized
+
+
+def _option_values(options: Dict[str, Any]) -> List[Any]:
+    values = []
+    for value in options.values():
+        values.extend(value if isinstance(value, list) else [value])
+    return values
+
+
+def _substitute(value: Any, placeholders: Dict[str, str]) -> str:
+    """Substitute placeholders into a step value."""
+    text = str(value)
+    try:
+        return text.format(**placeholders)
+    except KeyError as e:
+        raise BatchError(f"Unknown placeholder {{{e.args[0]}}} in {text!r}")
+    except (IndexError, ValueError, AttributeError) as e:
+        raise BatchError(
+            f"Invalid placeholder in {text!r} ({e}); write literal braces as {{{{ and }}}}"
+        )
+
+
+def expand_config_files(patterns: List[str]) -> List[str]:
+    """
+    Expand glob patterns into a sorted, de-duplicated list of files.
+
+    Args:
+        patterns: Glob patterns or plain file paths
+
+    Returns:
+        List of absolute file paths
+    """
+    files = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern, recursive=True) or (
+            [pattern] if os.path.isfile(pattern) else []
+        )
+        files.update(os.path.abspath(match) for match in matches if os.path.isfile(match))
+    return sorted(files)
+
+
+def build_step_argv(step: Dict[str, Any], placeholders: Dict[str, str]) -> List[str]:
+    """
+    Build the CLI argument list for a pipeline step.
+
+    Args:
+        step: Step dictionary from ``load_pipeline_spec``
+        placeholders: Values substituted into option strings
+
+    Returns:
+        Argument list suitable for the PANFlow CLI
+
+    Raises:
+        BatchError: If a value has an unknown or malformed placeholder
+    """
+    argv = [_substitute(word, placeholders) for word in shlex.split(step["command"])]
+    options = dict(step["options"])
+    options.setdefault("config", "{config}")
+
+    for key, value in options.items():
+        flag = key if key.startswith("-") else "--" + key.replace("_", "-")
+        if value is True:
+            argv.append(flag)
+        elif value is False or value is None:
+            continue
+        elif isinstance(value, list):
+            for item in value:
+                argv.extend([flag, _substitute(item, placeholders)])
+        else:
+            argv.extend([flag, _substitute(value, placeholders)])
+
+    argv.extend(_substitute(arg, placeholders) for arg in step["args"])
+    return argv
+
+
+def _load_cli():
+    """
+    Import the PANFlow CLI once per process.
+
+    Importing the CLI replaces the handlers of the panflow logger with its
+    console handler, so it is loaded before batch logging is set up.
+    """
+    global _cli_command
+    if _cli_command is None:
+        import typer
+
+        from panflow.cli import app
+
+        _cli_command = typer.main.get_command(app)
+    return _cli_command
+
+
+def _run_cli(argv: List[str]) -> int:
+    """Dispatch a command to the PANFlow CLI in-process and return its exit code."""
+    import click
+
+    try:
+        result = _load_cli().main(args=argv, prog_name="panflow", standalone_mode=False)
+    except click.ClickException as e:
+        logger.error(f"Command error: {e.format_message()}")
+        return e.exit_code
+    except click.exceptions.Abort:
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    return result if isinstance(result, int) else 0
+
+
+def run_pipeline_for_file(
+    config_file: str, steps: List[Dict[str, Any]], output_dir: str
+) -> Dict[str, Any]:
+    """
+    Run every pipeline step against one configuration file.
+
+    Steps run in order and stop at the first failure. Log output for the file
+    is written to ``<output_dir>/<stem>.log``.
+
+    Args:
+        config_file: Path to the configuration file
+        steps: Steps from ``load_pipeline_spec``
+        output_dir: Directory for per-file outputs and logs
+
+    Returns:
+        Per-file result dictionary
+    """
+    name = os.path.basename(config_file)
+    stem = name[:-4] if name.lower().endswith(".xml") else os.path.splitext(name)[0]
+    os.makedirs(output_dir, exist_ok=True)
+
+    _load_cli()
+    log_file = os.path.join(output_dir, f"{stem}.log")
+    file_handler = logging.FileHandler(log_file, mode="w")
+    file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    logger.addHandler(file_handler)
+
+    result: Dict[str, Any] = {
+        "file": config_file,
+        "status": "ok",
+        "log_file": log_file,
+        "steps": [],
+    }
+    current = config_file
+    start = time.perf_counter()
+
+    try:
+        for index, step in enumerate(steps, 1):
+            placeholders = {
+                "config": current,
+                "input": config_file,
+                "name": name,
+                "stem": stem,
+                "output_dir": output_dir,
+                "step": str(index),
+            }
+            argv: List[str] = []
+            step_start = time.perf_counter()
+
+            try:
+                argv = build_step_argv(step, placeholders)
+                exit_code = _run_cli(argv)
+                error = None if exit_code == 0 else f"exit code {exit_code}"
+            except BatchError as e:
+                logger.error(f"Step {index} failed: {e}")
+                exit_code, error = 1, str(e)
+            except Exception as e:
+                logger.error(f"Step {index} failed: {e}", exc_info=True)
+                exit_code, error = 1, str(e)
+
+            result["steps"].append(
+                {
+                    "command": step["command"],
+                    "argv": argv,
+                    "exit_code": exit_code,
+                    "error": error,
+                    "duration": time.perf_counter() - step_start,
+                }
+            )
+
+            if exit_code != 0:
+                result["status"] = "failed"
+                result["error"] = f"Step {index} ({step['command']}) failed: {error}"
+                break
+
+            output = step["options"].get("output")
+            if isinstance(output, str) and output.lower().endswith(".xml"):
+                output = _substitute(output, placeholders)
+                if os.path.exists(output):
+                    current = output
+    finally:
+        logger.removeHandler(file_handler)
+        file_handler.close()
+
+    result["final_config"] = current
+    result["duration"] = time.perf_counter() - start
+    return result
+
+
+def _init_worker() -> None:
+    """Keep worker console output quiet; each file logs to its own file."""
+    # Load the CLI first: importing it adds a console handler
+    _load_cli()
+    for handler in logger.handlers[:]:
+        if isinstance(handler, logging.StreamHandler) and not isinstance(
+            handler, logging.FileHandler
+        ):
+            logger.removeHandler(handler)
+
+
+class BatchRunner:
+    """
+    Run a pipeline over many configuration files in a process pool.
+
+    Results are recorded in a checkpoint file as each file completes, so an
+    interrupted batch can be resumed without reprocessing finished files.
+    """
+
+    def __init__(
+        self,
+        steps: List[Dict[str, Any]],
+        output_dir: str,
+        workers: int = 1,
+        checkpoint_file: Optional[str] = None,
+    ):
+        """
+        Initialize the batch runner.
+
+        Args:
+            steps: Steps from ``load_pipeline_spec``
+            output_dir: Directory for per-file outputs, logs and the summary
+            workers: Number of worker processes (1 runs in the current process)
+            checkpoint_file: Path of the checkpoint file used for resuming
+        """
+        self.steps = steps
+        self.output_dir = os.path.abspath(output_dir)
+        self.workers = max(1, workers)
+        self.checkpoint_file = checkpoint_file or os.path.join(
+            self.output_dir, "batch-checkpoint.json"
+        )
+        self.pipeline_hash = hashlib.sha256(
+            json.dumps(steps, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        self.checkpoint: Dict[str, Any] = {}
+
+    def load_checkpoint(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load completed file results from the checkpoint.
+
+        Checkpoints written for a different pipeline are ignored.
+
+        Returns:
+            Dictionary mapping file paths to their checkpoint records
+        """
+        if not os.path.exists(self.checkpoint_file):
+            return {}
+        try:
+            with open(self.checkpoint_file, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.checkpoint_file}: {e}")
+            return {}
+        if data.get("pipeline") != self.pipeline_hash:
+            logger.info("Pipeline changed since last checkpoint, starting fresh")
+            return {}
+        return data.get("files", {})
+
+    def _save_checkpoint(self) -> None:
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "pipeline": self.pipeline_hash,
+            "files": self.checkpoint,
+        }
+        temp_file = self.checkpoint_file + ".tmp"
+        with open(temp_file, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_file, self.checkpoint_file)
+
+    @staticmethod
+    def _file_signature(config_file: str) -> Dict[str, float]:
+        stat = os.stat(config_file)
+        return {"mtime": stat.st_mtime, "size": stat.st_size}
+
+    def run(
+        self,
+        config_files: List[str],
+        resume: bool = True,
+        progress_callback: Optional[Callable[[Dict[str, Any], int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the pipeline over a set of configuration files.
+
+        Args:
+            config_files: Files to process
+            resume: Skip files that completed successfully in a previous run
+            progress_callback: Called with (result, completed, total) as files finish
+
+        Returns:
+            Aggregate summary including per-file results
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.checkpoint = self.load_checkpoint() if resume else {}
+
+        results: List[Dict[str, Any]] = []
+        pending = []
+        for config_file in config_files:
+            record = self.checkpoint.get(config_file)
+            if (
+                record
+                and record["result"]["status"] == "ok"
+                and record["signature"] == self._file_signature(config_file)
+            ):
+                results.append({**record["result"], "skipped": True})
+            else:
+                pending.append(config_file)
+
+        total = len(config_files)
+        completed = len(results)
+        start = time.perf_counter()
+        logger.info(
+            f"Processing {len(pending)} of {total} files with {self.workers} worker(s)"
+            + (f", {completed} already complete" if completed else "")
+        )
+
+        def record_result(config_file: str, result: Dict[str, Any]) -> None:
+            nonlocal completed
+            completed += 1
+            results.append(result)
+            self.checkpoint[config_file] = {
+                "signature": self._file_signature(config_file),
+                "result": result,
+            }
+            self._save_checkpoint()
+            if progress_callback:
+                progress_callback(result, completed, total)
+
+        if self.workers == 1:
+            for config_file in pending:
+                record_result(
+                    config_file, run_pipeline_for_file(config_file, self.steps, self.output_dir)
+                )
+        else:
+            # Spawned workers start from a clean interpreter rather than a fork
+            # of this process and its logging, console and CLI state
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        run_pipeline_for_file, config_file, self.steps, self.output_dir
+                    ): config_file
+                    for config_file in pending
+                }
+                for future in as_completed(futures):
+                    config_file = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # The worker itself died; record the file as failed
+                        result = {
+                            "file": config_file,
+                            "status": "failed",
+                            "error": f"Worker error: {e}",
+                            "steps": [],
+                        }
+                    record_result(config_file, result)
+
+        summary = self.summarize(results, time.perf_counter() - start)
+        summary_file = os.path.join(self.output_dir, "batch-summary.json")
+        with open(summary_file, "w") as f:
+            json.dump(summary, f, indent=2)
+        summary["summary_file"] = summary_file
+        return summary
+
+    def summarize(self, results: List[Dict[str, Any]], duration: float) -> Dict[str, Any]:
+        """
+        Aggregate per-file results into a summary.
+
+        Args:
+            results: Per-file results
+            duration: Wall-clock duration of the run in seconds
+
+        Returns:
+            Summary dictionary
+        """
+        step_stats: Dict[str, Dict[str, Any]] = {}
+        for result in results:
+            if result.get("skipped"):
+                continue
+            for step in result.get("steps", []):
+                stats = step_stats.setdefault(
+                    step["command"], {"succeeded": 0, "failed": 0, "total_duration": 0.0}
+                )
+                stats["succeeded" if step["exit_code"] == 0 else "failed"] += 1
+                stats["total_duration"] += step["duration"]
+
+        return {
+            "total_files": len(results),
+            "succeeded": sum(1 for r in results if r["status"] == "ok"),
+            "failed": sum(1 for r in results if r["status"] != "ok"),
+            "skipped": sum(1 for r in results if r.get("skipped")),
+            "workers": self.workers,
+            "duration": duration,
+            "steps": step_stats,
+            "files": sorted(results, key=lambda r: r["file"]),
+        }
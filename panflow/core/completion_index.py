@@ -0,0 +1,398 @@
+"""
+Completion index for PAN-OS configuration files.
+
+Shell completion of device group, vsys, template, object and rule names must
+not parse the configuration on every TAB. The names are collected once into a
+small index per configuration file, stored as a sidecar in the user cache
+directory and keyed by the configuration's path. The index records the
+configuration's size and modification time and is ignored once the file
+changes; it is rewritten whenever PANFlow loads the changed file or by
+``panflow completion index``.
+
+Names are stored as sorted arrays per kind and context, so a completion is a
+binary search for the prefix. Reading the index only needs the standard
+library, which keeps the ``__complete`` fast path of the launchers cheap.
+"""
+
+import bisect
+import hashlib
+import heapq
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("panflow")
+
+# Format version of the index files
+INDEX_FORMAT_VERSION = 1
+
+# Object container elements indexed in every context
+OBJECT_KINDS = (
+    "address",
+    "address-group",
+    "service",
+    "service-group",
+    "tag",
+    "application",
+    "application-group",
+    "application-filter",
+    "profile-group",
+)
+
+# Context kinds, whose names are indexed under the "shared" context
+CONTEXT_KINDS = ("device-group", "vsys", "template")
+
+# Kind of names completed after each option
+OPTION_KINDS = {
+    "--device-group": "device-group",
+    "--dg": "device-group",
+    "--source-dg": "device-group",
+    "--target-dg": "device-group",
+    "--vsys": "vsys",
+    "--source-vsys": "vsys",
+    "--target-vsys": "vsys",
+    "--template": "template",
+    "--rule-name": "rule",
+    "--name": "object",
+    "-n": "object",
+}
+
+# Names of the rules of a vsys, device group or shared context
+_RULE_NAMES_XPATH = (
+    "./rulebase/*/rules/entry/@name"
+    " | ./pre-rulebase/*/rules/entry/@name"
+    " | ./post-rulebase/*/rules/entry/@name"
+)
+
+# Stamps of the files whose index this process has found up to date
+_current: Dict[str, Tuple[int, int]] = {}
+
+# Options naming the configuration file
+CONFIG_OPTIONS = ("--config", "-c")
+
+# Options whose value is an object type
+_TYPE_OPTIONS = ("--type", "-t")
+
+# Options selecting the context whose names are completed
+_CONTEXT_OPTIONS = ("--device-group", "--dg", "--vsys")
+
+
+def _cache_dir() -> Optional[str]:
+    """
+    Get the directory of the completion index files.
+
+    The PANFLOW_COMPLETION_CACHE environment variable overrides the default
+    location under the user cache directory; setting it to an empty string
+    disables the index.
+
+    Returns:
+        Directory path, or None if the index is disabled
+    """
+    cache_dir = os.environ.get("PANFLOW_COMPLETION_CACHE")
+    if cache_dir is None:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        cache_dir = os.path.join(cache_home, "panflow", "completion")
+    return cache_dir or None
+
+
+def index_path(config_file: str) -> Optional[str]:
+    """
+    Get the path of the completion index of a configuration file.
+
+    Args:
+        config_file: Path to the configuration file
+
+    Returns:
+        Path of the index file, or None if the index is disabled
+    """
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    digest = hashlib.sha1(os.path.abspath(config_file).encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.json")
+
+
+def _file_stamp(config_file: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(config_file)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _prefixed(names: Sequence[str], prefix: str) -> List[str]:
+    """Get the names starting with a prefix from a sorted array."""
+    start = bisect.bisect_left(names, prefix)
+    end = start
+    while end < len(names) and names[end].startswith(prefix):
+        end += 1
+    return list(names[start:end])
+
+
+class CompletionIndex:
+    """Sorted names of a configuration per kind and context."""
+
+    def __init__(self, names: Dict[str, Dict[str, List[str]]]):
+        """
+        Initialize the index.
+
+        Args:
+            names: Sorted name arrays keyed by kind, then context name
+        """
+        self.names = names
+
+    @classmethod
+    def from_tree(cls, tree) -> "CompletionIndex":
+        """
+        Collect the names of a configuration.
+
+        Args:
+            tree: ElementTree containing the configuration
+
+        Returns:
+            CompletionIndex of the configuration
+        """
+        names: Dict[str, Dict[str, set]] = {}
+
+        def add(kind: str, context: str, values: Iterable[str]) -> None:
+            names.setdefault(kind, {}).setdefault(context, set()).update(v for v in values if v)
+
+        contexts = [("shared", element) for element in tree.xpath("/config/shared")]
+        for kind in CONTEXT_KINDS:
+            entries = tree.xpath(f"/config/devices/entry/{kind}/entry")
+            add(kind, "shared", (entry.get("name") for entry in entries))
+            if kind != "template":
+                contexts.extend(
+                    (entry.get("name"), entry) for entry in entries if entry.get("name")
+                )
+
+        for context, element in contexts:
+            for kind in OBJECT_KINDS:
+                add(kind, context, element.xpath(f"./{kind}/entry/@name", smart_strings=False))
+            add("rule", context, element.xpath(_RULE_NAMES_XPATH, smart_strings=False))
+
+        return cls(
+            {
+                kind: {context: sorted(values) for context, values in by_context.items() if values}
+                for kind, by_context in names.items()
+            }
+        )
+
+    def complete(
+        self,
+        kind: str,
+        prefix: str = "",
+        context: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Get the names of a kind starting with a prefix.
+
+        Args:
+            kind: Kind of name (device-group, vsys, template, rule or an object type)
+            prefix: Prefix the names start with
+            context: Only names visible in this context (its own and shared names)
+            limit: Maximum number of names returned
+
+        Returns:
+            Sorted, distinct names
+        """
+        by_context = self.names.get(kind.replace("_", "-"), {})
+        if context is None:
+            arrays = list(by_context.values())
+        else:
+            arrays = [by_context.get(context, []), by_context.get("shared", [])]
+
+        matches = []
+        last = None
+        for name in heapq.merge(*(_prefixed(array, prefix) for array in arrays)):
+            if name != last:
+                matches.append(name)
+                last = name
+                if limit is not None and len(matches) >= limit:
+                    break
+        return matches
+
+    def complete_objects(
+        self, object_type: Optional[str], prefix: str = "", context: Optional[str] = None
+    ) -> List[str]:
+        """
+        Get object names starting with a prefix.
+
+        Args:
+            object_type: Object type, or None for objects of all types
+            prefix: Prefix the names start with
+            context: Only names visible in this context
+
+        Returns:
+            Sorted, distinct names
+        """
+        if object_type:
+            return self.complete(object_type, prefix, context)
+        return sorted(set().union(*(self.complete(kind, prefix, context) for kind in OBJECT_KINDS)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the index to a JSON-serializable dict."""
+        return {"format_version": INDEX_FORMAT_VERSION, "names": self.names}
+
+
+def load_completion_index(config_file: str) -> Optional[CompletionIndex]:
+    """
+    Read the completion index of a configuration file.
+
+    Args:
+        config_file: Path to the configuration file
+
+    Returns:
+        CompletionIndex, or None if there is no index for the file as it is now
+    """
+    path = index_path(config_file)
+    stamp = _file_stamp(config_file)
+    if path is None or stamp is None:
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("format_version") != INDEX_FORMAT_VERSION or data.get("stamp") != list(stamp):
+        return None
+    return CompletionIndex(data["names"])
+
+
+def write_completion_index(config_file: str, tree=None) -> Optional[CompletionIndex]:
+    """
+    Build the completion index of a configuration file and write it.
+
+    Args:
+        config_file: Path to the configuration file
+        tree: The parsed configuration, to avoid parsing the file again
+
+    Returns:
+        The CompletionIndex written, or None if the index is disabled
+    """
+    path = index_path(config_file)
+    if path is None:
+        return None
+    stamp = _file_stamp(config_file)
+    if tree is None:
+        from .config_loader import load_config_from_file
+
+        tree, _ = load_config_from_file(config_file)
+    index = CompletionIndex.from_tree(tree)
+
+    data = index.to_dict()
+    data["config"] = os.path.abspath(config_file)
+    data["stamp"] = list(stamp) if stamp else None
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.tmp{os.getpid()}"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(temp_path, path)
+    logger.debug(f"Wrote completion index of {config_file} to {path}")
+    return index
+
+
+def update_completion_index(config_file: str, tree) -> None:
+    """
+    Rewrite the completion index of a loaded configuration if it is out of date.
+
+    Errors are logged and ignored; completion then falls back to static values.
+
+    Args:
+        config_file: Path to the configuration file
+        tree: The parsed configuration
+    """
+    path = index_path(config_file)
+    if path is None:
+        return
+    stamp = _file_stamp(config_file)
+    if stamp is not None and _current.get(path) == stamp:
+        return
+    try:
+        if load_completion_index(config_file) is None:
+            write_completion_index(config_file, tree)
+        _current[path] = stamp
+    except OSError as e:
+        logger.debug(f"Cannot write completion index {path}: {e}")
+
+
+def _option_values(words: Sequence[str]) -> Dict[str, str]:
+    """Get the values of the options on a command line."""
+    values = {}
+    for i, word in enumerate(words):
+        if word.startswith("-"):
+            if "=" in word:
+                option, value = word.split("=", 1)
+                values[option] = value
+            elif i + 1 < len(words):
+                values[word] = words[i + 1]
+    return values
+
+
+def complete_command_line(words: Sequence[str]) -> List[Tuple[str, str]]:
+    """
+    Complete the last word of a panflow command line from the completion index.
+
+    Args:
+        words: Command line words after the program name; the last one is the
+            word being completed
+
+    Returns:
+        List of (type, value) completions, where type is "plain" for a name
+        and "file" for a file name prefix the shell should complete
+    """
+    if not words:
+        return []
+    incomplete = words[-1]
+    previous = words[-2] if len(words) > 1 else ""
+    option = None
+    if incomplete.startswith("--") and "=" in incomplete:
+        option, incomplete = incomplete.split("=", 1)
+    elif previous.startswith("-"):
+        option = previous
+
+    if option in CONFIG_OPTIONS:
+        return [("file", incomplete)]
+    kind = OPTION_KINDS.get(option)
+    if kind is None:
+        return []
+
+    values = _option_values(words[:-1])
+    config_file = next((values[o] for o in CONFIG_OPTIONS if o in values), None)
+    index = load_completion_index(config_file) if config_file else None
+    if index is None:
+        return []
+
+    if kind == "object":
+        object_type = next((values[o] for o in _TYPE_OPTIONS if o in values), None)
+        context = next((values[o] for o in _CONTEXT_OPTIONS if o in values), None)
+        names = index.complete_objects(object_type, incomplete, context)
+    elif kind == "rule":
+        context = next((values[o] for o in _CONTEXT_OPTIONS if o in values), None)
+        names = index.complete("rule", incomplete, context)
+    else:
+        names = index.complete(kind, incomplete, "shared")
+    return [("plain", name) for name in names]
+
+
+def run_complete(words: Sequence[str]) -> bool:
+    """
+    Print the completions of a command line for the shell completion scripts.
+
+    Each completion is printed as ``type,value`` on its own line.
+
+    Args:
+        words: Command line words after ``__complete``
+
+    Returns:
+        Whether anything was printed; if not, the caller falls back to
+        completing commands and options from the CLI itself
+    """
+    completions = complete_command_line(words)
+    for completion_type, value in completions:
+        print(f"{completion_type},{value}")
+    return bool(completions)
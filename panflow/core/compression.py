@@ -0,0 +1,211 @@
+"""
+Transparent compression support for PANFlow configuration files.
+
+Configurations archived as ``.xml.gz`` or ``.xml.zst`` can be read and written
+directly. Input is decompressed as a stream that the XML parser reads in chunks,
+so the decompressed document never has to land on disk or be held in memory as
+one string. Gzip uses the standard library; zstd uses ``compression.zstd`` on
+Python 3.14+ or the optional ``zstandard`` package.
+"""
+
+import gzip
+import io
+import logging
+import os
+from typing import BinaryIO, Optional, TextIO, Tuple
+
+from .exceptions import FileOperationError, SecurityError
+
+# zstd support is optional
+try:
+    from compression import zstd as _stdlib_zstd  # type: ignore[import-not-found]
+except ImportError:
+    _stdlib_zstd = None
+
+try:
+    import zstandard  # type: ignore[import-not-found]
+except ImportError:
+    zstandard = None
+
+HAVE_ZSTD = _stdlib_zstd is not None or zstandard is not None
+
+logger = logging.getLogger("panflow")
+
+# File suffixes and the compression they imply
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+# Leading bytes that identify compressed streams regardless of file name
+_MAGIC_NUMBERS = {b"\x1f\x8b": "gzip", b"\x28\xb5\x2f\xfd": "zstd"}
+
+DEFAULT_LEVELS = {"gzip": 6, "zstd": 3}
+
+
+def split_compression_suffix(filename: str) -> Tuple[str, Optional[str]]:
+    """
+    Split a compression suffix off a file name.
+
+    Args:
+        filename: File name such as ``config.xml.gz``
+
+    Returns:
+        Tuple of (file name without the compression suffix, compression name or None)
+    """
+    base, ext = os.path.splitext(filename)
+    compression = COMPRESSION_SUFFIXES.get(ext.lower())
+    if compression is None:
+        return filename, None
+    return base, compression
+
+
+def detect_compression(file_path: str) -> Optional[str]:
+    """
+    Detect the compression of a file from its leading bytes.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        "gzip", "zstd" or None for uncompressed files
+    """
+    with open(file_path, "rb") as f:
+        header = f.read(4)
+    for magic, compression in _MAGIC_NUMBERS.items():
+        if header.startswith(magic):
+            return compression
+    return None
+
+
+def _require_zstd() -> None:
+    if not HAVE_ZSTD:
+        raise FileOperationError(
+            "zstd compressed configurations require Python 3.14+ or the 'zstandard' package "
+            "(pip install zstandard)"
+        )
+
+
+class _LimitedReader(io.RawIOBase):
+    """Readable stream that fails once more than ``max_size`` bytes have been read."""
+
+    def __init__(self, stream: BinaryIO, max_size: int, name: str):
+        self._stream = stream
+        self._max_size = max_size
+        self._read = 0
+        self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self._read += len(data)
+        if self._read > self._max_size:
+            raise SecurityError(
+                f"Decompressed size of {self.name} exceeds maximum allowed size {self._max_size}"
+            )
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        self._stream.close()
+        super().close()
+
+
+def open_config_input(file_path: str, max_size: Optional[int] = None) -> BinaryIO:
+    """
+    Open a configuration file for reading, decompressing it on the fly.
+
+    Compression is detected from the file contents, so compressed files are
+    handled even without a ``.gz`` or ``.zst`` suffix.
+
+    Args:
+        file_path: Path to the configuration file
+        max_size: Maximum number of decompressed bytes to allow (compressed inputs only)
+
+    Returns:
+        Binary file object yielding the uncompressed XML
+
+    Raises:
+        FileOperationError: If the file uses zstd and no zstd support is installed
+    """
+    compression = detect_compression(file_path)
+
+    if compression is None:
+        return open(file_path, "rb")
+
+    logger.debug(f"Reading {compression} compressed configuration: {file_path}")
+    if compression == "gzip":
+        stream = gzip.open(file_path, "rb")
+    else:
+        _require_zstd()
+        if _stdlib_zstd is not None:
+            stream = _stdlib_zstd.open(file_path, "rb")
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(open(file_path, "rb"), closefd=True)
+
+    if max_size is not None:
+        return io.BufferedReader(_LimitedReader(stream, max_size, file_path))
+    return stream
+
+
+def open_config_output(
+    file_path: str, compression: Optional[str] = None, level: Optional[int] = None
+) -> BinaryIO:
+    """
+    Open a configuration file for writing, compressing it on the fly.
+
+    Args:
+        file_path: Path to write to
+        compression: "gzip", "zstd" or None (defaults to the file name's suffix)
+        level: Compression level (defaults to a balanced level per format)
+
+    Returns:
+        Binary file object accepting the uncompressed XML
+
+    Raises:
+        FileOperationError: If the compression is unknown or zstd support is missing
+    """
+    if compression is None:
+        compression = split_compression_suffix(file_path)[1]
+    if compression is None:
+        return open(file_path, "wb")
+    if compression not in DEFAULT_LEVELS:
+        raise FileOperationError(f"Unsupported compression: {compression}")
+
+    level = DEFAULT_LEVELS[compression] if level is None else level
+    if compression == "gzip":
+        return gzip.open(file_path, "wb", compresslevel=level)
+
+    _require_zstd()
+    if _stdlib_zstd is not None:
+        return _stdlib_zstd.open(file_path, "wb", level=level)
+    return zstandard.ZstdCompressor(level=level).stream_writer(open(file_path, "wb"), closefd=True)
+
+
+def open_text_output(
+    file_path: str,
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+    newline: Optional[str] = None,
+) -> TextIO:
+    """
+    Open a UTF-8 text file for writing, compressing it on the fly.
+
+    Args:
+        file_path: Path to write to
+        compression: "gzip", "zstd" or None (defaults to the file name's suffix)
+        level: Compression level (defaults to a balanced level per format)
+        newline: Newline translation, as for :func:`open`
+
+    Returns:
+        Text file object
+
+    Raises:
+        FileOperationError: If the compression is unknown or zstd support is missing
+    """
+    return io.TextIOWrapper(
+        open_config_output(file_path, compression, level), encoding="utf-8", newline=newline
+    )
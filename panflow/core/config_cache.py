@@ -0,0 +1,258 @@
+"""
+In-memory cache of loaded configurations for long-running PANFlow processes.
+
+A :class:`ConfigCache` keeps parsed configuration trees, keyed by file path and
+content hash, in an LRU bounded by a memory budget. Once a cache is activated,
+:func:`panflow.core.config_loader.load_config_from_file` serves configurations
+from it instead of parsing the file again.
+
+Data derived from a cached tree, such as configuration graphs and report
+indexes, is kept with the tree through :func:`derived`, so it is built once
+per configuration version as well.
+
+Requests that may modify the configuration must not change the cached tree.
+They run in :meth:`ConfigCache.request` with ``read_only=False`` and get a
+private copy of the tree instead; data derived from copies is not cached.
+"""
+
+import copy
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger("panflow")
+
+# Estimated memory use of a parsed configuration per byte of XML
+MEMORY_PER_BYTE = 6
+
+DEFAULT_MEMORY_BUDGET = 2 * 1024**3
+
+# Cache used by the configuration loader, if any
+_active: Optional["ConfigCache"] = None
+
+
+def _file_digest(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CachedConfig:
+    """A parsed configuration file and the data derived from it."""
+
+    def __init__(self, path: str, stamp: Tuple[int, int], digest: str, tree, version: str):
+        self.path = path
+        self.stamp = stamp
+        self.digest = digest
+        self.tree = tree
+        self.version = version
+        self.size = stamp[1] * MEMORY_PER_BYTE
+        self.derived: Dict[Any, Any] = {}
+        self.hits = 0
+        self.loaded_at = time.time()
+        self.lock = threading.Lock()
+
+
+class ConfigCache:
+    """LRU of parsed configurations bounded by an estimated memory budget."""
+
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET):
+        """
+        Initialize the cache.
+
+        Args:
+            memory_budget: Estimated memory, in bytes, the cached configurations may use;
+                the most recently used configuration is kept even if it is larger
+        """
+        self.memory_budget = memory_budget
+        self._entries: "OrderedDict[str, CachedConfig]" = OrderedDict()
+        self._by_tree: Dict[int, CachedConfig] = {}
+        self._lock = threading.RLock()
+        self._loading: Dict[str, threading.Lock] = {}
+        self._request = threading.local()
+        self.loads = 0
+        self.hits = 0
+        self.evictions = 0
+
+    def get(self, file_path: str) -> CachedConfig:
+        """
+        Get the cached configuration of a file, parsing it if it is new or changed.
+
+        Args:
+            file_path: Path to the configuration file
+
+        Returns:
+            CachedConfig of the file as it is now
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.stamp == stamp:
+                self._entries.move_to_end(path)
+                entry.hits += 1
+                self.hits += 1
+                return entry
+            load_lock = self._loading.setdefault(path, threading.Lock())
+
+        # Parse outside the cache lock; concurrent requests for the same file wait
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(path)
+                if entry is not None and entry.stamp == stamp:
+                    entry.hits += 1
+                    self.hits += 1
+                    return entry
+
+            from .config_loader import parse_config_file
+
+            digest = _file_digest(path)
+            if entry is not None and entry.digest == digest:
+                # Touched but unchanged: keep the tree and everything derived from it
+                entry.stamp = stamp
+                return entry
+
+            tree, version = parse_config_file(path)
+            entry = CachedConfig(path, stamp, digest, tree, version)
+            with self._lock:
+                self._remove(path)
+                self._entries[path] = entry
+                self._by_tree[id(tree)] = entry
+                self.loads += 1
+                self._evict()
+            logger.debug(f"Cached configuration {path} ({digest[:12]})")
+            return entry
+
+    def _remove(self, path: str) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._by_tree.pop(id(entry.tree), None)
+
+    def _evict(self) -> None:
+        while len(self._entries) > 1 and self.memory_used > self.memory_budget:
+            path, entry = next(iter(self._entries.items()))
+            self._remove(path)
+            self.evictions += 1
+            logger.debug(f"Evicted configuration {path} from the cache")
+
+    @property
+    def memory_used(self) -> int:
+        """Estimated memory used by the cached configurations, in bytes."""
+        return sum(entry.size for entry in self._entries.values())
+
+    def entry_for_tree(self, tree) -> Optional[CachedConfig]:
+        """Get the cache entry a tree belongs to, if it is a cached tree."""
+        with self._lock:
+            return self._by_tree.get(id(tree))
+
+    def clear(self) -> None:
+        """Drop every cached configuration."""
+        with self._lock:
+            self._entries.clear()
+            self._by_tree.clear()
+
+    @property
+    def read_only(self) -> bool:
+        """Whether the current thread's request only reads configurations."""
+        return getattr(self._request, "read_only", False)
+
+    @contextmanager
+    def request(self, read_only: bool) -> Iterator[None]:
+        """
+        Run a request in the current thread.
+
+        Args:
+            read_only: Whether the request only reads configurations and may
+                share the cached trees
+        """
+        previous = self.read_only
+        self._request.read_only = read_only
+        try:
+            yield
+        finally:
+            self._request.read_only = previous
+
+    def load(self, file_path: str, version: Optional[str] = None) -> Tuple[Any, str]:
+        """
+        Load a configuration for the current request.
+
+        Args:
+            file_path: Path to the configuration file
+            version: User-specified PAN-OS version (optional)
+
+        Returns:
+            Tuple of (ElementTree, PAN-OS version); the tree is shared for
+            read-only requests and a private copy otherwise
+        """
+        entry = self.get(file_path)
+        tree = entry.tree if self.read_only else copy.deepcopy(entry.tree)
+        return tree, version or entry.version
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the cache statistics and the cached configurations."""
+        with self._lock:
+            return {
+                "configs": [
+                    {
+                        "path": entry.path,
+                        "sha256": entry.digest,
+                        "version": entry.version,
+                        "estimated_bytes": entry.size,
+                        "hits": entry.hits,
+                        "derived": len(entry.derived),
+                    }
+                    for entry in self._entries.values()
+                ],
+                "memory_used": self.memory_used,
+                "memory_budget": self.memory_budget,
+                "loads": self.loads,
+                "hits": self.hits,
+                "evictions": self.evictions,
+            }
+
+
+def activate(cache: Optional[ConfigCache]) -> None:
+    """
+    Make the configuration loader serve configurations from a cache.
+
+    Args:
+        cache: Cache to use, or None to load configurations from disk again
+    """
+    global _active
+    _active = cache
+
+
+def active_cache() -> Optional[ConfigCache]:
+    """Get the active configuration cache, if any."""
+    return _active
+
+
+def derived(tree, key: Any, build: Callable[[], Any]) -> Any:
+    """
+    Get data derived from a configuration tree, building it once per cached tree.
+
+    Args:
+        tree: Configuration tree the data is derived from
+        key: Key identifying the data, e.g. ("graph", device_type, context_type)
+        build: Function building the data
+
+    Returns:
+        The cached data if the tree is a cached, read-only tree, else build()
+    """
+    cache = _active
+    entry = cache.entry_for_tree(tree) if cache is not None else None
+    if entry is None:
+        return build()
+    with entry.lock:
+        if key not in entry.derived:
+            entry.derived[key] = build()
+        return entry.derived[key]
@@ -9,6 +9,9 @@ from typing import Optional, Dict, Any, List, Tuple, Union
 from lxml import etree
 import logging
 from .xpath_resolver import determine_version_from_config
+from .compression import detect_compression, open_config_input, open_config_output
+from .config_cache import active_cache
+from .session import active_session
 
 # Initialize logger for this module
 logger = logging.getLogger("panflow")
@@ -20,6 +23,44 @@ def load_config_from_file(
     """
     Load XML configuration from a file and return the element tree and detected version.
 
+    Gzip (.xml.gz) and zstd (.xml.zst) compressed files are decompressed as a
+    stream directly into the parser. In a process with an active
+    configuration cache (see :mod:`panflow.core.config_cache`), unchanged
+    files are served from the cache instead of being parsed again; during a
+    pipeline session (see :mod:`panflow.core.session`), the session's
+    configuration is served from memory.
+
+    Args:
+        file_path: Path to XML configuration file
+        version: User-specified PAN-OS version (optional)
+        validate: Whether to validate the XML structure
+
+    Returns:
+        Tuple containing (ElementTree, PAN-OS version)
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist
+        etree.XMLSyntaxError: If the XML is malformed
+        ValueError: If the XML doesn't appear to be a valid PAN-OS configuration
+    """
+    session = active_session()
+    if session is not None and session.owns(file_path):
+        return session.load(file_path, version)
+    cache = active_cache()
+    if cache is not None and not validate and os.path.exists(file_path):
+        return cache.load(file_path, version)
+    return parse_config_file(file_path, version, validate)
+
+
+def parse_config_file(
+    file_path: str, version: Optional[str] = None, validate: bool = False
+) -> Tuple[etree._ElementTree, str]:
+    """
+    Parse XML configuration from a file and return the element tree and detected version.
+
+    Gzip (.xml.gz) and zstd (.xml.zst) compressed files are decompressed as a
+    stream directly into the parser.
+
     Args:
         file_path: Path to XML configuration file
         version: User-specified PAN-OS version (optional)
@@ -43,7 +84,11 @@ def load_config_from_file(
         # Parse the XML file
         logger.debug(f"Attempting to parse XML file: {file_path}")
         parser = etree.XMLParser(remove_blank_text=True)
-        tree = etree.parse(file_path, parser)
+        if detect_compression(file_path):
+            with open_config_input(file_path) as stream:
+                tree = etree.parse(stream, parser)
+        else:
+            tree = etree.parse(file_path, parser)
         root = tree.getroot()
 
         # Basic validation of PAN-OS configuration structure
@@ -124,6 +169,10 @@ def save_config(tree: etree._ElementTree, output_file: str) -> bool:
     """
     Save an XML configuration to a file.
 
+    Output files ending in .gz or .zst are written compressed. Saving the
+    configuration of an active pipeline session is deferred to the end of
+    the session.
+
     Args:
         tree: ElementTree containing the configuration
         output_file: Path to save the configuration file
@@ -131,6 +180,10 @@ def save_config(tree: etree._ElementTree, output_file: str) -> bool:
     Returns:
         bool: Success status
     """
+    session = active_session()
+    if session is not None and tree is session.tree:
+        return session.defer_save(output_file)
+
     logger.info(f"Saving configuration to: {output_file}")
 
     try:
@@ -142,7 +195,8 @@ def save_config(tree: etree._ElementTree, output_file: str) -> bool:
 
         # Write the configuration to file
         logger.debug("Writing configuration to file")
-        tree.write(output_file, encoding="utf-8", xml_declaration=True, pretty_print=True)
+        with open_config_output(output_file) as f:
+            tree.write(f, encoding="utf-8", xml_declaration=True, pretty_print=True)
         logger.info(f"Successfully saved configuration to {output_file}")
         return True
     except PermissionError as e:
@@ -6,6 +6,7 @@ to files, with features like timestamping, backups, and validation.
 """
 
 import os
+import re
 import json
 import shutil
 import logging
@@ -23,11 +24,20 @@ except ImportError:
 
     HAVE_LXML = False
 
-from .xml.base import parse_xml, prettify_xml, validate_xml, element_to_dict
+from .xml.base import parse_xml, prettify_xml, validate_xml
+from .xml.stream import write_element_json, write_element_json_lines
+from .snapshot import write_snapshot
+from .backup_store import BackupStore, BackupStoreError
+from .compression import COMPRESSION_SUFFIXES, open_config_output, split_compression_suffix
 from .exceptions import PANFlowError, ParseError
 
 logger = logging.getLogger("panflow")
 
+# Backup identifiers have the form <backup_dir>/<file name>.<version>.bak
+_COMPRESSION_EXTENSIONS = {name: suffix for suffix, name in COMPRESSION_SUFFIXES.items()}
+
+_BACKUP_ID_PATTERN = re.compile(r"^(?P<name>.+)\.(?P<version>\d{8}_\d{6}_\d{6})\.bak$")
+
 
 class ConfigSaverError(PANFlowError):
     """Base exception for configuration saving operations."""
@@ -51,6 +61,7 @@ class ConfigSaver:
         validate_before_save: bool = False,
         schema_file: Optional[str] = None,
         pretty_print: bool = True,
+        compression: Optional[str] = None,
     ):
         """
         Initialize the ConfigSaver with specified options.
@@ -62,6 +73,8 @@ class ConfigSaver:
             validate_before_save: Whether to validate XML before saving
             schema_file: XML Schema file for validation
             pretty_print: Whether to pretty-print XML when saving
+            compression: Compress saved XML with "gzip" or "zstd" (file names ending in
+                .gz or .zst are always compressed)
         """
         self.config_dir = os.path.abspath(config_dir)
         self.backup_dir = (
@@ -71,6 +84,8 @@ class ConfigSaver:
         self.validate_before_save = validate_before_save
         self.schema_file = schema_file
         self.pretty_print = pretty_print
+        self.compression = compression
+        self._backup_store: Optional[BackupStore] = None
 
         # Create directories if they don't exist
         os.makedirs(self.config_dir, exist_ok=True)
@@ -88,7 +103,8 @@ class ConfigSaver:
 
         Args:
             tree_or_element: ElementTree or Element to save
-            filename: Target filename (with or without .xml extension)
+            filename: Target filename (with or without .xml extension); a .gz or
+                .zst suffix writes the file compressed
             overwrite: Whether to overwrite existing file
 
         Returns:
@@ -98,9 +114,13 @@ class ConfigSaver:
             ConfigSaverError: If saving fails
         """
         try:
-            # Ensure filename has .xml extension
+            # Ensure filename has .xml extension, keeping any compression suffix last
+            filename, compression = split_compression_suffix(filename)
+            compression = compression or self.compression
             if not filename.lower().endswith(".xml"):
                 filename += ".xml"
+            if compression:
+                filename += _COMPRESSION_EXTENSIONS[compression]
 
             # Construct full file path
             file_path = os.path.join(self.config_dir, filename)
@@ -130,7 +150,14 @@ class ConfigSaver:
             else:
                 tree = etree.ElementTree(tree_or_element)
 
-            if self.pretty_print and HAVE_LXML:
+            if compression:
+                with open_config_output(file_path, compression) as f:
+                    if self.pretty_print and HAVE_LXML:
+                        # Same bytes as prettify_xml, serialized straight into the compressor
+                        tree.write(f, encoding="utf-8", pretty_print=True)
+                    else:
+                        tree.write(f, encoding="utf-8", xml_declaration=True)
+            elif self.pretty_print and HAVE_LXML:
                 xml_string = prettify_xml(tree)
                 with open(file_path, "w", encoding="utf-8") as f:
                     f.write(xml_string)
@@ -177,6 +204,9 @@ class ConfigSaver:
         """
         Save configuration as JSON.
 
+        The document is streamed to the file as the tree is walked, so the
+        full dictionary form of the configuration is never held in memory.
+
         Args:
             tree_or_element: ElementTree or Element to save
             filename: Target filename (with or without .json extension)
@@ -190,32 +220,17 @@ class ConfigSaver:
             ConfigSaverError: If saving fails
         """
         try:
-            # Ensure filename has .json extension
-            if not filename.lower().endswith(".json"):
-                filename += ".json"
-
-            # Construct full file path
-            file_path = os.path.join(self.config_dir, filename)
+            file_path = self._prepare_target(filename, ".json", overwrite)
 
-            # Check if file exists and create backup if needed
-            if os.path.exists(file_path):
-                if not overwrite:
-                    raise ConfigSaverError(f"File already exists: {file_path}")
-
-                if self.create_backup:
-                    self._create_backup(file_path)
-
-            # Convert XML to dictionary
             element = (
                 tree_or_element
                 if isinstance(tree_or_element, etree._Element)
                 else tree_or_element.getroot()
             )
-            data = element_to_dict(element)
 
-            # Write the JSON to file
+            # Stream the JSON to file
             with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=indent)
+                write_element_json(element, f, indent=indent)
 
             logger.info(f"Configuration saved as JSON to {file_path}")
             return file_path
@@ -224,6 +239,109 @@ class ConfigSaver:
             logger.error(f"Error saving configuration as JSON: {e}")
             raise ConfigSaverError(f"Failed to save configuration as JSON: {e}")
 
+    def save_as_json_lines(
+        self,
+        tree_or_element: Union[etree._ElementTree, etree._Element],
+        filename: str,
+        overwrite: bool = True,
+    ) -> str:
+        """
+        Save configuration objects and rules as JSON Lines.
+
+        Each line holds one object or rule entry with its type, name and
+        context alongside the entry data.
+
+        Args:
+            tree_or_element: ElementTree or Element to save
+            filename: Target filename (with or without .jsonl extension)
+            overwrite: Whether to overwrite existing file
+
+        Returns:
+            Path to the saved file
+
+        Raises:
+            ConfigSaverError: If saving fails
+        """
+        try:
+            file_path = self._prepare_target(filename, ".jsonl", overwrite)
+
+            with open(file_path, "w", encoding="utf-8") as f:
+                count = write_element_json_lines(tree_or_element, f)
+
+            logger.info(f"Saved {count} records as JSON Lines to {file_path}")
+            return file_path
+
+        except Exception as e:
+            logger.error(f"Error saving configuration as JSON Lines: {e}")
+            raise ConfigSaverError(f"Failed to save configuration as JSON Lines: {e}")
+
+    def save_as_snapshot(
+        self,
+        tree_or_element: Union[etree._ElementTree, etree._Element],
+        filename: str,
+        device_type: Optional[str] = None,
+        version: Optional[str] = None,
+        overwrite: bool = True,
+    ) -> str:
+        """
+        Save configuration objects and rules as a binary columnar snapshot.
+
+        Args:
+            tree_or_element: ElementTree or Element to save
+            filename: Target filename (with or without .pfsnap extension)
+            device_type: Device type recorded in the snapshot
+            version: PAN-OS version recorded in the snapshot
+            overwrite: Whether to overwrite existing file
+
+        Returns:
+            Path to the saved file
+
+        Raises:
+            ConfigSaverError: If saving fails
+        """
+        try:
+            file_path = self._prepare_target(filename, ".pfsnap", overwrite)
+            write_snapshot(tree_or_element, file_path, device_type=device_type, version=version)
+
+            logger.info(f"Configuration saved as snapshot to {file_path}")
+            return file_path
+
+        except Exception as e:
+            logger.error(f"Error saving configuration as snapshot: {e}")
+            raise ConfigSaverError(f"Failed to save configuration as snapshot: {e}")
+
+    def _prepare_target(self, filename: str, extension: str, overwrite: bool) -> str:
+        """
+        Resolve an output path and back up any existing file at that path.
+
+        Args:
+            filename: Target filename (with or without extension)
+            extension: Required file extension, including the leading dot
+            overwrite: Whether to overwrite existing file
+
+        Returns:
+            Full path to the target file
+
+        Raises:
+            ConfigSaverError: If the file exists and overwrite is False
+        """
+        # Ensure filename has the expected extension
+        if not filename.lower().endswith(extension):
+            filename += extension
+
+        # Construct full file path
+        file_path = os.path.join(self.config_dir, filename)
+
+        # Check if file exists and create backup if needed
+        if os.path.exists(file_path):
+            if not overwrite:
+                raise ConfigSaverError(f"File already exists: {file_path}")
+
+            if self.create_backup:
+                self._create_backup(file_path)
+
+        return file_path
+
     def create_archive(
         self,
         files: List[str],
@@ -295,29 +413,108 @@ class ConfigSaver:
             logger.error(f"Error creating archive: {e}")
             raise ConfigSaverError(f"Failed to create archive: {e}")
 
+    def _get_backup_store(self, create: bool = False) -> Optional[BackupStore]:
+        """
+        Get the content-addressed backup store in the backup directory.
+
+        Args:
+            create: Whether to create the store if the backup directory does not exist
+
+        Returns:
+            The backup store, or None if there is no backup directory and create is False
+        """
+        if not create and not os.path.isdir(self.backup_dir):
+            return None
+        if self._backup_store is None:
+            self._backup_store = BackupStore(self.backup_dir)
+        return self._backup_store
+
+    def _backup_id(self, manifest: Dict[str, Any]) -> str:
+        """Return the identifier used for a stored backup version."""
+        return os.path.join(self.backup_dir, f"{manifest['name']}.{manifest['version']}.bak")
+
     def _create_backup(self, file_path: str) -> str:
         """
         Create a backup of a file before modification.
 
+        The file is added to the content-addressed backup store, which only
+        writes the sections that changed since earlier backups.
+
         Args:
             file_path: Path to the file to back up
 
         Returns:
-            Path to the backup file
+            Identifier of the backup, usable with restore_backup
         """
-        backup_filename = f"{os.path.basename(file_path)}.bak"
-        backup_path = os.path.join(self.backup_dir, backup_filename)
+        try:
+            manifest = self._get_backup_store(create=True).add(file_path)
+        except BackupStoreError as e:
+            raise ConfigSaverError(str(e))
+
+        backup_id = self._backup_id(manifest)
+        logger.debug(f"Created backup: {backup_id}")
+        return backup_id
+
+    def restore_backup(self, backup: str, target_path: Optional[str] = None) -> str:
+        """
+        Rebuild a backup into a file.
+
+        Args:
+            backup: Backup identifier returned by get_saved_configs or _create_backup,
+                or the path of a plain backup file
+            target_path: Path to write to (defaults to the original file name in config_dir)
+
+        Returns:
+            Path to the restored file
+
+        Raises:
+            ConfigSaverError: If the backup does not exist or cannot be rebuilt
+        """
+        match = _BACKUP_ID_PATTERN.match(os.path.basename(backup))
+        store = self._get_backup_store()
+
+        if match and store is not None:
+            name = match.group("name")
+            target_path = target_path or os.path.join(self.config_dir, name)
+            try:
+                store.restore(name, target_path, match.group("version"))
+            except BackupStoreError as e:
+                raise ConfigSaverError(f"Failed to restore backup: {e}")
+        elif os.path.isfile(backup):
+            # Plain backup files written before the backup store was introduced
+            name = re.sub(r"(\.\d{8}_\d{6})?\.bak$", "", os.path.basename(backup))
+            target_path = target_path or os.path.join(self.config_dir, name)
+            shutil.copy2(backup, target_path)
+        else:
+            raise ConfigSaverError(f"Backup not found: {backup}")
+
+        logger.info(f"Restored backup {backup} to {target_path}")
+        return target_path
+
+    def _list_backups(self) -> List[Tuple[str, float]]:
+        """
+        List all backups with their creation times, oldest first.
+
+        Returns:
+            List of (backup identifier, timestamp) tuples
+        """
+        backups = []
+        store = self._get_backup_store()
+        if store is None:
+            return backups
 
-        # If the backup already exists, create a timestamped version
-        if os.path.exists(backup_path):
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"{os.path.basename(file_path)}.{timestamp}.bak"
-            backup_path = os.path.join(self.backup_dir, backup_filename)
+        for manifest in store.list_versions():
+            created = datetime.fromisoformat(manifest["created"]).timestamp()
+            backups.append((self._backup_id(manifest), created))
 
-        # Create backup
-        shutil.copy2(file_path, backup_path)
-        logger.debug(f"Created backup: {backup_path}")
-        return backup_path
+        # Plain backup files written before the backup store was introduced
+        for file in os.listdir(self.backup_dir):
+            file_path = os.path.join(self.backup_dir, file)
+            if file.lower().endswith(".bak") and os.path.isfile(file_path):
+                backups.append((file_path, os.path.getmtime(file_path)))
+
+        backups.sort(key=lambda x: x[1])
+        return backups
 
     def get_saved_configs(
         self, pattern: Optional[str] = None, include_backups: bool = False
@@ -327,26 +524,25 @@ class ConfigSaver:
 
         Args:
             pattern: Optional filename pattern to match
-            include_backups: Whether to include backup files
+            include_backups: Whether to include backups
 
         Returns:
-            List of configuration file paths
+            List of configuration file paths and backup identifiers
         """
         configs = []
 
         # List files in the config directory
         if os.path.exists(self.config_dir):
             for file in os.listdir(self.config_dir):
-                if file.lower().endswith(".xml"):
+                if file.lower().endswith((".xml", ".xml.gz", ".xml.zst")):
                     if pattern is None or pattern in file:
                         configs.append(os.path.join(self.config_dir, file))
 
-        # List files in the backup directory if requested
-        if include_backups and os.path.exists(self.backup_dir):
-            for file in os.listdir(self.backup_dir):
-                if file.lower().endswith(".xml") or file.lower().endswith(".bak"):
-                    if pattern is None or pattern in file:
-                        configs.append(os.path.join(self.backup_dir, file))
+        # List stored backups if requested
+        if include_backups:
+            for backup_id, _ in self._list_backups():
+                if pattern is None or pattern in os.path.basename(backup_id):
+                    configs.append(backup_id)
 
         return sorted(configs)
 
@@ -357,60 +553,62 @@ class ConfigSaver:
         dry_run: bool = False,
     ) -> List[str]:
         """
-        Clean up old backup files.
+        Clean up old backups.
+
+        Chunks that are no longer referenced by any remaining backup are
+        removed from the backup store.
 
         Args:
-            max_age_days: Maximum age of files to keep (days)
-            max_files: Maximum number of backup files to keep
-            dry_run: Don't actually delete files, just show what would be deleted
+            max_age_days: Maximum age of backups to keep (days)
+            max_files: Maximum number of backups to keep
+            dry_run: Don't actually delete backups, just show what would be deleted
 
         Returns:
-            List of files that were deleted (or would be deleted in dry run)
+            List of backups that were deleted (or would be deleted in dry run)
         """
         deleted_files = []
 
-        if not os.path.exists(self.backup_dir):
+        # Get all backups with their creation times (oldest first)
+        backups = self._list_backups()
+        if not backups:
             return deleted_files
 
-        # Get all backup files with their modification times
-        backups = []
-        for file in os.listdir(self.backup_dir):
-            if file.lower().endswith((".xml.bak", ".bak")):
-                file_path = os.path.join(self.backup_dir, file)
-                mtime = os.path.getmtime(file_path)
-                backups.append((file_path, mtime))
-
-        # Sort by modification time (oldest first)
-        backups.sort(key=lambda x: x[1])
-
-        # Delete files based on age
+        # Delete backups based on age
         if max_age_days is not None:
             now = datetime.now().timestamp()
             max_age_seconds = max_age_days * 24 * 60 * 60
 
-            for file_path, mtime in backups:
-                age_seconds = now - mtime
+            for backup_id, created in backups:
+                age_seconds = now - created
                 if age_seconds > max_age_seconds:
-                    deleted_files.append(file_path)
+                    deleted_files.append(backup_id)
 
-        # Delete files based on max count
+        # Delete backups based on max count
         if max_files is not None and len(backups) > max_files:
-            # How many files to delete
+            # How many backups to delete
             to_delete = len(backups) - max_files
 
-            # Add oldest files to delete list (that aren't already there)
+            # Add oldest backups to delete list (that aren't already there)
             for i in range(min(to_delete, len(backups))):
-                file_path = backups[i][0]
-                if file_path not in deleted_files:
-                    deleted_files.append(file_path)
-
-        # Delete the files if not a dry run
-        if not dry_run:
-            for file_path in deleted_files:
+                backup_id = backups[i][0]
+                if backup_id not in deleted_files:
+                    deleted_files.append(backup_id)
+
+        # Delete the backups if not a dry run
+        if not dry_run and deleted_files:
+            store = self._get_backup_store()
+            for backup_id in deleted_files:
                 try:
-                    os.remove(file_path)
-                    logger.debug(f"Deleted backup file: {file_path}")
+                    match = _BACKUP_ID_PATTERN.match(os.path.basename(backup_id))
+                    if match and not os.path.isfile(backup_id):
+                        store.remove_version(match.group("name"), match.group("version"))
+                    else:
+                        os.remove(backup_id)
+                    logger.debug(f"Deleted backup: {backup_id}")
                 except Exception as e:
-                    logger.warning(f"Failed to delete {file_path}: {e}")
+                    logger.warning(f"Failed to delete {backup_id}: {e}")
+
+            removed = store.collect_garbage()
+            logger.debug(f"Removed {removed} unreferenced backup chunks")
 
         return deleted_files
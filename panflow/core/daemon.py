@@ -0,0 +1,425 @@
+"""
+PANFlow daemon mode.
+
+``panflow serve`` starts a local server on a Unix socket that runs PANFlow
+commands in-process against a :class:`~panflow.core.config_cache.ConfigCache`,
+so imports, XML parsing, configuration graphs and report indexes are paid for
+once instead of on every command. The normal CLI forwards commands to the
+server when its socket exists and prints the output the server returns.
+
+Each connection carries one JSON request line and gets one JSON response line.
+Requests are handled in their own threads: read-only commands share the cached
+trees and run concurrently, and all other commands run on a private copy of
+the cached tree. Command output is captured per request thread.
+
+Relative paths given to path options on a forwarded command line are made
+absolute by the client, since the server's working directory differs from the
+caller's. Commands that read from the terminal always run in the caller.
+Log level options only apply to the request that gave them.
+"""
+
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO
+
+from .config_cache import DEFAULT_MEMORY_BUDGET, ConfigCache, activate
+from .exceptions import PANFlowError
+from .logging_utils import thread_log_levels
+
+logger = logging.getLogger("panflow")
+
+# Commands that only read configurations and can share the cached trees
+READ_ONLY_COMMANDS = {
+    ("object", "list"),
+    ("object", "find"),
+    ("object", "find-duplicates"),
+    ("object", "filter"),
+    ("policy", "list"),
+    ("policy", "filter"),
+    ("policy", "match"),
+    ("query", "execute"),
+    ("query", "verify"),
+    ("report", "policy-analysis"),
+    ("report", "object-usage"),
+    ("report", "rule-expansion"),
+    ("report", "bundle"),
+    ("config", "export"),
+}
+
+# Commands always run by the calling process
+LOCAL_COMMANDS = {
+    ("serve",),
+    ("api",),
+    ("completion",),
+    ("__complete",),
+    ("batch",),
+    ("pipeline",),
+    ("query", "interactive"),
+    ("nlq", "interactive"),
+}
+
+# Commands that prompt on stdin unless one of the options is given. The daemon
+# cannot read the caller's terminal, so without them they run locally.
+PROMPTING_COMMANDS = {
+    ("object", "bulk-delete"): ("--force", "--dry-run"),
+}
+
+# Options whose value is a file or directory path
+PATH_OPTIONS = {
+    "--config",
+    "-c",
+    "--output",
+    "-o",
+    "--output-dir",
+    "--report-file",
+    "--state-file",
+    "--pipeline",
+    "--criteria",
+    "--exclude-file",
+    "--include-file",
+    "--names-file",
+    "--source-config",
+    "--target-config",
+    "--impact-report",
+    "--hit-counts",
+}
+
+
+class DaemonError(PANFlowError):
+    """Exception raised when the PANFlow daemon cannot be started or reached."""
+
+    pass
+
+
+def socket_path() -> Optional[str]:
+    """
+    Get the path of the daemon socket.
+
+    The PANFLOW_SOCKET environment variable overrides the default location in
+    the user runtime directory; setting it to an empty string disables
+    forwarding commands to a daemon.
+
+    Returns:
+        Socket path, or None if the daemon is disabled
+    """
+    path = os.environ.get("PANFLOW_SOCKET")
+    if path is None:
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(
+            os.path.expanduser("~"), ".cache", "panflow"
+        )
+        path = os.path.join(runtime_dir, "panflow.sock")
+    return path or None
+
+
+def _command_path(argv: Sequence[str]) -> tuple:
+    """Get the command and subcommand names at the start of a command line."""
+    names = []
+    for word in argv:
+        if word.startswith("-") or len(names) == 2:
+            break
+        names.append(word)
+    return tuple(names)
+
+
+def is_read_only(argv: Sequence[str]) -> bool:
+    """Check whether a command line only reads configurations."""
+    return _command_path(argv) in READ_ONLY_COMMANDS
+
+
+def is_local(argv: Sequence[str]) -> bool:
+    """Check whether a command line must run in the calling process."""
+    path = _command_path(argv)
+    if not path or path[:1] in LOCAL_COMMANDS or path in LOCAL_COMMANDS:
+        return True
+    unattended = PROMPTING_COMMANDS.get(path)
+    return unattended is not None and not any(word.partition("=")[0] in unattended for word in argv)
+
+
+def absolute_paths(argv: Sequence[str], cwd: Optional[str] = None) -> List[str]:
+    """
+    Make the paths on a command line absolute.
+
+    Only the values of PATH_OPTIONS are resolved against the working
+    directory. Other values are left alone even if they happen to name a
+    file, and no forwarded command takes positional path arguments.
+
+    Args:
+        argv: Command line words
+        cwd: Working directory (defaults to the current one)
+
+    Returns:
+        Command line with absolute paths
+    """
+    cwd = cwd or os.getcwd()
+    result = []
+    path_value = False
+    for word in argv:
+        if path_value:
+            word = os.path.join(cwd, word)
+            path_value = False
+        elif word.startswith("-"):
+            option, sep, value = word.partition("=")
+            if option in PATH_OPTIONS:
+                if sep:
+                    word = f"{option}={os.path.join(cwd, value)}"
+                else:
+                    path_value = True
+        result.append(word)
+    return result
+
+
+class _ThreadOutput(io.TextIOBase):
+    """Text stream that writes to a per-thread buffer while one is captured."""
+
+    def __init__(self, default: TextIO):
+        self._default = default
+        self._local = threading.local()
+
+    @contextmanager
+    def capture(self) -> Iterator[io.StringIO]:
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = None
+
+    def _target(self) -> TextIO:
+        return getattr(self._local, "buffer", None) or self._default
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return self._target().isatty()
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+
+def _dispatch(argv: List[str]) -> int:
+    """Dispatch a command to the PANFlow CLI in-process and return its exit code."""
+    import click
+    import typer
+
+    from panflow.cli import app
+
+    command = typer.main.get_command(app)
+    try:
+        result = command.main(args=argv, prog_name="panflow", standalone_mode=False)
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.exceptions.Abort:
+        return 1
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    except Exception as e:
+        logger.error(f"{type(e).__name__}: {e}")
+        return 1
+    return result if isinstance(result, int) else 0
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            response = self.server.handle_request(request)
+        except ValueError as e:
+            response = {"error": f"Invalid request: {e}"}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class PANFlowDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server running PANFlow commands against a configuration cache."""
+
+    daemon_threads = True
+
+    def __init__(self, path: str, memory_budget: int = DEFAULT_MEMORY_BUDGET):
+        """
+        Bind the server to its socket.
+
+        Args:
+            path: Path of the Unix socket
+            memory_budget: Estimated memory the cached configurations may use, in bytes
+
+        Raises:
+            DaemonError: If another daemon is listening on the socket
+        """
+        if os.path.exists(path):
+            if ping(path):
+                raise DaemonError(f"A PANFlow daemon is already listening on {path}")
+            os.unlink(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        self.path = path
+        self.cache = ConfigCache(memory_budget)
+        self.started = time.time()
+        self.requests = 0
+        self._requests_lock = threading.Lock()
+        self._stdout = _ThreadOutput(sys.stdout)
+        self._stderr = _ThreadOutput(sys.stderr)
+        # Create the socket accessible to the owner only from the start
+        umask = os.umask(0o077)
+        try:
+            super().__init__(path, _RequestHandler)
+        finally:
+            os.umask(umask)
+
+    def run_command(self, argv: List[str]) -> Dict[str, Any]:
+        """
+        Run a command line and capture its output.
+
+        Args:
+            argv: Command line words after the program name
+
+        Returns:
+            Dict with the "exit_code", "stdout", "stderr" and "duration"
+        """
+        start = time.perf_counter()
+        with self.cache.request(read_only=is_read_only(argv)):
+            with self._stdout.capture() as stdout, self._stderr.capture() as stderr:
+                exit_code = _dispatch(argv)
+        return {
+            "exit_code": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "duration": time.perf_counter() - start,
+        }
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle one request.
+
+        Args:
+            request: Request with "op" ("run", "status" or "stop") and, for
+                "run", the command line as "argv"
+
+        Returns:
+            Response for the client
+        """
+        with self._requests_lock:
+            self.requests += 1
+        op = request.get("op")
+        if op == "run":
+            return self.run_command(list(request.get("argv", [])))
+        if op == "status":
+            return {
+                "pid": os.getpid(),
+                "socket": self.path,
+                "uptime": time.time() - self.started,
+                "requests": self.requests,
+                "cache": self.cache.stats(),
+            }
+        if op == "stop":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"stopping": True}
+        return {"error": f"Unknown request: {op}"}
+
+    def serve(self) -> None:
+        """Serve requests until the daemon is stopped, then remove the socket."""
+        streams = (sys.stdout, sys.stderr)
+        sys.stdout, sys.stderr = self._stdout, self._stderr
+        # Log output goes to the requesting client too
+        handlers = [
+            handler
+            for handler in logger.handlers
+            if isinstance(handler, logging.StreamHandler) and handler.stream in streams
+        ]
+        for handler in handlers:
+            handler.setStream(self._stdout if handler.stream is streams[0] else self._stderr)
+        activate(self.cache)
+        try:
+            with thread_log_levels():
+                self.serve_forever()
+        finally:
+            activate(None)
+            for handler in handlers:
+                handler.setStream(streams[0] if handler.stream is self._stdout else streams[1])
+            sys.stdout, sys.stderr = streams
+            self.server_close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+
+def send_request(
+    request: Dict[str, Any], path: Optional[str] = None, timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Send a request to the daemon and wait for the response.
+
+    Args:
+        request: Request dict
+        path: Socket path (defaults to socket_path())
+        timeout: Seconds to wait for the response (default: no limit)
+
+    Returns:
+        Response dict
+
+    Raises:
+        OSError: If the daemon cannot be reached
+    """
+    path = path or socket_path()
+    if not path:
+        raise DaemonError("The PANFlow daemon is disabled (PANFLOW_SOCKET is empty)")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(path)
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with client.makefile("rb") as response:
+            line = response.readline()
+    if not line:
+        raise ConnectionError(f"No response from the PANFlow daemon on {path}")
+    return json.loads(line)
+
+
+def ping(path: Optional[str] = None) -> bool:
+    """Check whether a daemon is listening on the socket."""
+    try:
+        return "pid" in send_request({"op": "status"}, path, timeout=2)
+    except (OSError, ValueError):
+        return False
+
+
+def forward_command(argv: Sequence[str], path: Optional[str] = None) -> Optional[int]:
+    """
+    Run a command line in the daemon if one is listening.
+
+    The command's output is written to this process's stdout and stderr.
+
+    Args:
+        argv: Command line words after the program name
+        path: Socket path (defaults to socket_path())
+
+    Returns:
+        The command's exit code, or None if the command must run locally
+    """
+    path = path or socket_path()
+    if not path or is_local(argv) or not os.path.exists(path):
+        return None
+    try:
+        response = send_request({"op": "run", "argv": absolute_paths(argv)}, path)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Not forwarding to the PANFlow daemon on {path}: {e}")
+        return None
+    if "exit_code" not in response:
+        logger.debug(f"PANFlow daemon rejected the command: {response.get('error')}")
+        return None
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    sys.stdout.flush()
+    return response["exit_code"]
@@ -14,7 +14,7 @@ import logging
 from typing import Dict, Any, Optional, List, Tuple, Union, Set
 from lxml import etree
 
-from .xpath_resolver import get_object_xpath
+from .xpath_resolver import find_object_elements, get_object_xpath
 from .config_loader import xpath_search
 
 # Initialize logger
@@ -192,7 +192,7 @@ class DeduplicationEngine:
                 if value_key:
                     if value_key not in by_value:
                         by_value[value_key] = []
-                    
+
                     # Store object with context information
                     by_value[value_key].append((name, addr, dict(context_info)))
                 else:
@@ -586,7 +586,7 @@ class DeduplicationEngine:
                                     references[source_name] = []
                                 ref_path = f"{path_name}:{policy_name}:source"
                                 references[source_name].append((ref_path, source))
-                                
+
                         for dest in policy.xpath("./destination/member"):
                             if dest.text and dest.text != "any":
                                 dest_name = dest.text
@@ -832,27 +832,27 @@ class DeduplicationEngine:
     def _format_reference_location(self, ref_path, context_kwargs=None):
         """
         Format a reference path into a human-readable location description.
-        
+
         Args:
             ref_path: Reference path string (e.g., "address-group:web-servers")
             context_kwargs: Optional context parameters for device group info
-            
+
         Returns:
             str: Formatted location description
         """
         if not ref_path:
             return "Unknown location"
-            
+
         # Use instance context_kwargs if not provided
         if context_kwargs is None:
             context_kwargs = self.context_kwargs
-            
+
         # Split the reference path
         parts = ref_path.split(":")
         ref_type = parts[0] if parts else ""
-        
+
         location_parts = []
-        
+
         # Add device group context if available
         if "device_group" in context_kwargs:
             location_parts.append(f"Device Group: {context_kwargs['device_group']}")
@@ -860,20 +860,20 @@ class DeduplicationEngine:
             location_parts.append("Device Group: Shared")
         elif self.context_type == "vsys" and "vsys" in context_kwargs:
             location_parts.append(f"VSYS: {context_kwargs['vsys']}")
-            
+
         # Format based on reference type
         if ref_type == "address-group":
             group_name = parts[1] if len(parts) > 1 else "unknown"
             location_parts.append(f"Address-Group: {group_name}")
-            
+
         elif ref_type == "service-group":
             group_name = parts[1] if len(parts) > 1 else "unknown"
             location_parts.append(f"Service-Group: {group_name}")
-            
+
         elif ref_type in ["security", "pre-security", "post-security"]:
             rule_name = parts[1] if len(parts) > 1 else "unknown"
             field = parts[2] if len(parts) > 2 else "unknown"
-            
+
             # Determine rulebase type
             if ref_type == "pre-security":
                 rulebase = "Pre-Rulebase Security"
@@ -881,15 +881,15 @@ class DeduplicationEngine:
                 rulebase = "Post-Rulebase Security"
             else:
                 rulebase = "Security"
-                
+
             location_parts.append(f"Rulebase: {rulebase}")
             location_parts.append(f"Rule: {rule_name}")
             location_parts.append(f"Field: {field}")
-            
+
         elif ref_type in ["nat", "pre-nat", "post-nat"]:
             rule_name = parts[1] if len(parts) > 1 else "unknown"
             field = parts[2] if len(parts) > 2 else "unknown"
-            
+
             # Determine rulebase type
             if ref_type == "pre-nat":
                 rulebase = "Pre-Rulebase NAT"
@@ -897,29 +897,29 @@ class DeduplicationEngine:
                 rulebase = "Post-Rulebase NAT"
             else:
                 rulebase = "NAT"
-                
+
             location_parts.append(f"Rulebase: {rulebase}")
             location_parts.append(f"Rule: {rule_name}")
             location_parts.append(f"Field: {field}")
-            
+
         elif ref_type == "app-override":
             rule_name = parts[1] if len(parts) > 1 else "unknown"
             field = parts[2] if len(parts) > 2 else "unknown"
             location_parts.append("Rulebase: Application Override")
             location_parts.append(f"Rule: {rule_name}")
             location_parts.append(f"Field: {field}")
-            
+
         elif ref_type == "decryption":
             rule_name = parts[1] if len(parts) > 1 else "unknown"
             field = parts[2] if len(parts) > 2 else "unknown"
             location_parts.append("Rulebase: Decryption")
             location_parts.append(f"Rule: {rule_name}")
             location_parts.append(f"Field: {field}")
-            
+
         else:
             # Fallback to raw path
             location_parts.append(ref_path)
-            
+
         return " | ".join(location_parts)
 
     def merge_duplicates(self, duplicates, references, primary_name_strategy="first"):
@@ -992,7 +992,7 @@ class DeduplicationEngine:
                     else:
                         name, obj = obj_tuple
                         context = None
-                        
+
                     # Skip the primary object
                     if name == primary_name:
                         continue
@@ -1011,17 +1011,17 @@ class DeduplicationEngine:
                     # Update references to this object
                     if name in references:
                         ref_count = len(references[name])
-                        
+
                         for ref_path, ref_elem in references[name]:
                             try:
                                 # Format the location for better readability
                                 location = self._format_reference_location(ref_path)
-                                
+
                                 # Log the detailed replacement message
                                 logger.info(
                                     f"Replacing reference to '{name}' with '{primary_name}' in {location}"
                                 )
-                                
+
                                 # Update the reference to point to primary_name
                                 old_text = ref_elem.text
                                 ref_elem.text = primary_name
@@ -1151,16 +1151,11 @@ class DeduplicationEngine:
             **kwargs: Additional context parameters (device_group, vsys, etc.)
         """
         try:
-            # Build the XPath for this context
-            context_xpath = get_object_xpath(
-                object_type, self.device_type, context_type, self.version, **kwargs
+            # Search with the compiled XPath of this context
+            objects = find_object_elements(
+                self.tree, object_type, self.device_type, context_type, self.version, **kwargs
             )
 
-            logger.debug(
-                f"Searching for {object_type} objects in {context_type} using XPath: {context_xpath}"
-            )
-            objects = xpath_search(self.tree, context_xpath)
-
             # Extract key context info (for reporting and decision making)
             context_info = {"type": context_type}
             if "device_group" in kwargs:
@@ -1378,17 +1373,17 @@ class DeduplicationEngine:
                     # Update references to this object
                     if name in references:
                         ref_count = len(references[name])
-                        
+
                         for ref_path, ref_elem in references[name]:
                             try:
                                 # Format the location for better readability
                                 location = self._format_reference_location(ref_path)
-                                
+
                                 # Log the detailed replacement message
                                 logger.info(
                                     f"Replacing reference to '{name}' with '{primary_name}' in {location}"
                                 )
-                                
+
                                 # Update the reference to point to primary_name
                                 old_text = ref_elem.text
                                 ref_elem.text = primary_name
@@ -1534,36 +1529,38 @@ class DeduplicationEngine:
 
         # Check if objects have context information (tuples of length 3)
         has_context = len(objects[0]) >= 3
-        
+
         # Special case for context-aware selection
         if strategy == "context_priority" and has_context:
             # Prioritize shared context first, then device groups by hierarchy level
             logger.debug("Using 'context_priority' strategy - prioritizing by context level")
-            
+
             # First check for shared context
-            shared_objects = [obj for obj in objects if obj[2].get('type') == 'shared']
+            shared_objects = [obj for obj in objects if obj[2].get("type") == "shared"]
             if shared_objects:
                 return shared_objects[0]
-                
+
             # If no shared objects, select objects from device groups
-            device_group_objects = [obj for obj in objects if obj[2].get('type') == 'device_group']
+            device_group_objects = [obj for obj in objects if obj[2].get("type") == "device_group"]
             if device_group_objects:
                 # Sort by level if available
-                if any('level' in obj[2] for obj in device_group_objects):
-                    sorted_dg_objects = sorted(device_group_objects, key=lambda x: x[2].get('level', 999))
+                if any("level" in obj[2] for obj in device_group_objects):
+                    sorted_dg_objects = sorted(
+                        device_group_objects, key=lambda x: x[2].get("level", 999)
+                    )
                     return sorted_dg_objects[0]
                 else:
                     # If no levels, just return the first device group object
                     return device_group_objects[0]
-            
+
             # Fall back to vsys objects
-            vsys_objects = [obj for obj in objects if obj[2].get('type') == 'vsys']
+            vsys_objects = [obj for obj in objects if obj[2].get("type") == "vsys"]
             if vsys_objects:
                 return vsys_objects[0]
-                
+
             # If no context-based selection works, fall back to first object
             return objects[0]
-            
+
         # Standard strategies
         if strategy == "first":
             logger.debug("Using 'first' strategy - selecting first object")
@@ -8,6 +8,7 @@ making it easier to work with the graph database consistently across the applica
 from typing import Dict, List, Any, Optional, Union, Set
 from lxml import etree
 
+from .config_cache import derived
 from .graph_utils import ConfigGraph
 from .query_language import Query
 from .query_engine import QueryExecutor
@@ -19,8 +20,14 @@ class GraphService:
     def __init__(self):
         self._graph_cache = {}  # Cache graphs by configuration and context
 
-    def get_graph(self, tree: etree._ElementTree, refresh: bool = False, 
-                device_type: str = None, context_type: str = None, **context_kwargs) -> ConfigGraph:
+    def get_graph(
+        self,
+        tree: etree._ElementTree,
+        refresh: bool = False,
+        device_type: str = None,
+        context_type: str = None,
+        **context_kwargs,
+    ) -> ConfigGraph:
         """
         Get or create a graph from the XML tree, respecting context parameters.
 
@@ -38,22 +45,36 @@ class GraphService:
         cache_key = f"{id(tree)}_{device_type}_{context_type}"
         if context_kwargs:
             cache_key += "_" + "_".join(f"{k}={v}" for k, v in sorted(context_kwargs.items()))
-        
+
         # Return cached graph if available and refresh is not requested
         if not refresh and cache_key in self._graph_cache:
             return self._graph_cache[cache_key]
-        
-        # Create a new graph with context information
-        graph = ConfigGraph(device_type, context_type, **context_kwargs)
-        graph.build_from_xml(tree)
-        
+
+        def build_graph() -> ConfigGraph:
+            # Create a new graph with context information
+            graph = ConfigGraph(device_type, context_type, **context_kwargs)
+            graph.build_from_xml(tree)
+            return graph
+
+        if refresh:
+            graph = build_graph()
+        else:
+            # Graphs of configurations kept by a long-running process are shared
+            graph = derived(tree, ("graph", cache_key.split("_", 1)[1]), build_graph)
+
         # Cache the graph
         self._graph_cache[cache_key] = graph
         return graph
 
     def find_objects_by_name_pattern(
-        self, tree: etree._ElementTree, object_type: str, pattern: str, case_sensitive: bool = False,
-        device_type: str = None, context_type: str = None, **context_kwargs
+        self,
+        tree: etree._ElementTree,
+        object_type: str,
+        pattern: str,
+        case_sensitive: bool = False,
+        device_type: str = None,
+        context_type: str = None,
+        **context_kwargs,
     ) -> List[str]:
         """
         Find objects by name pattern.
@@ -70,7 +91,9 @@ class GraphService:
         Returns:
             List of object names matching the pattern
         """
-        graph = self.get_graph(tree, device_type=device_type, context_type=context_type, **context_kwargs)
+        graph = self.get_graph(
+            tree, device_type=device_type, context_type=context_type, **context_kwargs
+        )
 
         # Implement case sensitivity
         case_modifier = "" if case_sensitive else "(?i)"
@@ -87,9 +110,9 @@ class GraphService:
         pattern: str,
         wildcard_support: bool = True,
         case_sensitive: bool = False,
-        device_type: str = None, 
-        context_type: str = None, 
-        **context_kwargs
+        device_type: str = None,
+        context_type: str = None,
+        **context_kwargs,
     ) -> List[str]:
         """
         Find objects by value pattern.
@@ -107,7 +130,9 @@ class GraphService:
         Returns:
             List of object names with values matching the pattern
         """
-        graph = self.get_graph(tree, device_type=device_type, context_type=context_type, **context_kwargs)
+        graph = self.get_graph(
+            tree, device_type=device_type, context_type=context_type, **context_kwargs
+        )
 
         # Process wildcards if supported
         if wildcard_support:
@@ -122,8 +147,12 @@ class GraphService:
         return self._execute_name_query(graph, query_text)
 
     def find_address_objects_containing_ip(
-        self, tree: etree._ElementTree, ip_fragment: str,
-        device_type: str = None, context_type: str = None, **context_kwargs
+        self,
+        tree: etree._ElementTree,
+        ip_fragment: str,
+        device_type: str = None,
+        context_type: str = None,
+        **context_kwargs,
     ) -> List[str]:
         """
         Find address objects containing a specific IP or subnet.
@@ -138,7 +167,9 @@ class GraphService:
         Returns:
             List of address object names containing the IP fragment
         """
-        graph = self.get_graph(tree, device_type=device_type, context_type=context_type, **context_kwargs)
+        graph = self.get_graph(
+            tree, device_type=device_type, context_type=context_type, **context_kwargs
+        )
 
         # Escape dots for regex
         ip_pattern = ip_fragment.replace(".", "\\.")
@@ -146,8 +177,14 @@ class GraphService:
         query_text = f"MATCH (a:address) WHERE a.value =~ '.*{ip_pattern}.*' RETURN a.name"
         return self._execute_name_query(graph, query_text)
 
-    def find_service_objects_with_port(self, tree: etree._ElementTree, port: str,
-                                 device_type: str = None, context_type: str = None, **context_kwargs) -> List[str]:
+    def find_service_objects_with_port(
+        self,
+        tree: etree._ElementTree,
+        port: str,
+        device_type: str = None,
+        context_type: str = None,
+        **context_kwargs,
+    ) -> List[str]:
         """
         Find service objects with a specific port.
 
@@ -161,13 +198,21 @@ class GraphService:
         Returns:
             List of service object names with the specified port
         """
-        graph = self.get_graph(tree, device_type=device_type, context_type=context_type, **context_kwargs)
+        graph = self.get_graph(
+            tree, device_type=device_type, context_type=context_type, **context_kwargs
+        )
 
         query_text = f"MATCH (s:service) WHERE s.dst_port == '{port}' RETURN s.name"
         return self._execute_name_query(graph, query_text)
 
-    def find_unused_objects(self, tree: etree._ElementTree, object_type: str,
-                        device_type: str = None, context_type: str = None, **context_kwargs) -> List[str]:
+    def find_unused_objects(
+        self,
+        tree: etree._ElementTree,
+        object_type: str,
+        device_type: str = None,
+        context_type: str = None,
+        **context_kwargs,
+    ) -> List[str]:
         """
         Find objects that are not referenced by any policy or group.
 
@@ -181,7 +226,9 @@ class GraphService:
         Returns:
             List of unused object names
         """
-        graph = self.get_graph(tree, device_type=device_type, context_type=context_type, **context_kwargs)
+        graph = self.get_graph(
+            tree, device_type=device_type, context_type=context_type, **context_kwargs
+        )
 
         query_text = f"""
         MATCH (a:{object_type}) 
@@ -191,8 +238,12 @@ class GraphService:
         return self._execute_name_query(graph, query_text)
 
     def execute_custom_query(
-        self, tree: etree._ElementTree, query_text: str,
-        device_type: str = None, context_type: str = None, **context_kwargs
+        self,
+        tree: etree._ElementTree,
+        query_text: str,
+        device_type: str = None,
+        context_type: str = None,
+        **context_kwargs,
     ) -> List[Dict[str, Any]]:
         """
         Execute a custom graph query.
@@ -207,7 +258,9 @@ class GraphService:
         Returns:
             List of result rows
         """
-        graph = self.get_graph(tree, device_type=device_type, context_type=context_type, **context_kwargs)
+        graph = self.get_graph(
+            tree, device_type=device_type, context_type=context_type, **context_kwargs
+        )
 
         # Ensure the query has a RETURN clause
         if "RETURN" not in query_text.upper():
@@ -224,9 +277,9 @@ class GraphService:
         object_type: str,
         query_text: str,
         name_attribute: str = "object_name",
-        device_type: str = None, 
-        context_type: str = None, 
-        **context_kwargs
+        device_type: str = None,
+        context_type: str = None,
+        **context_kwargs,
     ) -> List[Any]:
         """
         Filter a list of objects using a graph query.
@@ -245,7 +298,9 @@ class GraphService:
             Filtered list of objects
         """
         # Get names of objects matching the query
-        graph = self.get_graph(tree, device_type=device_type, context_type=context_type, **context_kwargs)
+        graph = self.get_graph(
+            tree, device_type=device_type, context_type=context_type, **context_kwargs
+        )
 
         # Ensure the query returns object names
         if "RETURN" not in query_text.upper():
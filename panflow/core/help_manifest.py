@@ -0,0 +1,103 @@
+"""
+Help manifest for the PANFlow launchers.
+
+``panflow --version`` and ``panflow [GROUP...] --help`` should answer without
+importing the CLI and its dependencies. The output of these command lines is
+rendered from the real Typer app when the package is built, by
+``python -m panflow.cli.registry``, and stored in a manifest shipped with the
+package. The launchers print from the manifest and fall back to the CLI for
+anything it does not cover; a test checks that the manifest matches the app.
+
+Reading the manifest only needs the standard library.
+"""
+
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict, Optional, Sequence
+
+logger = logging.getLogger("panflow")
+
+# Format version of the help manifest
+HELP_MANIFEST_FORMAT_VERSION = 1
+
+HELP_MANIFEST_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cli", "help_manifest.json"
+)
+
+# Terminal width the help pages are rendered for
+HELP_WIDTH = 80
+
+
+def load_help_manifest(path: str = HELP_MANIFEST_PATH) -> Optional[Dict[str, Any]]:
+    """
+    Read the help manifest.
+
+    Args:
+        path: Path of the manifest file
+
+    Returns:
+        The manifest, or None if it is missing, unreadable or of another format
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Cannot read help manifest {path}: {e}")
+        return None
+    if not isinstance(manifest, dict):
+        return None
+    if manifest.get("format_version") != HELP_MANIFEST_FORMAT_VERSION:
+        return None
+    return manifest
+
+
+def lookup_help(args: Sequence[str], manifest: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the output of a help or version command line from the manifest.
+
+    Covered command lines are ``--version``/``-V``, ``[GROUP...] --help`` and
+    a bare command group that shows its help when run without arguments.
+
+    Args:
+        args: Command line arguments after the program name
+        manifest: Help manifest
+
+    Returns:
+        The output the CLI prints, or None if the command line is not covered
+    """
+    args = list(args)
+    if args in (["--version"], ["-V"]):
+        return manifest["version_output"]
+
+    pages = manifest["pages"]
+    if args and args[-1] == "--help":
+        page = pages.get(" ".join(args[:-1]))
+        return page["help"] if page else None
+
+    page = pages.get(" ".join(args))
+    if page and page["no_args_is_help"]:
+        return page["help"]
+    return None
+
+
+def run_help(args: Sequence[str], path: str = HELP_MANIFEST_PATH) -> bool:
+    """
+    Print the output of a help or version command line from the manifest.
+
+    Args:
+        args: Command line arguments after the program name
+        path: Path of the manifest file
+
+    Returns:
+        Whether the output was printed; if not, the caller runs the CLI
+    """
+    manifest = load_help_manifest(path)
+    if manifest is None:
+        return False
+    output = lookup_help(args, manifest)
+    if output is None:
+        return False
+    sys.stdout.write(output)
+    return True
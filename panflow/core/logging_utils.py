@@ -7,7 +7,9 @@ This module provides functions for configuring and using the logging system.
 import logging
 import sys
 import os
-from typing import Optional, Union, Dict, Any
+import threading
+from contextlib import contextmanager
+from typing import Optional, Union, Dict, Any, Iterator
 
 # Define log levels
 LOG_LEVELS = {
@@ -22,6 +24,81 @@ LOG_LEVELS = {
 logger = logging.getLogger("panflow")
 
 
+class ThreadLogLevels(logging.Filter):
+    """
+    Handler filter applying a log level per thread.
+
+    A process running several CLI requests at once installs it with
+    :func:`thread_log_levels`, so the log level options of one request only
+    apply to the records logged by the thread running that request.
+    """
+
+    def __init__(self, default_level: int):
+        super().__init__()
+        self.default_level = default_level
+        self._local = threading.local()
+
+    @property
+    def level(self) -> int:
+        """Log level of the current thread."""
+        return getattr(self._local, "level", self.default_level)
+
+    @level.setter
+    def level(self, value: int) -> None:
+        self._local.level = value
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= self.level
+
+
+# Per-thread log levels while thread_log_levels() is active
+_thread_levels: Optional[ThreadLogLevels] = None
+
+
+@contextmanager
+def thread_log_levels() -> Iterator[ThreadLogLevels]:
+    """
+    Scope the log level options to the thread that sets them.
+
+    While active, the logger passes every record to its handlers and a
+    :class:`ThreadLogLevels` filter on the handlers drops the records below the
+    level of the thread logging them. Threads start at the current level.
+
+    Yields:
+        The installed filter
+    """
+    global _thread_levels
+    levels = ThreadLogLevels(logger.getEffectiveLevel())
+    handlers = [(handler, handler.level) for handler in logger.handlers]
+    logger_level = logger.level
+    for handler, _ in handlers:
+        handler.addFilter(levels)
+        handler.setLevel(logging.NOTSET)
+    logger.setLevel(logging.DEBUG)
+    _thread_levels = levels
+    try:
+        yield levels
+    finally:
+        _thread_levels = None
+        logger.setLevel(logger_level)
+        for handler, level in handlers:
+            handler.removeFilter(levels)
+            handler.setLevel(level)
+
+
+def _set_console_level(level: int) -> None:
+    """Set the log level of the logger and its console handlers, or of this thread."""
+    if _thread_levels is not None:
+        _thread_levels.level = level
+        return
+    logger.setLevel(level)
+    for handler in logger.handlers:
+        if isinstance(handler, logging.StreamHandler) and not isinstance(
+            handler, logging.FileHandler
+        ):
+            handler.setLevel(level)
+
+
 def configure_logging(
     level: str = "info",
     log_file: Optional[str] = None,
@@ -136,23 +213,9 @@ def log_structured(message: str, level: str = "info", **kwargs) -> None:
     """
     log_level = LOG_LEVELS.get(level.lower(), logging.INFO)
 
-    # Create a custom record factory to add extra_data
-    old_factory = logging.getLogRecordFactory()
-
-    def record_factory(*args, **kwargs):
-        record = old_factory(*args, **kwargs)
-        record.extra_data = kwargs
-        return record
-
-    # Set the custom factory
-    logging.setLogRecordFactory(record_factory)
-
-    # Log the message
+    # Attach the structured data to the record as extra_data
     logger.log(log_level, message, extra={"extra_data": kwargs})
 
-    # Restore the original factory
-    logging.setLogRecordFactory(old_factory)
-
 
 def log(message: str, level: str = "info", data: Optional[Dict[str, Any]] = None) -> None:
     """
@@ -178,24 +241,22 @@ def verbose_callback(value: bool) -> bool:
     """Typer callback for verbose flag"""
     if value:
         log_level = "debug"
-        current_handlers = logger.handlers
-        if not current_handlers:
+        if not logger.handlers:
             # Configure logging if not already configured
             configure_logging(level=log_level, quiet=False)
         else:
             # Just update the log level
-            logger.setLevel(LOG_LEVELS[log_level])
-            for handler in current_handlers:
-                if isinstance(handler, logging.StreamHandler) and not isinstance(
-                    handler, logging.FileHandler
-                ):
-                    handler.setLevel(LOG_LEVELS[log_level])
+            _set_console_level(LOG_LEVELS[log_level])
     return value
 
 
 def quiet_callback(value: bool) -> bool:
     """Typer callback for quiet flag"""
     if value:
+        if _thread_levels is not None:
+            # Silence this thread only
+            _thread_levels.level = logging.CRITICAL + 1
+            return value
         # Remove all stream handlers
         for handler in logger.handlers[:]:
             if isinstance(handler, logging.StreamHandler) and not isinstance(
@@ -212,15 +273,9 @@ def log_level_callback(value: str) -> str:
         valid_levels = ", ".join(LOG_LEVELS.keys())
         raise ValueError(f"Log level must be one of: {valid_levels}")
 
-    current_handlers = logger.handlers
-    if current_handlers:
+    if logger.handlers:
         # Update the log level
-        logger.setLevel(LOG_LEVELS[value])
-        for handler in current_handlers:
-            if isinstance(handler, logging.StreamHandler) and not isinstance(
-                handler, logging.FileHandler
-            ):
-                handler.setLevel(LOG_LEVELS[value])
+        _set_console_level(LOG_LEVELS[value])
 
     return value
 
@@ -0,0 +1,121 @@
+"""
+Precompiled XPath mapping bundle for PANFlow.
+
+The XPath mappings of every shipped PAN-OS version are compiled from the YAML
+files in ``panflow/xpath_mappings`` into the ``panflow.core._xpath_bundle``
+module, which is imported from its bytecode instead of parsing YAML at
+runtime. The bundle records a digest of each mapping file, and
+:func:`panflow.core.xpath_resolver.load_xpath_mappings` parses a file as YAML
+when it differs from the bundled version, so edited or added mapping files
+still take effect. The build scripts regenerate the bundle; after changing a
+mapping file, regenerate it with::
+
+    python -m panflow.core.mapping_bundle
+"""
+
+import os
+from typing import Any, Dict, List
+
+import yaml
+
+from .xpath_resolver import BUNDLE_FORMAT_VERSION, XPATH_DIR, _digest
+
+BUNDLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_xpath_bundle.py")
+
+BUNDLE_HEADER = '''"""
+Precompiled XPath mappings for PANFlow.
+
+Generated from the YAML files in panflow/xpath_mappings; do not edit. Regenerate
+after changing a mapping file with::
+
+    python -m panflow.core.mapping_bundle
+"""
+'''
+
+
+def _literal(value: Any) -> str:
+    """Format a scalar the way black writes it (double quotes unless that adds escapes)."""
+    literal = repr(value)
+    if isinstance(value, str) and literal[0] == "'" and '"' not in value:
+        literal = '"' + literal[1:-1].replace("\\'", "'") + '"'
+    return literal
+
+
+def _format(value: Any, indent: int = 0) -> str:
+    """
+    Format a mapping value as black-formatted Python source.
+
+    Dicts and lists are written one item per line with a trailing comma, so
+    black leaves the generated module unchanged.
+    """
+    if isinstance(value, dict):
+        items = [f"{_literal(key)}: {_format(item, indent + 4)}" for key, item in value.items()]
+        brackets = "{}"
+    elif isinstance(value, list):
+        items = [_format(item, indent + 4) for item in value]
+        brackets = "[]"
+    else:
+        return _literal(value)
+    if not items:
+        return brackets
+    lines: List[str] = [brackets[0]]
+    lines.extend(f"{' ' * (indent + 4)}{item}," for item in items)
+    lines.append(f"{' ' * indent}{brackets[1]}")
+    return "\n".join(lines)
+
+
+def build_mapping_bundle(xpath_dir: str = XPATH_DIR) -> str:
+    """
+    Build the source of the precompiled mapping bundle from the YAML files.
+
+    Args:
+        xpath_dir: Directory containing the ``panos_*.yaml`` mapping files
+
+    Returns:
+        Python source of the bundle module
+
+    Raises:
+        ValueError: If a mapping file cannot be parsed
+    """
+    sources: Dict[str, str] = {}
+    mappings: Dict[str, Any] = {}
+    for filename in sorted(os.listdir(xpath_dir)):
+        if not (filename.startswith("panos_") and filename.endswith(".yaml")):
+            continue
+        version = filename[6:-5].replace("_", ".")
+        with open(os.path.join(xpath_dir, filename), "r") as f:
+            text = f.read()
+        try:
+            mappings[version] = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Error parsing YAML in XPath mapping file {filename}: {e}")
+        sources[version] = _digest(text)
+
+    return (
+        f"{BUNDLE_HEADER}\n"
+        f"FORMAT_VERSION = {BUNDLE_FORMAT_VERSION}\n\n"
+        f"# SHA-256 digests of the mapping files, by PAN-OS version\n"
+        f"SOURCES = {_format(sources)}\n\n"
+        f"MAPPINGS = {_format(mappings)}\n"
+    )
+
+
+def write_mapping_bundle(path: str = BUNDLE_PATH) -> str:
+    """
+    Generate the precompiled mapping bundle and write it to a file.
+
+    Args:
+        path: Path of the bundle module
+
+    Returns:
+        Python source of the bundle module
+    """
+    source = build_mapping_bundle()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source)
+    return source
+
+
+if __name__ == "__main__":
+    write_mapping_bundle()
+    print(f"Wrote precompiled XPath mappings to {BUNDLE_PATH}")
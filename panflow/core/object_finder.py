@@ -10,7 +10,7 @@ from typing import Dict, Any, Optional, List, Tuple, Union, Set
 from lxml import etree
 import re
 
-from .xpath_resolver import get_object_xpath
+from .xpath_resolver import find_object_elements
 from .config_loader import xpath_search
 
 # Initialize logger
@@ -179,15 +179,18 @@ def find_objects_by_name(
     # Search for the object in each context
     for context_type, context_params in contexts:
         try:
-            # Get the XPath for this object in this context
-            xpath = get_object_xpath(
-                object_type, device_type, context_type, version, object_name, **context_params
-            )
-
             # For exact name match
             if not use_regex:
-                # Search for the object
-                elements = xpath_search(tree, xpath)
+                # Search for the object with the compiled XPath of this context
+                elements = find_object_elements(
+                    tree,
+                    object_type,
+                    device_type,
+                    context_type,
+                    version,
+                    object_name,
+                    **context_params,
+                )
 
                 if elements:
                     for element in elements:
@@ -198,11 +201,9 @@ def find_objects_by_name(
                         logger.debug(f"Found {obj_loc}")
             else:
                 # For regex matching, we need to get all objects of this type and filter by name
-                all_elements_xpath = get_object_xpath(
-                    object_type, device_type, context_type, version, **context_params
+                elements = find_object_elements(
+                    tree, object_type, device_type, context_type, version, **context_params
                 )
-                # The xpath already includes '/entry' (it's the path to all entries of this type)
-                elements = xpath_search(tree, all_elements_xpath)
 
                 logger.debug(f"Found {len(elements)} elements to check in {context_type}")
                 if elements:
@@ -294,15 +295,10 @@ def find_objects_by_value(
     # Search for objects in each context
     for context_type, context_params in contexts:
         try:
-            # Get the base XPath for this object type in this context
-            xpath_base = get_object_xpath(
-                object_type, device_type, context_type, version, **context_params
-            )
-
             # Get all objects of this type in this context
-            # Use xpath_base directly as it already includes the /entry part
-            xpath = xpath_base
-            elements = xpath_search(tree, xpath)
+            elements = find_object_elements(
+                tree, object_type, device_type, context_type, version, **context_params
+            )
 
             # Filter elements based on value criteria
             for element in elements:
@@ -431,7 +427,7 @@ def find_all_locations(
         "schedule",
         "region",
         # Using correct naming from YAML object definition keys:
-        "dynamic_user_group"  # Changed from "dynamic-user-group" to match YAML
+        "dynamic_user_group",  # Changed from "dynamic-user-group" to match YAML
         # Note: In the YAML, the key is "dynamic_user_group" (with underscores)
         # but the actual path is "/dynamic-user-group/" (with hyphens)
         # Removed "url-category" as it's not defined in YAML mappings
@@ -492,15 +488,10 @@ def find_all_locations(
 
         for context_type, context_params in contexts:
             try:
-                # Get the base XPath for this object type in this context
-                xpath_base = get_object_xpath(
-                    object_type, device_type, context_type, version, **context_params
-                )
-
                 # Get all objects of this type in this context
-                # Use xpath_base directly as it already includes the /entry part
-                xpath = xpath_base
-                elements = xpath_search(tree, xpath)
+                elements = find_object_elements(
+                    tree, object_type, device_type, context_type, version, **context_params
+                )
 
                 for element in elements:
                     obj_name = element.get("name")
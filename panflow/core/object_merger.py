@@ -11,7 +11,7 @@ from lxml import etree
 import copy
 import re
 
-from .xpath_resolver import get_object_xpath, get_context_xpath
+from .xpath_resolver import find_object_elements, get_object_xpath, get_context_xpath
 from .config_loader import xpath_search
 from .xml.base import clone_element, merge_elements, find_elements, find_element, element_exists
 from .object_validator import ObjectValidator
@@ -302,7 +302,8 @@ class ObjectMerger:
 
         # Get the source object
         try:
-            source_xpath = get_object_xpath(
+            source_elements = find_object_elements(
+                self.source_tree,
                 object_type,
                 self.source_device_type,
                 source_context_type,
@@ -311,9 +312,6 @@ class ObjectMerger:
                 **source_params,
             )
 
-            logger.debug(f"Looking for source object using XPath: {source_xpath}")
-            source_elements = xpath_search(self.source_tree, source_xpath)
-
             if not source_elements:
                 error_msg = f"Object '{object_name}' not found in source"
                 logger.error(error_msg)
@@ -345,7 +343,8 @@ class ObjectMerger:
 
         # Check if object exists in target
         try:
-            target_xpath = get_object_xpath(
+            target_elements = find_object_elements(
+                self.target_tree,
                 object_type,
                 self.target_device_type,
                 target_context_type,
@@ -354,9 +353,6 @@ class ObjectMerger:
                 **target_params,
             )
 
-            logger.debug(f"Checking if object exists in target using XPath: {target_xpath}")
-            target_elements = xpath_search(self.target_tree, target_xpath)
-
             if target_elements:
                 # Handle conflict using conflict resolution strategy
                 if conflict_strategy is None:
@@ -0,0 +1,400 @@
+"""
+Security rule matching for PANFlow.
+
+This module answers which security rule a flow hits. The rulebase is
+resolved with :class:`RuleResolver`, ordered the way the firewall evaluates
+it (Panorama pre-rules from shared down to the device group, then local
+rules, then post-rules from the device group back up to shared), and
+compiled into lookup tables.
+
+Tables are compiled per zone pair on first use. For each of source,
+destination and service, the rules of the zone pair are swept over the
+boundaries of their intervals, giving a sorted list of boundaries and the
+bitset of rules matching each elementary interval. A lookup is one binary
+search per dimension and an AND of the resulting bitsets; the lowest set bit
+is the first matching rule.
+"""
+
+import csv
+import ipaddress
+import logging
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from lxml import etree
+
+from .exceptions import ValidationError
+from .rule_resolver import IPV6_OFFSET, PROTOCOL_OFFSETS, MemberSet, ResolvedRule, RuleResolver
+
+logger = logging.getLogger("panflow")
+
+# Columns read from a flow CSV; missing columns leave that dimension unconstrained
+FLOW_COLUMNS = ("from", "to", "source", "destination", "protocol", "port", "application")
+
+# Opaque service members whose ports depend on the application
+PORT_AGNOSTIC_SERVICES = frozenset(["service:application-default"])
+
+
+def load_rulebase(
+    tree: etree._ElementTree,
+    device_type: str,
+    context_type: str,
+    version: str,
+    **kwargs,
+) -> List[Tuple[str, ResolvedRule]]:
+    """
+    Resolve the security rules evaluated for a context, in evaluation order.
+
+    Args:
+        tree: ElementTree containing the configuration
+        device_type: Type of device ("firewall" or "panorama")
+        context_type: Type of context (shared, device_group, vsys)
+        version: PAN-OS version
+        **kwargs: Additional parameters (device_group, vsys)
+
+    Returns:
+        List of (rulebase, rule) tuples, where rulebase is "local" on a firewall
+        and "pre:<context>" or "post:<context>" on Panorama
+    """
+    resolver = RuleResolver(tree, device_type, context_type, version, **kwargs)
+    if device_type.lower() != "panorama":
+        return [("local", rule) for rule in resolver.resolve_rules("security_rules")]
+
+    chain = resolver.context_chain()
+    stages = [("pre", context) for context in reversed(chain)]
+    stages += [("post", context) for context in chain]
+
+    resolvers: Dict[Tuple[str, Optional[str]], RuleResolver] = {}
+    rules = []
+    for stage, (stage_context, stage_kwargs) in stages:
+        label = stage_kwargs.get("device_group", "shared")
+        key = (stage_context, stage_kwargs.get("device_group"))
+        if key not in resolvers:
+            resolvers[key] = RuleResolver(tree, device_type, stage_context, version, **stage_kwargs)
+        for rule in resolvers[key].resolve_rules(f"security_{stage}_rules"):
+            rules.append((f"{stage}:{label}", rule))
+    return rules
+
+
+def address_point(value: str) -> int:
+    """
+    Convert an IP address into its position in the resolver's address space.
+
+    Args:
+        value: IPv4 or IPv6 address
+
+    Returns:
+        Integer position of the address
+
+    Raises:
+        ValidationError: If the value is not an IP address
+    """
+    try:
+        address = ipaddress.ip_address(value.strip())
+    except ValueError:
+        raise ValidationError(f"Invalid IP address: {value}")
+    return int(address) + (IPV6_OFFSET if address.version == 6 else 0)
+
+
+def service_point(protocol: str, port: Any) -> int:
+    """
+    Convert a protocol and destination port into a position in the service space.
+
+    Args:
+        protocol: "tcp", "udp" or "sctp"
+        port: Destination port
+
+    Returns:
+        Integer position of the port
+
+    Raises:
+        ValidationError: If the protocol or port is invalid
+    """
+    offset = PROTOCOL_OFFSETS.get(protocol.lower())
+    try:
+        port = int(port)
+    except (TypeError, ValueError):
+        raise ValidationError(f"Invalid port: {port}")
+    if offset is None or not 0 <= port <= 65535:
+        raise ValidationError(f"Invalid protocol/port: {protocol}/{port}")
+    return offset + port
+
+
+def default_rule(from_zone: Optional[str], to_zone: Optional[str]) -> Tuple[str, str]:
+    """
+    Get the predefined rule that handles flows no configured rule matches.
+
+    Args:
+        from_zone: Source zone
+        to_zone: Destination zone
+
+    Returns:
+        (rule name, action) of the intrazone or interzone default rule
+    """
+    if from_zone is not None and from_zone == to_zone:
+        return "intrazone-default", "allow"
+    return "interzone-default", "deny"
+
+
+class _Dimension:
+    """Elementary-interval lookup table for one range field of a zone pair."""
+
+    __slots__ = ("bounds", "slots", "wildcard", "negated")
+
+    def __init__(self, rules: List[ResolvedRule], field: str):
+        toggles: Dict[int, int] = defaultdict(int)
+        self.wildcard = 0
+        self.negated = 0
+
+        for local_id, rule in enumerate(rules):
+            bit = 1 << local_id
+            members: MemberSet = rule.negated.get(field) or rule.fields[field]
+            if field in rule.negated:
+                self.negated |= bit
+            if members.any or (field == "service" and members.names & PORT_AGNOSTIC_SERVICES):
+                self.wildcard |= bit
+                continue
+            # Intervals of one set never touch, so entering and leaving toggle the bit
+            for low, high in members.ranges.intervals:
+                toggles[low] ^= bit
+                toggles[high + 1] ^= bit
+
+        self.bounds = sorted(toggles)
+        self.slots = []
+        running = 0
+        for bound in self.bounds:
+            running ^= toggles[bound]
+            self.slots.append(running)
+
+    def match(self, point: int) -> int:
+        """Bitset of rules matching a point."""
+        index = bisect_right(self.bounds, point) - 1
+        bits = self.slots[index] if index >= 0 else 0
+        return (bits | self.wildcard) ^ self.negated
+
+
+class _ZonePairTable:
+    """Compiled lookup tables for the rules of one zone pair."""
+
+    __slots__ = ("entries", "all_bits", "source", "destination", "service", "app_any", "apps")
+
+    def __init__(self, entries: List[Tuple[str, ResolvedRule]]):
+        self.entries = entries
+        rules = [rule for _, rule in entries]
+        self.all_bits = (1 << len(rules)) - 1
+        self.source = _Dimension(rules, "source")
+        self.destination = _Dimension(rules, "destination")
+        self.service = _Dimension(rules, "service")
+
+        self.app_any = 0
+        self.apps: Dict[str, int] = defaultdict(int)
+        for local_id, rule in enumerate(rules):
+            applications = rule.fields["application"]
+            if applications.any:
+                self.app_any |= 1 << local_id
+            else:
+                for name in applications.names:
+                    self.apps[name] |= 1 << local_id
+
+
+class RuleMatcher:
+    """
+    Finds the first security rule matching a flow.
+
+    Dimensions left out of a lookup (no port, no application, ...) do not
+    constrain the match. Source users and URL categories are not part of a
+    flow and are ignored. Address members that cannot be resolved to IP
+    ranges (FQDNs, dynamic groups) never match an address, and
+    ``application-default`` matches any port.
+    """
+
+    def __init__(self, rules: Iterable[Tuple[str, ResolvedRule]]):
+        """
+        Index the enabled rules.
+
+        Args:
+            rules: (rulebase, rule) tuples in evaluation order, as returned by load_rulebase
+        """
+        self.entries = [(rulebase, rule) for rulebase, rule in rules if not rule.disabled]
+        self._zone_any: Dict[str, int] = {"from": 0, "to": 0}
+        self._zone_bits: Dict[str, Dict[str, int]] = {
+            "from": defaultdict(int),
+            "to": defaultdict(int),
+        }
+        for rule_id, (_, rule) in enumerate(self.entries):
+            for field in ("from", "to"):
+                zones = rule.fields[field]
+                if zones.any:
+                    self._zone_any[field] |= 1 << rule_id
+                else:
+                    for zone in zones.names:
+                        self._zone_bits[field][zone] |= 1 << rule_id
+        self._tables: Dict[Tuple[Optional[str], Optional[str]], _ZonePairTable] = {}
+
+    @classmethod
+    def from_config(
+        cls,
+        tree: etree._ElementTree,
+        device_type: str,
+        context_type: str,
+        version: str,
+        **kwargs,
+    ) -> "RuleMatcher":
+        """
+        Build a matcher for the rulebase evaluated in a context.
+
+        Args:
+            tree: ElementTree containing the configuration
+            device_type: Type of device ("firewall" or "panorama")
+            context_type: Type of context (shared, device_group, vsys)
+            version: PAN-OS version
+            **kwargs: Additional parameters (device_group, vsys)
+
+        Returns:
+            RuleMatcher instance
+        """
+        return cls(load_rulebase(tree, device_type, context_type, version, **kwargs))
+
+    def _zone_mask(self, field: str, zone: Optional[str]) -> int:
+        if zone is None:
+            return (1 << len(self.entries)) - 1
+        return self._zone_any[field] | self._zone_bits[field].get(zone, 0)
+
+    def compile(self, from_zone: Optional[str], to_zone: Optional[str]) -> _ZonePairTable:
+        """
+        Get the lookup tables for a zone pair, compiling them on first use.
+
+        Args:
+            from_zone: Source zone (None for any zone)
+            to_zone: Destination zone (None for any zone)
+
+        Returns:
+            Compiled zone pair table
+        """
+        key = (from_zone, to_zone)
+        table = self._tables.get(key)
+        if table is None:
+            mask = self._zone_mask("from", from_zone) & self._zone_mask("to", to_zone)
+            entries = [entry for rule_id, entry in enumerate(self.entries) if mask >> rule_id & 1]
+            table = _ZonePairTable(entries)
+            self._tables[key] = table
+            logger.debug(f"Compiled {len(entries)} rules for zone pair {from_zone} -> {to_zone}")
+        return table
+
+    def lookup(
+        self,
+        from_zone: Optional[str] = None,
+        to_zone: Optional[str] = None,
+        source: Optional[str] = None,
+        destination: Optional[str] = None,
+        protocol: str = "tcp",
+        port: Optional[Any] = None,
+        application: Optional[str] = None,
+    ) -> Optional[Tuple[str, ResolvedRule]]:
+        """
+        Find the first rule matching a flow.
+
+        Args:
+            from_zone: Source zone
+            to_zone: Destination zone
+            source: Source IP address
+            destination: Destination IP address
+            protocol: IP protocol ("tcp", "udp" or "sctp")
+            port: Destination port
+            application: Application name
+
+        Returns:
+            (rulebase, rule) tuple of the matching rule, or None if only the
+            default rules match
+
+        Raises:
+            ValidationError: If an address, protocol or port is invalid
+        """
+        table = self.compile(from_zone, to_zone)
+        bits = table.all_bits
+        if source:
+            bits &= table.source.match(address_point(source))
+        if destination and bits:
+            bits &= table.destination.match(address_point(destination))
+        if port not in (None, "") and bits:
+            bits &= table.service.match(service_point(protocol or "tcp", port))
+        if application and bits:
+            bits &= table.app_any | table.apps.get(application, 0)
+        if not bits:
+            return None
+        return table.entries[(bits & -bits).bit_length() - 1]
+
+    def match_flows(self, flows: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Match many flows, yielding each flow with the matched rule added.
+
+        Args:
+            flows: Dictionaries keyed by FLOW_COLUMNS
+
+        Yields:
+            Copies of the flows with "rule", "rulebase" and "action" keys; flows
+            with invalid values get an "error" key instead
+        """
+        for flow in flows:
+            result = dict(flow)
+            try:
+                match = self.lookup(
+                    from_zone=flow.get("from") or None,
+                    to_zone=flow.get("to") or None,
+                    source=flow.get("source"),
+                    destination=flow.get("destination"),
+                    protocol=flow.get("protocol") or "tcp",
+                    port=flow.get("port"),
+                    application=flow.get("application"),
+                )
+            except ValidationError as e:
+                result.update({"rule": "", "rulebase": "", "action": "", "error": str(e)})
+                yield result
+                continue
+
+            if match is None:
+                name, action = default_rule(flow.get("from"), flow.get("to"))
+                result.update({"rule": name, "rulebase": "default", "action": action})
+            else:
+                rulebase, rule = match
+                result.update({"rule": rule.name, "rulebase": rulebase, "action": rule.action})
+            yield result
+
+
+def match_flow_file(matcher: RuleMatcher, input_file: str, output_file: str) -> Dict[str, int]:
+    """
+    Match every flow of a CSV file and write the results as CSV.
+
+    The input needs a header row naming some of FLOW_COLUMNS; extra columns
+    are copied through. The output adds rule, rulebase and action columns.
+
+    Args:
+        matcher: Rule matcher
+        input_file: Path of the flow CSV
+        output_file: Path of the result CSV
+
+    Returns:
+        Dictionary with the number of flows, matched flows and invalid flows
+    """
+    stats = {"flows": 0, "matched": 0, "invalid": 0}
+    with open(input_file, newline="") as infile, open(output_file, "w", newline="") as outfile:
+        reader = csv.DictReader(infile)
+        fieldnames = list(reader.fieldnames or [])
+        fieldnames += [c for c in ("rule", "rulebase", "action", "error") if c not in fieldnames]
+        writer = csv.DictWriter(outfile, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+
+        for result in matcher.match_flows(reader):
+            stats["flows"] += 1
+            if "error" in result:
+                stats["invalid"] += 1
+            elif result["rulebase"] != "default":
+                stats["matched"] += 1
+            writer.writerow(result)
+
+    logger.info(
+        f"Matched {stats['matched']} of {stats['flows']} flows from {input_file} "
+        f"({stats['invalid']} invalid)"
+    )
+    return stats
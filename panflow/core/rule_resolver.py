@@ -0,0 +1,714 @@
+"""
+Rule resolution for PANFlow.
+
+This module resolves the member names used in security rules into normalized
+value sets so rules can be compared by what they match rather than by how
+their members are named. Addresses and address groups resolve to sets of
+IPv4/IPv6 intervals, services and service groups to sets of port ranges, and
+zones, applications and other name-based fields to name sets.
+
+All ranges of a field share one integer space: IPv4 addresses occupy
+``[0, 2**32)`` and IPv6 addresses follow, while TCP, UDP and SCTP ports are
+stacked in blocks of 65536. Anything that cannot be resolved to ranges
+(FQDNs, dynamic groups, external lists, negated fields) is kept as an opaque
+token that only ``any`` or the same token covers, so comparisons never
+report a coverage that does not exist.
+"""
+
+import ipaddress
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from lxml import etree
+
+from .config_loader import xpath_search
+from .xpath_resolver import get_object_xpath, get_policy_xpath
+
+logger = logging.getLogger("panflow")
+
+IPV6_OFFSET = 1 << 32
+PORT_SPACE = 65536
+PROTOCOL_OFFSETS = {"tcp": 0, "udp": PORT_SPACE, "sctp": 2 * PORT_SPACE}
+
+# Predefined PAN-OS services
+PREDEFINED_SERVICES = {
+    "service-http": [("tcp", 80, 80), ("tcp", 8080, 8080)],
+    "service-https": [("tcp", 443, 443)],
+}
+
+# Rule fields that resolve to address and port ranges; the rest are name sets
+ADDRESS_FIELDS = ("source", "destination")
+SERVICE_FIELDS = ("service",)
+RULE_FIELDS = (
+    "from",
+    "to",
+    "source",
+    "destination",
+    "application",
+    "service",
+    "source-user",
+    "category",
+)
+
+
+class IntervalSet:
+    """
+    An immutable set of integers stored as sorted, disjoint, non-adjacent intervals.
+
+    Intervals are inclusive ``(low, high)`` tuples.
+    """
+
+    __slots__ = ("intervals",)
+
+    def __init__(self, intervals: Iterable[Tuple[int, int]] = ()):
+        merged: List[Tuple[int, int]] = []
+        for low, high in sorted(intervals):
+            if merged and low <= merged[-1][1] + 1:
+                if high > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], high)
+            else:
+                merged.append((low, high))
+        self.intervals: Tuple[Tuple[int, int], ...] = tuple(merged)
+
+    def __bool__(self) -> bool:
+        return bool(self.intervals)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, IntervalSet) and self.intervals == other.intervals
+
+    def __hash__(self) -> int:
+        return hash(self.intervals)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self.intervals)})"
+
+    def __contains__(self, value: int) -> bool:
+        index = bisect_right(self.intervals, (value, float("inf"))) - 1
+        return index >= 0 and self.intervals[index][1] >= value
+
+    @classmethod
+    def _from_normalized(cls, intervals: Tuple[Tuple[int, int], ...]) -> "IntervalSet":
+        instance = cls.__new__(cls)
+        instance.intervals = intervals
+        return instance
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        """Return the union of two interval sets."""
+        if not other.intervals:
+            return self
+        if not self.intervals:
+            return other
+        if len(other.intervals) > 8:
+            return IntervalSet(self.intervals + other.intervals)
+
+        # Splice a few intervals into a long set without re-sorting it
+        intervals = self.intervals
+        for low, high in other.intervals:
+            start = bisect_left(intervals, (low,))
+            if start and intervals[start - 1][1] >= low - 1:
+                start -= 1
+            end = start
+            while end < len(intervals) and intervals[end][0] <= high + 1:
+                end += 1
+            if end > start:
+                low = min(low, intervals[start][0])
+                high = max(high, intervals[end - 1][1])
+            intervals = intervals[:start] + ((low, high),) + intervals[end:]
+        return IntervalSet._from_normalized(intervals)
+
+    def covers(self, other: "IntervalSet") -> bool:
+        """Check whether every value in ``other`` is also in this set."""
+        mine = self.intervals
+        index = 0
+        for low, high in other.intervals:
+            while index < len(mine) and mine[index][1] < low:
+                index += 1
+            if index == len(mine) or mine[index][0] > low or mine[index][1] < high:
+                return False
+        return True
+
+    def intersects(self, other: "IntervalSet") -> bool:
+        """Check whether the two sets share at least one value."""
+        a, b = self.intervals, other.intervals
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i][1] < b[j][0]:
+                i += 1
+            elif b[j][1] < a[i][0]:
+                j += 1
+            else:
+                return True
+        return False
+
+
+EMPTY_INTERVALS = IntervalSet()
+
+
+class MemberSet:
+    """
+    The resolved values of one rule field.
+
+    A member set is either ``any`` or the combination of an interval set and
+    a set of opaque names.
+    """
+
+    __slots__ = ("any", "ranges", "names")
+
+    def __init__(
+        self,
+        is_any: bool = False,
+        ranges: IntervalSet = EMPTY_INTERVALS,
+        names: FrozenSet[str] = frozenset(),
+    ):
+        self.any = is_any
+        self.ranges = EMPTY_INTERVALS if is_any else ranges
+        self.names = frozenset() if is_any else names
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, MemberSet)
+            and self.any == other.any
+            and self.ranges == other.ranges
+            and self.names == other.names
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.any, self.ranges, self.names))
+
+    def __repr__(self) -> str:
+        if self.any:
+            return "MemberSet(any)"
+        return f"MemberSet({self.ranges!r}, names={sorted(self.names)})"
+
+    def union(self, other: "MemberSet") -> "MemberSet":
+        """Return the union of two member sets."""
+        if self.any or other.any:
+            return ANY_MEMBERS
+        return MemberSet(False, self.ranges.union(other.ranges), self.names | other.names)
+
+    def covers(self, other: "MemberSet") -> bool:
+        """Check whether this set matches everything ``other`` matches."""
+        if self.any:
+            return True
+        if other.any:
+            return False
+        return other.names <= self.names and self.ranges.covers(other.ranges)
+
+    def intersects(self, other: "MemberSet") -> bool:
+        """Check whether the two sets match at least one common value."""
+        if self.any or other.any:
+            return True
+        return bool(self.names & other.names) or self.ranges.intersects(other.ranges)
+
+
+ANY_MEMBERS = MemberSet(True)
+
+
+def parse_address_value(value: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse an IP address, network or range into an interval of the address space.
+
+    Args:
+        value: Value such as ``10.0.0.0/8``, ``2001:db8::1`` or ``10.0.0.1-10.0.0.9``
+
+    Returns:
+        Inclusive (low, high) interval, or None if the value is not an address
+    """
+    try:
+        if "-" in value:
+            start, end = (ipaddress.ip_address(part.strip()) for part in value.split("-", 1))
+            if start.version != end.version or int(end) < int(start):
+                return None
+            offset = IPV6_OFFSET if start.version == 6 else 0
+            return offset + int(start), offset + int(end)
+
+        network = ipaddress.ip_network(value.strip(), strict=False)
+    except ValueError:
+        return None
+
+    offset = IPV6_OFFSET if network.version == 6 else 0
+    return offset + int(network.network_address), offset + int(network.broadcast_address)
+
+
+def parse_port_ranges(protocol: str, ports: str) -> List[Tuple[int, int]]:
+    """
+    Parse a PAN-OS port specification such as ``80,443,8000-8080``.
+
+    Args:
+        protocol: "tcp", "udp" or "sctp"
+        ports: Comma separated ports and port ranges
+
+    Returns:
+        List of inclusive intervals in the service space
+    """
+    offset = PROTOCOL_OFFSETS[protocol]
+    intervals = []
+    for part in ports.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            low, high = part.split("-", 1)
+            intervals.append((offset + int(low), offset + int(high)))
+        else:
+            intervals.append((offset + int(part), offset + int(part)))
+    return intervals
+
+
+def _members(element: Optional[etree._Element], path: str) -> List[str]:
+    if element is None:
+        return []
+    return [member.text for member in element.findall(path) if member.text]
+
+
+class RuleResolver:
+    """
+    Resolves rule members to member sets within one configuration context.
+
+    Objects are looked up from the most specific context outward: the
+    device group and its parent device groups (or the vsys), then shared.
+    Resolved names are memoized, so every object and group is expanded once.
+    """
+
+    def __init__(
+        self,
+        tree: etree._ElementTree,
+        device_type: str,
+        context_type: str,
+        version: str,
+        **kwargs,
+    ):
+        """
+        Load the objects visible from a context.
+
+        Args:
+            tree: ElementTree containing the configuration
+            device_type: Type of device ("firewall" or "panorama")
+            context_type: Type of context (shared, device_group, vsys)
+            version: PAN-OS version
+            **kwargs: Additional parameters (device_group, vsys)
+        """
+        self.tree = tree
+        self.device_type = device_type
+        self.context_type = context_type
+        self.version = version
+        self.context_kwargs = kwargs
+
+        self.addresses: Dict[str, etree._Element] = {}
+        self.address_groups: Dict[str, etree._Element] = {}
+        self.services: Dict[str, etree._Element] = {}
+        self.service_groups: Dict[str, etree._Element] = {}
+        self.application_groups: Dict[str, etree._Element] = {}
+
+        # Nearer contexts are loaded last so their objects override shared ones
+        for context_type, context_kwargs in reversed(self.context_chain()):
+            for object_type, table in (
+                ("address", self.addresses),
+                ("address-group", self.address_groups),
+                ("service", self.services),
+                ("service-group", self.service_groups),
+                ("application-group", self.application_groups),
+            ):
+                table.update(self._load_objects(object_type, context_type, context_kwargs))
+
+        self._address_cache: Dict[str, MemberSet] = {}
+        self._service_cache: Dict[str, MemberSet] = {}
+        self._application_cache: Dict[str, FrozenSet[str]] = {}
+
+    def context_chain(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Return the contexts whose objects are visible, nearest first."""
+        chain: List[Tuple[str, Dict[str, Any]]] = []
+        if self.context_type == "device_group":
+            device_group = self.context_kwargs.get("device_group")
+            seen: Set[str] = set()
+            while device_group and device_group not in seen:
+                seen.add(device_group)
+                chain.append(("device_group", {"device_group": device_group}))
+                parents = xpath_search(
+                    self.tree,
+                    f"/config/devices/entry/device-group/entry[@name='{device_group}']/parent-dg",
+                )
+                device_group = parents[0].text if parents else None
+        elif self.context_type != "shared":
+            chain.append((self.context_type, dict(self.context_kwargs)))
+        chain.append(("shared", {}))
+        return chain
+
+    def _load_objects(
+        self, object_type: str, context_type: str, context_kwargs: Dict[str, Any]
+    ) -> Dict[str, etree._Element]:
+        try:
+            xpath = get_object_xpath(
+                object_type, self.device_type, context_type, self.version, **context_kwargs
+            )
+        except ValueError:
+            return {}
+        return {e.get("name"): e for e in xpath_search(self.tree, xpath) if e.get("name")}
+
+    @staticmethod
+    def _complete(name: str, cuts: Set[str], parent_cuts: Optional[Set[str]]) -> bool:
+        """
+        Check whether a group resolution can be cached.
+
+        ``cuts`` holds the groups skipped while resolving ``name`` because
+        they were already being resolved further up. A group reached inside
+        a cycle misses their members, so it is only complete if it cycles
+        back to nothing but itself. The remaining cuts are passed up to the
+        caller's resolution.
+        """
+        cuts.discard(name)
+        if parent_cuts is not None:
+            parent_cuts |= cuts
+        return not cuts
+
+    def resolve_address(
+        self, name: str, _seen: Optional[Set[str]] = None, _cuts: Optional[Set[str]] = None
+    ) -> MemberSet:
+        """
+        Resolve an address, address group or literal address to a member set.
+
+        Args:
+            name: Member name as used in a rule
+
+        Returns:
+            Resolved member set
+        """
+        if name == "any":
+            return ANY_MEMBERS
+        cached = self._address_cache.get(name)
+        if cached is not None:
+            return cached
+
+        result = None
+        element = self.addresses.get(name)
+        if element is not None:
+            interval = None
+            for tag in ("ip-netmask", "ip-range"):
+                value = element.findtext(tag)
+                if value:
+                    interval = parse_address_value(value)
+                    break
+            if interval is not None:
+                result = MemberSet(ranges=IntervalSet([interval]))
+            else:
+                # FQDN and wildcard objects cannot be compared by value
+                result = MemberSet(names=frozenset([f"address:{name}"]))
+        elif name in self.address_groups:
+            group = self.address_groups[name]
+            static = group.find("static")
+            seen = (_seen or set()) | {name}
+            if static is not None:
+                result = MemberSet()
+                cuts: Set[str] = set()
+                for member in _members(static, "member"):
+                    if member in seen:
+                        cuts.add(member)
+                        continue
+                    result = result.union(self.resolve_address(member, seen, cuts))
+                if not self._complete(name, cuts, _cuts):
+                    return result
+            else:
+                # Dynamic group membership is only known on the device
+                result = MemberSet(names=frozenset([f"address-group:{name}"]))
+        else:
+            interval = parse_address_value(name)
+            if interval is not None:
+                result = MemberSet(ranges=IntervalSet([interval]))
+            else:
+                # External dynamic lists, regions and unknown names
+                result = MemberSet(names=frozenset([f"address:{name}"]))
+
+        self._address_cache[name] = result
+        return result
+
+    def resolve_service(
+        self, name: str, _seen: Optional[Set[str]] = None, _cuts: Optional[Set[str]] = None
+    ) -> MemberSet:
+        """
+        Resolve a service or service group to a member set of port ranges.
+
+        Args:
+            name: Member name as used in a rule
+
+        Returns:
+            Resolved member set
+        """
+        if name == "any":
+            return ANY_MEMBERS
+        cached = self._service_cache.get(name)
+        if cached is not None:
+            return cached
+
+        result = None
+        element = self.services.get(name)
+        if element is not None:
+            intervals: List[Tuple[int, int]] = []
+            opaque = False
+            for protocol in PROTOCOL_OFFSETS:
+                protocol_element = element.find(f"protocol/{protocol}")
+                if protocol_element is None:
+                    continue
+                # A source port restriction makes the service narrower than its ports
+                if protocol_element.findtext("source-port"):
+                    opaque = True
+                    break
+                try:
+                    intervals.extend(
+                        parse_port_ranges(protocol, protocol_element.findtext("port") or "")
+                    )
+                except ValueError:
+                    opaque = True
+            if opaque or not intervals:
+                result = MemberSet(names=frozenset([f"service:{name}"]))
+            else:
+                result = MemberSet(ranges=IntervalSet(intervals))
+        elif name in self.service_groups:
+            seen = (_seen or set()) | {name}
+            result = MemberSet()
+            cuts: Set[str] = set()
+            for member in _members(self.service_groups[name], "members/member"):
+                if member in seen:
+                    cuts.add(member)
+                    continue
+                result = result.union(self.resolve_service(member, seen, cuts))
+            if not self._complete(name, cuts, _cuts):
+                return result
+        elif name in PREDEFINED_SERVICES:
+            result = MemberSet(
+                ranges=IntervalSet(
+                    (PROTOCOL_OFFSETS[protocol] + low, PROTOCOL_OFFSETS[protocol] + high)
+                    for protocol, low, high in PREDEFINED_SERVICES[name]
+                )
+            )
+        else:
+            # application-default and unknown services
+            result = MemberSet(names=frozenset([f"service:{name}"]))
+
+        self._service_cache[name] = result
+        return result
+
+    def resolve_application(
+        self, name: str, _seen: Optional[Set[str]] = None, _cuts: Optional[Set[str]] = None
+    ) -> FrozenSet[str]:
+        """
+        Expand an application or application group into application names.
+
+        Args:
+            name: Member name as used in a rule
+
+        Returns:
+            Set of application names
+        """
+        cached = self._application_cache.get(name)
+        if cached is not None:
+            return cached
+
+        group = self.application_groups.get(name)
+        if group is None:
+            result = frozenset([name])
+        else:
+            seen = (_seen or set()) | {name}
+            names: Set[str] = set()
+            cuts: Set[str] = set()
+            for member in _members(group, "members/member"):
+                if member in seen:
+                    cuts.add(member)
+                else:
+                    names |= self.resolve_application(member, seen, cuts)
+            result = frozenset(names)
+            if not self._complete(name, cuts, _cuts):
+                return result
+
+        self._application_cache[name] = result
+        return result
+
+    def resolve_field(self, field: str, members: List[str]) -> MemberSet:
+        """
+        Resolve the members of a rule field.
+
+        Args:
+            field: Rule field name (source, destination, service, from, ...)
+            members: Member names listed in the rule
+
+        Returns:
+            Resolved member set; an empty member list means ``any``
+        """
+        if not members or "any" in members:
+            return ANY_MEMBERS
+
+        if field in ADDRESS_FIELDS:
+            resolve = self.resolve_address
+        elif field in SERVICE_FIELDS:
+            resolve = self.resolve_service
+        elif field == "application":
+            names: Set[str] = set()
+            for member in members:
+                names |= self.resolve_application(member)
+            return MemberSet(names=frozenset(names))
+        else:
+            return MemberSet(names=frozenset(members))
+
+        result = MemberSet()
+        for member in members:
+            result = result.union(resolve(member))
+        return result
+
+    def resolve_rule(self, rule: etree._Element) -> "ResolvedRule":
+        """
+        Resolve a security rule entry.
+
+        Args:
+            rule: Rule entry element
+
+        Returns:
+            Resolved rule
+        """
+        name = rule.get("name", "")
+        fields = {}
+        for field in RULE_FIELDS:
+            fields[field] = self.resolve_field(field, _members(rule.find(field), "member"))
+
+        # Negated fields match the complement, which is kept opaque
+        negated = {}
+        for field in ADDRESS_FIELDS:
+            if rule.findtext(f"negate-{field}") == "yes":
+                negated[field] = fields[field]
+                fields[field] = MemberSet(names=frozenset([f"negate-{field}:{name}"]))
+
+        return ResolvedRule(
+            name=name,
+            action=rule.findtext("action") or "allow",
+            disabled=rule.findtext("disabled") == "yes",
+            fields=fields,
+            negated=negated,
+        )
+
+    def resolve_rules(self, policy_type: str) -> List["ResolvedRule"]:
+        """
+        Resolve every rule of a rulebase, in rulebase order.
+
+        Args:
+            policy_type: Type of policy (security_rules, security_pre_rules, ...)
+
+        Returns:
+            List of resolved rules with their positions set
+        """
+        xpath = get_policy_xpath(
+            policy_type, self.device_type, self.context_type, self.version, **self.context_kwargs
+        )
+        containers = xpath_search(self.tree, xpath)
+        rules = []
+        if containers:
+            for rule in containers[0]:
+                if rule.tag == "entry" and rule.get("name"):
+                    resolved = self.resolve_rule(rule)
+                    resolved.position = len(rules)
+                    rules.append(resolved)
+        return rules
+
+
+class ResolvedRule:
+    """A security rule with every field resolved to a member set."""
+
+    __slots__ = ("name", "action", "disabled", "fields", "position", "negated")
+
+    def __init__(
+        self,
+        name: str,
+        action: str,
+        disabled: bool,
+        fields: Dict[str, MemberSet],
+        position: int = 0,
+        negated: Optional[Dict[str, MemberSet]] = None,
+    ):
+        self.name = name
+        self.action = action
+        self.disabled = disabled
+        self.fields = fields
+        self.position = position
+        # Resolved members of negated fields; the rule matches everything outside them
+        self.negated = negated or {}
+
+    def covers(self, other: "ResolvedRule") -> bool:
+        """Check whether this rule matches all traffic ``other`` matches."""
+        fields = self.fields
+        other_fields = other.fields
+        return all(fields[field].covers(other_fields[field]) for field in RULE_FIELDS)
+
+    def intersects(self, other: "ResolvedRule") -> bool:
+        """Check whether some traffic matches both rules."""
+        fields = self.fields
+        other_fields = other.fields
+        return all(fields[field].intersects(other_fields[field]) for field in RULE_FIELDS)
+
+
+class IntervalIndex:
+    """
+    Static index answering which members contain a point or overlap a range.
+
+    Built once over the intervals of many member sets, it is a segment tree
+    over the distinct interval boundaries: each interval is stored at the
+    O(log n) nodes that exactly cover it, so a point query only visits one
+    root-to-leaf path and returns the intervals found there.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[int, IntervalSet]]):
+        """
+        Build the index.
+
+        Args:
+            entries: (id, interval set) pairs
+        """
+        records = []
+        for entry_id, intervals in entries:
+            for low, high in intervals.intervals:
+                records.append((low, high, entry_id))
+
+        self._bounds = sorted({record[0] for record in records} | {r[1] + 1 for r in records})
+        self._size = 1
+        while self._size < len(self._bounds):
+            self._size *= 2
+        self._nodes: Dict[int, List[Tuple[int, int, int]]] = {}
+
+        for record in records:
+            left = bisect_left(self._bounds, record[0]) + self._size
+            right = bisect_left(self._bounds, record[1] + 1) + self._size
+            while left < right:
+                if left & 1:
+                    self._nodes.setdefault(left, []).append(record)
+                    left += 1
+                if right & 1:
+                    right -= 1
+                    self._nodes.setdefault(right, []).append(record)
+                left >>= 1
+                right >>= 1
+
+        self._starts = sorted((record[0], record[2]) for record in records)
+
+    def stab(self, point: int) -> Iterable[Tuple[int, int, int]]:
+        """Yield the (low, high, id) intervals that contain ``point``."""
+        slot = bisect_right(self._bounds, point) - 1
+        if slot < 0 or slot >= len(self._bounds) - 1:
+            return
+        node = slot + self._size
+        nodes = self._nodes
+        while node:
+            records = nodes.get(node)
+            if records:
+                yield from records
+            node >>= 1
+
+    def containing(self, low: int, high: int) -> Set[int]:
+        """Return the ids of entries with one interval containing ``[low, high]``."""
+        return {entry_id for _, record_high, entry_id in self.stab(low) if record_high >= high}
+
+    def overlapping(self, low: int, high: int) -> Set[int]:
+        """Return the ids of entries with an interval overlapping ``[low, high]``."""
+        result = {entry_id for _, _, entry_id in self.stab(low)}
+        starts = self._starts
+        index = bisect_right(starts, (low, float("inf")))
+        while index < len(starts) and starts[index][0] <= high:
+            result.add(starts[index][1])
+            index += 1
+        return result
@@ -0,0 +1,191 @@
+"""
+Pipeline sessions for PANFlow.
+
+A :class:`ConfigSession` runs a pipeline of PANFlow CLI commands against one
+configuration loaded once into memory. While a session is active, the
+configuration loader hands every command the session's tree instead of
+parsing the file again, and saving that tree only records where the command
+wanted it written. The session writes the configuration once, after the last
+step, so a pipeline of modifications costs one parse and one write instead
+of one of each per command.
+
+Steps use the pipeline spec format of :mod:`panflow.core.batch`. Commands
+that modify the configuration still need their ``--output`` option, which
+may simply be ``"{config}"``; a ``save`` step sets the final output path::
+
+    steps:
+      - command: object update
+        options: {type: address, name: web, properties: web.json, output: "{config}"}
+      - command: cleanup unused-objects
+        options: {type: [address, service], output: "{config}"}
+      - command: save
+        options: {output: cleaned.xml}
+"""
+
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger("panflow")
+
+# Session used by the configuration loader, if any
+_active: Optional["ConfigSession"] = None
+
+
+class ConfigSession:
+    """A configuration kept in memory while a pipeline of commands runs against it."""
+
+    def __init__(self, config_file: str, version: Optional[str] = None):
+        """
+        Load the configuration of the session.
+
+        Args:
+            config_file: Path to the configuration file
+            version: User-specified PAN-OS version (optional)
+        """
+        from .config_loader import parse_config_file
+
+        self.path = os.path.abspath(config_file)
+        self.tree, self.version = parse_config_file(self.path, version)
+        self.output: Optional[str] = None
+        # Paths that refer to the in-memory configuration
+        self._paths: Set[str] = {self.path}
+
+    def owns(self, file_path: str) -> bool:
+        """Check whether a path refers to the session's configuration."""
+        return os.path.abspath(file_path) in self._paths
+
+    def load(self, file_path: str, version: Optional[str] = None) -> Tuple[Any, str]:
+        """Get the session's configuration for a command loading ``file_path``."""
+        logger.debug(f"Using the in-memory configuration for {file_path}")
+        return self.tree, version or self.version
+
+    def defer_save(self, output_file: str) -> bool:
+        """
+        Record that a command saved the session's configuration.
+
+        Later steps loading ``output_file`` get the in-memory configuration too.
+
+        Args:
+            output_file: Path the command saved the configuration to
+
+        Returns:
+            True, as the configuration is written at the end of the session
+        """
+        self.output = output_file
+        self._paths.add(os.path.abspath(output_file))
+        logger.info(f"Saving to {output_file} is deferred until the end of the pipeline")
+        return True
+
+    def run(
+        self, steps: List[Dict[str, Any]], output: Optional[str] = None, dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run pipeline steps against the configuration, then save it once.
+
+        Steps run in order and stop at the first failure, in which case
+        nothing is saved. The configuration is written to ``output``, else to
+        the path of the last ``save`` step or command that saved it; if no step
+        saved it, it is not written.
+
+        Args:
+            steps: Steps from :func:`panflow.core.batch.load_pipeline_spec`
+            output: Path the configuration is written to at the end (optional)
+            dry_run: Run the steps but do not write the configuration
+
+        Returns:
+            Result dictionary with the per-step timings
+        """
+        from .batch import _run_cli, build_step_argv
+
+        name = os.path.basename(self.path)
+        stem = name[:-4] if name.lower().endswith(".xml") else os.path.splitext(name)[0]
+        result: Dict[str, Any] = {"file": self.path, "status": "ok", "steps": []}
+        start = time.perf_counter()
+
+        activate(self)
+        try:
+            for index, step in enumerate(steps, 1):
+                placeholders = {
+                    "config": self.path,
+                    "input": self.path,
+                    "name": name,
+                    "stem": stem,
+                    "output_dir": os.path.dirname(self.path),
+                    "step": str(index),
+                }
+                step_start = time.perf_counter()
+                if step["command"] == "save":
+                    target = step["options"].get("output") or (step["args"] or [None])[0]
+                    if not target:
+                        exit_code, error, argv = 1, "save needs an output path", ["save"]
+                    else:
+                        argv = ["save", str(target).format(**placeholders)]
+                        exit_code, error = 0, None
+                        self.defer_save(argv[1])
+                else:
+                    argv = build_step_argv(step, placeholders)
+                    try:
+                        exit_code = _run_cli(argv)
+                        error = None if exit_code == 0 else f"exit code {exit_code}"
+                    except Exception as e:
+                        logger.error(f"Step {index} failed: {e}", exc_info=True)
+                        exit_code, error = 1, str(e)
+
+                duration = time.perf_counter() - step_start
+                logger.info(f"Step {index} ({step['command']}) finished in {duration:.3f}s")
+                result["steps"].append(
+                    {
+                        "command": step["command"],
+                        "argv": argv,
+                        "exit_code": exit_code,
+                        "error": error,
+                        "duration": duration,
+                    }
+                )
+                if exit_code != 0:
+                    result["status"] = "failed"
+                    result["error"] = f"Step {index} ({step['command']}) failed: {error}"
+                    break
+        finally:
+            activate(None)
+
+        target = output or self.output
+        result["output"] = target
+        result["saved"] = False
+        if result["status"] != "ok":
+            logger.error("Pipeline failed; the configuration was not saved")
+        elif dry_run:
+            logger.info(f"Dry run: not saving the configuration to {target or 'any file'}")
+        elif target:
+            from .config_loader import save_config
+
+            save_start = time.perf_counter()
+            if save_config(self.tree, target):
+                result["saved"] = True
+            else:
+                result["status"] = "failed"
+                result["error"] = f"Failed to save the configuration to {target}"
+            result["save_duration"] = time.perf_counter() - save_start
+        else:
+            logger.info("No step saved the configuration; nothing was written")
+
+        result["duration"] = time.perf_counter() - start
+        return result
+
+
+def activate(session: Optional[ConfigSession]) -> None:
+    """
+    Make the configuration loader use a session's in-memory configuration.
+
+    Args:
+        session: Session to use, or None to load and save files again
+    """
+    global _active
+    _active = session
+
+
+def active_session() -> Optional[ConfigSession]:
+    """Get the active pipeline session, if any."""
+    return _active
@@ -0,0 +1,626 @@
+"""
+Binary columnar snapshots for PANFlow.
+
+This module exports the objects and rules of a PAN-OS configuration into a
+compact binary file made of typed columns, in the spirit of Arrow/Parquet but
+implemented with the standard library only. All names, contexts and values are
+interned into a single string dictionary and stored as integer ids, so a
+snapshot can be memory-mapped back and scanned without reparsing any XML.
+
+File layout (all offsets are relative to the start of the data section)::
+
+    magic (8 bytes) | header length (uint32, little endian) | JSON header
+    padding to 8 bytes | data section
+
+The JSON header describes the string dictionary and every table column with
+its array typecode, byte offset and byte length.
+
+Tables:
+- addresses: name, context_type, context_name, kind, value, description
+- services: name, context_type, context_name, protocol, port, source_port
+- groups: name, context_type, context_name, group_type, dynamic
+- rules: name, context_type, context_name, rulebase, rule_type, position, action, disabled
+- rule_members: rule (row in rules), field, member
+- references: group (row in groups), member
+
+``rule_members`` holds every ``<member>`` of a rule and the text of the
+single-valued elements under the fields that reference objects, such as the
+``translated-address`` of a destination NAT rule. ``field`` is the element
+path below the rule, e.g. ``source`` or
+``source-translation/static-ip/translated-address``.
+"""
+
+import json
+import logging
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from lxml import etree
+
+from .exceptions import PANFlowError
+from .xml.stream import iter_entry_records
+
+logger = logging.getLogger("panflow")
+
+MAGIC = b"PFSNAP\x00\x01"
+FORMAT_VERSION = 1
+_ALIGNMENT = 8
+
+# Column definitions per table: (column name, typecode, is string id)
+TABLE_SCHEMAS: Dict[str, List[Tuple[str, str, bool]]] = {
+    "addresses": [
+        ("name", "i", True),
+        ("context_type", "i", True),
+        ("context_name", "i", True),
+        ("kind", "i", True),
+        ("value", "i", True),
+        ("description", "i", True),
+    ],
+    "services": [
+        ("name", "i", True),
+        ("context_type", "i", True),
+        ("context_name", "i", True),
+        ("protocol", "i", True),
+        ("port", "i", True),
+        ("source_port", "i", True),
+    ],
+    "groups": [
+        ("name", "i", True),
+        ("context_type", "i", True),
+        ("context_name", "i", True),
+        ("group_type", "i", True),
+        ("dynamic", "B", False),
+    ],
+    "rules": [
+        ("name", "i", True),
+        ("context_type", "i", True),
+        ("context_name", "i", True),
+        ("rulebase", "i", True),
+        ("rule_type", "i", True),
+        ("position", "i", False),
+        ("action", "i", True),
+        ("disabled", "B", False),
+    ],
+    "rule_members": [
+        ("rule", "i", False),
+        ("field", "i", True),
+        ("member", "i", True),
+    ],
+    "references": [
+        ("group", "i", False),
+        ("member", "i", True),
+    ],
+}
+
+GROUP_TYPES = ("address-group", "service-group", "application-group")
+ADDRESS_KINDS = ("ip-netmask", "ip-range", "ip-wildcard", "fqdn")
+
+# Object type to the table searched by unused-object queries
+UNUSED_OBJECT_SOURCES = {"address": "addresses", "service": "services"}
+
+# Rule fields that reference objects of each type; the unused objects report
+# checks the same fields
+REFERENCE_FIELDS = {
+    "address": ("source", "destination", "source-translation", "destination-translation"),
+    "service": ("service", "service-translation"),
+}
+
+# Group type whose members reference objects of each type
+REFERENCE_GROUP_TYPES = {"address": "address-group", "service": "service-group"}
+
+_TEXT_REFERENCE_FIELDS = {field for fields in REFERENCE_FIELDS.values() for field in fields}
+
+
+class SnapshotError(PANFlowError):
+    """Exception raised when reading or writing a snapshot fails."""
+
+    pass
+
+
+class _StringPool:
+    """Interns strings into integer ids in insertion order."""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.values: List[str] = []
+        # Reserve id 0 for the empty string so missing values are cheap
+        self.intern("")
+
+    def intern(self, value: Optional[str]) -> int:
+        value = value or ""
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = len(self.values)
+            self.ids[value] = string_id
+            self.values.append(value)
+        return string_id
+
+
+class _SnapshotBuilder:
+    """Accumulates snapshot columns while walking a configuration tree."""
+
+    def __init__(self):
+        self.strings = _StringPool()
+        self.columns: Dict[str, Dict[str, array]] = {
+            table: {name: array(typecode) for name, typecode, _ in schema}
+            for table, schema in TABLE_SCHEMAS.items()
+        }
+        self.row_counts: Dict[str, int] = {table: 0 for table in TABLE_SCHEMAS}
+        self._rule_positions: Dict[etree._Element, int] = {}
+
+    def append(self, table: str, **values: Any) -> int:
+        """Append a row and return its index."""
+        columns = self.columns[table]
+        for name, _, is_string in TABLE_SCHEMAS[table]:
+            value = values.get(name)
+            columns[name].append(self.strings.intern(value) if is_string else int(value or 0))
+        row = self.row_counts[table]
+        self.row_counts[table] = row + 1
+        return row
+
+    def add_entry(self, metadata: Dict[str, str], entry: etree._Element) -> None:
+        """Add an object or rule entry produced by ``iter_entry_records``."""
+        record_type = metadata["type"]
+        context = {
+            "name": metadata["name"],
+            "context_type": metadata["context_type"],
+            "context_name": metadata.get("context_name", ""),
+        }
+
+        if "rulebase" in metadata:
+            self._add_rule(context, metadata, entry)
+        elif record_type == "address":
+            kind, value = "", ""
+            for candidate in ADDRESS_KINDS:
+                text = entry.findtext(candidate)
+                if text is not None:
+                    kind, value = candidate, text.strip()
+                    break
+            self.append(
+                "addresses",
+                kind=kind,
+                value=value,
+                description=(entry.findtext("description") or "").strip(),
+                **context,
+            )
+        elif record_type == "service":
+            protocol = entry.find("protocol")
+            proto_element = protocol[0] if protocol is not None and len(protocol) else None
+            self.append(
+                "services",
+                protocol=proto_element.tag if proto_element is not None else "",
+                port=(proto_element.findtext("port") or "") if proto_element is not None else "",
+                source_port=(
+                    (proto_element.findtext("source-port") or "")
+                    if proto_element is not None
+                    else ""
+                ),
+                **context,
+            )
+        elif record_type in GROUP_TYPES:
+            dynamic = entry.find("dynamic") is not None
+            row = self.append("groups", group_type=record_type, dynamic=dynamic, **context)
+            for member in entry.iterfind("./static/member"):
+                self.append("references", group=row, member=(member.text or "").strip())
+            for member in entry.iterfind("./members/member"):
+                self.append("references", group=row, member=(member.text or "").strip())
+
+    def _add_rule(
+        self, context: Dict[str, str], metadata: Dict[str, str], entry: etree._Element
+    ) -> None:
+        # Entries arrive in document order, so count per rules container
+        container = entry.getparent()
+        position = self._rule_positions.get(container, 0)
+        self._rule_positions[container] = position + 1
+
+        row = self.append(
+            "rules",
+            rulebase=metadata["rulebase"],
+            rule_type=metadata["type"],
+            position=position,
+            action=(entry.findtext("action") or "").strip(),
+            disabled=(entry.findtext("disabled") or "").strip() == "yes",
+            **context,
+        )
+
+        for element in entry.iter(etree.Element):
+            if len(element) or element is entry or not (element.text or "").strip():
+                continue
+            parts = [] if element.tag == "member" else [element.tag]
+            parent = element.getparent()
+            while parent is not None and parent is not entry:
+                parts.append(parent.tag)
+                parent = parent.getparent()
+            # Single-valued elements are only references under the reference fields
+            if element.tag != "member" and parts[-1] not in _TEXT_REFERENCE_FIELDS:
+                continue
+            field = "/".join(reversed(parts))
+            self.append("rule_members", rule=row, field=field, member=element.text.strip())
+
+
+def write_snapshot(
+    tree_or_element: Union[etree._ElementTree, etree._Element],
+    file_path: str,
+    device_type: Optional[str] = None,
+    version: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Write a columnar snapshot of a configuration.
+
+    Args:
+        tree_or_element: ElementTree or root Element of the configuration
+        file_path: Path of the snapshot file to write
+        device_type: Device type recorded in the snapshot header
+        version: PAN-OS version recorded in the snapshot header
+
+    Returns:
+        Dictionary mapping table names to row counts
+
+    Raises:
+        SnapshotError: If writing fails
+    """
+    builder = _SnapshotBuilder()
+    for metadata, entry in iter_entry_records(tree_or_element):
+        builder.add_entry(metadata, entry)
+
+    # Lay out the string dictionary followed by every column
+    sections: List[bytes] = []
+    offset = 0
+
+    def add_section(data: bytes) -> Dict[str, int]:
+        nonlocal offset
+        location = {"offset": offset, "length": len(data)}
+        padding = -len(data) % _ALIGNMENT
+        sections.append(data + b"\x00" * padding)
+        offset += len(data) + padding
+        return location
+
+    encoded = [value.encode("utf-8") for value in builder.strings.values]
+    string_offsets = array("q", [0])
+    for value in encoded:
+        string_offsets.append(string_offsets[-1] + len(value))
+
+    header: Dict[str, Any] = {
+        "format_version": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "device_type": device_type,
+        "version": version,
+        "strings": {
+            "count": len(encoded),
+            "offsets": add_section(string_offsets.tobytes()),
+            "data": add_section(b"".join(encoded)),
+        },
+        "tables": {},
+    }
+
+    for table, schema in TABLE_SCHEMAS.items():
+        columns = {}
+        for name, typecode, is_string in schema:
+            column = builder.columns[table][name]
+            columns[name] = {
+                "type": typecode,
+                "string": is_string,
+                **add_section(column.tobytes()),
+            }
+        header["tables"][table] = {"rows": builder.row_counts[table], "columns": columns}
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    header_bytes += b" " * (-(len(MAGIC) + 4 + len(header_bytes)) % _ALIGNMENT)
+
+    try:
+        with open(file_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(header_bytes)))
+            f.write(header_bytes)
+            for section in sections:
+                f.write(section)
+    except OSError as e:
+        raise SnapshotError(f"Failed to write snapshot {file_path}: {e}")
+
+    logger.info(
+        f"Wrote snapshot {file_path}: "
+        + ", ".join(f"{count} {table}" for table, count in builder.row_counts.items())
+    )
+    return dict(builder.row_counts)
+
+
+class SnapshotTable:
+    """A read-only view over one table of a memory-mapped snapshot."""
+
+    def __init__(self, snapshot: "ConfigSnapshot", name: str, info: Dict[str, Any]):
+        self.snapshot = snapshot
+        self.name = name
+        self.row_count = info["rows"]
+        self._columns = info["columns"]
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    @property
+    def column_names(self) -> List[str]:
+        """Names of the columns in this table."""
+        return list(self._columns)
+
+    def column(self, name: str) -> memoryview:
+        """
+        Get the raw integer column (string ids for string columns).
+
+        Args:
+            name: Column name
+
+        Returns:
+            Zero-copy memoryview over the column values
+        """
+        if name not in self._columns:
+            raise SnapshotError(f"Table '{self.name}' has no column '{name}'")
+        info = self._columns[name]
+        return self.snapshot._view(info["offset"], info["length"], info["type"])
+
+    def values(self, name: str) -> List[Any]:
+        """Get a column with string ids decoded back to strings."""
+        column = self.column(name)
+        if self._columns[name]["string"]:
+            lookup = self.snapshot.string
+            return [lookup(string_id) for string_id in column]
+        return list(column)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Get a single row as a dictionary."""
+        result = {}
+        for name, info in self._columns.items():
+            value = self.column(name)[index]
+            result[name] = self.snapshot.string(value) if info["string"] else value
+        return result
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over all rows as dictionaries."""
+        decoded = {name: self.values(name) for name in self._columns}
+        for index in range(self.row_count):
+            yield {name: values[index] for name, values in decoded.items()}
+
+    def where(self, **conditions: Any) -> List[int]:
+        """
+        Find rows whose columns equal the given values.
+
+        String conditions are converted to ids once and compared as integers,
+        so no strings are decoded while scanning.
+
+        Args:
+            **conditions: Column name to required value (None values are ignored)
+
+        Returns:
+            List of matching row indexes
+        """
+        matches: Optional[List[int]] = None
+        for name, value in conditions.items():
+            if value is None:
+                continue
+            if self._columns.get(name, {}).get("string"):
+                value = self.snapshot.string_id(value)
+                if value is None:
+                    return []
+            column = self.column(name)
+            candidates = range(self.row_count) if matches is None else matches
+            matches = [index for index in candidates if column[index] == value]
+        return list(range(self.row_count)) if matches is None else matches
+
+
+class ConfigSnapshot:
+    """
+    A memory-mapped columnar snapshot of a configuration.
+
+    Use as a context manager or call ``close`` when finished so the mapping
+    is released.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Open a snapshot file.
+
+        Args:
+            file_path: Path to a file written by ``write_snapshot``
+
+        Raises:
+            SnapshotError: If the file is not a valid snapshot
+        """
+        self.file_path = file_path
+        self._views: Dict[Tuple[int, str], Union[memoryview, array]] = {}
+        self._raw_views: List[memoryview] = []
+        self._string_cache: Dict[int, str] = {}
+        self._string_ids: Optional[Dict[str, int]] = None
+
+        try:
+            self._file = open(file_path, "rb")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise SnapshotError(f"Failed to open snapshot {file_path}: {e}")
+
+        if self._mmap[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise SnapshotError(f"Not a PANFlow snapshot: {file_path}")
+
+        (header_length,) = struct.unpack_from("<I", self._mmap, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        self.header = json.loads(self._mmap[header_start : header_start + header_length])
+        self._data_start = header_start + header_length
+        self._swap = self.header["byteorder"] != sys.byteorder
+
+        self.device_type = self.header.get("device_type")
+        self.version = self.header.get("version")
+        strings = self.header["strings"]
+        self._string_count = strings["count"]
+        self._string_offsets = self._view(
+            strings["offsets"]["offset"], strings["offsets"]["length"], "q"
+        )
+        self._string_data = strings["data"]["offset"] + self._data_start
+
+    def __enter__(self) -> "ConfigSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release all column views and unmap the file."""
+        for view in self._views.values():
+            if isinstance(view, memoryview):
+                view.release()
+        for view in self._raw_views:
+            view.release()
+        self._views.clear()
+        self._raw_views.clear()
+        if getattr(self, "_mmap", None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        if getattr(self, "_file", None) is not None:
+            self._file.close()
+            self._file = None
+
+    def _view(self, offset: int, length: int, typecode: str) -> Union[memoryview, array]:
+        key = (offset, typecode)
+        view = self._views.get(key)
+        if view is not None:
+            return view
+
+        start = self._data_start + offset
+        if self._swap and typecode != "B":
+            # Snapshots written on a machine of the other byte order are copied
+            view = array(typecode, self._mmap[start : start + length])
+            view.byteswap()
+        else:
+            raw = memoryview(self._mmap)[start : start + length]
+            view = raw.cast(typecode)
+            self._raw_views.append(raw)
+        self._views[key] = view
+        return view
+
+    @property
+    def table_names(self) -> List[str]:
+        """Names of the tables in the snapshot."""
+        return list(self.header["tables"])
+
+    def table(self, name: str) -> SnapshotTable:
+        """
+        Get a table by name.
+
+        Args:
+            name: Table name (addresses, services, groups, rules, rule_members, references)
+
+        Returns:
+            SnapshotTable view
+        """
+        if name not in self.header["tables"]:
+            raise SnapshotError(f"Snapshot has no table '{name}'")
+        return SnapshotTable(self, name, self.header["tables"][name])
+
+    def string(self, string_id: int) -> str:
+        """Decode a string id."""
+        value = self._string_cache.get(string_id)
+        if value is None:
+            start = self._string_data + self._string_offsets[string_id]
+            end = self._string_data + self._string_offsets[string_id + 1]
+            value = self._mmap[start:end].decode("utf-8")
+            self._string_cache[string_id] = value
+        return value
+
+    def string_id(self, value: str) -> Optional[int]:
+        """Look up the id of a string, or None if it does not occur in the snapshot."""
+        if self._string_ids is None:
+            self._string_ids = {self.string(i): i for i in range(self._string_count)}
+        return self._string_ids.get(value)
+
+    def row_counts(self) -> Dict[str, int]:
+        """Get the number of rows in each table."""
+        return {name: info["rows"] for name, info in self.header["tables"].items()}
+
+    def referenced_members(
+        self,
+        context_type: Optional[str] = None,
+        context_name: Optional[str] = None,
+        object_type: Optional[str] = None,
+    ) -> Set[int]:
+        """
+        Collect the string ids of every member referenced by rules and groups.
+
+        Args:
+            context_type: Restrict to rules and groups in this context type
+            context_name: Restrict to rules and groups in this named context
+            object_type: Restrict to the rule fields and group type that reference
+                objects of this type (address or service)
+
+        Returns:
+            Set of member string ids
+        """
+        used: Set[int] = set()
+
+        for table_name, owner_table, owner_column in (
+            ("rule_members", "rules", "rule"),
+            ("references", "groups", "group"),
+        ):
+            owners = self.table(owner_table)
+            allowed = None
+            if context_type is not None or context_name is not None:
+                allowed = set(owners.where(context_type=context_type, context_name=context_name))
+            if object_type is not None and owner_table == "groups":
+                group_type = REFERENCE_GROUP_TYPES[object_type]
+                allowed = set(owners.where(group_type=group_type)) & (
+                    allowed if allowed is not None else set(range(len(owners)))
+                )
+
+            table = self.table(table_name)
+            owner_ids = table.column(owner_column)
+            members = table.column("member")
+            rows: Iterable[int] = range(len(table))
+            if allowed is not None:
+                rows = [i for i in rows if owner_ids[i] in allowed]
+            if object_type is not None and table_name == "rule_members":
+                fields = table.column("field")
+                reference_fields = {
+                    field_id
+                    for field_id in set(fields)
+                    if self.string(field_id).split("/", 1)[0] in REFERENCE_FIELDS[object_type]
+                }
+                rows = [i for i in rows if fields[i] in reference_fields]
+            used.update(members[i] for i in rows)
+
+        return used
+
+    def find_unused_objects(
+        self,
+        object_type: str = "address",
+        context_type: str = "shared",
+        context_name: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find objects that are not referenced by any rule or group.
+
+        Objects in the shared context are checked against references from every
+        context. Objects in any other context are checked against references in
+        that same context only. Only the rule fields in ``REFERENCE_FIELDS`` and
+        the members of groups of the object's type count as references.
+
+        Args:
+            object_type: Object type (address or service)
+            context_type: Context type of the objects to check
+            context_name: Device group or vsys name for non-shared contexts
+
+        Returns:
+            List of unused object rows
+        """
+        if object_type not in UNUSED_OBJECT_SOURCES:
+            raise SnapshotError(f"Unused object queries are not supported for '{object_type}'")
+
+        objects = self.table(UNUSED_OBJECT_SOURCES[object_type])
+
+        if context_type == "shared":
+            used = self.referenced_members(object_type=object_type)
+            object_rows = objects.where(context_type="shared")
+        else:
+            used = self.referenced_members(context_type, context_name, object_type)
+            object_rows = objects.where(context_type=context_type, context_name=context_name)
+
+        names = objects.column("name")
+        return [objects.row(i) for i in object_rows if names[i] not in used]
@@ -3,16 +3,126 @@ Template loader for the reporting module.
 
 This module provides utilities for loading and rendering HTML templates
 for the various report formats.
+
+Jinja2 environments are shared per template directory, so templates are
+compiled once per process however many loaders and formatters are created,
+and compiled templates are kept in a bytecode cache on disk between runs.
 """
 
 import os
 import json
-from typing import Dict, Any, Optional, List, Union
-from jinja2 import Environment, FileSystemLoader, select_autoescape, PackageLoader, ChoiceLoader
+import threading
+from typing import Dict, Any, Optional, List, Union, Tuple
+from jinja2 import (
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    PackageLoader,
+    select_autoescape,
+)
 
 # Import logging utilities
 from ..core.logging_utils import logger, log, log_structured
 
+# Rows per page in large report tables; later pages are hidden until selected
+DEFAULT_PAGE_SIZE = 500
+
+# Number of template events buffered before each write when streaming to a file
+STREAM_BUFFER_SIZE = 64
+
+# Shared environments keyed by (template_dir, custom_templates_dir)
+_environments: Dict[Tuple[str, Optional[str]], Environment] = {}
+_environments_lock = threading.Lock()
+
+
+def _bytecode_cache_dir() -> Optional[str]:
+    """
+    Get the directory of the on-disk template bytecode cache.
+
+    The PANFLOW_TEMPLATE_CACHE environment variable overrides the default
+    location under the user cache directory; setting it to an empty string
+    disables the cache.
+
+    Returns:
+        Directory path, or None if the cache is disabled or cannot be created
+    """
+    cache_dir = os.environ.get("PANFLOW_TEMPLATE_CACHE")
+    if cache_dir is None:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        cache_dir = os.path.join(cache_home, "panflow", "templates")
+    if not cache_dir:
+        return None
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError as e:
+        logger.debug(f"Template bytecode cache disabled, cannot create {cache_dir}: {e}")
+        return None
+    return cache_dir
+
+
+def get_environment(template_dir: str, custom_templates_dir: Optional[str] = None) -> Environment:
+    """
+    Get the shared Jinja2 environment for a template directory.
+
+    Args:
+        template_dir: Directory containing the default templates
+        custom_templates_dir: Directory of templates that override the defaults
+
+    Returns:
+        Jinja2 Environment, created on first use
+    """
+    custom_dir = custom_templates_dir and os.path.abspath(custom_templates_dir)
+    key = (os.path.abspath(template_dir), custom_dir)
+    env = _environments.get(key)
+    if env is not None:
+        return env
+
+    with _environments_lock:
+        env = _environments.get(key)
+        if env is not None:
+            return env
+
+        if custom_templates_dir:
+            # Use a chain loader to first check custom templates, then fall back to default
+            loader = ChoiceLoader(
+                [FileSystemLoader(custom_templates_dir), FileSystemLoader(template_dir)]
+            )
+        else:
+            loader = FileSystemLoader(template_dir)
+
+        cache_dir = _bytecode_cache_dir()
+        env = Environment(
+            loader=loader,
+            autoescape=select_autoescape(["html", "xml"]),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            bytecode_cache=FileSystemBytecodeCache(cache_dir) if cache_dir else None,
+        )
+
+        # Add JSON encoder filter
+        env.filters["json_encode"] = lambda obj, indent=None: json.dumps(obj, indent=indent)
+
+        # Add custom filters for formatting
+        env.filters["format_date"] = lambda d: (
+            d.strftime("%Y-%m-%d %H:%M:%S") if hasattr(d, "strftime") else str(d)
+        )
+        env.filters["format_number"] = lambda n: f"{n:,}" if isinstance(n, (int, float)) else str(n)
+        env.globals["page_size"] = DEFAULT_PAGE_SIZE
+
+        _environments[key] = env
+        logger.debug(f"Created template environment for {key} (bytecode cache: {cache_dir})")
+        return env
+
+
+def clear_environment_cache() -> None:
+    """Drop the shared environments and the templates compiled in them."""
+    with _environments_lock:
+        _environments.clear()
+
 
 class TemplateLoader:
     """
@@ -42,42 +152,16 @@ class TemplateLoader:
         self.template_dir = template_dir
         self.custom_templates_dir = custom_templates_dir
 
-        # Initialize Jinja2 environment
+        # Use the shared Jinja2 environment for these directories
         if custom_templates_dir and os.path.exists(custom_templates_dir):
-            # Use a chain loader to first check custom templates, then fall back to default
-            from jinja2 import ChoiceLoader
-
-            self.env = Environment(
-                loader=ChoiceLoader(
-                    [FileSystemLoader(custom_templates_dir), FileSystemLoader(template_dir)]
-                ),
-                autoescape=select_autoescape(["html", "xml"]),
-                trim_blocks=True,
-                lstrip_blocks=True,
-            )
+            self.env = get_environment(template_dir, custom_templates_dir)
             logger.debug(
                 f"Using custom templates from {custom_templates_dir} with fallback to {template_dir}"
             )
         else:
-            self.env = Environment(
-                loader=FileSystemLoader(template_dir),
-                autoescape=select_autoescape(["html", "xml"]),
-                trim_blocks=True,
-                lstrip_blocks=True,
-            )
+            self.env = get_environment(template_dir)
             logger.debug(f"Using default templates from {template_dir}")
 
-        # Add JSON encoder filter
-        self.env.filters["json_encode"] = lambda obj, indent=None: json.dumps(obj, indent=indent)
-
-        # Add custom filters for formatting
-        self.env.filters["format_date"] = (
-            lambda d: d.strftime("%Y-%m-%d %H:%M:%S") if hasattr(d, "strftime") else str(d)
-        )
-        self.env.filters["format_number"] = (
-            lambda n: f"{n:,}" if isinstance(n, (int, float)) else str(n)
-        )
-
         logger.debug(f"Initialized TemplateLoader with template directory: {template_dir}")
 
     def render_template(self, template_name: str, context: Dict[str, Any]) -> str:
@@ -92,13 +176,8 @@ class TemplateLoader:
             Rendered template as a string
         """
         try:
-            # Add timestamp to all templates by default
-            import datetime
-            if 'timestamp' not in context:
-                context['timestamp'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                
             template = self.env.get_template(template_name)
-            return template.render(**context)
+            return template.render(**self._prepare_context(context))
         except Exception as e:
             # Use simple logging instead of structured logging to avoid potential extra_data conflicts
             logger.error(
@@ -106,13 +185,63 @@ class TemplateLoader:
                 f"type: {type(e).__name__}, template_dir: {self.template_dir}"
             )
             # Fallback to a simple template with error message
-            return f"""<!DOCTYPE html>
+            return self._error_page(template_name, e)
+
+    def stream_template(
+        self, template_name: str, context: Dict[str, Any], output_file: str
+    ) -> bool:
+        """
+        Render a template straight to a file.
+
+        The template is rendered with ``Template.generate()`` and written in
+        small buffered chunks, so the full document is never held in memory.
+        If rendering fails, the file is replaced with an error page.
+
+        Args:
+            template_name: Name of the template to render (relative to the template directory)
+            context: Dictionary of context variables for the template
+            output_file: Path of the file to write
+
+        Returns:
+            True if the template was rendered, False otherwise
+        """
+        try:
+            template = self.env.get_template(template_name)
+            stream = template.stream(**self._prepare_context(context))
+            stream.enable_buffering(STREAM_BUFFER_SIZE)
+            with open(output_file, "w", encoding="utf-8") as f:
+                stream.dump(f)
+            return True
+        except Exception as e:
+            logger.error(
+                f"Error rendering template '{template_name}' to {output_file}: {str(e)}, "
+                f"type: {type(e).__name__}, template_dir: {self.template_dir}"
+            )
+            try:
+                with open(output_file, "w", encoding="utf-8") as f:
+                    f.write(self._error_page(template_name, e))
+            except OSError:
+                pass
+            return False
+
+    @staticmethod
+    def _prepare_context(context: Dict[str, Any]) -> Dict[str, Any]:
+        # Add timestamp to all templates by default
+        import datetime
+
+        if "timestamp" not in context:
+            context["timestamp"] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return context
+
+    @staticmethod
+    def _error_page(template_name: str, error: Exception) -> str:
+        return f"""<!DOCTYPE html>
 <html>
 <head><title>Error Rendering Report</title></head>
 <body>
     <h1>Error Rendering Report</h1>
     <p>An error occurred while rendering the template '{template_name}':</p>
-    <pre>{str(e)}</pre>
+    <pre>{str(error)}</pre>
 </body>
 </html>"""
 
@@ -144,8 +273,10 @@ class TemplateLoader:
         """
         context = {"analysis": analysis}
         return self.render_template("reports/object_usage.html", context)
-        
-    def render_unused_objects_report(self, report_data: Dict[str, Any], report_info: Optional[Dict[str, Any]] = None) -> str:
+
+    def render_unused_objects_report(
+        self, report_data: Dict[str, Any], report_info: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Render the unused objects report.
 
@@ -158,11 +289,13 @@ class TemplateLoader:
         """
         context = {
             "unused_objects": report_data.get("unused_objects", []),
-            "report_info": report_info or {}
+            "report_info": report_info or {},
         }
         return self.render_template("reports/unused_objects.html", context)
-        
-    def render_duplicate_objects_report(self, report_data: Dict[str, Any], report_info: Optional[Dict[str, Any]] = None) -> str:
+
+    def render_duplicate_objects_report(
+        self, report_data: Dict[str, Any], report_info: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Render the duplicate objects report.
 
@@ -174,13 +307,17 @@ class TemplateLoader:
             Rendered HTML report as a string
         """
         duplicates = report_data.get("duplicate_objects", {})
-        total_duplicates = sum(len(objs) - 1 for objs in duplicates.values() if not isinstance(objs, dict) and not str(objs).startswith('_'))
-        
+        total_duplicates = sum(
+            len(objs) - 1
+            for objs in duplicates.values()
+            if not isinstance(objs, dict) and not str(objs).startswith("_")
+        )
+
         context = {
             "duplicate_objects": duplicates,
             "total_count": total_duplicates,
-            "unique_values": len([k for k in duplicates.keys() if not str(k).startswith('_')]),
-            "report_info": report_info or {}
+            "unique_values": len([k for k in duplicates.keys() if not str(k).startswith("_")]),
+            "report_info": report_info or {},
         }
         return self.render_template("reports/duplicate_objects.html", context)
 
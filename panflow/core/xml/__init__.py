@@ -10,6 +10,7 @@ The package is organized into several modules:
 - builder: Classes for building and manipulating XML
 - query: Utilities for querying XML
 - diff: Utilities for comparing XML trees
+- stream: Streaming JSON and JSON Lines serialization
 
 Most common functionality is available from the package directly.
 """
@@ -46,6 +47,14 @@ from .query import XmlQuery
 # Import XML diff classes
 from .diff import XmlDiff, DiffItem, DiffType
 
+# Import streaming serialization utilities
+from .stream import (
+    iter_element_json,
+    write_element_json,
+    iter_entry_records,
+    write_element_json_lines,
+)
+
 # Import caching utilities
 from .cache import cached_xpath, clear_xpath_cache, invalidate_element_cache, LRUCache
 
@@ -84,6 +93,11 @@ __all__ = [
     "XmlDiff",
     "DiffItem",
     "DiffType",
+    # Streaming exports
+    "iter_element_json",
+    "write_element_json",
+    "iter_entry_records",
+    "write_element_json_lines",
     # Cache exports
     "cached_xpath",
     "clear_xpath_cache",
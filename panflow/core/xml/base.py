@@ -43,6 +43,7 @@ from ..exceptions import (
     ValidationError,
     FileOperationError,
 )
+from ..compression import detect_compression, open_config_input
 
 
 # Import caching utilities - deferred import to avoid circular references
@@ -145,11 +146,14 @@ def parse_xml(
     """
     Parse XML from a file or string and return both the tree and root element.
 
+    Gzip and zstd compressed files are decompressed on the fly.
+
     Args:
         source: XML source (file path, bytes, or XML string)
         validate: Whether to validate against a schema
         schema_file: XML Schema file path (required if validate=True)
-        max_file_size: Maximum allowed file size in bytes (default: 100MB)
+        max_file_size: Maximum allowed file size in bytes (default: 100MB), applied to
+            both the file on disk and the decompressed stream
 
     Returns:
         Tuple containing (ElementTree, root Element)
@@ -182,25 +186,38 @@ def parse_xml(
                     raise
                 logger.warning(f"Unable to check file size for {source}: {e}")
 
-            if HAVE_LXML:
-                try:
-                    if validate and schema_file:
-                        schema_doc = etree.parse(schema_file)
-                        schema = etree.XMLSchema(schema_doc)
-                        parser = etree.XMLParser(schema=schema, resolve_entities=False)
-                        tree = etree.parse(source, parser)
-                    else:
-                        parser = etree.XMLParser(resolve_entities=False)
-                        tree = etree.parse(source, parser)
-                    root = tree.getroot()
-                except Exception as e:
-                    raise ParseError(f"Error parsing XML file {source}: {e}")
-            else:
-                try:
-                    tree = etree.parse(source)
-                    root = tree.getroot()
-                except Exception as e:
-                    raise ParseError(f"Error parsing XML file {source}: {e}")
+            # Compressed files are decompressed as a stream straight into the parser
+            compression = detect_compression(source)
+            stream = open_config_input(source, max_file_size) if compression else None
+            parse_source = stream if stream is not None else source
+
+            try:
+                if HAVE_LXML:
+                    try:
+                        if validate and schema_file:
+                            schema_doc = etree.parse(schema_file)
+                            schema = etree.XMLSchema(schema_doc)
+                            parser = etree.XMLParser(schema=schema, resolve_entities=False)
+                            tree = etree.parse(parse_source, parser)
+                        else:
+                            parser = etree.XMLParser(resolve_entities=False)
+                            tree = etree.parse(parse_source, parser)
+                        root = tree.getroot()
+                    except SecurityError:
+                        raise
+                    except Exception as e:
+                        raise ParseError(f"Error parsing XML file {source}: {e}")
+                else:
+                    try:
+                        tree = etree.parse(parse_source)
+                        root = tree.getroot()
+                    except SecurityError:
+                        raise
+                    except Exception as e:
+                        raise ParseError(f"Error parsing XML file {source}: {e}")
+            finally:
+                if stream is not None:
+                    stream.close()
 
             return tree, root
     except FileNotFoundError:
@@ -524,12 +541,40 @@ def element_to_dict(element: etree._Element) -> Dict[str, Any]:
     """
     Convert an XML element to a dictionary.
 
+    The tree is walked with an explicit stack rather than recursion so that
+    deeply nested configurations cannot exhaust the interpreter recursion limit.
+
     Args:
         element: XML element to convert
 
     Returns:
         Dictionary representation of the element
     """
+    result = _element_dict_header(element)
+    stack = [(element, result)]
+
+    while stack:
+        current, current_dict = stack.pop()
+
+        # Process child elements
+        for child in current:
+            child_dict = _element_dict_header(child)
+
+            # Handle repeated tags (convert to list)
+            if child.tag in current_dict:
+                if not isinstance(current_dict[child.tag], list):
+                    current_dict[child.tag] = [current_dict[child.tag]]
+                current_dict[child.tag].append(child_dict)
+            else:
+                current_dict[child.tag] = child_dict
+
+            stack.append((child, child_dict))
+
+    return result
+
+
+def _element_dict_header(element: etree._Element) -> Dict[str, Any]:
+    """Build the attribute and text portion of an element's dictionary form."""
     result = {}
 
     # Add attributes with @ prefix
@@ -540,19 +585,6 @@ def element_to_dict(element: etree._Element) -> Dict[str, Any]:
     if element.text and element.text.strip():
         result["#text"] = element.text.strip()
 
-    # Process child elements
-    for child in element:
-        # Convert child element recursively
-        child_dict = element_to_dict(child)
-
-        # Handle repeated tags (convert to list)
-        if child.tag in result:
-            if not isinstance(result[child.tag], list):
-                result[child.tag] = [result[child.tag]]
-            result[child.tag].append(child_dict)
-        else:
-            result[child.tag] = child_dict
-
     return result
 
 
@@ -0,0 +1,293 @@
+"""
+Streaming serialization utilities for PAN-OS XML configurations.
+
+This module converts lxml trees to JSON without materializing the intermediate
+dictionary produced by ``element_to_dict``. The tree is walked iteratively and
+JSON tokens are emitted as they are produced, so memory use is bounded by the
+depth of the tree rather than its size and deep configurations cannot hit the
+interpreter recursion limit.
+
+Two output shapes are supported:
+- JSON: a single document identical to ``json.dump(element_to_dict(root))``
+- JSON Lines: one record per object or rule entry
+"""
+
+import json
+import logging
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from lxml import etree
+
+logger = logging.getLogger("panflow")
+
+# JSON string encoder used by json.dump with the default ensure_ascii=True
+_encode_string = json.encoder.encode_basestring_ascii
+
+# Number of tokens buffered before a write to the underlying file handle
+WRITE_BATCH_SIZE = 512
+
+# Container tags whose entries are emitted as individual JSON Lines records
+OBJECT_CONTAINERS = frozenset(
+    {
+        "address",
+        "address-group",
+        "service",
+        "service-group",
+        "application",
+        "application-group",
+        "application-filter",
+        "tag",
+        "external-list",
+        "schedule",
+        "region",
+        "profile-group",
+    }
+)
+
+RULEBASE_TAGS = frozenset({"rulebase", "pre-rulebase", "post-rulebase"})
+
+# Context container tags mapped to the context type names used across PANFlow
+CONTEXT_CONTAINERS = {
+    "device-group": "device_group",
+    "vsys": "vsys",
+    "template": "template",
+}
+
+
+def _element_members(element: etree._Element) -> List[Tuple[str, Any]]:
+    """
+    Collect the JSON members of an element in ``element_to_dict`` order.
+
+    Attributes come first, then stripped text, then child tags in order of first
+    occurrence. Repeated child tags are grouped into a list. Comments and
+    processing instructions are skipped since they have no JSON key.
+
+    Args:
+        element: XML element to inspect
+
+    Returns:
+        List of (key, value) pairs where value is a string, an element, or a
+        list of elements
+    """
+    members: List[Tuple[str, Any]] = [(f"@{key}", value) for key, value in element.attrib.items()]
+
+    text = element.text
+    if text and text.strip():
+        members.append(("#text", text.strip()))
+
+    groups: Dict[str, List[etree._Element]] = {}
+    for child in element:
+        if not isinstance(child.tag, str):
+            continue
+        groups.setdefault(child.tag, []).append(child)
+
+    for tag, children in groups.items():
+        members.append((tag, children[0] if len(children) == 1 else children))
+
+    return members
+
+
+def iter_element_json(element: etree._Element, indent: Optional[int] = 2) -> Iterator[str]:
+    """
+    Yield JSON text fragments for an element.
+
+    The concatenated output is byte-for-byte identical to
+    ``json.dumps(element_to_dict(element), indent=indent)``.
+
+    Args:
+        element: XML element to serialize
+        indent: Number of spaces per indentation level, or None for compact output
+
+    Yields:
+        JSON text fragments
+    """
+    if indent is None:
+        item_separator = ", "
+
+        def newline(depth: int) -> str:
+            return ""
+
+    else:
+        item_separator = ","
+        padding = " " * indent
+
+        def newline(depth: int) -> str:
+            return "\n" + padding * depth
+
+    members = _element_members(element)
+    if not members:
+        yield "{}"
+        return
+
+    yield "{"
+    # Each frame is [member iterator, is_list, depth, first]
+    stack: List[List[Any]] = [[iter(members), False, 1, True]]
+
+    while stack:
+        frame = stack[-1]
+        item = next(frame[0], None)
+        depth = frame[2]
+
+        if item is None:
+            stack.pop()
+            yield newline(depth - 1) + ("]" if frame[1] else "}")
+            continue
+
+        prefix = newline(depth) if frame[3] else item_separator + newline(depth)
+        frame[3] = False
+
+        if frame[1]:
+            value = item
+        else:
+            key, value = item
+            prefix += _encode_string(key) + ": "
+
+        if isinstance(value, str):
+            yield prefix + _encode_string(value)
+        elif isinstance(value, list):
+            yield prefix + "["
+            stack.append([iter(value), True, depth + 1, True])
+        else:
+            child_members = _element_members(value)
+            if child_members:
+                yield prefix + "{"
+                stack.append([iter(child_members), False, depth + 1, True])
+            else:
+                yield prefix + "{}"
+
+
+def write_element_json(element: etree._Element, fp: IO[str], indent: Optional[int] = 2) -> None:
+    """
+    Stream an element as a JSON document to a text file handle.
+
+    Args:
+        element: XML element to serialize
+        fp: Writable text file handle
+        indent: Number of spaces per indentation level, or None for compact output
+    """
+    buffer: List[str] = []
+    for chunk in iter_element_json(element, indent):
+        buffer.append(chunk)
+        if len(buffer) >= WRITE_BATCH_SIZE:
+            fp.write("".join(buffer))
+            buffer.clear()
+    if buffer:
+        fp.write("".join(buffer))
+
+
+def _entry_record_type(entry: etree._Element) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Classify an ``entry`` element as an object or rule.
+
+    Args:
+        entry: ``entry`` element to classify
+
+    Returns:
+        Tuple of (record type, rulebase) or None if the entry is neither an
+        object nor a rule. Rulebase is None for objects.
+    """
+    container = entry.getparent()
+    if container is None:
+        return None
+
+    if container.tag == "rules":
+        rule_type = container.getparent()
+        rulebase = rule_type.getparent() if rule_type is not None else None
+        if rulebase is not None and rulebase.tag in RULEBASE_TAGS:
+            return rule_type.tag, rulebase.tag
+        return None
+
+    if container.tag in OBJECT_CONTAINERS:
+        owner = container.getparent()
+        if owner is None:
+            return None
+        if owner.tag == "shared":
+            return container.tag, None
+        owner_parent = owner.getparent()
+        if owner.tag == "entry" and owner_parent is not None:
+            if owner_parent.tag in CONTEXT_CONTAINERS:
+                return container.tag, None
+
+    return None
+
+
+def _entry_context(entry: etree._Element) -> Dict[str, str]:
+    """
+    Determine the configuration context that owns an entry.
+
+    Args:
+        entry: Object or rule ``entry`` element
+
+    Returns:
+        Dictionary with ``context_type`` and, for non-shared contexts, ``context_name``
+    """
+    for ancestor in entry.iterancestors():
+        if ancestor.tag == "shared":
+            return {"context_type": "shared"}
+        if ancestor.tag == "entry":
+            parent = ancestor.getparent()
+            if parent is not None and parent.tag in CONTEXT_CONTAINERS:
+                return {
+                    "context_type": CONTEXT_CONTAINERS[parent.tag],
+                    "context_name": ancestor.get("name", ""),
+                }
+    return {"context_type": "shared"}
+
+
+def iter_entry_records(
+    element: Union[etree._Element, etree._ElementTree],
+) -> Iterator[Tuple[Dict[str, str], etree._Element]]:
+    """
+    Iterate over object and rule entries in document order.
+
+    Args:
+        element: Root element or tree to scan
+
+    Yields:
+        Tuples of (record metadata, entry element). Metadata contains ``type``,
+        ``name``, ``context_type``, optional ``context_name`` and, for rules,
+        ``rulebase``.
+    """
+    root = element.getroot() if isinstance(element, etree._ElementTree) else element
+
+    for entry in root.iter("entry"):
+        classification = _entry_record_type(entry)
+        if classification is None:
+            continue
+
+        record_type, rulebase = classification
+        metadata = {"type": record_type, "name": entry.get("name", "")}
+        metadata.update(_entry_context(entry))
+        if rulebase is not None:
+            metadata["rulebase"] = rulebase
+
+        yield metadata, entry
+
+
+def write_element_json_lines(
+    element: Union[etree._Element, etree._ElementTree], fp: IO[str]
+) -> int:
+    """
+    Stream object and rule entries as JSON Lines to a text file handle.
+
+    Each line is a JSON object holding the record metadata from
+    ``iter_entry_records`` plus a ``data`` member with the entry in
+    ``element_to_dict`` shape.
+
+    Args:
+        element: Root element or tree to export
+        fp: Writable text file handle
+
+    Returns:
+        Number of records written
+    """
+    count = 0
+    for metadata, entry in iter_entry_records(element):
+        header = ", ".join(f"{_encode_string(k)}: {_encode_string(v)}" for k, v in metadata.items())
+        fp.write("{" + header + ', "data": ')
+        write_element_json(entry, fp, indent=None)
+        fp.write("}\n")
+        count += 1
+
+    logger.debug(f"Wrote {count} JSON Lines records")
+    return count
@@ -3,17 +3,33 @@ XPath resolver for PANFlow.
 
 This module provides functions to load and resolve XPath expressions for different
 PAN-OS versions, ensuring that the correct XPath is used for each version.
+
+The YAML mapping files are compiled into the ``_xpath_bundle`` module at build
+time by :mod:`panflow.core.mapping_bundle`, so loading the mappings of a shipped
+version does not parse YAML.
+
+The mappings of a version are flattened into an :class:`XPathTable` on first
+use. Callers searching in loops use :func:`find_object_elements` and
+:func:`find_policy_elements`, which reuse XPaths compiled once per version,
+device type, context type and object or policy type, and pass names and
+context parameters as XPath variables.
 """
 
+import hashlib
 import os
-import yaml
+import re
 import logging
 from typing import Dict, Any, Optional, Tuple, List
 
+from lxml import etree
+
 # Package constants
 DEFAULT_VERSION = "11.2"  # Newest version as default
 XPATH_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "xpath_mappings")
 
+# Format version of the precompiled mapping bundle
+BUNDLE_FORMAT_VERSION = 1
+
 # Initialize logger
 logger = logging.getLogger("panflow")
 
@@ -25,6 +41,10 @@ def load_xpath_mappings(version: str) -> Dict[str, Any]:
     """
     Load XPath mappings for a specific PAN-OS version.
 
+    The mappings of the shipped versions come from the precompiled bundle. A
+    mapping file that differs from the one the bundle was generated from, or
+    that is not in the bundle, is parsed as YAML.
+
     Args:
         version: PAN-OS version (e.g., "10.1", "11.0")
 
@@ -47,7 +67,7 @@ def load_xpath_mappings(version: str) -> Dict[str, Any]:
     # Look for exact version mapping file
     file_path = os.path.join(XPATH_DIR, f"panos_{normalized_version}.yaml")
 
-    if not os.path.exists(file_path):
+    if not os.path.exists(file_path) and version not in _bundle_sources():
         # If exact version not found, use the default
         if version != DEFAULT_VERSION:
             logger.debug(
@@ -57,16 +77,29 @@ def load_xpath_mappings(version: str) -> Dict[str, Any]:
         normalized_version = version.replace(".", "_")
         file_path = os.path.join(XPATH_DIR, f"panos_{normalized_version}.yaml")
 
-        if not os.path.exists(file_path):
+        if not os.path.exists(file_path) and version not in _bundle_sources():
             error_msg = f"XPath mapping file not found for PAN-OS version {version}"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-    # Load YAML file
+    # Use the bundled mappings unless the YAML file was changed
     try:
-        logger.debug(f"Reading XPath mappings from file: {file_path}")
-        with open(file_path, "r") as f:
-            mappings = yaml.safe_load(f)
+        text = None
+        if os.path.exists(file_path):
+            with open(file_path, "r") as f:
+                text = f.read()
+
+        mappings = _bundled_mappings(version, text)
+        if mappings is None:
+            import yaml
+
+            logger.debug(f"Parsing XPath mappings from file: {file_path}")
+            try:
+                mappings = yaml.safe_load(text)
+            except yaml.YAMLError as e:
+                error_msg = f"Error parsing YAML in XPath mapping file for version {version}: {e}"
+                logger.error(error_msg, exc_info=True)
+                raise ValueError(error_msg)
 
         logger.debug(f"Successfully loaded XPath mappings for PAN-OS version {version}")
 
@@ -75,87 +108,208 @@ def load_xpath_mappings(version: str) -> Dict[str, Any]:
         logger.debug(f"Cached XPath mappings for version {version}")
 
         return mappings
-    except yaml.YAMLError as e:
-        error_msg = f"Error parsing YAML in XPath mapping file for version {version}: {e}"
-        logger.error(error_msg, exc_info=True)
-        raise ValueError(error_msg)
+    except ValueError:
+        raise
     except Exception as e:
         error_msg = f"Unexpected error loading XPath mappings for version {version}: {e}"
         logger.error(error_msg, exc_info=True)
         raise ValueError(error_msg)
 
 
-def get_context_xpath(
-    device_type: str, context_type: str, version: str = DEFAULT_VERSION, **kwargs
-) -> str:
+def _bundle_sources() -> Dict[str, str]:
+    """Get the digests of the mapping files in the precompiled bundle by version."""
+    try:
+        from . import _xpath_bundle
+    except ImportError:
+        return {}
+    if getattr(_xpath_bundle, "FORMAT_VERSION", None) != BUNDLE_FORMAT_VERSION:
+        return {}
+    return _xpath_bundle.SOURCES
+
+
+def _bundled_mappings(version: str, text: Optional[str]) -> Optional[Dict[str, Any]]:
     """
-    Get the base XPath for a specific context.
+    Get the bundled mappings of a version.
 
     Args:
-        device_type: Type of device ("firewall" or "panorama")
-        context_type: Type of context (shared, device_group, template, vsys)
         version: PAN-OS version
-        **kwargs: Additional parameters (device_group, template, vsys)
+        text: Content of the version's mapping file, if it exists
 
     Returns:
-        str: Base XPath for the context
+        The bundled mappings, or None if the version is not bundled or the
+        mapping file differs from the one the bundle was generated from
+    """
+    digest = _bundle_sources().get(version)
+    if digest is None:
+        return None
+    if text is not None and _digest(text) != digest:
+        logger.debug(f"XPath mapping file for version {version} differs from the bundle")
+        return None
 
-    Raises:
-        ValueError: If the device type or context type is invalid
+    from . import _xpath_bundle
+
+    return _xpath_bundle.MAPPINGS[version]
+
+
+def _digest(text: str) -> str:
+    """Get the digest identifying the content of a mapping file."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class XPathTable:
     """
-    logger.debug(f"Getting context XPath for {device_type}/{context_type} (version {version})")
+    XPath templates of one PAN-OS version, flattened into tuple-keyed tables.
 
-    # Load XPath mappings for the specified version
-    try:
-        mappings = load_xpath_mappings(version)
-    except ValueError as e:
-        logger.error(f"Failed to load XPath mappings: {e}")
-        raise
+    Attributes:
+        contexts: (device_type, context_type) -> context XPath template
+        objects: object_type -> object XPath template relative to ``{base_path}``
+        policies: (device_type, policy_type) -> policy XPath template relative to ``{base_path}``
+        overrides: (device_type, type) -> version-specific XPath template
+    """
+
+    def __init__(self, mappings: Dict[str, Any]):
+        self.contexts: Dict[Tuple[str, str], str] = {}
+        self.policies: Dict[Tuple[str, str], str] = {}
+        self.overrides: Dict[Tuple[str, str], str] = {}
+        self.objects: Dict[str, str] = dict(mappings.get("objects") or {})
+        self.context_devices = set((mappings.get("contexts") or {}).keys())
+        self.policy_devices = set((mappings.get("policies") or {}).keys())
+
+        for device_type, contexts in (mappings.get("contexts") or {}).items():
+            for context_type, template in (contexts or {}).items():
+                self.contexts[(device_type, context_type)] = template
+        for device_type, policies in (mappings.get("policies") or {}).items():
+            for policy_type, template in (policies or {}).items():
+                self.policies[(device_type, policy_type)] = template
+        for device_type, overrides in (mappings.get("version_specific") or {}).items():
+            for xpath_type, template in (overrides or {}).items():
+                self.overrides[(device_type, xpath_type)] = template
 
-    # Get context mappings for the device type
+
+# Flattened XPath tables by requested PAN-OS version
+_xpath_tables: Dict[str, XPathTable] = {}
+
+# Compiled XPaths by (version, kind, device_type, context_type, type, named)
+_compiled_xpaths: Dict[Tuple[str, str, str, str, str, bool], etree.XPath] = {}
+
+# Quoted template placeholders, compiled to XPath variables
+_PLACEHOLDER = re.compile(r"'\{(\w+)\}'")
+
+
+def get_xpath_table(version: str) -> XPathTable:
+    """
+    Get the flattened XPath templates of a PAN-OS version.
+
+    Args:
+        version: PAN-OS version (e.g., "10.1", "11.0")
+
+    Returns:
+        XPathTable built from the version's mappings on first use
+
+    Raises:
+        ValueError: If the mapping file cannot be found or loaded
+    """
+    table = _xpath_tables.get(version)
+    if table is None:
+        try:
+            table = XPathTable(load_xpath_mappings(version))
+        except ValueError as e:
+            logger.error(f"Failed to load XPath mappings: {e}")
+            raise
+        _xpath_tables[version] = table
+    return table
+
+
+def _policy_type_key(policy_type: str, device_type: str) -> str:
+    """Map Panorama policy types to the firewall policy types they correspond to."""
+    if device_type == "firewall":
+        for prefix in ("security", "nat", "decryption", "authentication"):
+            if policy_type.startswith(prefix + "_"):
+                return prefix + "_rules"
+    return policy_type
+
+
+def _context_template(table: XPathTable, device_type: str, context_type: str) -> str:
     device_type_lower = device_type.lower()
-    if device_type_lower not in mappings["contexts"]:
+    if device_type_lower not in table.context_devices:
         error_msg = f"Invalid device type: {device_type}"
         logger.error(error_msg)
         raise ValueError(error_msg)
 
-    contexts = mappings["contexts"][device_type_lower]
-
-    # Get the XPath template for the context type
-    if context_type not in contexts:
+    template = table.contexts.get((device_type_lower, context_type))
+    if template is None:
         error_msg = f"Invalid context type for {device_type}: {context_type}"
         logger.error(error_msg)
         raise ValueError(error_msg)
+    return template
+
+
+def _object_template(table: XPathTable, object_type: str, device_type: str) -> Tuple[str, bool]:
+    """Get an object XPath template and whether it is a full (version-specific) path."""
+    template = table.objects.get(object_type)
+    if template is not None:
+        return template, False
+
+    template = table.overrides.get((device_type.lower(), object_type))
+    if template is not None and template.startswith("/config"):
+        return template, True
+
+    error_msg = f"Invalid object type: {object_type}"
+    logger.error(error_msg)
+    raise ValueError(error_msg)
+
+
+def _policy_template(table: XPathTable, policy_type: str, device_type: str) -> Tuple[str, bool]:
+    """Get a policy XPath template and whether it is a full (version-specific) path."""
+    device_type_lower = device_type.lower()
+    if device_type_lower not in table.policy_devices:
+        error_msg = f"Invalid device type for policies: {device_type}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+
+    policy_type_key = _policy_type_key(policy_type, device_type_lower)
+    template = table.policies.get((device_type_lower, policy_type_key))
+    if template is not None:
+        return template, False
+
+    template = table.overrides.get((device_type_lower, policy_type_key))
+    if template is not None and template.startswith("/config"):
+        return template, True
+
+    error_msg = f"Invalid policy type for {device_type}: {policy_type}"
+    logger.error(error_msg)
+    raise ValueError(error_msg)
+
+
+def get_context_xpath(
+    device_type: str, context_type: str, version: str = DEFAULT_VERSION, **kwargs
+) -> str:
+    """
+    Get the base XPath for a specific context.
 
-    xpath_template = contexts[context_type]
+    Args:
+        device_type: Type of device ("firewall" or "panorama")
+        context_type: Type of context (shared, device_group, template, vsys)
+        version: PAN-OS version
+        **kwargs: Additional parameters (device_group, template, vsys)
+
+    Returns:
+        str: Base XPath for the context
+
+    Raises:
+        ValueError: If the device type or context type is invalid
+    """
+    xpath_template = _context_template(get_xpath_table(version), device_type, context_type)
 
     # Format the XPath with the provided parameters
     try:
         if context_type == "device_group" and "device_group" in kwargs:
-            device_group = kwargs["device_group"]
-            xpath = xpath_template.format(device_group=device_group)
-            logger.debug(
-                f"Generated context XPath for {device_type}/{context_type} (device_group={device_group}): {xpath}"
-            )
-            return xpath
+            return xpath_template.format(device_group=kwargs["device_group"])
         elif context_type == "template" and "template" in kwargs:
-            template = kwargs["template"]
-            xpath = xpath_template.format(template=template)
-            logger.debug(
-                f"Generated context XPath for {device_type}/{context_type} (template={template}): {xpath}"
-            )
-            return xpath
+            return xpath_template.format(template=kwargs["template"])
         elif context_type == "vsys":
-            vsys = kwargs.get("vsys", "vsys1")
-            xpath = xpath_template.format(vsys=vsys)
-            logger.debug(
-                f"Generated context XPath for {device_type}/{context_type} (vsys={vsys}): {xpath}"
-            )
-            return xpath
+            return xpath_template.format(vsys=kwargs.get("vsys", "vsys1"))
         else:
-            logger.debug(
-                f"Generated context XPath for {device_type}/{context_type}: {xpath_template}"
-            )
             return xpath_template
     except KeyError as e:
         error_msg = f"Missing required parameter for {context_type} context: {e}"
@@ -178,6 +332,9 @@ def get_object_xpath(
     """
     Get the XPath for a specific object type in a specific context.
 
+    Hot loops should prefer :func:`find_object_elements`, which reuses a
+    compiled XPath instead of formatting a new expression on every call.
+
     Args:
         object_type: Type of object (address, service, etc.)
         device_type: Type of device ("firewall" or "panorama")
@@ -192,16 +349,7 @@ def get_object_xpath(
     Raises:
         ValueError: If the object type is invalid
     """
-    logger.debug(
-        f"Getting object XPath for {object_type} in {device_type}/{context_type} (version {version})"
-    )
-
-    # Load XPath mappings for the specified version
-    try:
-        mappings = load_xpath_mappings(version)
-    except ValueError as e:
-        logger.error(f"Failed to load XPath mappings: {e}")
-        raise
+    table = get_xpath_table(version)
 
     # Get the base context path
     try:
@@ -210,50 +358,16 @@ def get_object_xpath(
         logger.error(f"Failed to get context XPath: {e}")
         raise
 
-    # Get the object XPath template
-    if object_type not in mappings["objects"]:
-        # Check version-specific overrides
-        if (
-            "version_specific" in mappings
-            and device_type.lower() in mappings["version_specific"]
-            and object_type in mappings["version_specific"][device_type.lower()]
-        ):
-            xpath_template = mappings["version_specific"][device_type.lower()][object_type]
-            logger.debug(f"Using version-specific XPath for {object_type}")
-
-            # If it's a full path, use it directly
-            if xpath_template.startswith("/config"):
-                if name:
-                    xpath = xpath_template.format(name=name, **kwargs)
-                    logger.debug(f"Generated object XPath: {xpath}")
-                    return xpath
-                else:
-                    # Return path to all objects of this type without removing the entry part
-                    path = xpath_template.format(name="", **kwargs)
-                    # Replace the [@name=''] with just empty brackets or remove it entirely
-                    xpath = path.replace("[@name='']", "")
-                    logger.debug(f"Generated object XPath: {xpath}")
-                    return xpath
-        else:
-            error_msg = f"Invalid object type: {object_type}"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
-    else:
-        xpath_template = mappings["objects"][object_type]
+    xpath_template, full_path = _object_template(table, object_type, device_type)
 
     # Format the XPath with the provided parameters
     try:
-        if name:
-            xpath = xpath_template.format(base_path=base_path, name=name)
-            logger.debug(f"Generated object XPath for {object_type} '{name}': {xpath}")
-            return xpath
+        if full_path:
+            xpath = xpath_template.format(name=name or "", **kwargs)
         else:
-            # Return path to all objects of this type without removing the entry part
-            path = xpath_template.format(base_path=base_path, name="")
-            # Replace the [@name=''] with just empty brackets or remove it entirely
-            xpath = path.replace("[@name='']", "")
-            logger.debug(f"Generated object XPath for all {object_type} objects: {xpath}")
-            return xpath
+            xpath = xpath_template.format(base_path=base_path, name=name or "")
+        # Without a name, return the path to all objects of this type
+        return xpath if name else xpath.replace("[@name='']", "")
     except KeyError as e:
         error_msg = f"Missing required parameter for object XPath: {e}"
         logger.error(error_msg)
@@ -289,16 +403,7 @@ def get_policy_xpath(
     Raises:
         ValueError: If the policy type is invalid for the device type
     """
-    logger.debug(
-        f"Getting policy XPath for {policy_type} in {device_type}/{context_type} (version {version})"
-    )
-
-    # Load XPath mappings for the specified version
-    try:
-        mappings = load_xpath_mappings(version)
-    except ValueError as e:
-        logger.error(f"Failed to load XPath mappings: {e}")
-        raise
+    table = get_xpath_table(version)
 
     # Get the base context path
     try:
@@ -307,70 +412,18 @@ def get_policy_xpath(
         logger.error(f"Failed to get context XPath: {e}")
         raise
 
-    # Get policy mappings for the device type
-    device_type_lower = device_type.lower()
-    if device_type_lower not in mappings["policies"]:
-        error_msg = f"Invalid device type for policies: {device_type}"
-        logger.error(error_msg)
-        raise ValueError(error_msg)
-
-    policies = mappings["policies"][device_type_lower]
-
-    # Convert panorama policy types to firewall types if needed
-    if device_type_lower == "firewall":
-        if policy_type.startswith("security_"):
-            policy_type_key = "security_rules"
-        elif policy_type.startswith("nat_"):
-            policy_type_key = "nat_rules"
-        elif policy_type.startswith("decryption_"):
-            policy_type_key = "decryption_rules"
-        elif policy_type.startswith("authentication_"):
-            policy_type_key = "authentication_rules"
-        else:
-            policy_type_key = policy_type
-    else:
-        policy_type_key = policy_type
-
-    # Get the policy XPath template
-    if policy_type_key not in policies:
-        # Check version-specific overrides
-        if (
-            "version_specific" in mappings
-            and device_type_lower in mappings["version_specific"]
-            and policy_type_key in mappings["version_specific"][device_type_lower]
-        ):
-            xpath_template = mappings["version_specific"][device_type_lower][policy_type_key]
-            logger.debug(f"Using version-specific XPath for {policy_type}")
-
-            # If it's a full path, use it directly
-            if xpath_template.startswith("/config"):
-                if name:
-                    xpath = xpath_template.format(name=name, **kwargs)
-                    logger.debug(f"Generated policy XPath: {xpath}")
-                    return xpath
-                else:
-                    # Return path to all policies of this type (remove the [@name=''] part)
-                    xpath = xpath_template.format(name="").rsplit("/", 1)[0]
-                    logger.debug(f"Generated policy XPath: {xpath}")
-                    return xpath
-        else:
-            error_msg = f"Invalid policy type for {device_type}: {policy_type}"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
-    else:
-        xpath_template = policies[policy_type_key]
+    xpath_template, full_path = _policy_template(table, policy_type, device_type)
 
     # Format the XPath with the provided parameters
     try:
         if name:
-            xpath = xpath_template.format(base_path=base_path, name=name)
-            logger.debug(f"Generated policy XPath for {policy_type} '{name}': {xpath}")
-            return xpath
-        else:
-            # Return path to all policies of this type (remove the [@name=''] part)
-            xpath = xpath_template.format(base_path=base_path, name="").rsplit("/", 1)[0]
-            logger.debug(f"Generated policy XPath for all {policy_type} policies: {xpath}")
-            return xpath
+            if full_path:
+                return xpath_template.format(name=name, **kwargs)
+            return xpath_template.format(base_path=base_path, name=name)
+        # Return path to all policies of this type (remove the [@name=''] part)
+        if full_path:
+            return xpath_template.format(name="").rsplit("/", 1)[0]
+        return xpath_template.format(base_path=base_path, name="").rsplit("/", 1)[0]
     except KeyError as e:
         error_msg = f"Missing required parameter for policy XPath: {e}"
         logger.error(error_msg)
@@ -381,6 +434,188 @@ def get_policy_xpath(
         raise ValueError(error_msg)
 
 
+def compile_object_xpath(
+    object_type: str,
+    device_type: str,
+    context_type: str,
+    version: str = DEFAULT_VERSION,
+    named: bool = True,
+) -> etree.XPath:
+    """
+    Get the compiled XPath selecting objects of a type in a context.
+
+    The XPath is compiled once per (version, device type, context type,
+    object type) and takes the object name and the context parameters as
+    XPath variables, e.g. ``xpath(tree, name="web", device_group="DG1")``.
+
+    Args:
+        object_type: Type of object (address, service, etc.)
+        device_type: Type of device ("firewall" or "panorama")
+        context_type: Type of context (shared, device_group, template, vsys)
+        version: PAN-OS version
+        named: Whether the XPath selects one object by its ``$name`` variable
+            or all objects of the type
+
+    Returns:
+        Compiled XPath
+
+    Raises:
+        ValueError: If the device, context or object type is invalid
+    """
+    key = (version, "object", device_type, context_type, object_type, named)
+    compiled = _compiled_xpaths.get(key)
+    if compiled is None:
+        table = get_xpath_table(version)
+        base_path = _context_template(table, device_type, context_type)
+        template, full_path = _object_template(table, object_type, device_type)
+        if not full_path:
+            template = template.replace("{base_path}", base_path)
+        if not named:
+            template = template.replace("[@name='{name}']", "")
+        compiled = _compile(template)
+        _compiled_xpaths[key] = compiled
+    return compiled
+
+
+def compile_policy_xpath(
+    policy_type: str,
+    device_type: str,
+    context_type: str,
+    version: str = DEFAULT_VERSION,
+    named: bool = True,
+) -> etree.XPath:
+    """
+    Get the compiled XPath selecting policies of a type in a context.
+
+    Like :func:`get_policy_xpath`, the XPath without a name selects the
+    rules container of the policy type rather than the rules themselves.
+
+    Args:
+        policy_type: Type of policy (security_pre_rules, nat_rules, etc.)
+        device_type: Type of device ("firewall" or "panorama")
+        context_type: Type of context (shared, device_group, vsys)
+        version: PAN-OS version
+        named: Whether the XPath selects one policy by its ``$name`` variable
+
+    Returns:
+        Compiled XPath
+
+    Raises:
+        ValueError: If the device, context or policy type is invalid
+    """
+    key = (version, "policy", device_type, context_type, policy_type, named)
+    compiled = _compiled_xpaths.get(key)
+    if compiled is None:
+        table = get_xpath_table(version)
+        base_path = _context_template(table, device_type, context_type)
+        template, full_path = _policy_template(table, policy_type, device_type)
+        if not full_path:
+            template = template.replace("{base_path}", base_path)
+        if not named:
+            template = template.rsplit("/", 1)[0]
+        compiled = _compile(template)
+        _compiled_xpaths[key] = compiled
+    return compiled
+
+
+def _compile(template: str) -> etree.XPath:
+    try:
+        return etree.XPath(_PLACEHOLDER.sub(r"$\1", template))
+    except etree.XPathSyntaxError as e:
+        error_msg = f"Error compiling XPath template {template}: {e}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+
+
+def _xpath_variables(
+    context_type: str, name: Optional[str], kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    variables = {key: value for key, value in kwargs.items() if isinstance(value, str)}
+    if context_type == "vsys":
+        variables.setdefault("vsys", "vsys1")
+    if name:
+        variables["name"] = name
+    return variables
+
+
+def find_object_elements(
+    tree,
+    object_type: str,
+    device_type: str,
+    context_type: str,
+    version: str = DEFAULT_VERSION,
+    name: Optional[str] = None,
+    **kwargs,
+) -> List[etree._Element]:
+    """
+    Find object elements with a compiled XPath.
+
+    Equivalent to searching the tree for ``get_object_xpath(...)`` with the
+    same arguments, without building and parsing a new XPath expression.
+
+    Args:
+        tree: ElementTree or element to search
+        object_type: Type of object (address, service, etc.)
+        device_type: Type of device ("firewall" or "panorama")
+        context_type: Type of context (shared, device_group, template, vsys)
+        version: PAN-OS version
+        name: Name of the object (optional, all objects of the type if omitted)
+        **kwargs: Context parameters (device_group, template, vsys)
+
+    Returns:
+        List of matching elements
+
+    Raises:
+        ValueError: If the device, context or object type is invalid
+    """
+    compiled = compile_object_xpath(object_type, device_type, context_type, version, bool(name))
+    try:
+        return compiled(tree, **_xpath_variables(context_type, name, kwargs))
+    except etree.XPathEvalError as e:
+        error_msg = f"Missing required parameter for object XPath: {e}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+
+
+def find_policy_elements(
+    tree,
+    policy_type: str,
+    device_type: str,
+    context_type: str,
+    version: str = DEFAULT_VERSION,
+    name: Optional[str] = None,
+    **kwargs,
+) -> List[etree._Element]:
+    """
+    Find policy elements with a compiled XPath.
+
+    Equivalent to searching the tree for ``get_policy_xpath(...)`` with the
+    same arguments; without a name, the rules container is returned.
+
+    Args:
+        tree: ElementTree or element to search
+        policy_type: Type of policy (security_pre_rules, nat_rules, etc.)
+        device_type: Type of device ("firewall" or "panorama")
+        context_type: Type of context (shared, device_group, vsys)
+        version: PAN-OS version
+        name: Name of the policy (optional)
+        **kwargs: Context parameters (device_group, template, vsys)
+
+    Returns:
+        List of matching elements
+
+    Raises:
+        ValueError: If the device, context or policy type is invalid
+    """
+    compiled = compile_policy_xpath(policy_type, device_type, context_type, version, bool(name))
+    try:
+        return compiled(tree, **_xpath_variables(context_type, name, kwargs))
+    except etree.XPathEvalError as e:
+        error_msg = f"Missing required parameter for policy XPath: {e}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+
+
 def get_all_versions() -> List[str]:
     """
     Get all available PAN-OS versions with XPath mappings.
@@ -5,6 +5,9 @@ This package contains the functional modules for different aspects of
 PAN-OS configuration management, including objects, policies, groups, and reports.
 """
 
+import importlib
+from typing import Any
+
 # Import key functions from each module for convenient access
 from .objects import (
     get_objects,
@@ -36,12 +39,14 @@ from .groups import (
     get_group_filter,
 )
 
-from ..reporting import (
-    generate_unused_objects_report,
-    generate_duplicate_objects_report,
-    generate_security_rule_coverage_report,
-    generate_reference_check_report,
-    generate_rule_hit_count_report,
+# The report functions are re-exported from panflow.reporting on first access:
+# its engine imports the modules above, so importing it here would be circular
+_REPORTING_EXPORTS = (
+    "generate_unused_objects_report",
+    "generate_duplicate_objects_report",
+    "generate_security_rule_coverage_report",
+    "generate_reference_check_report",
+    "generate_rule_hit_count_report",
 )
 
 # Define the public API
@@ -77,3 +82,12 @@ __all__ = [
     "generate_reference_check_report",
     "generate_rule_hit_count_report",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a report function from panflow.reporting on first access."""
+    if name in _REPORTING_EXPORTS:
+        value = getattr(importlib.import_module("..reporting", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
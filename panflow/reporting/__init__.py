@@ -13,9 +13,18 @@ from lxml import etree
 from .engine import ReportingEngine
 
 # Define exports from the new implementation for backward compatibility
-from .reports.unused_objects import generate_unused_objects_report_data
+from .reports.unused_objects import (
+    generate_unused_objects_report_data,
+    generate_unused_objects_report_data_from_snapshot,
+    iter_object_references,
+    iter_unused_objects,
+)
 from .reports.duplicate_objects import generate_duplicate_objects_report_data
 from .reports.policy_analysis import generate_security_policy_analysis_data
+from .reports.policy_shadowing import generate_policy_shadowing_report_data
+from .reports.object_usage import generate_object_usage_report_data
+from .reports.rule_expansion import generate_rule_expansion_report_data
+from .reports.hit_counts import HitCountTable
 
 
 # Define warning function
@@ -5,11 +5,14 @@ This module provides the main reporting engine for PAN-OS XML configurations.
 """
 
 import os
+import time
 import datetime
 import logging
-from typing import Dict, Any, Optional, List, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, Iterable, List, Union, Callable, Tuple
 from lxml import etree
 
+from ..core.config_cache import derived
 from ..core.config_loader import xpath_search, extract_element_data
 from ..core.xpath_resolver import get_object_xpath, get_policy_xpath
 from ..core.logging_utils import logger, log, log_structured
@@ -20,9 +23,107 @@ from ..core.bulk_operations import ConfigQuery
 from .formatters.html import HTMLFormatter
 from .formatters.json import JSONFormatter
 from .formatters.csv import CSVFormatter
-from .reports.unused_objects import generate_unused_objects_report_data
+from .reports.unused_objects import generate_unused_objects_report_data, iter_object_references
 from .reports.duplicate_objects import generate_duplicate_objects_report_data
 from .reports.policy_analysis import generate_security_policy_analysis_data
+from .reports.policy_shadowing import generate_policy_shadowing_report_data
+from .reports.object_usage import generate_object_usage_report_data
+from .reports.rule_expansion import generate_rule_expansion_report_data
+from .reports.hit_counts import DEFAULT_STALE_DAYS, HitCountTable
+from .reports.report_index import ReportIndex
+
+# Sections of the default audit bundle; keys other than name and report are
+# passed to the report builder
+DEFAULT_BUNDLE_SECTIONS = [
+    {"name": "unused-address", "report": "unused_objects", "object_type": "address"},
+    {"name": "unused-address-group", "report": "unused_objects", "object_type": "address-group"},
+    {"name": "unused-service", "report": "unused_objects", "object_type": "service"},
+    {"name": "unused-service-group", "report": "unused_objects", "object_type": "service-group"},
+    {"name": "duplicate-address", "report": "duplicate_objects", "object_type": "address"},
+    {"name": "duplicate-service", "report": "duplicate_objects", "object_type": "service"},
+    {"name": "security-policy-analysis", "report": "security_policy_analysis"},
+    {"name": "policy-shadowing", "report": "policy_shadowing"},
+]
+
+# Report builders by report type
+REPORT_BUILDERS = {
+    "unused_objects": generate_unused_objects_report_data,
+    "duplicate_objects": generate_duplicate_objects_report_data,
+    "security_policy_analysis": generate_security_policy_analysis_data,
+    "policy_shadowing": generate_policy_shadowing_report_data,
+    "object_usage": generate_object_usage_report_data,
+    "rule_expansion": generate_rule_expansion_report_data,
+}
+
+# Report types whose builders accept a shared ReportIndex
+_INDEXED_REPORTS = {
+    "unused_objects",
+    "duplicate_objects",
+    "security_policy_analysis",
+    "object_usage",
+}
+
+# Report types with an HTML template; others are written as JSON in HTML bundles
+_HTML_REPORTS = {"unused_objects", "duplicate_objects", "security_policy_analysis"}
+
+_FORMAT_EXTENSIONS = {"json": "json", "jsonl": "jsonl", "csv": "csv", "html": "html"}
+
+
+def _report_records(report_type: str, data: Any) -> Iterable[Dict[str, Any]]:
+    """Get the records of a report written one per line in JSON Lines output."""
+    if report_type == "unused_objects":
+        return data.get("unused_objects", [])
+    if report_type == "duplicate_objects":
+        return (
+            {"value": value_key, "objects": objects}
+            for value_key, objects in data.get("duplicate_objects", {}).items()
+        )
+    if report_type == "security_policy_analysis":
+        return ({"name": name, **info} for name, info in data.get("policies", {}).items())
+    if report_type == "policy_shadowing":
+        return data.get("findings", [])
+    if report_type == "object_usage":
+        return data.get("objects", [])
+    if report_type == "rule_expansion":
+        return data.get("rules", [])
+    if report_type == "object_references":
+        return data
+    raise ValueError(f"No JSON Lines format for report type: {report_type}")
+
+
+# Engine of a bundle worker process, set by _init_bundle_worker
+_worker_engine = None
+_worker_index = None
+
+
+def _init_bundle_worker(
+    config_xml: bytes,
+    device_type: str,
+    context_type: str,
+    version: str,
+    template_dir: Optional[str],
+    custom_templates_dir: Optional[str],
+    context_kwargs: Dict[str, Any],
+) -> None:
+    """Parse the configuration once per bundle worker process."""
+    global _worker_engine, _worker_index
+    tree = etree.ElementTree(etree.fromstring(config_xml, etree.XMLParser(huge_tree=True)))
+    _worker_engine = ReportingEngine(
+        tree,
+        device_type,
+        context_type,
+        version,
+        template_dir=template_dir,
+        custom_templates_dir=custom_templates_dir,
+        **context_kwargs,
+    )
+    _worker_index = ReportIndex(tree)
+
+
+def _run_bundle_worker_section(
+    section: Dict[str, Any], output_dir: Optional[str], output_format: str
+) -> Tuple[str, Dict[str, Any], Optional[str], float]:
+    return _worker_engine._build_section(section, _worker_index, output_dir, output_format)
 
 
 class ReportingEngine:
@@ -60,6 +161,8 @@ class ReportingEngine:
         self.context_type = context_type
         self.version = version
         self.context_kwargs = kwargs
+        self.template_dir = template_dir
+        self.custom_templates_dir = custom_templates_dir
         self.query = ConfigQuery(tree, device_type, context_type, version, **kwargs)
 
         # Initialize formatters
@@ -113,6 +216,42 @@ class ReportingEngine:
 
         return report_data
 
+    def generate_object_references_report(
+        self,
+        output_file: str,
+        object_type: str = "address",
+        output_format: str = "jsonl",
+        **kwargs,
+    ) -> bool:
+        """
+        Write a report of every reference to the objects of a type.
+
+        References are written to the file as the rulebases are read, so
+        the report is never held in memory.
+
+        Args:
+            output_file: File to write the report to (compressed if it ends in .gz or .zst)
+            object_type: Type of object (address, service, etc.)
+            output_format: Output format ('jsonl', 'csv', 'json')
+            **kwargs: Additional parameters (context-specific)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        references = iter_object_references(
+            self.tree,
+            self.device_type,
+            self.context_type,
+            self.version,
+            object_type=object_type,
+            **{**self.context_kwargs, **kwargs},
+        )
+        if output_format.lower() == "json":
+            return self._save_report(
+                {"references": references}, output_file, "json", "object_references"
+            )
+        return self._save_report(references, output_file, output_format, "object_references")
+
     def generate_duplicate_objects_report(
         self,
         object_type: str = "address",
@@ -152,10 +291,12 @@ class ReportingEngine:
         self,
         policy_type: Optional[str] = None,
         include_hit_counts: bool = False,
-        hit_count_data: Optional[Dict[str, Dict[str, int]]] = None,
+        hit_count_data: Optional[Union[HitCountTable, Dict[str, Dict[str, int]]]] = None,
         output_file: Optional[str] = None,
         output_format: str = "json",
         include_visualization: bool = False,
+        max_overlap_links: Optional[int] = None,
+        stale_days: int = DEFAULT_STALE_DAYS,
         **kwargs,
     ) -> Dict[str, Any]:
         """
@@ -164,10 +305,13 @@ class ReportingEngine:
         Args:
             policy_type: Type of security policy to analyze (if None, determine based on device type)
             include_hit_counts: Whether to include hit count analysis
-            hit_count_data: Dictionary of hit count data (if available)
+            hit_count_data: HitCountTable, or dictionary of hit count data keyed by
+                rule name (if available)
             output_file: File to write the report to
             output_format: Output format ('json', 'csv', 'html')
             include_visualization: Whether to include visualization data
+            max_overlap_links: Maximum overlap links per policy in the visualization
+            stale_days: Days without a hit after which a rule is reported as stale
             **kwargs: Additional parameters (context-specific)
 
         Returns:
@@ -183,6 +327,8 @@ class ReportingEngine:
             include_hit_counts=include_hit_counts,
             hit_count_data=hit_count_data,
             include_visualization=include_visualization,
+            max_overlap_links=max_overlap_links,
+            stale_days=stale_days,
             **{**self.context_kwargs, **kwargs},
         )
 
@@ -194,6 +340,275 @@ class ReportingEngine:
 
         return analysis
 
+    def generate_policy_shadowing_report(
+        self,
+        policy_type: Optional[str] = None,
+        output_file: Optional[str] = None,
+        output_format: str = "json",
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Generate a report of shadowed, redundant and partially shadowed rules.
+
+        Args:
+            policy_type: Type of security policy to analyze
+                (if None, determine based on device type)
+            output_file: File to write the report to
+            output_format: Output format ('json', 'csv')
+            **kwargs: Additional parameters (context-specific)
+
+        Returns:
+            Dictionary containing the report data
+        """
+        # Generate the report data
+        report_data = generate_policy_shadowing_report_data(
+            self.tree,
+            self.device_type,
+            self.context_type,
+            self.version,
+            policy_type=policy_type,
+            **{**self.context_kwargs, **kwargs},
+        )
+
+        # Save the report to a file if requested
+        if output_file:
+            self._save_report(report_data, output_file, output_format, "policy_shadowing")
+
+        return report_data
+
+    def generate_object_usage_report(
+        self,
+        object_type: str = "address",
+        output_file: Optional[str] = None,
+        output_format: str = "json",
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Generate a report of which device groups use each object (Panorama only).
+
+        Args:
+            object_type: Type of object to check (address, service, etc.)
+            output_file: File to write the report to
+            output_format: Output format ('json', 'jsonl', 'csv')
+            **kwargs: Additional parameters (context-specific)
+
+        Returns:
+            Dictionary containing the report data
+        """
+        # Generate the report data
+        report_data = generate_object_usage_report_data(
+            self.tree,
+            self.device_type,
+            self.context_type,
+            self.version,
+            object_type=object_type,
+            **{**self.context_kwargs, **kwargs},
+        )
+
+        # Save the report to a file if requested
+        if output_file:
+            self._save_report(report_data, output_file, output_format, "object_usage")
+
+        return report_data
+
+    def generate_rule_expansion_report(
+        self,
+        output_file: Optional[str] = None,
+        output_format: str = "json",
+        approximate: bool = False,
+        top: Optional[int] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Generate a report of the expanded member counts and cost of each rule.
+
+        Args:
+            output_file: File to write the report to
+            output_format: Output format ('json', 'jsonl', 'csv')
+            approximate: Estimate the member counts of groups with sketches
+            top: Only list the rules with the highest cost (default: all)
+            **kwargs: Additional parameters (context-specific)
+
+        Returns:
+            Dictionary containing the report data
+        """
+        # Generate the report data
+        report_data = generate_rule_expansion_report_data(
+            self.tree,
+            self.device_type,
+            self.context_type,
+            self.version,
+            approximate=approximate,
+            top=top,
+            **{**self.context_kwargs, **kwargs},
+        )
+
+        # Save the report to a file if requested
+        if output_file:
+            self._save_report(report_data, output_file, output_format, "rule_expansion")
+
+        return report_data
+
+    def generate_bundle(
+        self,
+        sections: Optional[List[Dict[str, Any]]] = None,
+        output_dir: Optional[str] = None,
+        output_format: str = "json",
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+        on_section: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        index: Optional[ReportIndex] = None,
+    ) -> Dict[str, Any]:
+        """
+        Generate several reports over the same configuration concurrently.
+
+        With threads (the default), all sections share one ReportIndex, so
+        each object and policy lookup is built once for the whole bundle.
+        With processes, the configuration is serialized once and each worker
+        parses it and keeps its own index, which avoids the GIL for
+        CPU-heavy sections at the cost of one parse per worker. Each section
+        is written to ``output_dir`` as soon as it is done.
+
+        Args:
+            sections: Section specs with "name", "report" (one of REPORT_BUILDERS)
+                and builder parameters; an optional "format" overrides
+                output_format (defaults to DEFAULT_BUNDLE_SECTIONS)
+            output_dir: Directory to write one file per section to (None to not write)
+            output_format: Output format ('json', 'csv', 'html')
+            max_workers: Maximum number of concurrent sections
+            use_processes: Run sections in worker processes instead of threads
+            on_section: Called with the section name and result as each section finishes
+            index: Lookups to use in thread mode, e.g. an IncrementalReportIndex
+                updated to this configuration (defaults to a new ReportIndex)
+
+        Returns:
+            Dictionary with the report data ("sections"), written files ("files"),
+            per-section durations ("timings"), failed sections ("errors") and
+            the total duration
+
+        Raises:
+            ValueError: If a section has an unknown report type or a duplicate name
+        """
+        sections = [dict(section) for section in (sections or DEFAULT_BUNDLE_SECTIONS)]
+        names = set()
+        for section in sections:
+            section.setdefault("name", section.get("report"))
+            if section.get("report") not in REPORT_BUILDERS:
+                raise ValueError(f"Unknown report type in bundle: {section.get('report')}")
+            if section["name"] in names:
+                raise ValueError(f"Duplicate bundle section name: {section['name']}")
+            names.add(section["name"])
+
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        max_workers = max_workers or min(len(sections), os.cpu_count() or 1)
+        logger.info(
+            f"Generating report bundle with {len(sections)} sections "
+            f"({max_workers} {'processes' if use_processes else 'threads'})"
+        )
+
+        start = time.perf_counter()
+        bundle = {"sections": {}, "files": {}, "timings": {}, "errors": {}}
+        if index is None:
+            index = derived(self.tree, "report_index", lambda: ReportIndex(self.tree))
+
+        if use_processes:
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_bundle_worker,
+                initargs=(
+                    etree.tostring(self.tree),
+                    self.device_type,
+                    self.context_type,
+                    self.version,
+                    self.template_dir,
+                    self.custom_templates_dir,
+                    self.context_kwargs,
+                ),
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="report")
+
+        with executor:
+            futures = {}
+            for section in sections:
+                if use_processes:
+                    future = executor.submit(
+                        _run_bundle_worker_section, section, output_dir, output_format
+                    )
+                else:
+                    future = executor.submit(
+                        self._build_section, section, index, output_dir, output_format
+                    )
+                futures[future] = section
+
+            for future in as_completed(futures):
+                name = futures[future]["name"]
+                try:
+                    name, data, output_file, duration = future.result()
+                except Exception as e:
+                    logger.error(f"Report bundle section {name} failed: {e}")
+                    bundle["errors"][name] = str(e)
+                    continue
+
+                bundle["sections"][name] = data
+                bundle["timings"][name] = duration
+                if output_file:
+                    bundle["files"][name] = output_file
+                if on_section:
+                    on_section(name, data)
+
+        bundle["duration"] = time.perf_counter() - start
+        if not use_processes:
+            bundle["index"] = {"hits": index.hits, "misses": index.misses}
+        logger.info(
+            f"Report bundle finished in {bundle['duration']:.2f}s "
+            f"({len(bundle['sections'])} sections, {len(bundle['errors'])} failed)"
+        )
+        return bundle
+
+    def _build_section(
+        self,
+        section: Dict[str, Any],
+        index: ReportIndex,
+        output_dir: Optional[str],
+        output_format: str,
+    ) -> Tuple[str, Dict[str, Any], Optional[str], float]:
+        """Build one bundle section and write it through its formatter."""
+        start = time.perf_counter()
+        name = section["name"]
+        report_type = section["report"]
+        params = {k: v for k, v in section.items() if k not in ("name", "report", "format")}
+        if report_type in _INDEXED_REPORTS:
+            params["index"] = index
+
+        data = REPORT_BUILDERS[report_type](
+            self.tree,
+            self.device_type,
+            self.context_type,
+            self.version,
+            **{**self.context_kwargs, **params},
+        )
+
+        output_file = None
+        if output_dir:
+            section_format = section.get("format", output_format).lower()
+            if section_format == "html" and report_type not in _HTML_REPORTS:
+                section_format = "json"
+            extension = _FORMAT_EXTENSIONS.get(section_format, section_format)
+            output_file = os.path.join(output_dir, f"{name}.{extension}")
+            if not self._save_report(
+                data,
+                output_file,
+                section_format,
+                report_type,
+                bool(section.get("include_hit_counts")),
+            ):
+                raise IOError(f"Could not write {output_file}")
+
+        return name, data, output_file, time.perf_counter() - start
+
     def _save_report(
         self,
         data: Dict[str, Any],
@@ -208,8 +623,10 @@ class ReportingEngine:
         Args:
             data: The report data to save
             output_file: Path to the output file
-            output_format: Output format ('json', 'csv', 'html')
-            report_type: Type of report ('unused_objects', 'duplicate_objects', 'security_policy_analysis')
+            output_format: Output format ('json', 'jsonl', 'csv', 'html')
+            report_type: Type of report ('unused_objects', 'duplicate_objects',
+                'security_policy_analysis', 'policy_shadowing', 'object_usage', 'rule_expansion',
+                'object_references')
             include_hit_counts: Whether hit count data is included (only for security policy analysis)
 
         Returns:
@@ -223,38 +640,19 @@ class ReportingEngine:
             if output_format.lower() == "json":
                 return self.json_formatter.save(data, output_file)
 
-            elif output_format.lower() == "csv":
-                # Format the report as CSV
-                csv_data = ""
-                if report_type == "unused_objects":
-                    csv_data = self.csv_formatter.format_unused_objects_report(data)
-                elif report_type == "duplicate_objects":
-                    csv_data = self.csv_formatter.format_duplicate_objects_report(data)
-                elif report_type == "security_policy_analysis":
-                    csv_data = self.csv_formatter.format_security_policy_analysis(
-                        data, include_hit_counts
-                    )
+            elif output_format.lower() == "jsonl":
+                return self.json_formatter.save_lines(
+                    _report_records(report_type, data), output_file
+                )
 
-                # Save the CSV data
-                return self.csv_formatter.save(csv_data, output_file)
+            elif output_format.lower() == "csv":
+                # Rows are written as they are generated
+                rows = self.csv_formatter.report_rows(report_type, data, include_hit_counts)
+                return self.csv_formatter.save(rows, output_file)
 
             elif output_format.lower() == "html":
-                # Format the report as HTML
-                html_data = ""
-                if report_type == "unused_objects":
-                    html_data = self.html_formatter.format_unused_objects_report(data)
-                elif report_type == "duplicate_objects":
-                    html_data = self.html_formatter.format_duplicate_objects_report(data)
-                elif report_type == "security_policy_analysis":
-                    html_data = self.html_formatter.format_security_policy_analysis(
-                        data, include_hit_counts
-                    )
-
-                # Save the HTML data
-                with open(output_file, "w") as f:
-                    f.write(html_data)
-                logger.info(f"Report saved to {output_file} (HTML format)")
-                return True
+                # Stream the HTML report to the file
+                return self.html_formatter.save(data, output_file, report_type, include_hit_counts)
 
             else:
                 logger.error(f"Unsupported output format: {output_format}")
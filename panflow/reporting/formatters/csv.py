@@ -2,15 +2,31 @@
 CSV formatter for reports.
 
 This module provides functionality for formatting report data as CSV.
+
+Each report type has a ``*_rows`` generator yielding the header and then one
+row at a time, so rows can be written to a file as they are produced instead
+of building the whole document as a string.
 """
 
 import csv
 import io
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Union
+
+from ...core.compression import open_text_output
 
 logger = logging.getLogger("panflow")
 
+# Columns of the object references report
+OBJECT_REFERENCE_COLUMNS = [
+    "Object Name",
+    "Context",
+    "Referenced By",
+    "Reference Type",
+    "Reference Context",
+    "Field",
+]
+
 
 class CSVFormatter:
     """
@@ -32,10 +48,24 @@ class CSVFormatter:
         Returns:
             CSV formatted string
         """
-        output = io.StringIO()
-        writer = csv.writer(output)
+        return self.format_rows(
+            self.security_policy_analysis_rows(analysis_data, include_hit_counts)
+        )
+
+    def security_policy_analysis_rows(
+        self, analysis_data: Dict[str, Any], include_hit_counts: bool = False
+    ) -> Iterator[List[Any]]:
+        """
+        Generate the CSV rows of a security policy analysis, header first.
 
-        # Write header
+        Args:
+            analysis_data: The analysis data to format
+            include_hit_counts: Whether hit count data is included
+
+        Returns:
+            Iterator of rows
+        """
+        # Header
         header = [
             "Policy Name",
             "Action",
@@ -49,9 +79,9 @@ class CSVFormatter:
         ]
         if include_hit_counts:
             header.append("Hit Count")
-        writer.writerow(header)
+        yield header
 
-        # Write rows
+        # Rows
         for name, policy_info in analysis_data.get("policies", {}).items():
             row = [
                 name,
@@ -66,9 +96,7 @@ class CSVFormatter:
             ]
             if include_hit_counts:
                 row.append(policy_info.get("hit_count", "N/A"))
-            writer.writerow(row)
-
-        return output.getvalue()
+            yield row
 
     def format_unused_objects_report(self, report_data: Dict[str, Any]) -> str:
         """
@@ -80,13 +108,20 @@ class CSVFormatter:
         Returns:
             CSV formatted string
         """
-        output = io.StringIO()
-        writer = csv.writer(output)
+        return self.format_rows(self.unused_objects_rows(report_data))
+
+    def unused_objects_rows(self, report_data: Dict[str, Any]) -> Iterator[List[Any]]:
+        """
+        Generate the CSV rows of an unused objects report, header first.
 
-        # Write header
-        writer.writerow(["Object Name", "Type", "Value"])
+        Args:
+            report_data: The report data; "unused_objects" may be any iterable
+
+        Returns:
+            Iterator of rows
+        """
+        yield ["Object Name", "Type", "Value"]
 
-        # Write rows
         for obj in report_data.get("unused_objects", []):
             obj_name = obj.get("name", "")
             obj_props = obj.get("properties", {})
@@ -108,9 +143,7 @@ class CSVFormatter:
                 obj_type = "Service"
                 obj_value = obj_props["protocol"]
 
-            writer.writerow([obj_name, obj_type, obj_value])
-
-        return output.getvalue()
+            yield [obj_name, obj_type, obj_value]
 
     def format_duplicate_objects_report(self, report_data: Dict[str, Any]) -> str:
         """
@@ -122,37 +155,235 @@ class CSVFormatter:
         Returns:
             CSV formatted string
         """
-        output = io.StringIO()
-        writer = csv.writer(output)
+        return self.format_rows(self.duplicate_objects_rows(report_data))
+
+    def duplicate_objects_rows(self, report_data: Dict[str, Any]) -> Iterator[List[Any]]:
+        """
+        Generate the CSV rows of a duplicate objects report, header first.
 
-        # Write header
-        writer.writerow(["Value", "Object Type", "Duplicate Objects"])
+        Args:
+            report_data: The report data to format
+
+        Returns:
+            Iterator of rows
+        """
+        yield ["Value", "Object Type", "Duplicate Objects"]
 
-        # Write rows
         for value_key, names in report_data.get("duplicate_objects", {}).items():
             # Parse the value key to get the object type and value
             parts = value_key.split(":") if ":" in value_key else ["unknown", value_key]
             obj_type = parts[0]
             obj_value = parts[1] if len(parts) > 1 else ""
 
-            writer.writerow([obj_value, obj_type, ", ".join(names)])
+            # Duplicates are listed as objects with context information
+            names = [name["name"] if isinstance(name, dict) else name for name in names]
+            yield [obj_value, obj_type, ", ".join(names)]
+
+    def format_policy_shadowing_report(self, report_data: Dict[str, Any]) -> str:
+        """
+        Format rule shadowing report data as CSV.
+
+        Args:
+            report_data: The report data to format
+
+        Returns:
+            CSV formatted string
+        """
+        return self.format_rows(self.policy_shadowing_rows(report_data))
+
+    def policy_shadowing_rows(self, report_data: Dict[str, Any]) -> Iterator[List[Any]]:
+        """
+        Generate the CSV rows of a rule shadowing report, header first.
+
+        Args:
+            report_data: The report data; "findings" may be any iterable
+
+        Returns:
+            Iterator of rows
+        """
+        yield ["Policy Name", "Position", "Action", "Finding", "Coverage", "Related Rules"]
+
+        for finding in report_data.get("findings", []):
+            related = finding.get("covered_by", finding.get("overlapping_rules", []))
+            yield [
+                finding.get("rule", ""),
+                finding.get("position", ""),
+                finding.get("action", ""),
+                finding.get("type", ""),
+                finding.get("coverage", ""),
+                ", ".join(related),
+            ]
+
+    def object_usage_rows(self, report_data: Dict[str, Any]) -> Iterator[List[Any]]:
+        """
+        Generate the CSV rows of an object usage report, header first.
 
+        Each row is one object; the device groups using it are listed with
+        their reference counts.
+
+        Args:
+            report_data: The report data to format
+
+        Returns:
+            Iterator of rows
+        """
+        yield [
+            "Object Name",
+            "Context",
+            "References",
+            "Device Groups",
+            "Recommendation",
+            "Target",
+        ]
+
+        for obj in report_data.get("objects", []):
+            users = obj.get("device_groups", {})
+            recommendation = obj.get("recommendation") or {}
+            yield [
+                obj.get("name", ""),
+                obj.get("context", ""),
+                obj.get("references", 0),
+                ", ".join(f"{name}:{count}" for name, count in users.items()),
+                recommendation.get("action", ""),
+                recommendation.get("target") or "",
+            ]
+
+    def rule_expansion_rows(self, report_data: Dict[str, Any]) -> Iterator[List[Any]]:
+        """
+        Generate the CSV rows of a rule expansion cost report, header first.
+
+        Args:
+            report_data: The report data to format
+
+        Returns:
+            Iterator of rows
+        """
+        fields = ["from", "to", "source", "destination", "service", "application"]
+        yield ["Rule Name", "Context", "Policy Type", "Cost", "Estimated", "Disabled"] + [
+            field.capitalize() for field in fields
+        ]
+
+        for rule in report_data.get("rules", []):
+            counts = rule.get("counts", {})
+            yield [
+                rule.get("name", ""),
+                rule.get("context", ""),
+                rule.get("policy_type", ""),
+                rule.get("cost", 0),
+                "Yes" if rule.get("estimated") else "No",
+                "Yes" if rule.get("disabled") else "No",
+            ] + [counts.get(field, "") for field in fields]
+
+    def object_references_rows(self, references: Iterable[Dict[str, Any]]) -> Iterator[List[Any]]:
+        """
+        Generate the CSV rows of an object references report, header first.
+
+        Args:
+            references: Reference records, e.g. from ``iter_object_references``
+
+        Returns:
+            Iterator of rows
+        """
+        yield OBJECT_REFERENCE_COLUMNS
+
+        for reference in references:
+            yield [
+                reference["object"],
+                reference["context"],
+                reference["referenced_by"],
+                reference["reference_type"],
+                reference["reference_context"],
+                reference["field"],
+            ]
+
+    def report_rows(
+        self, report_type: str, report_data: Any, include_hit_counts: bool = False
+    ) -> Iterator[List[Any]]:
+        """
+        Generate the CSV rows of a report by report type.
+
+        Args:
+            report_type: Type of report ('unused_objects', 'duplicate_objects',
+                'security_policy_analysis', 'policy_shadowing', 'object_usage',
+                'rule_expansion', 'object_references')
+            report_data: The report data (an iterable of records for 'object_references')
+            include_hit_counts: Whether hit count data is included (only for security
+                policy analysis)
+
+        Returns:
+            Iterator of rows
+
+        Raises:
+            ValueError: If the report type has no CSV format
+        """
+        if report_type == "unused_objects":
+            return self.unused_objects_rows(report_data)
+        if report_type == "duplicate_objects":
+            return self.duplicate_objects_rows(report_data)
+        if report_type == "security_policy_analysis":
+            return self.security_policy_analysis_rows(report_data, include_hit_counts)
+        if report_type == "policy_shadowing":
+            return self.policy_shadowing_rows(report_data)
+        if report_type == "object_usage":
+            return self.object_usage_rows(report_data)
+        if report_type == "rule_expansion":
+            return self.rule_expansion_rows(report_data)
+        if report_type == "object_references":
+            return self.object_references_rows(report_data)
+        raise ValueError(f"No CSV format for report type: {report_type}")
+
+    def format_rows(self, rows: Iterable[Sequence[Any]]) -> str:
+        """
+        Format rows as a CSV string.
+
+        Args:
+            rows: Rows to format
+
+        Returns:
+            CSV formatted string
+        """
+        output = io.StringIO()
+        self.write_rows(rows, output)
         return output.getvalue()
 
-    def save(self, data: str, output_file: str) -> bool:
+    def write_rows(self, rows: Iterable[Sequence[Any]], output: TextIO) -> int:
+        """
+        Write rows to a text file handle as they are produced.
+
+        Args:
+            rows: Rows to write
+            output: File handle opened with newline=""
+
+        Returns:
+            Number of rows written
+        """
+        writer = csv.writer(output)
+        count = 0
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+        return count
+
+    def save(self, data: Union[str, Iterable[Sequence[Any]]], output_file: str) -> bool:
         """
         Save CSV data to a file.
 
+        Rows are written as they are produced; files ending in .gz or .zst
+        are compressed.
+
         Args:
-            data: The CSV data to save
+            data: The CSV data to save, or an iterable of rows
             output_file: Path to the output file
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            with open(output_file, "w", newline="") as f:
-                f.write(data)
+            with open_text_output(output_file, newline="") as f:
+                if isinstance(data, str):
+                    f.write(data)
+                else:
+                    self.write_rows(data, f)
             logger.info(f"Report saved to {output_file} (CSV format)")
             return True
         except Exception as e:
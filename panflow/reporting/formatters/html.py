@@ -6,7 +6,7 @@ This module provides functionality for formatting report data as HTML.
 
 import os
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from ...core.template_loader import TemplateLoader
 
@@ -45,8 +45,8 @@ class HTMLFormatter:
         Returns:
             HTML formatted report
         """
-        return self.template_loader.render_security_policy_analysis(
-            analysis_data, include_hit_counts
+        return self.template_loader.render_template(
+            *self._report_template("security_policy_analysis", analysis_data, include_hit_counts)
         )
 
     def format_unused_objects_report(self, report_data: Dict[str, Any]) -> str:
@@ -60,12 +60,7 @@ class HTMLFormatter:
             HTML formatted report
         """
         return self.template_loader.render_template(
-            "object_usage.html",
-            {
-                "report_title": "Unused Objects Report",
-                "unused_objects": report_data.get("unused_objects", []),
-                "total_count": len(report_data.get("unused_objects", [])),
-            },
+            *self._report_template("unused_objects", report_data)
         )
 
     def format_duplicate_objects_report(self, report_data: Dict[str, Any]) -> str:
@@ -78,15 +73,69 @@ class HTMLFormatter:
         Returns:
             HTML formatted report
         """
-        duplicates = report_data.get("duplicate_objects", {})
-        total_duplicates = sum(len(names) - 1 for names in duplicates.values())
-
         return self.template_loader.render_template(
-            "object_usage.html",
-            {
-                "report_title": "Duplicate Objects Report",
+            *self._report_template("duplicate_objects", report_data)
+        )
+
+    def save(
+        self,
+        report_data: Dict[str, Any],
+        output_file: str,
+        report_type: str,
+        include_hit_counts: bool = False,
+    ) -> bool:
+        """
+        Render a report as HTML straight to a file.
+
+        The document is streamed to the file as it is rendered instead of
+        being built in memory first.
+
+        Args:
+            report_data: The report data to format
+            output_file: Path to the output file
+            report_type: Type of report ('unused_objects', 'duplicate_objects',
+                'security_policy_analysis')
+            include_hit_counts: Whether hit count data is included (only for security
+                policy analysis)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            template_name, context = self._report_template(
+                report_type, report_data, include_hit_counts
+            )
+        except ValueError as e:
+            logger.error(str(e))
+            return False
+
+        if not self.template_loader.stream_template(template_name, context, output_file):
+            return False
+        logger.info(f"Report saved to {output_file} (HTML format)")
+        return True
+
+    def _report_template(
+        self, report_type: str, report_data: Dict[str, Any], include_hit_counts: bool = False
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Get the template name and context for a report type."""
+        if report_type == "security_policy_analysis":
+            return "reports/security_policy_analysis.html", {
+                "analysis": report_data,
+                "include_hit_counts": include_hit_counts,
+            }
+
+        if report_type == "unused_objects":
+            return "reports/unused_objects.html", {
+                "unused_objects": report_data.get("unused_objects", []),
+            }
+
+        if report_type == "duplicate_objects":
+            duplicates = report_data.get("duplicate_objects", {})
+            total_duplicates = sum(len(names) - 1 for names in duplicates.values())
+            return "reports/duplicate_objects.html", {
                 "duplicate_objects": duplicates,
                 "total_count": total_duplicates,
                 "unique_values": len(duplicates),
-            },
-        )
+            }
+
+        raise ValueError(f"No HTML template for report type: {report_type}")
@@ -2,15 +2,43 @@
 JSON formatter for reports.
 
 This module provides functionality for formatting report data as JSON.
+
+Report data may contain iterators (e.g. generators yielding rows) in place
+of lists. They are written as JSON arrays one item at a time, so a report can
+be streamed to a file without materializing its rows. JSON Lines output
+writes one record per line.
 """
 
+import io
 import json
 import logging
-from typing import Dict, Any, Optional
+from collections.abc import Iterator, KeysView, ValuesView
+from typing import Any, Dict, Iterable, Optional, TextIO
+
+from ...core.compression import open_text_output
 
 logger = logging.getLogger("panflow")
 
 
+def _is_stream(value: Any) -> bool:
+    """Check whether a value is an iterator or view to be written as a JSON array."""
+    return isinstance(value, (Iterator, KeysView, ValuesView))
+
+
+def _encode_key(key: Any) -> str:
+    """Encode a dictionary key the way json.dumps does."""
+    if isinstance(key, (bool, type(None))):
+        key = json.dumps(key)
+    return json.dumps(str(key))
+
+
+def _json_default(value: Any) -> Any:
+    # Sets and other iterables nested inside records are written as arrays
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 class JSONFormatter:
     """
     JSON formatter for reports.
@@ -37,12 +65,68 @@ class JSONFormatter:
         Returns:
             JSON formatted string
         """
-        return json.dumps(data, indent=self.indent)
+        output = io.StringIO()
+        self.write(data, output)
+        return output.getvalue()
+
+    def write(self, data: Any, output: TextIO) -> None:
+        """
+        Write data as JSON to a text file handle.
+
+        Dictionaries and iterators are written item by item; other values are
+        encoded whole. The output is the same as ``json.dumps`` with this
+        formatter's indentation.
+
+        Args:
+            data: The data to write
+            output: Text file handle
+        """
+        self._write_value(data, output, 0)
+
+    def _write_value(self, value: Any, output: TextIO, level: int) -> None:
+        if isinstance(value, dict):
+            items = ((_encode_key(key), item) for key, item in value.items())
+            self._write_container(items, output, level, "{", "}")
+        elif _is_stream(value):
+            self._write_container(((None, item) for item in value), output, level, "[", "]")
+        else:
+            encoded = json.dumps(value, indent=self.indent, default=_json_default)
+            if self.indent is not None and level:
+                encoded = encoded.replace("\n", "\n" + " " * (self.indent * level))
+            output.write(encoded)
+
+    def _write_container(
+        self, items, output: TextIO, level: int, opening: str, closing: str
+    ) -> None:
+        if self.indent is None:
+            separator, item_indent, closing_indent = ", ", "", ""
+        else:
+            item_indent = "\n" + " " * (self.indent * (level + 1))
+            closing_indent = "\n" + " " * (self.indent * level)
+            separator = ","
+
+        output.write(opening)
+        first = True
+        for key, item in items:
+            if not first:
+                output.write(separator)
+            output.write(item_indent)
+            if key is not None:
+                output.write(key)
+                output.write(": ")
+            self._write_value(item, output, level + 1)
+            first = False
+        if not first:
+            output.write(closing_indent)
+        output.write(closing)
 
     def save(self, data: Dict[str, Any], output_file: str) -> bool:
         """
         Save data as JSON to a file.
 
+        The data is written as it is encoded; files ending in .gz or .zst are
+        compressed.
+
         Args:
             data: The data to save
             output_file: Path to the output file
@@ -51,10 +135,48 @@ class JSONFormatter:
             True if successful, False otherwise
         """
         try:
-            with open(output_file, "w") as f:
-                json.dump(data, f, indent=self.indent)
+            with open_text_output(output_file) as f:
+                self.write(data, f)
             logger.info(f"Report saved to {output_file} (JSON format)")
             return True
         except Exception as e:
             logger.error(f"Error saving report to {output_file}: {e}")
             return False
+
+    def write_lines(self, records: Iterable[Any], output: TextIO) -> int:
+        """
+        Write records as JSON Lines, one compact JSON document per line.
+
+        Args:
+            records: Records to write
+            output: Text file handle
+
+        Returns:
+            Number of records written
+        """
+        count = 0
+        for record in records:
+            output.write(json.dumps(record, default=_json_default))
+            output.write("\n")
+            count += 1
+        return count
+
+    def save_lines(self, records: Iterable[Any], output_file: str) -> bool:
+        """
+        Save records as JSON Lines to a file.
+
+        Args:
+            records: Records to save, e.g. a generator of report rows
+            output_file: Path to the output file (compressed if it ends in .gz or .zst)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with open_text_output(output_file) as f:
+                count = self.write_lines(records, f)
+            logger.info(f"Report saved to {output_file} (JSON Lines format, {count} records)")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving report to {output_file}: {e}")
+            return False
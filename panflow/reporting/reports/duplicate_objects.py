@@ -10,6 +10,7 @@ from typing import Dict, Any, Optional, List, Union
 from lxml import etree
 
 from ...modules.objects import get_objects
+from .report_index import ReportIndex
 from ...core.logging_utils import logger
 
 
@@ -19,6 +20,7 @@ def generate_duplicate_objects_report_data(
     context_type: str,
     version: str,
     object_type: str = "address",
+    index: Optional[ReportIndex] = None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -30,6 +32,7 @@ def generate_duplicate_objects_report_data(
         context_type: Type of context (shared, device_group, vsys)
         version: PAN-OS version
         object_type: Type of object to check (address, service, etc.)
+        index: Shared lookups to reuse across reports (optional)
         **kwargs: Additional parameters (device_group, vsys)
 
     Returns:
@@ -38,7 +41,8 @@ def generate_duplicate_objects_report_data(
     report_data = {"duplicate_objects": {}}
 
     # Get objects of the specified type
-    objects = get_objects(tree, object_type, device_type, context_type, version, **kwargs)
+    lookup = index.get_objects if index is not None else get_objects
+    objects = lookup(tree, object_type, device_type, context_type, version, **kwargs)
 
     # Group by value
     objects_by_value = {}
@@ -112,11 +116,8 @@ def generate_duplicate_objects_report_data(
             objects_with_context = []
             for name in names:
                 # Create object data with context information
-                obj_data = {
-                    "name": name,
-                    "context_type": context_type
-                }
-                
+                obj_data = {"name": name, "context_type": context_type}
+
                 # Add specific context details based on type
                 if context_type == "device_group" and "device_group" in kwargs:
                     obj_data["context_name"] = kwargs["device_group"]
@@ -124,9 +125,9 @@ def generate_duplicate_objects_report_data(
                     obj_data["context_name"] = kwargs["vsys"]
                 elif context_type == "shared":
                     obj_data["context_name"] = "Shared"
-                
+
                 objects_with_context.append(obj_data)
-            
+
             duplicates[value_key] = objects_with_context
 
     report_data["duplicate_objects"] = duplicates
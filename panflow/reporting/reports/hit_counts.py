@@ -0,0 +1,496 @@
+"""
+Rule hit-count ingestion for policy analysis.
+
+This module reads the hit-count exports produced by ``show rule-hit-count``
+(XML API responses or CSV exports, optionally gzip/zstd compressed) for any
+number of devices and aggregates them per rule name. Records are streamed,
+and the aggregate is kept in a few parallel ``array`` columns indexed by rule
+position rather than in per-rule dictionaries, so hundreds of devices with
+tens of thousands of rules each stay small in memory:
+
+- ``hits``: total hit count across devices
+- ``last_hit``: most recent hit (epoch seconds, 0 if never hit or unknown)
+- ``first_hit``: earliest first hit (epoch seconds, 0 if unknown)
+- ``devices``: number of device records seen for the rule
+- ``devices_hit``: number of those records with at least one hit
+
+:meth:`HitCountTable.join` aligns the columns with the policies of an
+analysis in one pass, and the bucketing helpers classify the aligned columns
+by hit count and by the age of the last hit.
+"""
+
+import csv
+import datetime
+import io
+import time
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from lxml import etree
+
+from ...core.compression import open_config_input
+from ...core.exceptions import ParseError
+from ...core.logging_utils import logger
+
+# Upper bounds (exclusive) of the zero/low/medium hit count categories
+HIT_COUNT_THRESHOLDS = (1, 100, 1000)
+HIT_COUNT_CATEGORIES = ("zero", "low", "medium", "high")
+
+# Upper bounds (inclusive, in days) of the last-hit age buckets
+AGE_BUCKET_DAYS = (7, 30, 90, 180, 365)
+AGE_BUCKETS = ("0-7d", "8-30d", "31-90d", "91-180d", "181-365d", "over-365d")
+
+# Rules without a hit in this many days are reported as stale
+DEFAULT_STALE_DAYS = 90
+
+# Accepted CSV header names, compared case-insensitively
+CSV_COLUMNS = {
+    "rule": ("name", "rule", "rule name", "rule_name"),
+    "hits": ("hit count", "hit-count", "hit_count", "hits"),
+    "last_hit": ("last hit", "last-hit-timestamp", "last_hit", "last hit timestamp"),
+    "first_hit": ("first hit", "first-hit-timestamp", "first_hit", "first hit timestamp"),
+    "device": ("device", "device name", "serial", "device-name"),
+}
+
+_TIME_FORMATS = ("%a %b %d %H:%M:%S %Y", "%Y/%m/%d %H:%M:%S", "%Y-%m-%d %H:%M:%S")
+
+# Largest hit count the unsigned 64-bit ``hits`` column holds
+MAX_HIT_COUNT = 2**64 - 1
+
+
+def parse_hit_count(value: Optional[str]) -> Optional[int]:
+    """
+    Parse a hit count from an export.
+
+    Args:
+        value: Hit count text (empty means 0)
+
+    Returns:
+        The hit count, or None if it is not a number between 0 and MAX_HIT_COUNT
+    """
+    try:
+        hit_count = int(value or 0)
+    except ValueError:
+        return None
+    if not 0 <= hit_count <= MAX_HIT_COUNT:
+        return None
+    return hit_count
+
+
+def parse_timestamp(value: Optional[str]) -> int:
+    """
+    Parse a hit-count timestamp into epoch seconds.
+
+    Args:
+        value: Epoch seconds, an ISO date, or a PAN-OS date such as
+            ``Mon Jan  8 10:15:00 2024``
+
+    Returns:
+        Epoch seconds, or 0 if the value is empty, ``never`` or unparseable
+    """
+    if not value:
+        return 0
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    if value.lower() in ("-", "never", "none", "n/a"):
+        return 0
+
+    try:
+        parsed = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        parsed = None
+        normalized = " ".join(value.split())
+        for time_format in _TIME_FORMATS:
+            try:
+                parsed = datetime.datetime.strptime(normalized, time_format)
+                break
+            except ValueError:
+                continue
+    if parsed is None:
+        return 0
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return int(parsed.timestamp())
+
+
+class HitCountTable:
+    """
+    Hit counts of many devices aggregated per rule name in array columns.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.hits = array("Q")
+        self.last_hit = array("q")
+        self.first_hit = array("q")
+        self.devices = array("I")
+        self.devices_hit = array("I")
+        self.device_names = set()
+        self.record_count = 0
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, rule: str) -> bool:
+        return rule in self._index
+
+    def add(
+        self,
+        rule: str,
+        hit_count: int,
+        last_hit: int = 0,
+        first_hit: int = 0,
+        device: Optional[str] = None,
+    ) -> None:
+        """
+        Add the hit count one device reported for a rule.
+
+        Args:
+            rule: Rule name
+            hit_count: Hit count reported by the device
+            last_hit: Last hit timestamp (epoch seconds, 0 if unknown)
+            first_hit: First hit timestamp (epoch seconds, 0 if unknown)
+            device: Device name or serial, used to count distinct devices
+        """
+        position = self._index.get(rule)
+        if position is None:
+            position = len(self.names)
+            self._index[rule] = position
+            self.names.append(rule)
+            self.hits.append(0)
+            self.last_hit.append(0)
+            self.first_hit.append(0)
+            self.devices.append(0)
+            self.devices_hit.append(0)
+
+        self.hits[position] += hit_count
+        if last_hit > self.last_hit[position]:
+            self.last_hit[position] = last_hit
+        if first_hit and (not self.first_hit[position] or first_hit < self.first_hit[position]):
+            self.first_hit[position] = first_hit
+        self.devices[position] += 1
+        if hit_count:
+            self.devices_hit[position] += 1
+        if device is not None:
+            self.device_names.add(device)
+        self.record_count += 1
+
+    def load(self, file_path: str, device: Optional[str] = None, rulebase: str = "security") -> int:
+        """
+        Load a hit-count export, choosing the format from its contents.
+
+        Args:
+            file_path: Path to a CSV or XML export (optionally gzip/zstd compressed)
+            device: Device name used for records that do not name one
+                (defaults to the file name)
+            rulebase: Rulebase to read from XML exports
+
+        Returns:
+            Number of records loaded
+
+        Raises:
+            ParseError: If the file cannot be parsed
+        """
+        with open_config_input(file_path) as stream:
+            is_xml = stream.read(256).lstrip().startswith(b"<")
+        device = device or file_path
+        if is_xml:
+            return self.load_xml(file_path, device=device, rulebase=rulebase)
+        return self.load_csv(file_path, device=device)
+
+    def load_csv(self, file_path: str, device: Optional[str] = None) -> int:
+        """
+        Load a CSV hit-count export.
+
+        The header must name the rule and hit count columns; last hit, first
+        hit and device columns are optional.
+
+        Args:
+            file_path: Path to the CSV file
+            device: Device name used when the file has no device column
+
+        Returns:
+            Number of records loaded
+
+        Raises:
+            ParseError: If required columns are missing
+        """
+        count = 0
+        with open_config_input(file_path) as stream:
+            reader = csv.reader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+            header = [column.strip().lower() for column in next(reader, [])]
+            columns = {}
+            for key, aliases in CSV_COLUMNS.items():
+                for alias in aliases:
+                    if alias in header:
+                        columns[key] = header.index(alias)
+                        break
+            if "rule" not in columns or "hits" not in columns:
+                raise ParseError(
+                    f"{file_path}: hit-count CSV needs rule name and hit count columns"
+                )
+
+            rule_col, hits_col = columns["rule"], columns["hits"]
+            last_col, first_col = columns.get("last_hit"), columns.get("first_hit")
+            device_col = columns.get("device")
+            for row in reader:
+                if len(row) <= max(rule_col, hits_col) or not row[rule_col]:
+                    continue
+                hit_count = parse_hit_count(row[hits_col])
+                if hit_count is None:
+                    logger.warning(
+                        f"{file_path}: skipping line {reader.line_num} with invalid hit count "
+                        f"{row[hits_col]!r} for rule {row[rule_col]}"
+                    )
+                    continue
+                self.add(
+                    row[rule_col],
+                    hit_count,
+                    parse_timestamp(row[last_col]) if last_col is not None else 0,
+                    parse_timestamp(row[first_col]) if first_col is not None else 0,
+                    row[device_col] if device_col is not None else device,
+                )
+                count += 1
+
+        logger.debug(f"Loaded {count} hit-count records from {file_path}")
+        return count
+
+    def load_xml(
+        self, file_path: str, device: Optional[str] = None, rulebase: str = "security"
+    ) -> int:
+        """
+        Load an XML ``show rule-hit-count`` response.
+
+        Both firewall responses (rule entries holding ``hit-count``) and
+        Panorama responses (rule entries holding per-device ``device-vsys``
+        entries) are supported. The file is parsed incrementally.
+
+        Args:
+            file_path: Path to the XML file
+            device: Device name used for firewall responses
+            rulebase: Rulebase to read (e.g. "security")
+
+        Returns:
+            Number of records loaded
+
+        Raises:
+            ParseError: If the XML is malformed
+        """
+        count = 0
+        try:
+            with open_config_input(file_path) as stream:
+                for _, element in etree.iterparse(stream, events=("end",), tag="entry"):
+                    parent = element.getparent()
+                    if element.find("hit-count") is None or parent is None:
+                        continue
+
+                    if parent.tag == "rules":
+                        rule_entry, record_device = element, device
+                    else:
+                        # Panorama: rules/entry/device-vsys/entry
+                        rule_entry = parent.getparent()
+                        record_device = element.get("name")
+                        if rule_entry is None or rule_entry.getparent() is None:
+                            continue
+                        if rule_entry.getparent().tag != "rules":
+                            continue
+
+                    rulebase_entry = rule_entry.getparent().getparent()
+                    if (
+                        rulebase_entry is not None
+                        and rulebase_entry.tag == "entry"
+                        and rulebase_entry.get("name") not in (None, rulebase)
+                    ):
+                        element.clear()
+                        continue
+
+                    hit_count = parse_hit_count(element.findtext("hit-count"))
+                    if hit_count is None:
+                        logger.warning(
+                            f"{file_path}: skipping invalid hit count "
+                            f"{element.findtext('hit-count')!r} for rule {rule_entry.get('name')}"
+                        )
+                        element.clear()
+                        continue
+                    self.add(
+                        rule_entry.get("name", ""),
+                        hit_count,
+                        parse_timestamp(element.findtext("last-hit-timestamp")),
+                        parse_timestamp(element.findtext("first-hit-timestamp")),
+                        record_device,
+                    )
+                    count += 1
+                    element.clear()
+                    # Drop processed siblings so memory stays flat on large files
+                    while element.getprevious() is not None:
+                        del parent[0]
+        except etree.XMLSyntaxError as e:
+            raise ParseError(f"{file_path}: invalid hit-count XML: {e}")
+
+        logger.debug(f"Loaded {count} hit-count records from {file_path}")
+        return count
+
+    @classmethod
+    def from_files(cls, file_paths: Iterable[str], rulebase: str = "security") -> "HitCountTable":
+        """
+        Aggregate the hit-count exports of many devices.
+
+        Args:
+            file_paths: Paths to CSV or XML exports, one or more devices per file
+            rulebase: Rulebase to read from XML exports
+
+        Returns:
+            Aggregated table
+        """
+        table = cls()
+        for file_path in file_paths:
+            table.load(file_path, rulebase=rulebase)
+        logger.info(
+            f"Aggregated {table.record_count} hit-count records for {len(table)} rules "
+            f"from {len(table.device_names)} devices"
+        )
+        return table
+
+    @classmethod
+    def from_dict(cls, hit_count_data: Dict[str, Dict[str, Any]]) -> "HitCountTable":
+        """
+        Build a table from the ``{rule: {"hit_count": n, ...}}`` dictionary format.
+
+        Args:
+            hit_count_data: Dictionary of hit count data keyed by rule name
+
+        Returns:
+            Table with one record per rule
+        """
+        table = cls()
+        for rule, data in hit_count_data.items():
+            hit_count = parse_hit_count(str(data.get("hit_count") or 0))
+            if hit_count is None:
+                logger.warning(
+                    f"Skipping invalid hit count {data.get('hit_count')!r} for rule {rule}"
+                )
+                continue
+            table.add(
+                rule,
+                hit_count,
+                parse_timestamp(str(data.get("last_hit") or "")),
+                parse_timestamp(str(data.get("first_hit") or "")),
+            )
+        return table
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        """
+        Convert the table to the ``{rule: {"hit_count": n, ...}}`` dictionary format.
+
+        Returns:
+            Dictionary of hit count data keyed by rule name
+        """
+        return {
+            name: {
+                "hit_count": self.hits[i],
+                "last_hit": self.last_hit[i],
+                "first_hit": self.first_hit[i],
+                "devices": self.devices[i],
+                "devices_hit": self.devices_hit[i],
+            }
+            for i, name in enumerate(self.names)
+        }
+
+    def join(self, rule_names: Sequence[str]) -> Tuple[array, array, array]:
+        """
+        Align the table with a list of rules.
+
+        Args:
+            rule_names: Rule names in the order of the analysis
+
+        Returns:
+            (hits, last_hit, devices_hit) arrays aligned with ``rule_names``;
+            rules without hit-count data get -1 hits
+        """
+        index = self._index
+        positions = [index.get(name, -1) for name in rule_names]
+        hits, last_hit, devices_hit = self.hits, self.last_hit, self.devices_hit
+        return (
+            array("q", [hits[p] if p >= 0 else -1 for p in positions]),
+            array("q", [last_hit[p] if p >= 0 else 0 for p in positions]),
+            array("q", [devices_hit[p] if p >= 0 else 0 for p in positions]),
+        )
+
+
+def hit_count_categories(hits: Sequence[int]) -> List[Optional[str]]:
+    """
+    Classify aligned hit counts as zero, low, medium or high.
+
+    Args:
+        hits: Hit counts, -1 for rules without data
+
+    Returns:
+        Category per rule (None for rules without data)
+    """
+    return [
+        HIT_COUNT_CATEGORIES[bisect_right(HIT_COUNT_THRESHOLDS, count)] if count >= 0 else None
+        for count in hits
+    ]
+
+
+def age_buckets(
+    hits: Sequence[int], last_hit: Sequence[int], reference_time: Optional[float] = None
+) -> List[Optional[str]]:
+    """
+    Classify aligned last-hit timestamps by age.
+
+    Args:
+        hits: Hit counts, -1 for rules without data
+        last_hit: Last hit timestamps (epoch seconds, 0 if unknown)
+        reference_time: Time the ages are measured from (defaults to now)
+
+    Returns:
+        Age bucket per rule: one of AGE_BUCKETS, "never" for rules without
+        hits, "unknown" for hit rules without a timestamp, None without data
+    """
+    now = reference_time if reference_time is not None else time.time()
+    # Ascending timestamps at which a rule moves into the next older bucket
+    bounds = sorted(now - days * 86400 for days in AGE_BUCKET_DAYS)
+    buckets = []
+    for count, timestamp in zip(hits, last_hit):
+        if count < 0:
+            buckets.append(None)
+        elif count == 0:
+            buckets.append("never")
+        elif not timestamp:
+            buckets.append("unknown")
+        else:
+            buckets.append(AGE_BUCKETS[len(bounds) - bisect_right(bounds, timestamp)])
+    return buckets
+
+
+def stale_rules(
+    names: Sequence[str],
+    hits: Sequence[int],
+    last_hit: Sequence[int],
+    stale_days: int = DEFAULT_STALE_DAYS,
+    reference_time: Optional[float] = None,
+) -> List[str]:
+    """
+    Find rules with no hits, or no hits within ``stale_days``.
+
+    Args:
+        names: Rule names
+        hits: Aligned hit counts, -1 for rules without data
+        last_hit: Aligned last hit timestamps
+        stale_days: Days without a hit after which a rule is stale
+        reference_time: Time the ages are measured from (defaults to now)
+
+    Returns:
+        Names of stale rules, in the given order
+    """
+    now = reference_time if reference_time is not None else time.time()
+    cutoff = now - stale_days * 86400
+    return [
+        name
+        for name, count, timestamp in zip(names, hits, last_hit)
+        if count == 0 or (count > 0 and timestamp and timestamp < cutoff)
+    ]
@@ -0,0 +1,319 @@
+"""
+Incremental report state.
+
+Regenerating reports after a change window re-reads every object and rule of
+the configuration even when a handful of entries changed. An
+:class:`IncrementalReportIndex` is a :class:`ReportIndex` whose sections (the
+entries of one object type or rulebase in one context) are kept together with
+the XML they were built from. Given the next revision of the configuration,
+:meth:`IncrementalReportIndex.update` compares each section entry by entry,
+runs :class:`~panflow.core.xml.diff.XmlDiff` on the entries that changed and
+rebuilds only those. The report builders then run over the updated sections
+exactly as they do over a fresh index, so the output matches a full
+regeneration.
+
+The state can be saved between runs with :meth:`IncrementalReportIndex.save`
+and restored with :meth:`IncrementalReportIndex.load`.
+"""
+
+import hashlib
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from lxml import etree
+
+from ...core.compression import open_config_input, open_config_output
+from ...core.config_loader import extract_element_data
+from ...core.exceptions import CacheError
+from ...core.logging_utils import logger
+from ...core.xml.diff import XmlDiff
+from ...core.xpath_resolver import get_object_xpath, get_policy_xpath
+from .report_index import ReportIndex
+
+# Format version of saved report state files
+STATE_FORMAT_VERSION = 1
+
+# Name of the top-level entry a diff path under a section container refers to
+_ENTRY_PATH = re.compile(r"^/entry\[@name='(.*?)'\]/")
+
+
+class _Section:
+    """Entries of one object type or rulebase and the XML they were built from."""
+
+    __slots__ = ("digest", "entry_xml")
+
+    def __init__(self, digest: Optional[str] = None, entry_xml: Optional[Dict[str, str]] = None):
+        self.digest = digest
+        self.entry_xml = entry_xml or {}
+
+
+def _section_container(tree: etree._ElementTree, key: Tuple) -> Optional[etree._Element]:
+    """Find the container element of a section (e.g. <rules> or <address>)."""
+    kind, section_type, device_type, context_type, version, kwargs = key
+    if kind == "objects":
+        # Object XPaths select the entries; the section is their parent
+        xpath = get_object_xpath(section_type, device_type, context_type, version, **dict(kwargs))
+        if xpath.endswith("/entry"):
+            xpath = xpath[: -len("/entry")]
+    else:
+        xpath = get_policy_xpath(section_type, device_type, context_type, version, **dict(kwargs))
+
+    elements = tree.xpath(xpath)
+    return elements[0] if elements else None
+
+
+def _digest(xml: str) -> str:
+    return hashlib.blake2b(xml.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _entry_xml(element: etree._Element) -> str:
+    return etree.tostring(element, encoding="unicode", with_tail=False)
+
+
+def _section_label(key: Tuple) -> str:
+    kind, section_type, _, context_type, _, kwargs = key
+    context = ",".join(f"{name}={value}" for name, value in kwargs)
+    return f"{kind}:{section_type}:{context_type}" + (f":{context}" if context else "")
+
+
+class IncrementalReportIndex(ReportIndex):
+    """
+    Report lookups that are updated in place for new configuration revisions.
+
+    Sections are built on first use, like in :class:`ReportIndex`, and are
+    refreshed by :meth:`update`. Updating is not safe while other threads
+    are using the index.
+    """
+
+    def __init__(self, tree: Optional[etree._ElementTree]):
+        """
+        Initialize an empty index.
+
+        Args:
+            tree: ElementTree the lookups are made against (None until :meth:`update`)
+        """
+        super().__init__(tree)
+        self._sections: Dict[Tuple, _Section] = {}
+
+    def get_objects(
+        self,
+        tree: etree._ElementTree,
+        object_type: str,
+        device_type: str,
+        context_type: str,
+        version: str,
+        **kwargs,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get objects of a type in a context, building them on first use.
+
+        Args:
+            tree: ElementTree containing the configuration (must be the indexed tree)
+            object_type: Type of object (address, service, ...)
+            device_type: Type of device ("firewall" or "panorama")
+            context_type: Type of context (shared, device_group, vsys)
+            version: PAN-OS version
+            **kwargs: Additional parameters (device_group, vsys)
+
+        Returns:
+            Dictionary of objects keyed by name
+        """
+        self._check_tree(tree)
+        context = tuple(sorted(kwargs.items()))
+        key = ("objects", object_type, device_type, context_type, version, context)
+        return self._memoized(key, lambda: self._build_section(key))
+
+    def get_policies(
+        self,
+        tree: etree._ElementTree,
+        policy_type: str,
+        device_type: str,
+        context_type: str,
+        version: str,
+        **kwargs,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get policies of a type in a context, building them on first use.
+
+        Args:
+            tree: ElementTree containing the configuration (must be the indexed tree)
+            policy_type: Type of policy (security_rules, nat_pre_rules, ...)
+            device_type: Type of device ("firewall" or "panorama")
+            context_type: Type of context (shared, device_group, vsys)
+            version: PAN-OS version
+            **kwargs: Additional parameters (device_group, vsys)
+
+        Returns:
+            Dictionary of policies keyed by name
+        """
+        self._check_tree(tree)
+        context = tuple(sorted(kwargs.items()))
+        key = ("policies", policy_type, device_type, context_type, version, context)
+        return self._memoized(key, lambda: self._build_section(key))
+
+    def _build_section(self, key: Tuple) -> Dict[str, Dict[str, Any]]:
+        """Build all entries of a section from the current tree."""
+        container = _section_container(self.tree, key)
+        section = _Section()
+        entries = {}
+        if container is not None:
+            section.digest = _digest(_entry_xml(container))
+            for element in container:
+                name = element.get("name")
+                if name:
+                    section.entry_xml[name] = _entry_xml(element)
+                    entries[name] = extract_element_data(element)
+        self._sections[key] = section
+        return entries
+
+    def update(self, tree: etree._ElementTree) -> Dict[str, Dict[str, Any]]:
+        """
+        Move the index to a new revision of the configuration.
+
+        Unchanged sections are detected by a digest of their XML. In changed
+        sections, entries whose XML differs are compared with XmlDiff and
+        rebuilt; added entries are built, removed entries are dropped and the
+        entry order follows the new configuration.
+
+        Args:
+            tree: ElementTree of the new configuration revision
+
+        Returns:
+            Delta of the changed sections, keyed by section label, with the
+            "added" and "removed" entry names and the XmlDiff paths of each
+            "changed" entry
+        """
+        self.tree = tree
+        delta = {}
+
+        for key, section in self._sections.items():
+            value, error = self._results.get(key, (None, None))
+            if error is not None:
+                continue
+
+            container = _section_container(tree, key)
+            if container is None:
+                if value:
+                    removed = list(value)
+                    delta[_section_label(key)] = {"added": [], "removed": removed, "changed": {}}
+                self._results[key] = ({}, None)
+                self._sections[key] = _Section()
+                continue
+
+            container_xml = _entry_xml(container)
+            digest = _digest(container_xml)
+            if digest == section.digest:
+                continue
+
+            entries = {}
+            entry_xml = {}
+            added, changed = [], {}
+            for element in container:
+                name = element.get("name")
+                if not name:
+                    continue
+                xml = _entry_xml(element)
+                entry_xml[name] = xml
+                previous_xml = section.entry_xml.get(name)
+                if previous_xml == xml:
+                    entries[name] = value[name]
+                    continue
+
+                if previous_xml is None:
+                    added.append(name)
+                else:
+                    # Compare the entry as if it were alone under the container,
+                    # so the diff paths start at the entry
+                    parent = etree.Element(container.tag)
+                    parent.append(etree.fromstring(previous_xml))
+                    current = etree.Element(container.tag)
+                    current.append(etree.fromstring(xml))
+                    diffs = XmlDiff(parent, current).compare().get_diffs()
+                    changed[name] = [_ENTRY_PATH.sub("", diff.path) or "/" for diff in diffs]
+                entries[name] = extract_element_data(element)
+
+            removed = [name for name in section.entry_xml if name not in entry_xml]
+            self._results[key] = (entries, None)
+            self._sections[key] = _Section(digest, entry_xml)
+            if added or removed or changed:
+                label = _section_label(key)
+                delta[label] = {"added": added, "removed": removed, "changed": changed}
+
+        if delta:
+            logger.info(
+                f"Updated report index: {len(delta)} of {len(self._sections)} sections changed"
+            )
+        else:
+            logger.info(f"Updated report index: no changes in {len(self._sections)} sections")
+        return delta
+
+    def save(self, file_path: str) -> None:
+        """
+        Save the index state to a JSON file (compressed if the name ends in .gz or .zst).
+
+        Args:
+            file_path: Path of the state file
+        """
+        sections = []
+        for key, section in self._sections.items():
+            value, error = self._results.get(key, (None, None))
+            if error is not None:
+                continue
+            sections.append(
+                {
+                    "key": [*key[:5], [list(item) for item in key[5]]],
+                    "digest": section.digest,
+                    "entries": value,
+                    "xml": section.entry_xml,
+                }
+            )
+
+        with open_config_output(file_path) as f:
+            f.write(
+                json.dumps({"format_version": STATE_FORMAT_VERSION, "sections": sections}).encode(
+                    "utf-8"
+                )
+            )
+        logger.info(f"Saved report index state with {len(sections)} sections to {file_path}")
+
+    @classmethod
+    def load(cls, file_path: str) -> "IncrementalReportIndex":
+        """
+        Load a saved index state.
+
+        The sections describe the configuration the state was saved from;
+        call :meth:`update` with the current configuration before using it.
+
+        Args:
+            file_path: Path of the state file
+
+        Returns:
+            IncrementalReportIndex with the saved sections
+
+        Raises:
+            CacheError: If the file is not a report state file of this version
+        """
+        try:
+            with open_config_input(file_path) as f:
+                data = json.loads(f.read().decode("utf-8"))
+        except (OSError, ValueError) as e:
+            raise CacheError(f"Cannot read report state {file_path}: {e}")
+
+        if not isinstance(data, dict) or data.get("format_version") != STATE_FORMAT_VERSION:
+            raise CacheError(f"Unsupported report state format in {file_path}")
+
+        index = cls(None)
+        for section in data["sections"]:
+            key = (*section["key"][:5], tuple(tuple(item) for item in section["key"][5]))
+            index._results[key] = (section["entries"], None)
+            index._sections[key] = _Section(section["digest"], section["xml"])
+        logger.info(
+            f"Loaded report index state with {len(index._sections)} sections from {file_path}"
+        )
+        return index
+
+    @property
+    def section_labels(self) -> List[str]:
+        """Labels of the sections held by the index."""
+        return [_section_label(key) for key in self._sections]
@@ -0,0 +1,258 @@
+"""
+Object usage heatmap report generator.
+
+This module reports which device groups of a Panorama configuration use the
+objects defined in shared and in each device group, to find objects that can
+be moved down or up the device-group hierarchy.
+
+The policies and groups of shared and of every device group are read in a
+single pass. Each reference is resolved to the object it names the way
+Panorama does, starting at the referencing device group and walking up its
+ancestors to shared, and counted in a sparse object x device-group matrix.
+Recommendations are derived from the matrix:
+
+- ``unused``: nothing in shared or any device group references the object
+- ``move_down``: every user is in the subtree of a device group below the
+  context the object is defined in, so it can be defined there instead
+- ``consolidate``: device groups define the object with the same name and
+  value, and a single definition in their nearest common ancestor would
+  resolve the same way for every user
+"""
+
+import json
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from lxml import etree
+
+from ...core.deduplication import DeduplicationEngine
+from ...core.logging_utils import logger
+from .report_index import ReportIndex
+from .unused_objects import _iter_references, _lookups
+
+# Column of references made by shared policies and groups
+SHARED = "shared"
+
+
+def _ancestry(hierarchy: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Get the chain of contexts from shared down to each device group."""
+    chains = {SHARED: [SHARED]}
+    for device_group in hierarchy:
+        chain = [device_group]
+        parent = hierarchy[device_group]["parent"]
+        while parent != SHARED and parent in hierarchy and parent not in chain:
+            chain.append(parent)
+            parent = hierarchy[parent]["parent"]
+        chain.append(SHARED)
+        chains[device_group] = chain[::-1]
+    return chains
+
+
+def _common_ancestor(chains: Dict[str, List[str]], contexts: Iterable[str]) -> str:
+    """Get the nearest context whose subtree contains all the given contexts."""
+    prefix = None
+    for context in contexts:
+        chain = chains[context]
+        if prefix is None:
+            prefix = chain
+            continue
+        length = 0
+        for ours, theirs in zip(prefix, chain):
+            if ours != theirs:
+                break
+            length += 1
+        prefix = prefix[:length]
+        if length == 1:
+            break
+    return prefix[-1] if prefix else SHARED
+
+
+def _value_key(properties: Dict[str, Any]) -> str:
+    return json.dumps(properties, sort_keys=True, default=str)
+
+
+def generate_object_usage_report_data(
+    tree: etree._ElementTree,
+    device_type: str,
+    context_type: str,
+    version: str,
+    object_type: str = "address",
+    index: Optional[ReportIndex] = None,
+    **kwargs,
+) -> Dict[str, Any]:
+    """
+    Generate raw data for an object x device-group usage report.
+
+    The report always covers shared and every device group; the context
+    parameters only select the configuration like for the other reports.
+
+    Args:
+        tree: ElementTree containing the configuration
+        device_type: Type of device (must be "panorama")
+        context_type: Type of context (shared, device_group)
+        version: PAN-OS version
+        object_type: Type of object to check (address, service, etc.)
+        index: Shared lookups to reuse across reports (optional)
+        **kwargs: Additional parameters (device_group)
+
+    Returns:
+        Dict: Report data
+    """
+    if device_type.lower() != "panorama":
+        logger.warning("The object usage report requires a Panorama configuration")
+        return {"error": "The object usage report requires a Panorama configuration"}
+
+    get_objects, get_policies = _lookups(index)
+    hierarchy = DeduplicationEngine(tree, device_type, "shared", version).device_group_hierarchy
+    chains = _ancestry(hierarchy)
+    # Contexts a reference from each column is resolved in, nearest first
+    lookup_order = {context: chain[::-1] for context, chain in chains.items()}
+
+    # Objects defined in each context
+    defined = {SHARED: get_objects(tree, object_type, device_type, "shared", version)}
+    for device_group in hierarchy:
+        defined[device_group] = get_objects(
+            tree, object_type, device_type, "device_group", version, device_group=device_group
+        )
+
+    # Sparse matrix of reference counts: (context, name) -> column -> count
+    usage: Dict[Tuple[str, str], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    contexts = [("shared", {})] + [
+        ("device_group", {"device_group": device_group}) for device_group in hierarchy
+    ]
+    for name, _, _, _, ctx_kwargs, _ in _iter_references(
+        tree, device_type, "shared", version, object_type, get_objects, get_policies, {}, contexts
+    ):
+        column = ctx_kwargs.get("device_group", SHARED)
+        for context in lookup_order[column]:
+            if name in defined[context]:
+                usage[(context, name)][column] += 1
+                break
+
+    objects = []
+    recommendations = []
+    for context in chains:
+        for name in defined[context]:
+            users = usage.get((context, name), {})
+            row = {
+                "name": name,
+                "context": context,
+                "device_groups": dict(users),
+                "references": sum(users.values()),
+                "recommendation": None,
+            }
+            if not users:
+                row["recommendation"] = {
+                    "action": "unused",
+                    "target": None,
+                    "reason": "Not referenced by any policy or group",
+                }
+            else:
+                target = _common_ancestor(chains, users)
+                if target != context:
+                    row["recommendation"] = {
+                        "action": "move_down",
+                        "target": target,
+                        "reason": f"Only used in the {target} subtree",
+                    }
+            if row["recommendation"]:
+                recommendations.append(
+                    {"object": name, "context": context, **row["recommendation"]}
+                )
+            objects.append(row)
+
+    recommendations.extend(_consolidation_candidates(defined, usage, chains))
+
+    columns = defaultdict(lambda: [0, 0])
+    for users in usage.values():
+        for column, count in users.items():
+            columns[column][0] += 1
+            columns[column][1] += count
+    device_groups = [
+        {
+            "name": context,
+            "parent": hierarchy[context]["parent"] if context in hierarchy else None,
+            "depth": len(chains[context]) - 1,
+            "objects_used": columns.get(context, (0, 0))[0],
+            "references": columns.get(context, (0, 0))[1],
+        }
+        for context in chains
+    ]
+
+    actions = defaultdict(int)
+    for recommendation in recommendations:
+        actions[recommendation["action"]] += 1
+    logger.info(
+        f"Object usage of {len(objects)} {object_type} objects across "
+        f"{len(hierarchy)} device groups: {actions['unused']} unused, "
+        f"{actions['move_down']} to move down, "
+        f"{actions['consolidate']} to consolidate"
+    )
+
+    return {
+        "summary": {
+            "object_type": object_type,
+            "device_groups": len(hierarchy),
+            "objects": len(objects),
+            "used_objects": len(usage),
+            "cells": sum(len(users) for users in usage.values()),
+            "unused_count": actions["unused"],
+            "move_down_count": actions["move_down"],
+            "consolidate_count": actions["consolidate"],
+        },
+        "device_groups": device_groups,
+        "objects": objects,
+        "recommendations": recommendations,
+    }
+
+
+def _consolidation_candidates(
+    defined: Dict[str, Dict[str, Dict[str, Any]]],
+    usage: Dict[Tuple[str, str], Dict[str, int]],
+    chains: Dict[str, List[str]],
+) -> List[Dict[str, Any]]:
+    """Find objects defined with the same name and value in several device groups."""
+    definitions = defaultdict(list)
+    for context, objects in defined.items():
+        if context == SHARED:
+            continue
+        for name, properties in objects.items():
+            definitions[name].append((context, properties))
+
+    candidates = []
+    for name, contexts in definitions.items():
+        if len(contexts) < 2:
+            continue
+
+        by_value = defaultdict(list)
+        for context, properties in contexts:
+            by_value[_value_key(properties)].append(context)
+
+        for value, same in by_value.items():
+            if len(same) < 2:
+                continue
+            target = _common_ancestor(chains, same)
+
+            # An existing definition in the target must have the same value
+            existing = defined[target].get(name)
+            if existing is not None and _value_key(existing) != value:
+                continue
+            # References in the target subtree that resolve above the target
+            # would start resolving to the moved object
+            if any(
+                target in chains[column]
+                for context in chains[target][:-1]
+                for column in usage.get((context, name), {})
+            ):
+                continue
+
+            candidates.append(
+                {
+                    "object": name,
+                    "context": ", ".join(same),
+                    "action": "consolidate",
+                    "target": target,
+                    "reason": f"Defined with the same value in {len(same)} device groups",
+                }
+            )
+    return candidates
@@ -7,11 +7,21 @@ security policies in PAN-OS configurations.
 
 import datetime
 import logging
-from typing import Dict, Any, Optional, List, Union, Tuple, Set
+from typing import Dict, Any, Optional, List, Union, Tuple, Set, Sequence
 from lxml import etree
 from collections import Counter, defaultdict
 
 from ...modules.policies import get_policies
+from .policy_overlap import PolicyOverlapIndex
+from .report_index import ReportIndex
+from .hit_counts import (
+    AGE_BUCKETS,
+    DEFAULT_STALE_DAYS,
+    HitCountTable,
+    age_buckets,
+    hit_count_categories,
+    stale_rules,
+)
 from ...core.logging_utils import logger, log, log_structured
 
 
@@ -22,8 +32,12 @@ def generate_security_policy_analysis_data(
     version: str,
     policy_type: Optional[str] = None,
     include_hit_counts: bool = False,
-    hit_count_data: Optional[Dict[str, Dict[str, int]]] = None,
+    hit_count_data: Optional[Union[HitCountTable, Dict[str, Dict[str, int]]]] = None,
     include_visualization: bool = False,
+    max_overlap_links: Optional[int] = None,
+    stale_days: int = DEFAULT_STALE_DAYS,
+    reference_time: Optional[float] = None,
+    index: Optional[ReportIndex] = None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -36,8 +50,14 @@ def generate_security_policy_analysis_data(
         version: PAN-OS version
         policy_type: Type of security policy to analyze (if None, determine based on device type)
         include_hit_counts: Whether to include hit count analysis
-        hit_count_data: Dictionary of hit count data (if available)
+        hit_count_data: HitCountTable, or dictionary of hit count data keyed by
+            rule name (if available)
         include_visualization: Whether to include visualization data
+        max_overlap_links: Maximum overlap links per policy in the visualization
+            (None for no limit)
+        stale_days: Days without a hit after which a rule is reported as stale
+        reference_time: Epoch time last-hit ages are measured from (defaults to now)
+        index: Shared lookups to reuse across reports (optional)
         **kwargs: Additional parameters (device_group, vsys)
 
     Returns:
@@ -60,7 +80,8 @@ def generate_security_policy_analysis_data(
         log("Using default policy type", "debug", {"policy_type": policy_type})
 
     # Get all policies of the specified type
-    policies = get_policies(tree, policy_type, device_type, context_type, version, **kwargs)
+    lookup = index.get_policies if index is not None else get_policies
+    policies = lookup(tree, policy_type, device_type, context_type, version, **kwargs)
 
     if not policies:
         log(f"No {policy_type} policies found", "warning")
@@ -111,17 +132,12 @@ def generate_security_policy_analysis_data(
         },
     }
 
-    # Add hit count category if requested
+    # Align hit counts with the policies once instead of looking them up per policy
+    hits = None
     if include_hit_counts and hit_count_data:
-        analysis["categories"]["by_hit_count"] = {"zero": [], "low": [], "medium": [], "high": []}
-        analysis["statistics"]["hit_counts"] = {
-            "min": 0,
-            "max": 0,
-            "avg": 0,
-            "median": 0,
-            "total": 0,
-            "distribution": {},
-        }
+        if not isinstance(hit_count_data, HitCountTable):
+            hit_count_data = HitCountTable.from_dict(hit_count_data)
+        hits, last_hits, devices_hit = hit_count_data.join(list(policies))
 
     # Analyze each policy
     for name, policy in policies.items():
@@ -248,27 +264,6 @@ def generate_security_policy_analysis_data(
         for dst_zone in policy.get("to", []):
             analysis["statistics"]["zones"]["destination"][dst_zone] += 1
 
-        # Add hit count info if available
-        if include_hit_counts and hit_count_data and name in hit_count_data:
-            hit_count = hit_count_data[name]["hit_count"]
-            policy_info["hit_count"] = hit_count
-
-            # Categorize by hit count
-            if hit_count == 0:
-                analysis["categories"]["by_hit_count"]["zero"].append(name)
-            elif hit_count < 100:
-                analysis["categories"]["by_hit_count"]["low"].append(name)
-            elif hit_count < 1000:
-                analysis["categories"]["by_hit_count"]["medium"].append(name)
-            else:
-                analysis["categories"]["by_hit_count"]["high"].append(name)
-
-            # Update distribution
-            count_range = str(_get_hit_count_range(hit_count))
-            if count_range not in analysis["statistics"]["hit_counts"]["distribution"]:
-                analysis["statistics"]["hit_counts"]["distribution"][count_range] = 0
-            analysis["statistics"]["hit_counts"]["distribution"][count_range] += 1
-
         # Store the policy info
         analysis["policies"][name] = policy_info
 
@@ -292,34 +287,83 @@ def generate_security_policy_analysis_data(
         analysis["categories"]["without_log_forwarding"]
     )
 
-    # Calculate hit count statistics if available
-    if include_hit_counts and hit_count_data:
-        hit_counts = [
-            hit_count_data[name]["hit_count"] for name in policies if name in hit_count_data
-        ]
-        if hit_counts:
-            analysis["statistics"]["hit_counts"]["min"] = min(hit_counts)
-            analysis["statistics"]["hit_counts"]["max"] = max(hit_counts)
-            analysis["statistics"]["hit_counts"]["avg"] = sum(hit_counts) / len(hit_counts)
-            analysis["statistics"]["hit_counts"]["total"] = sum(hit_counts)
-
-            # Calculate median
-            sorted_counts = sorted(hit_counts)
-            mid = len(sorted_counts) // 2
-            if len(sorted_counts) % 2 == 0:
-                analysis["statistics"]["hit_counts"]["median"] = (
-                    sorted_counts[mid - 1] + sorted_counts[mid]
-                ) / 2
-            else:
-                analysis["statistics"]["hit_counts"]["median"] = sorted_counts[mid]
+    # Join hit count data if available
+    if hits is not None:
+        _add_hit_count_analysis(
+            analysis, list(policies), hits, last_hits, devices_hit, stale_days, reference_time
+        )
 
     # Generate rule overlap analysis if requested
     if include_visualization:
-        analysis["visualization"] = _generate_policy_visualization(policies)
+        analysis["visualization"] = _generate_policy_visualization(policies, max_overlap_links)
 
     return analysis
 
 
+def _add_hit_count_analysis(
+    analysis: Dict[str, Any],
+    names: List[str],
+    hits: Sequence[int],
+    last_hits: Sequence[int],
+    devices_hit: Sequence[int],
+    stale_days: int,
+    reference_time: Optional[float],
+) -> None:
+    """Add hit count categories, statistics and stale rules from aligned hit count columns."""
+    categories = hit_count_categories(hits)
+    ages = age_buckets(hits, last_hits, reference_time)
+
+    by_hit_count = {"zero": [], "low": [], "medium": [], "high": []}
+    by_age = {bucket: [] for bucket in AGE_BUCKETS + ("never", "unknown")}
+    distribution = Counter()
+    for name, count, last_hit, devices, category, age in zip(
+        names, hits, last_hits, devices_hit, categories, ages
+    ):
+        if category is None:
+            continue
+        policy_info = analysis["policies"][name]
+        policy_info["hit_count"] = count
+        policy_info["devices_hit"] = devices
+        policy_info["last_hit"] = (
+            datetime.datetime.fromtimestamp(last_hit, datetime.timezone.utc).isoformat()
+            if last_hit
+            else None
+        )
+        policy_info["last_hit_age"] = age
+        by_hit_count[category].append(name)
+        by_age[age].append(name)
+        distribution[str(_get_hit_count_range(count))] += 1
+
+    stale = stale_rules(names, hits, last_hits, stale_days, reference_time)
+    analysis["categories"]["by_hit_count"] = by_hit_count
+    analysis["categories"]["by_last_hit_age"] = by_age
+    analysis["categories"]["stale"] = stale
+    analysis["summary"]["stale_count"] = len(stale)
+
+    counts = sorted(count for count in hits if count >= 0)
+    statistics = {
+        "min": 0,
+        "max": 0,
+        "avg": 0,
+        "median": 0,
+        "total": 0,
+        "distribution": dict(distribution),
+        "stale_days": stale_days,
+    }
+    if counts:
+        mid = len(counts) // 2
+        statistics.update(
+            {
+                "min": counts[0],
+                "max": counts[-1],
+                "avg": sum(counts) / len(counts),
+                "total": sum(counts),
+                "median": counts[mid] if len(counts) % 2 else (counts[mid - 1] + counts[mid]) / 2,
+            }
+        )
+    analysis["statistics"]["hit_counts"] = statistics
+
+
 def _get_hit_count_range(count: int) -> Tuple[int, int]:
     """Get the range for a hit count value."""
     if count == 0:
@@ -336,12 +380,15 @@ def _get_hit_count_range(count: int) -> Tuple[int, int]:
         return (10000, float("inf"))
 
 
-def _generate_policy_visualization(policies: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+def _generate_policy_visualization(
+    policies: Dict[str, Dict[str, Any]], max_links_per_rule: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Generate visualization data for policy analysis.
 
     Args:
         policies: Dictionary of policies
+        max_links_per_rule: Maximum overlap links to emit per policy (None for no limit)
 
     Returns:
         Dictionary containing visualization data
@@ -369,36 +416,28 @@ def _generate_policy_visualization(policies: Dict[str, Dict[str, Any]]) -> Dict[
             }
         )
 
-    # Analyze policy overlaps
-    for i, (name1, policy1) in enumerate(policies.items()):
-        row = {"name": name1, "overlaps": []}
+    # Analyze policy overlaps through the inverted index rather than pairwise
+    overlap_index = PolicyOverlapIndex(policies)
+    links = visualization["overlap_graph"]["links"]
 
-        # Skip disabled policies for overlap analysis
-        if policy1.get("disabled", "no") == "yes":
-            continue
+    for rule_id, name1 in enumerate(overlap_index.names):
+        row = {"name": name1, "overlaps": []}
 
-        for j, (name2, policy2) in enumerate(policies.items()):
-            # Skip self and disabled policies
-            if name1 == name2 or policy2.get("disabled", "no") == "yes":
-                continue
-
-            # Check for potential overlaps
-            overlap = _check_policy_overlap(policy1, policy2)
-
-            if overlap["has_overlap"]:
-                row["overlaps"].append(
-                    {"policy": name2, "type": overlap["type"], "fields": overlap["fields"]}
-                )
-
-                # Add link to overlap graph
-                visualization["overlap_graph"]["links"].append(
-                    {
-                        "source": name1,
-                        "target": name2,
-                        "type": overlap["type"],
-                        "weight": len(overlap["fields"]),
-                    }
-                )
+        for other_id, overlap_type, fields in overlap_index.overlaps_for(
+            rule_id, max_links_per_rule
+        ):
+            name2 = overlap_index.names[other_id]
+            row["overlaps"].append({"policy": name2, "type": overlap_type, "fields": fields})
+
+            # Add link to overlap graph
+            links.append(
+                {
+                    "source": name1,
+                    "target": name2,
+                    "type": overlap_type,
+                    "weight": len(fields),
+                }
+            )
 
         visualization["policy_matrix"].append(row)
 
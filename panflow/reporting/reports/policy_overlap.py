@@ -0,0 +1,175 @@
+"""
+Indexed policy overlap engine.
+
+This module finds overlapping security policies without comparing every pair
+of rules. For each compared field it builds an inverted index from member
+value to a bitset of rule ids, plus a wildcard bitset of rules that use
+``any``. The rules overlapping a given rule on a field are then the union of
+the bitsets for its values and the wildcard bitset, and the work done per
+rule tracks the number of rules it actually overlaps with.
+
+Bitsets are plain Python integers, with bit ``i`` standing for the ``i``-th
+indexed rule, so unions and intersections run over machine words in C.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Fields compared for overlaps, in the order they are reported
+OVERLAP_FIELDS = ["source", "destination", "service", "application", "from", "to"]
+
+
+def _iter_bits(bitset: int) -> Iterator[int]:
+    """Yield the positions of the set bits in ascending order."""
+    bits = format(bitset, "b")[::-1]
+    position = bits.find("1")
+    while position != -1:
+        yield position
+        position = bits.find("1", position + 1)
+
+
+class PolicyOverlapIndex:
+    """
+    Inverted index over policy fields for fast overlap queries.
+
+    Two policies overlap on a field when both define the field as a member
+    list and either list contains ``any`` or the lists share a member. They
+    overlap when at least one field overlaps; overlapping on every field is a
+    duplicate, or a conflict when the actions differ.
+    """
+
+    def __init__(self, policies: Dict[str, Dict[str, Any]], fields: Optional[List[str]] = None):
+        """
+        Index the enabled policies.
+
+        Args:
+            policies: Dictionary of policies keyed by name, in rulebase order
+            fields: Fields to compare (defaults to OVERLAP_FIELDS)
+        """
+        self.fields = list(fields or OVERLAP_FIELDS)
+        self.names: List[str] = []
+        self.actions: List[str] = []
+        self._members: List[Dict[str, List[str]]] = []
+
+        # field -> bitset of rules that define the field as a list
+        self._present: Dict[str, int] = {field: 0 for field in self.fields}
+        # field -> bitset of rules whose list contains "any"
+        self._wildcard: Dict[str, int] = {field: 0 for field in self.fields}
+        # field -> member value -> bitset of rules listing that value
+        self._index: Dict[str, Dict[str, int]] = {field: defaultdict(int) for field in self.fields}
+
+        for name, policy in policies.items():
+            if policy.get("disabled", "no") == "yes":
+                continue
+
+            rule_id = len(self.names)
+            bit = 1 << rule_id
+            self.names.append(name)
+            self.actions.append(policy.get("action", ""))
+
+            members = {}
+            for field in self.fields:
+                values = policy.get(field)
+                if not isinstance(values, list):
+                    continue
+                members[field] = values
+                self._present[field] |= bit
+                if "any" in values:
+                    self._wildcard[field] |= bit
+                field_index = self._index[field]
+                for value in values:
+                    field_index[value] |= bit
+            self._members.append(members)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def field_overlaps(self, rule_id: int) -> Dict[str, int]:
+        """
+        Get the rules overlapping a rule on each field.
+
+        Args:
+            rule_id: Index of the rule
+
+        Returns:
+            Dictionary mapping each overlapping field to a bitset of rule ids,
+            excluding the rule itself
+        """
+        self_bit = 1 << rule_id
+        overlaps = {}
+        for field, values in self._members[rule_id].items():
+            if "any" in values:
+                matches = self._present[field]
+            else:
+                matches = self._wildcard[field]
+                field_index = self._index[field]
+                for value in values:
+                    matches |= field_index[value]
+            matches &= ~self_bit
+            if matches:
+                overlaps[field] = matches
+        return overlaps
+
+    def overlaps_for(
+        self, rule_id: int, max_links: Optional[int] = None
+    ) -> List[Tuple[int, str, List[str]]]:
+        """
+        Find the rules overlapping a rule.
+
+        When ``max_links`` caps the result, duplicates and conflicts are kept
+        ahead of partial overlaps, and the kept overlaps stay in rulebase order.
+
+        Args:
+            rule_id: Index of the rule
+            max_links: Maximum number of overlaps to return (None for all)
+
+        Returns:
+            List of (rule id, overlap type, overlapping fields) tuples in rulebase order
+        """
+        field_bitsets = self.field_overlaps(rule_id)
+        if not field_bitsets:
+            return []
+
+        union = 0
+        for bitset in field_bitsets.values():
+            union |= bitset
+
+        if len(field_bitsets) == len(self.fields):
+            full = union
+            for bitset in field_bitsets.values():
+                full &= bitset
+        else:
+            full = 0
+
+        if max_links is None:
+            candidates = list(_iter_bits(union))
+        else:
+            candidates = []
+            for bitset in (full, union & ~full):
+                for other_id in _iter_bits(bitset):
+                    if len(candidates) >= max_links:
+                        break
+                    candidates.append(other_id)
+            candidates.sort()
+
+        # Binary strings make per-pair field membership an O(1) lookup
+        field_bits = [
+            (field, format(field_bitsets[field], "b")[::-1])
+            for field in self.fields
+            if field in field_bitsets
+        ]
+        action = self.actions[rule_id]
+
+        results = []
+        for other_id in candidates:
+            fields = [
+                field
+                for field, bits in field_bits
+                if other_id < len(bits) and bits[other_id] == "1"
+            ]
+            if len(fields) == len(self.fields):
+                overlap_type = "conflict" if self.actions[other_id] != action else "duplicate"
+            else:
+                overlap_type = "partial"
+            results.append((other_id, overlap_type, fields))
+        return results
@@ -0,0 +1,313 @@
+"""
+Security rule shadowing and redundancy report generator.
+
+This module finds rules that can never match, or only partly match, because
+rules earlier in the rulebase already match their traffic. Unlike the
+name-based overlap check in the policy analysis report, rule members are
+resolved to address intervals and port ranges first, so a host inside
+``10.0.0.0/8`` or two differently named groups with the same members are
+compared by value.
+
+Rules are walked in rulebase order. For each rule, candidate earlier rules
+are narrowed with bitset indexes over zones, applications and the other
+name fields and with interval indexes over addresses and services; only the
+remaining candidates are compared in full. Coverage accumulated from several
+earlier rules that differ in a single field is tracked per field, so a rule
+covered by the combined sources (or destinations, or services) of several
+earlier rules is reported too.
+"""
+
+import datetime
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from lxml import etree
+
+from ...core.logging_utils import log, logger
+from ...core.rule_resolver import (
+    ADDRESS_FIELDS,
+    RULE_FIELDS,
+    SERVICE_FIELDS,
+    IntervalIndex,
+    MemberSet,
+    ResolvedRule,
+    RuleResolver,
+)
+
+RANGE_FIELDS = ADDRESS_FIELDS + SERVICE_FIELDS
+# Name fields are cheap to narrow on, so they are applied before range fields
+NARROWING_ORDER = tuple(f for f in RULE_FIELDS if f not in RANGE_FIELDS) + RANGE_FIELDS
+
+# Maximum number of overlapping earlier rules listed for a partially shadowed rule
+MAX_LISTED_RULES = 10
+
+# Candidate count below which rules are compared directly instead of narrowed further
+DIRECT_COMPARE_LIMIT = 32
+
+
+def _iter_bits(bitset: int) -> Iterator[int]:
+    """Yield the positions of the set bits in ascending order."""
+    bits = format(bitset, "b")[::-1]
+    position = bits.find("1")
+    while position != -1:
+        yield position
+        position = bits.find("1", position + 1)
+
+
+class ShadowAnalyzer:
+    """
+    Finds shadowed, redundant and partially shadowed rules in a rulebase.
+
+    - shadowed: every packet the rule matches is matched first by earlier
+      rules, at least one of which has a different action
+    - redundant: the rule is fully matched by earlier rules with the same action
+    - partially_shadowed: some of the rule's traffic is matched first by an
+      earlier rule with a different action
+    """
+
+    def __init__(self, rules: List[ResolvedRule]):
+        """
+        Index the enabled rules.
+
+        Args:
+            rules: Resolved rules in rulebase order
+        """
+        self.rules = [rule for rule in rules if not rule.disabled]
+        self.disabled_count = len(rules) - len(self.rules)
+
+        self._any_bits: Dict[str, int] = defaultdict(int)
+        self._name_bits: Dict[str, Dict[str, int]] = {f: defaultdict(int) for f in RULE_FIELDS}
+        self._action_bits: Dict[str, int] = defaultdict(int)
+
+        for rule_id, rule in enumerate(self.rules):
+            bit = 1 << rule_id
+            self._action_bits[rule.action] |= bit
+            for field in RULE_FIELDS:
+                members = rule.fields[field]
+                if members.any:
+                    self._any_bits[field] |= bit
+                else:
+                    name_bits = self._name_bits[field]
+                    for name in members.names:
+                        name_bits[name] |= bit
+
+        self._range_index = {
+            field: IntervalIndex(
+                (rule_id, rule.fields[field].ranges) for rule_id, rule in enumerate(self.rules)
+            )
+            for field in RANGE_FIELDS
+        }
+        # (query, field, low, high) -> bitset; rules often share the same addresses and services
+        self._range_bits: Dict[Tuple[str, str, int, int], int] = {}
+
+    def _range_query_bits(self, query: str, field: str, low: int, high: int) -> int:
+        """Bitset of rules with an interval containing or overlapping ``[low, high]``."""
+        key = (query, field, low, high)
+        bits = self._range_bits.get(key)
+        if bits is None:
+            bits = 0
+            for rule_id in getattr(self._range_index[field], query)(low, high):
+                bits |= 1 << rule_id
+            self._range_bits[key] = bits
+        return bits
+
+    def _covering_candidates(self, rule_id: int) -> int:
+        """Bitset of earlier rules that could cover a rule in every field."""
+        rule = self.rules[rule_id]
+        candidates = (1 << rule_id) - 1
+
+        for field in NARROWING_ORDER:
+            if candidates.bit_count() <= DIRECT_COMPARE_LIMIT:
+                break
+            members = rule.fields[field]
+            field_bits = self._any_bits[field]
+            if not members.any:
+                if members.ranges:
+                    # A rule covering this one must contain its first interval
+                    low, high = members.ranges.intervals[0]
+                    field_bits |= self._range_query_bits("containing", field, low, high)
+                elif members.names:
+                    field_bits |= self._name_bits[field][next(iter(members.names))]
+                else:
+                    # An empty member set is covered by anything
+                    continue
+            candidates &= field_bits
+
+        return candidates
+
+    def _overlapping_candidates(self, rule_id: int) -> int:
+        """Bitset of earlier rules with a different action that could overlap a rule."""
+        rule = self.rules[rule_id]
+        candidates = ((1 << rule_id) - 1) & ~self._action_bits[rule.action]
+
+        for field in NARROWING_ORDER:
+            if candidates.bit_count() <= DIRECT_COMPARE_LIMIT:
+                break
+            members = rule.fields[field]
+            if members.any:
+                continue
+            field_bits = self._any_bits[field]
+            name_bits = self._name_bits[field]
+            for name in members.names:
+                field_bits |= name_bits[name]
+            if field in self._range_index:
+                for low, high in members.ranges.intervals:
+                    field_bits |= self._range_query_bits("overlapping", field, low, high)
+            candidates &= field_bits
+
+        return candidates
+
+    @staticmethod
+    def _key_without(rule: ResolvedRule, field: str) -> Tuple[MemberSet, ...]:
+        return tuple(rule.fields[f] for f in RULE_FIELDS if f != field)
+
+    def analyze(self) -> List[Dict[str, Any]]:
+        """
+        Walk the rulebase in order and classify every rule.
+
+        Returns:
+            List of findings in rulebase order
+        """
+        findings = []
+        # field -> key of the other fields -> [union of the field, contributing rule ids]
+        accumulated: Dict[str, Dict[Tuple[MemberSet, ...], List[Any]]] = {
+            field: {} for field in RANGE_FIELDS
+        }
+
+        for rule_id, rule in enumerate(self.rules):
+            finding = self._check_rule(rule_id, accumulated)
+            if finding:
+                findings.append(finding)
+
+            for field in RANGE_FIELDS:
+                key = self._key_without(rule, field)
+                entry = accumulated[field].get(key)
+                if entry is None:
+                    accumulated[field][key] = [rule.fields[field], [rule_id]]
+                else:
+                    entry[0] = entry[0].union(rule.fields[field])
+                    entry[1].append(rule_id)
+
+        return findings
+
+    def _check_rule(
+        self,
+        rule_id: int,
+        accumulated: Dict[str, Dict[Tuple[MemberSet, ...], List[Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        rule = self.rules[rule_id]
+
+        # Fully covered by a single earlier rule
+        for other_id in _iter_bits(self._covering_candidates(rule_id)):
+            other = self.rules[other_id]
+            if other.covers(rule):
+                return self._finding(rule, "single", [other_id])
+
+        # Fully covered by earlier rules that differ from this one in a single field
+        for field in RANGE_FIELDS:
+            entry = accumulated[field].get(self._key_without(rule, field))
+            if entry and entry[0].covers(rule.fields[field]):
+                contributors = [
+                    other_id
+                    for other_id in entry[1]
+                    if self.rules[other_id].fields[field].intersects(rule.fields[field])
+                ]
+                return self._finding(rule, "combined", contributors)
+
+        # Partly matched first by an earlier rule with a different action
+        overlapping = []
+        for other_id in _iter_bits(self._overlapping_candidates(rule_id)):
+            if self.rules[other_id].intersects(rule):
+                overlapping.append(other_id)
+                if len(overlapping) >= MAX_LISTED_RULES:
+                    break
+        if overlapping:
+            return {
+                "rule": rule.name,
+                "position": rule.position,
+                "action": rule.action,
+                "type": "partially_shadowed",
+                "overlapping_rules": [self.rules[i].name for i in overlapping],
+            }
+        return None
+
+    def _finding(
+        self, rule: ResolvedRule, coverage: str, covering_ids: List[int]
+    ) -> Dict[str, Any]:
+        covering = [self.rules[i] for i in covering_ids]
+        same_action = all(other.action == rule.action for other in covering)
+        return {
+            "rule": rule.name,
+            "position": rule.position,
+            "action": rule.action,
+            "type": "redundant" if same_action else "shadowed",
+            "coverage": coverage,
+            "covered_by": [other.name for other in covering],
+        }
+
+
+def generate_policy_shadowing_report_data(
+    tree: etree._ElementTree,
+    device_type: str,
+    context_type: str,
+    version: str,
+    policy_type: Optional[str] = None,
+    **kwargs,
+) -> Dict[str, Any]:
+    """
+    Generate raw data for a rule shadowing and redundancy report.
+
+    Args:
+        tree: ElementTree containing the configuration
+        device_type: Type of device ("firewall" or "panorama")
+        context_type: Type of context (shared, device_group, vsys)
+        version: PAN-OS version
+        policy_type: Type of security policy to analyze (if None, determine based on device type)
+        **kwargs: Additional parameters (device_group, vsys)
+
+    Returns:
+        Dict: Report data
+    """
+    if policy_type is None:
+        policy_type = (
+            "security_pre_rules" if device_type.lower() == "panorama" else "security_rules"
+        )
+        log("Using default policy type", "debug", {"policy_type": policy_type})
+
+    resolver = RuleResolver(tree, device_type, context_type, version, **kwargs)
+    rules = resolver.resolve_rules(policy_type)
+    if not rules:
+        log(f"No {policy_type} policies found", "warning")
+        return {"error": f"No {policy_type} policies found"}
+
+    log(
+        "Analyzing rule shadowing", "info", {"policy_type": policy_type, "policy_count": len(rules)}
+    )
+    analyzer = ShadowAnalyzer(rules)
+    findings = analyzer.analyze()
+
+    counts = defaultdict(int)
+    for finding in findings:
+        counts[finding["type"]] += 1
+
+    logger.info(
+        f"Shadowing analysis of {len(rules)} rules: {counts['shadowed']} shadowed, "
+        f"{counts['redundant']} redundant, {counts['partially_shadowed']} partially shadowed"
+    )
+
+    return {
+        "summary": {
+            "total_policies": len(rules),
+            "analyzed_policies": len(analyzer.rules),
+            "disabled_policies": analyzer.disabled_count,
+            "shadowed_count": counts["shadowed"],
+            "redundant_count": counts["redundant"],
+            "partially_shadowed_count": counts["partially_shadowed"],
+            "device_type": device_type,
+            "context_type": context_type,
+            "policy_type": policy_type,
+            "generation_time": datetime.datetime.now().isoformat(),
+            "version": version,
+        },
+        "findings": findings,
+    }
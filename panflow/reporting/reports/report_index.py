@@ -0,0 +1,137 @@
+"""
+Shared lookups for report builders.
+
+Report builders repeatedly read the same objects and policies: every unused
+objects section scans all rulebases of every context, and the policy analysis
+reads the security rulebase again. A :class:`ReportIndex` memoizes
+``get_objects`` and ``get_policies`` (including the errors they raise) for one
+configuration tree so a bundle of reports parses each section of the tree
+once. It is safe to share between threads; concurrent requests for the same
+lookup wait for a single builder.
+
+Returned dictionaries are shared between callers and must not be modified.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from lxml import etree
+
+from ...modules.objects import get_objects
+from ...modules.policies import get_policies
+
+
+class ReportIndex:
+    """
+    Memoized object and policy lookups over one configuration tree.
+
+    The ``get_objects`` and ``get_policies`` methods take the same arguments
+    as the functions in :mod:`panflow.modules`, so report builders can use
+    either interchangeably.
+    """
+
+    def __init__(self, tree: etree._ElementTree):
+        """
+        Initialize an empty index.
+
+        Args:
+            tree: ElementTree the lookups are made against
+        """
+        self.tree = tree
+        self._results: Dict[Tuple, Any] = {}
+        self._locks: Dict[Tuple, threading.Lock] = {}
+        self._guard = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _memoized(self, key: Tuple, build: Callable[[], Any]) -> Any:
+        result = self._results.get(key)
+        if result is None:
+            with self._guard:
+                lock = self._locks.setdefault(key, threading.Lock())
+            with lock:
+                result = self._results.get(key)
+                if result is None:
+                    self.misses += 1
+                    # Lookups that fail (e.g. a policy type the device does not
+                    # have) fail the same way every time, so errors are kept too
+                    try:
+                        result = (build(), None)
+                    except Exception as e:
+                        result = (None, e)
+                    self._results[key] = result
+                else:
+                    self.hits += 1
+        else:
+            self.hits += 1
+
+        value, error = result
+        if error is not None:
+            raise error
+        return value
+
+    def _check_tree(self, tree: etree._ElementTree) -> None:
+        if tree is not self.tree:
+            raise ValueError("ReportIndex used with a different configuration tree")
+
+    def get_objects(
+        self,
+        tree: etree._ElementTree,
+        object_type: str,
+        device_type: str,
+        context_type: str,
+        version: str,
+        **kwargs,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get objects of a type in a context, building them on first use.
+
+        Args:
+            tree: ElementTree containing the configuration (must be the indexed tree)
+            object_type: Type of object (address, service, ...)
+            device_type: Type of device ("firewall" or "panorama")
+            context_type: Type of context (shared, device_group, vsys)
+            version: PAN-OS version
+            **kwargs: Additional parameters (device_group, vsys)
+
+        Returns:
+            Dictionary of objects keyed by name
+        """
+        self._check_tree(tree)
+        context = tuple(sorted(kwargs.items()))
+        key = ("objects", object_type, device_type, context_type, version, context)
+        return self._memoized(
+            key,
+            lambda: get_objects(tree, object_type, device_type, context_type, version, **kwargs),
+        )
+
+    def get_policies(
+        self,
+        tree: etree._ElementTree,
+        policy_type: str,
+        device_type: str,
+        context_type: str,
+        version: str,
+        **kwargs,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get policies of a type in a context, building them on first use.
+
+        Args:
+            tree: ElementTree containing the configuration (must be the indexed tree)
+            policy_type: Type of policy (security_rules, nat_pre_rules, ...)
+            device_type: Type of device ("firewall" or "panorama")
+            context_type: Type of context (shared, device_group, vsys)
+            version: PAN-OS version
+            **kwargs: Additional parameters (device_group, vsys)
+
+        Returns:
+            Dictionary of policies keyed by name
+        """
+        self._check_tree(tree)
+        context = tuple(sorted(kwargs.items()))
+        key = ("policies", policy_type, device_type, context_type, version, context)
+        return self._memoized(
+            key,
+            lambda: get_policies(tree, policy_type, device_type, context_type, version, **kwargs),
+        )
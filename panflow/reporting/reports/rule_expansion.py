@@ -0,0 +1,377 @@
+"""
+Rule expansion cost report generator.
+
+When a configuration is committed, the groups used by each security rule are
+expanded into their member objects, and rules whose groups expand into huge
+numbers of combinations slow commits down or hit device limits. This module
+computes the expanded cardinality of every rule: the number of distinct leaf
+members of its source and destination addresses, services, applications and
+from/to zones, and their product as the rule's expansion cost. Rules are
+ranked by cost and the costs are totalled per device group (or vsys).
+
+Group expansion is memoized, so each group of a context is expanded once
+however many rules and groups use it. In approximate mode each group is
+summarized by a k-minimum-values sketch of its members' hashes instead of
+the full member set; sketches are merged in constant size, and set sizes up
+to the sketch size are still exact.
+"""
+
+import hashlib
+import heapq
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+from lxml import etree
+
+from ...core.config_loader import xpath_search
+from ...core.logging_utils import logger
+from ...core.rule_resolver import RuleResolver
+from ...core.xpath_resolver import get_policy_xpath
+
+# Rule fields whose member counts are multiplied into the expansion cost
+EXPANSION_FIELDS = ("from", "to", "source", "destination", "service", "application")
+
+# Member kind used to expand each rule field
+_FIELD_KINDS = {
+    "source": "address",
+    "destination": "address",
+    "service": "service",
+    "application": "application",
+}
+
+# Number of hashes kept per sketch in approximate mode
+DEFAULT_SKETCH_SIZE = 512
+
+_HASH_SPACE = 1 << 64
+
+
+def _hash(member: str) -> int:
+    return int.from_bytes(hashlib.blake2b(member.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class SizeSketch:
+    """
+    K-minimum-values sketch estimating the number of distinct members of a set.
+
+    The sketch keeps the ``size`` smallest member hashes. Sketches of two sets
+    merge into the sketch of their union, and the count is exact while the
+    set has fewer members than the sketch size.
+    """
+
+    __slots__ = ("hashes", "size")
+
+    def __init__(self, hashes: Iterable[int] = (), size: int = DEFAULT_SKETCH_SIZE):
+        self.size = size
+        self.hashes: Tuple[int, ...] = tuple(sorted(set(hashes))[:size])
+
+    @classmethod
+    def of(cls, members: Iterable[str], size: int = DEFAULT_SKETCH_SIZE) -> "SizeSketch":
+        """Build the sketch of a set of member names."""
+        return cls((_hash(member) for member in members), size)
+
+    @classmethod
+    def merge(
+        cls, sketches: Iterable["SizeSketch"], size: int = DEFAULT_SKETCH_SIZE
+    ) -> "SizeSketch":
+        """Build the sketch of the union of the sets of several sketches."""
+        return cls((value for sketch in sketches for value in sketch.hashes), size)
+
+    @property
+    def exact(self) -> bool:
+        """Whether the estimate is the exact count."""
+        return len(self.hashes) < self.size
+
+    def estimate(self) -> int:
+        """Estimate the number of distinct members."""
+        if self.exact:
+            return len(self.hashes)
+        return round((self.size - 1) * _HASH_SPACE / (self.hashes[-1] + 1))
+
+
+Expansion = Union[FrozenSet[str], SizeSketch]
+
+
+class GroupExpander:
+    """
+    Expands rule members into their leaf members within one context.
+
+    Objects are looked up like in :class:`RuleResolver`, from the context
+    outward to shared. Expansions are memoized, except those cut short by a
+    group cycle.
+    """
+
+    def __init__(
+        self,
+        resolver: RuleResolver,
+        approximate: bool = False,
+        sketch_size: int = DEFAULT_SKETCH_SIZE,
+    ):
+        """
+        Initialize the expander.
+
+        Args:
+            resolver: Resolver holding the objects visible from the context
+            approximate: Estimate member counts with sketches instead of sets
+            sketch_size: Number of hashes kept per sketch in approximate mode
+        """
+        self.resolver = resolver
+        self.approximate = approximate
+        self.sketch_size = sketch_size
+        self.groups_expanded = 0
+        self._cache: Dict[Tuple[str, str], Expansion] = {}
+
+    def _group_members(self, kind: str, name: str) -> Optional[List[str]]:
+        """Get the members of a group, or None if the name is not a static group."""
+        resolver = self.resolver
+        if kind == "address":
+            group = None if name in resolver.addresses else resolver.address_groups.get(name)
+            # Dynamic groups are only resolved on the device
+            static = group.find("static") if group is not None else None
+            if static is None:
+                return None
+            return [m.text for m in static.findall("member") if m.text]
+        if kind == "service":
+            group = None if name in resolver.services else resolver.service_groups.get(name)
+        else:
+            group = resolver.application_groups.get(name)
+        if group is None:
+            return None
+        return [m.text for m in group.findall("members/member") if m.text]
+
+    def _expand_members(
+        self, kind: str, members: List[str], seen: Set[str]
+    ) -> Tuple[Expansion, Set[str]]:
+        """
+        Expand a list of members, hashing leaf members straight into the result.
+
+        Returns:
+            Tuple of (expansion, names of groups skipped because they are
+            already being expanded further up)
+        """
+        leaves = []
+        parts = []
+        cuts: Set[str] = set()
+        for member in members:
+            if member in seen:
+                cuts.add(member)
+                continue
+            if self._group_members(kind, member) is None:
+                leaves.append(f"{kind}:{member}")
+            else:
+                part, part_cuts = self._expand(kind, member, seen)
+                parts.append(part)
+                cuts |= part_cuts
+
+        if self.approximate:
+            if not leaves and len(parts) == 1:
+                return parts[0], cuts
+            hashes = [_hash(leaf) for leaf in leaves]
+            for part in parts:
+                hashes.extend(part.hashes)
+            return SizeSketch(hashes, self.sketch_size), cuts
+        if not leaves and len(parts) == 1:
+            return parts[0], cuts
+        return frozenset(leaves).union(*parts), cuts
+
+    def _expand(self, kind: str, name: str, seen: Set[str]) -> Tuple[Expansion, Set[str]]:
+        """Expand a member below the groups in ``seen``, returning the expansion and its cuts."""
+        key = (kind, name)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached, set()
+
+        members = self._group_members(kind, name)
+        if members is None:
+            members = [name]
+            seen = set()
+        else:
+            self.groups_expanded += 1
+            seen = seen | {name}
+        result, cuts = self._expand_members(kind, members, seen)
+
+        # A group reached inside a cycle misses the members of the groups it
+        # cycles back to, so only complete expansions are memoized
+        cuts.discard(name)
+        if not cuts:
+            self._cache[key] = result
+        return result, cuts
+
+    def expand(self, kind: str, name: str) -> Expansion:
+        """
+        Expand a member into its leaf members.
+
+        Args:
+            kind: Member kind (address, service, application)
+            name: Member name as used in a rule or group
+
+        Returns:
+            Set of leaf members, or its sketch in approximate mode
+        """
+        return self._expand(kind, name, set())[0]
+
+    def count(self, field: str, members: List[str]) -> Tuple[int, bool]:
+        """
+        Count the distinct leaf members of a rule field.
+
+        Args:
+            field: Rule field name (from, to, source, destination, service, application)
+            members: Member names listed in the rule
+
+        Returns:
+            Tuple of (count, whether the count is estimated); ``any`` counts as one
+        """
+        if not members or "any" in members:
+            return 1, False
+        kind = _FIELD_KINDS.get(field)
+        if kind is None:
+            return len(set(members)), False
+
+        result, _ = self._expand_members(kind, members, set())
+        if self.approximate:
+            return max(result.estimate(), 1), not result.exact
+        return max(len(result), 1), False
+
+    def rule_cost(self, rule: etree._Element) -> Dict[str, Any]:
+        """
+        Compute the expanded member counts and expansion cost of a rule.
+
+        Args:
+            rule: Rule entry element
+
+        Returns:
+            Dict with the per-field "counts", the "cost" and whether any
+            count is "estimated"
+        """
+        counts = {}
+        estimated = False
+        cost = 1
+        for field in EXPANSION_FIELDS:
+            members = [m.text for m in rule.findall(f"{field}/member") if m.text]
+            counts[field], field_estimated = self.count(field, members)
+            estimated = estimated or field_estimated
+            cost *= counts[field]
+        return {"counts": counts, "cost": cost, "estimated": estimated}
+
+
+def _contexts(
+    tree: etree._ElementTree, device_type: str, context_type: str, kwargs: Dict[str, Any]
+) -> List[Tuple[str, Dict[str, Any], str]]:
+    """Get the contexts whose rulebases are reported, with their labels."""
+    if device_type.lower() == "panorama":
+        if context_type == "device_group" and kwargs.get("device_group"):
+            device_group = kwargs["device_group"]
+            return [("device_group", {"device_group": device_group}, device_group)]
+        contexts = [("shared", {}, "shared")]
+        for dg in tree.xpath("/config/devices/entry/device-group/entry"):
+            name = dg.get("name")
+            if name:
+                contexts.append(("device_group", {"device_group": name}, name))
+        return contexts
+    label = kwargs.get("vsys") or context_type
+    return [(context_type, kwargs, label)]
+
+
+def generate_rule_expansion_report_data(
+    tree: etree._ElementTree,
+    device_type: str,
+    context_type: str,
+    version: str,
+    approximate: bool = False,
+    top: Optional[int] = None,
+    **kwargs,
+) -> Dict[str, Any]:
+    """
+    Generate raw data for a rule expansion cost report.
+
+    On Panorama the shared context reports shared and every device group;
+    a device group context reports that device group only.
+
+    Args:
+        tree: ElementTree containing the configuration
+        device_type: Type of device ("firewall" or "panorama")
+        context_type: Type of context (shared, device_group, vsys)
+        version: PAN-OS version
+        approximate: Estimate the member counts of groups with sketches
+        top: Only list the rules with the highest cost (default: all)
+        **kwargs: Additional parameters (device_group, vsys)
+
+    Returns:
+        Dict: Report data
+    """
+    if device_type.lower() == "panorama":
+        policy_types = ["security_pre_rules", "security_post_rules"]
+    else:
+        policy_types = ["security_rules"]
+
+    rules = []
+    contexts = []
+    groups_expanded = 0
+    for ctx_type, ctx_kwargs, label in _contexts(tree, device_type, context_type, kwargs):
+        expander = GroupExpander(
+            RuleResolver(tree, device_type, ctx_type, version, **ctx_kwargs), approximate
+        )
+        context_rules = []
+        for policy_type in policy_types:
+            try:
+                xpath = get_policy_xpath(policy_type, device_type, ctx_type, version, **ctx_kwargs)
+            except ValueError as e:
+                logger.warning(f"Skipping {policy_type} in {label}: {e}")
+                continue
+            containers = xpath_search(tree, xpath)
+            if not containers:
+                continue
+            position = 0
+            for rule in containers[0]:
+                if rule.tag != "entry" or not rule.get("name"):
+                    continue
+                context_rules.append(
+                    {
+                        "name": rule.get("name"),
+                        "context": label,
+                        "policy_type": policy_type,
+                        "position": position,
+                        "disabled": rule.findtext("disabled") == "yes",
+                        **expander.rule_cost(rule),
+                    }
+                )
+                position += 1
+
+        groups_expanded += expander.groups_expanded
+        rules.extend(context_rules)
+        if context_rules:
+            costliest = max(context_rules, key=lambda row: row["cost"])
+            contexts.append(
+                {
+                    "name": label,
+                    "rules": len(context_rules),
+                    "total_cost": sum(row["cost"] for row in context_rules),
+                    "max_cost": costliest["cost"],
+                    "costliest_rule": costliest["name"],
+                }
+            )
+
+    ranked = (
+        heapq.nlargest(top, rules, key=lambda row: row["cost"])
+        if top
+        else sorted(rules, key=lambda row: row["cost"], reverse=True)
+    )
+    contexts.sort(key=lambda row: row["total_cost"], reverse=True)
+    total_cost = sum(row["cost"] for row in rules)
+
+    logger.info(
+        f"Expansion cost of {len(rules)} rules in {len(contexts)} contexts: total {total_cost}, "
+        f"{groups_expanded} groups expanded{' (approximate)' if approximate else ''}"
+    )
+
+    return {
+        "summary": {
+            "mode": "approximate" if approximate else "exact",
+            "total_rules": len(rules),
+            "total_cost": total_cost,
+            "max_cost": ranked[0]["cost"] if ranked else 0,
+            "contexts": len(contexts),
+            "groups_expanded": groups_expanded,
+            "estimated_rules": sum(1 for row in rules if row["estimated"]),
+        },
+        "rules": ranked,
+        "contexts": contexts,
+    }
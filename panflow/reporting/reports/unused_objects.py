@@ -6,72 +6,50 @@ in PAN-OS configurations.
 """
 
 import logging
-from typing import Dict, Any, Optional, List, Set, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+
 from lxml import etree
 
-from ...modules.objects import get_objects
-from ...modules.policies import get_policies
 from ...core.logging_utils import logger
+from ...core.snapshot import REFERENCE_FIELDS, ConfigSnapshot
+from ...modules.objects import get_objects as _get_objects
+from ...modules.policies import get_policies as _get_policies
+from .report_index import ReportIndex
 
+# Fields of each object type that policies reference objects in; snapshots
+# record the same address and service fields
+_FIELDS_TO_CHECK = {
+    "address": list(REFERENCE_FIELDS["address"]),
+    "service": list(REFERENCE_FIELDS["service"]),
+    "application": ["application"],
+    "tag": ["tag"],
+}
 
-def generate_unused_objects_report_data(
-    tree: etree._ElementTree,
-    device_type: str,
-    context_type: str,
-    version: str,
-    object_type: str = "address",
-    **kwargs,
-) -> Dict[str, Any]:
-    """
-    Generate raw data for a report of unused objects.
+# Group type whose members reference objects of each object type
+_GROUP_TYPES = {
+    "address": "address-group",
+    "service": "service-group",
+    "application": "application-group",
+}
 
-    Args:
-        tree: ElementTree containing the configuration
-        device_type: Type of device ("firewall" or "panorama")
-        context_type: Type of context (shared, device_group, vsys)
-        version: PAN-OS version
-        object_type: Type of object to check (address, service, etc.)
-        **kwargs: Additional parameters (device_group, vsys)
 
-    Returns:
-        Dict: Report data
-    """
-    report_data = {"unused_objects": []}
-
-    # Get objects of the specified type in the current context
-    objects = get_objects(tree, object_type, device_type, context_type, version, **kwargs)
-
-    # Define policy types to check for object usage
-    policy_types = []
-
-    # Define base fields for each policy type (will be filtered based on object_type later)
+def _policy_types(device_type: str) -> List[Tuple[str, List[str]]]:
+    """Get the policy types to check for object usage, with their base fields."""
+    nat_fields = [
+        "source",
+        "destination",
+        "service",
+        "source-translation",
+        "destination-translation",
+        "service-translation",
+    ]
     if device_type.lower() == "panorama":
         # Panorama policy types - both pre and post rulebases
-        policy_types = [
+        return [
             ("security_pre_rules", ["source", "destination", "service"]),
             ("security_post_rules", ["source", "destination", "service"]),
-            (
-                "nat_pre_rules",
-                [
-                    "source",
-                    "destination",
-                    "service",
-                    "source-translation",
-                    "destination-translation",
-                    "service-translation",
-                ],
-            ),
-            (
-                "nat_post_rules",
-                [
-                    "source",
-                    "destination",
-                    "service",
-                    "source-translation",
-                    "destination-translation",
-                    "service-translation",
-                ],
-            ),
+            ("nat_pre_rules", nat_fields),
+            ("nat_post_rules", nat_fields),
             ("decryption_pre_rules", ["source", "destination", "service"]),
             ("decryption_post_rules", ["source", "destination", "service"]),
             ("qos_pre_rules", ["source", "destination", "service"]),
@@ -85,55 +63,24 @@ def generate_unused_objects_report_data(
             ("dos_pre_rules", ["source", "destination"]),
             ("dos_post_rules", ["source", "destination"]),
         ]
-    else:  # firewall
-        # Firewall policy types - standard rulebase
-        policy_types = [
-            ("security_rules", ["source", "destination", "service"]),
-            (
-                "nat_rules",
-                [
-                    "source",
-                    "destination",
-                    "service",
-                    "source-translation",
-                    "destination-translation",
-                    "service-translation",
-                ],
-            ),
-            ("decryption_rules", ["source", "destination", "service"]),
-            ("qos_rules", ["source", "destination", "service"]),
-            ("authentication_rules", ["source", "destination", "service"]),
-            ("pbf_rules", ["source", "destination", "service"]),
-            ("application_override_rules", ["source", "destination", "service"]),
-            ("dos_rules", ["source", "destination"]),
-        ]
-
-    # Determine which group type to check based on object type
-    group_type = None
-    fields_to_check_map = {
-        "address": ["source", "destination", "source-translation", "destination-translation"],
-        "service": ["service", "service-translation"],
-        "application": ["application"],
-        "tag": ["tag"],
-    }
-
-    # Determine the appropriate group type to check
-    if object_type == "address":
-        group_type = "address-group"
-    elif object_type == "service":
-        group_type = "service-group"
-    elif object_type == "application":
-        group_type = "application-group"
 
-    # Get the appropriate group objects if needed
-    groups = {}
-    if group_type:
-        groups = get_objects(tree, group_type, device_type, context_type, version, **kwargs)
+    # Firewall policy types - standard rulebase
+    return [
+        ("security_rules", ["source", "destination", "service"]),
+        ("nat_rules", nat_fields),
+        ("decryption_rules", ["source", "destination", "service"]),
+        ("qos_rules", ["source", "destination", "service"]),
+        ("authentication_rules", ["source", "destination", "service"]),
+        ("pbf_rules", ["source", "destination", "service"]),
+        ("application_override_rules", ["source", "destination", "service"]),
+        ("dos_rules", ["source", "destination"]),
+    ]
 
-    # Track used objects
-    used_objects = set()
 
-    # Define contexts to check
+def _contexts_to_check(
+    tree: etree._ElementTree, device_type: str, context_type: str, kwargs: Dict[str, Any]
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """Get the contexts whose policies and groups can use objects of a context."""
     contexts_to_check = []
 
     if device_type.lower() == "panorama":
@@ -143,10 +90,8 @@ def generate_unused_objects_report_data(
             contexts_to_check.append(("shared", {}))
 
             # 2. All device groups
-            # Find all device groups
             dg_xpath = "/config/devices/entry[@name='localhost.localdomain']/device-group/entry"
-            dg_elements = tree.xpath(dg_xpath)
-            for dg in dg_elements:
+            for dg in tree.xpath(dg_xpath):
                 dg_name = dg.get("name")
                 if dg_name:
                     contexts_to_check.append(("device_group", {"device_group": dg_name}))
@@ -158,94 +103,290 @@ def generate_unused_objects_report_data(
         # For firewall, just check the current context
         contexts_to_check.append((context_type, kwargs))
 
-    # Check each context for usage
-    for ctx_type, ctx_kwargs in contexts_to_check:
+    return contexts_to_check
+
+
+def _context_name(context_type: str, kwargs: Dict[str, Any]) -> Optional[str]:
+    """Get the display name of a context."""
+    if context_type == "device_group" and "device_group" in kwargs:
+        return kwargs["device_group"]
+    if context_type == "vsys" and "vsys" in kwargs:
+        return kwargs["vsys"]
+    if context_type == "shared":
+        return "Shared"
+    return None
+
+
+def _iter_field_values(value: Any, path: str) -> Iterator[Tuple[str, str]]:
+    """Yield every (value, field path) of a policy field, descending into nested fields."""
+    if isinstance(value, str):
+        yield value, path
+    elif isinstance(value, list):
+        for item in value:
+            if isinstance(item, str):
+                yield item, path
+    elif isinstance(value, dict):
+        # Nested fields like source-translation/dynamic-ip-and-port/translated-address
+        for subfield, subvalue in value.items():
+            yield from _iter_field_values(subvalue, f"{path}/{subfield}")
+
+
+def _lookups(index: Optional[ReportIndex]) -> Tuple[Callable, Callable]:
+    if index is not None:
+        return index.get_objects, index.get_policies
+    return _get_objects, _get_policies
+
+
+def _iter_references(
+    tree: etree._ElementTree,
+    device_type: str,
+    context_type: str,
+    version: str,
+    object_type: str,
+    get_objects: Callable,
+    get_policies: Callable,
+    kwargs: Dict[str, Any],
+    contexts: Optional[List[Tuple[str, Dict[str, Any]]]] = None,
+) -> Iterator[Tuple[str, str, str, str, Dict[str, Any], str]]:
+    """
+    Yield every value of the policy and group fields that can reference objects.
+
+    Each item is (value, referenced by, reference type, context type, context
+    parameters, field path). Values are not checked against the defined
+    objects, so they include literals such as "any". The contexts whose
+    policies and groups are read default to those that can use objects of
+    the given context.
+    """
+    group_type = _GROUP_TYPES.get(object_type)
+    if contexts is None:
+        contexts = _contexts_to_check(tree, device_type, context_type, kwargs)
+
+    for ctx_type, ctx_kwargs in contexts:
         # Check policies for this context
-        for policy_type, fields_to_check in policy_types:
+        for policy_type, fields_to_check in _policy_types(device_type):
+            # Get the appropriate fields to check based on object type
+            relevant_fields = _FIELDS_TO_CHECK.get(object_type, fields_to_check)
             try:
-                # Get policies of this type
                 policies = get_policies(
                     tree, policy_type, device_type, ctx_type, version, **ctx_kwargs
                 )
-
-                # Check each policy for object usage
-                for rule_name, rule in policies.items():
-                    # Get the appropriate fields to check based on object type
-                    relevant_fields = fields_to_check_map.get(object_type, fields_to_check)
-
-                    # Check all relevant fields that might contain objects of the specified type
-                    for field in relevant_fields:
-                        if field in rule and isinstance(rule[field], list):
-                            for obj in rule[field]:
-                                used_objects.add(obj)
-                        elif field in rule and isinstance(rule[field], dict):
-                            # Handle nested fields like source-translation or service-translation
-                            for subfield, value in rule[field].items():
-                                if isinstance(value, list):
-                                    for obj in value:
-                                        used_objects.add(obj)
-                                elif isinstance(value, str):
-                                    used_objects.add(value)
-
-                                # Special handling for service objects in service-translation
-                                if object_type == "service" and field == "service-translation":
-                                    # In some cases, the service name could be in the 'translated-service' field
-                                    if subfield == "translated-service" and isinstance(value, str):
-                                        used_objects.add(value)
-                                    # Also check for protocol-specific fields that might reference service objects
-                                    elif subfield in ["tcp", "udp"] and isinstance(value, dict):
-                                        for proto_field, proto_value in value.items():
-                                            if isinstance(proto_value, str):
-                                                used_objects.add(proto_value)
             except Exception as e:
                 # Log but continue if a policy type fails
                 logger.warning(f"Error checking {policy_type} for object usage in {ctx_type}: {e}")
                 continue
 
+            for rule_name, rule in policies.items():
+                for field in relevant_fields:
+                    for obj, path in _iter_field_values(rule.get(field), field):
+                        yield obj, rule_name, policy_type, ctx_type, ctx_kwargs, path
+
         # Check appropriate groups for this context
         if group_type:
             try:
                 ctx_groups = get_objects(
                     tree, group_type, device_type, ctx_type, version, **ctx_kwargs
                 )
-                for group_name, group in ctx_groups.items():
-                    if "static" in group and isinstance(group["static"], list):
-                        for obj in group["static"]:
-                            used_objects.add(obj)
-                    # For service groups, also check "members" field
-                    elif "members" in group and isinstance(group["members"], list):
-                        for obj in group["members"]:
-                            used_objects.add(obj)
             except Exception as e:
                 # Log but continue if group check fails
                 logger.warning(f"Error checking {group_type} for usage in {ctx_type}: {e}")
                 continue
 
-    # Find unused objects
-    unused_objects = []
-    for obj_name in objects:
+            for group_name, group in ctx_groups.items():
+                if "static" in group and isinstance(group["static"], list):
+                    for obj in group["static"]:
+                        yield obj, group_name, group_type, ctx_type, ctx_kwargs, "static"
+                # For service groups, also check "members" field
+                elif "members" in group and isinstance(group["members"], list):
+                    for obj in group["members"]:
+                        yield obj, group_name, group_type, ctx_type, ctx_kwargs, "members"
+
+
+def _iter_unused(
+    objects: Dict[str, Dict[str, Any]],
+    used_objects: Set[str],
+    context_type: str,
+    kwargs: Dict[str, Any],
+) -> Iterator[Dict[str, Any]]:
+    context_name = _context_name(context_type, kwargs)
+    for obj_name, properties in objects.items():
         if obj_name not in used_objects:
-            # Add context information to each object
-            obj_data = {
-                "name": obj_name, 
-                "properties": objects[obj_name],
-                # Add context information
-                "context_type": context_type
+            obj_data = {"name": obj_name, "properties": properties, "context_type": context_type}
+            if context_name is not None:
+                obj_data["context_name"] = context_name
+            yield obj_data
+
+
+def iter_object_references(
+    tree: etree._ElementTree,
+    device_type: str,
+    context_type: str,
+    version: str,
+    object_type: str = "address",
+    index: Optional[ReportIndex] = None,
+    **kwargs,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one row per reference to an object of a type in a context.
+
+    References are found the same way as for the unused objects report, in
+    the policies and groups of every context that can use the objects. Rows
+    are produced as the rulebases are read, so they can be streamed to a
+    file with the CSV or JSON Lines formatters.
+
+    Args:
+        tree: ElementTree containing the configuration
+        device_type: Type of device ("firewall" or "panorama")
+        context_type: Type of context (shared, device_group, vsys)
+        version: PAN-OS version
+        object_type: Type of object (address, service, etc.)
+        index: Shared lookups to reuse across reports (optional)
+        **kwargs: Additional parameters (device_group, vsys)
+
+    Yields:
+        Dict with the object, context, referenced_by, reference_type,
+        reference_context and field of a reference
+    """
+    get_objects, get_policies = _lookups(index)
+    objects = get_objects(tree, object_type, device_type, context_type, version, **kwargs)
+    context_name = _context_name(context_type, kwargs)
+
+    for name, referenced_by, reference_type, ctx_type, ctx_kwargs, field in _iter_references(
+        tree, device_type, context_type, version, object_type, get_objects, get_policies, kwargs
+    ):
+        if name in objects:
+            yield {
+                "object": name,
+                "context": context_name,
+                "referenced_by": referenced_by,
+                "reference_type": reference_type,
+                "reference_context": _context_name(ctx_type, ctx_kwargs),
+                "field": field,
             }
-            
-            # Add specific context details based on type
-            if context_type == "device_group" and "device_group" in kwargs:
-                obj_data["context_name"] = kwargs["device_group"]
-            elif context_type == "vsys" and "vsys" in kwargs:
-                obj_data["context_name"] = kwargs["vsys"]
-            elif context_type == "shared":
-                obj_data["context_name"] = "Shared"
-            
-            unused_objects.append(obj_data)
-
-    report_data["unused_objects"] = unused_objects
+
+
+def iter_unused_objects(
+    tree: etree._ElementTree,
+    device_type: str,
+    context_type: str,
+    version: str,
+    object_type: str = "address",
+    index: Optional[ReportIndex] = None,
+    **kwargs,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the rows of the unused objects report.
+
+    Args:
+        tree: ElementTree containing the configuration
+        device_type: Type of device ("firewall" or "panorama")
+        context_type: Type of context (shared, device_group, vsys)
+        version: PAN-OS version
+        object_type: Type of object to check (address, service, etc.)
+        index: Shared lookups to reuse across reports (optional)
+        **kwargs: Additional parameters (device_group, vsys)
+
+    Yields:
+        Dict with the name, properties and context of an unused object
+    """
+    get_objects, get_policies = _lookups(index)
+    objects = get_objects(tree, object_type, device_type, context_type, version, **kwargs)
+    used_objects = {
+        reference[0]
+        for reference in _iter_references(
+            tree, device_type, context_type, version, object_type, get_objects, get_policies, kwargs
+        )
+    }
+    yield from _iter_unused(objects, used_objects, context_type, kwargs)
+
+
+def generate_unused_objects_report_data(
+    tree: etree._ElementTree,
+    device_type: str,
+    context_type: str,
+    version: str,
+    object_type: str = "address",
+    index: Optional[ReportIndex] = None,
+    **kwargs,
+) -> Dict[str, Any]:
+    """
+    Generate raw data for a report of unused objects.
+
+    Args:
+        tree: ElementTree containing the configuration
+        device_type: Type of device ("firewall" or "panorama")
+        context_type: Type of context (shared, device_group, vsys)
+        version: PAN-OS version
+        object_type: Type of object to check (address, service, etc.)
+        index: Shared lookups to reuse across reports (optional)
+        **kwargs: Additional parameters (device_group, vsys)
+
+    Returns:
+        Dict: Report data
+    """
+    get_objects, get_policies = _lookups(index)
+
+    # Get objects of the specified type in the current context
+    objects = get_objects(tree, object_type, device_type, context_type, version, **kwargs)
+
+    # Track used objects
+    used_objects = {
+        reference[0]
+        for reference in _iter_references(
+            tree, device_type, context_type, version, object_type, get_objects, get_policies, kwargs
+        )
+    }
+
+    unused_objects = list(_iter_unused(objects, used_objects, context_type, kwargs))
     logger.info(
         f"Found {len(unused_objects)} unused {object_type} objects out of {len(objects)} total"
     )
 
-    return report_data
+    return {"unused_objects": unused_objects}
+
+
+def generate_unused_objects_report_data_from_snapshot(
+    snapshot: ConfigSnapshot,
+    context_type: str = "shared",
+    object_type: str = "address",
+    **kwargs,
+) -> Dict[str, Any]:
+    """
+    Generate unused objects report data from a columnar snapshot.
+
+    This produces the same report shape as ``generate_unused_objects_report_data``
+    without reparsing the XML configuration.
+
+    Args:
+        snapshot: Open ConfigSnapshot
+        context_type: Type of context (shared, device_group, vsys)
+        object_type: Type of object to check (address or service)
+        **kwargs: Additional parameters (device_group, vsys)
+
+    Returns:
+        Dict: Report data
+    """
+    context_name = kwargs.get("device_group") or kwargs.get("vsys")
+    rows = snapshot.find_unused_objects(object_type, context_type, context_name)
+
+    unused_objects = []
+    for row in rows:
+        if object_type == "address":
+            properties = {row["kind"]: row["value"]} if row["kind"] else {}
+            if row["description"]:
+                properties["description"] = row["description"]
+        else:
+            properties = {"protocol": {row["protocol"]: {"port": row["port"]}}}
+            if row["source_port"]:
+                properties["protocol"][row["protocol"]]["source-port"] = row["source_port"]
+
+        unused_objects.append(
+            {
+                "name": row["name"],
+                "properties": properties,
+                "context_type": context_type,
+                "context_name": row["context_name"] or "Shared",
+            }
+        )
+
+    logger.info(f"Found {len(unused_objects)} unused {object_type} objects in snapshot")
+    return {"unused_objects": unused_objects}
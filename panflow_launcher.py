@@ -11,9 +11,15 @@ import os
 # Make sure we can import from the panflow package
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Help and version output is printed from the help manifest without loading the CLI
+from panflow.core.help_manifest import run_help
+
+if run_help(sys.argv[1:]):
+    sys.exit(0)
+
 # Import main CLI app
 from panflow.cli import app
 
 if __name__ == "__main__":
     # Run the CLI app
-    app()
\ No newline at end of file
+    app()
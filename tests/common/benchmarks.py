@@ -5,22 +5,22 @@ This module provides tools for measuring and tracking performance
 to ensure refactoring doesn't introduce performance regressions.
 """
 
-import time
 import functools
-import statistics
-from typing import Callable, Dict, List, Any, Optional, Tuple
-from pathlib import Path
 import json
 import os
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 class PerformanceBenchmark:
     """Class for tracking performance benchmarks."""
-    
+
     def __init__(self, name: str, baseline_file: Optional[str] = None):
         """
         Initialize a performance benchmark.
-        
+
         Args:
             name: Name of the benchmark suite
             baseline_file: Path to baseline performance data
@@ -29,20 +29,20 @@ class PerformanceBenchmark:
         self.results: Dict[str, List[float]] = {}
         self.baseline_file = baseline_file
         self.baseline_data: Dict[str, Dict[str, float]] = {}
-        
+
         if baseline_file and Path(baseline_file).exists():
             self.load_baseline()
-    
+
     def load_baseline(self):
         """Load baseline performance data."""
-        with open(self.baseline_file, 'r') as f:
+        with open(self.baseline_file, "r") as f:
             self.baseline_data = json.load(f)
-    
+
     def save_baseline(self):
         """Save current results as baseline."""
         if not self.baseline_file:
             return
-        
+
         baseline = {}
         for test_name, times in self.results.items():
             baseline[test_name] = {
@@ -51,50 +51,44 @@ class PerformanceBenchmark:
                 "stdev": statistics.stdev(times) if len(times) > 1 else 0,
                 "min": min(times),
                 "max": max(times),
-                "samples": len(times)
+                "samples": len(times),
             }
-        
+
         os.makedirs(os.path.dirname(self.baseline_file), exist_ok=True)
-        with open(self.baseline_file, 'w') as f:
+        with open(self.baseline_file, "w") as f:
             json.dump(baseline, f, indent=2)
-    
+
     def measure(self, test_name: str, func: Callable, *args, **kwargs) -> Tuple[Any, float]:
         """
         Measure the execution time of a function.
-        
+
         Args:
             test_name: Name of the test
             func: Function to measure
             *args: Positional arguments for func
             **kwargs: Keyword arguments for func
-            
+
         Returns:
             Tuple of (result, execution_time)
         """
         start = time.perf_counter()
         result = func(*args, **kwargs)
         end = time.perf_counter()
-        
+
         execution_time = end - start
-        
+
         if test_name not in self.results:
             self.results[test_name] = []
         self.results[test_name].append(execution_time)
-        
+
         return result, execution_time
-    
+
     def measure_repeated(
-        self,
-        test_name: str,
-        func: Callable,
-        iterations: int = 10,
-        warmup: int = 2,
-        *args,
-        **kwargs
+        self, test_name: str, func: Callable, iterations: int = 10, warmup: int = 2, *args, **kwargs
     ) -> Dict[str, float]:
         """
         Measure a function multiple times for statistical accuracy.
-        
+
         Args:
             test_name: Name of the test
             func: Function to measure
@@ -102,65 +96,61 @@ class PerformanceBenchmark:
             warmup: Number of warmup iterations
             *args: Positional arguments for func
             **kwargs: Keyword arguments for func
-            
+
         Returns:
             Dictionary with statistical measurements
         """
         # Warmup iterations
         for _ in range(warmup):
             func(*args, **kwargs)
-        
+
         # Actual measurements
         times = []
         for _ in range(iterations):
             _, exec_time = self.measure(test_name, func, *args, **kwargs)
             times.append(exec_time)
-        
+
         return {
             "mean": statistics.mean(times),
             "median": statistics.median(times),
             "stdev": statistics.stdev(times) if len(times) > 1 else 0,
             "min": min(times),
             "max": max(times),
-            "iterations": iterations
+            "iterations": iterations,
         }
-    
+
     def compare_to_baseline(self, test_name: str) -> Optional[Dict[str, Any]]:
         """
         Compare current results to baseline.
-        
+
         Args:
             test_name: Name of the test to compare
-            
+
         Returns:
             Comparison results or None if no baseline
         """
         if test_name not in self.results or test_name not in self.baseline_data:
             return None
-        
+
         current_times = self.results[test_name]
         baseline = self.baseline_data[test_name]
-        
+
         current_mean = statistics.mean(current_times)
         baseline_mean = baseline["mean"]
-        
+
         return {
             "current_mean": current_mean,
             "baseline_mean": baseline_mean,
             "difference": current_mean - baseline_mean,
             "percent_change": ((current_mean - baseline_mean) / baseline_mean) * 100,
             "regression": current_mean > baseline_mean * 1.1,  # 10% threshold
-            "improvement": current_mean < baseline_mean * 0.9
+            "improvement": current_mean < baseline_mean * 0.9,
         }
-    
+
     def generate_report(self) -> str:
         """Generate a performance report."""
-        report_lines = [
-            f"Performance Benchmark Report: {self.name}",
-            "=" * 50,
-            ""
-        ]
-        
+        report_lines = [f"Performance Benchmark Report: {self.name}", "=" * 50, ""]
+
         for test_name, times in self.results.items():
             report_lines.append(f"Test: {test_name}")
             report_lines.append(f"  Samples: {len(times)}")
@@ -170,122 +160,122 @@ class PerformanceBenchmark:
                 report_lines.append(f"  Std Dev: {statistics.stdev(times):.4f}s")
             report_lines.append(f"  Min: {min(times):.4f}s")
             report_lines.append(f"  Max: {max(times):.4f}s")
-            
+
             # Compare to baseline if available
             comparison = self.compare_to_baseline(test_name)
             if comparison:
                 report_lines.append("  Baseline Comparison:")
                 report_lines.append(f"    Baseline: {comparison['baseline_mean']:.4f}s")
                 report_lines.append(f"    Change: {comparison['percent_change']:+.1f}%")
-                if comparison['regression']:
+                if comparison["regression"]:
                     report_lines.append("    ⚠️  PERFORMANCE REGRESSION DETECTED")
-                elif comparison['improvement']:
+                elif comparison["improvement"]:
                     report_lines.append("    ✅ Performance improved")
-            
+
             report_lines.append("")
-        
+
         return "\n".join(report_lines)
 
+    def print_report(self):
+        """Print the performance report below the test's progress output."""
+        print("\n" + self.generate_report())
+
 
 def benchmark(name: Optional[str] = None, iterations: int = 1):
     """
     Decorator for benchmarking functions.
-    
+
     Args:
         name: Optional name for the benchmark
         iterations: Number of times to run the function
     """
+
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             test_name = name or func.__name__
-            
+
             # Get or create benchmark instance
-            benchmark_instance = getattr(
-                wrapper, '_benchmark',
-                PerformanceBenchmark(test_name)
-            )
-            
+            benchmark_instance = getattr(wrapper, "_benchmark", PerformanceBenchmark(test_name))
+
             if iterations > 1:
                 stats = benchmark_instance.measure_repeated(
                     test_name, func, iterations, 0, *args, **kwargs
                 )
                 result = func(*args, **kwargs)  # Run once more for the result
-                
+
                 # Print summary
                 print(f"\nBenchmark: {test_name}")
                 print(f"  Mean: {stats['mean']:.4f}s")
                 print(f"  Median: {stats['median']:.4f}s")
-                
+
                 return result
             else:
-                result, exec_time = benchmark_instance.measure(
-                    test_name, func, *args, **kwargs
-                )
+                result, exec_time = benchmark_instance.measure(test_name, func, *args, **kwargs)
                 print(f"\nBenchmark: {test_name} - {exec_time:.4f}s")
                 return result
-        
+
         wrapper._benchmark = PerformanceBenchmark(name or func.__name__)
         return wrapper
-    
+
     return decorator
 
 
 def track_performance(baseline_file: str):
     """
     Class decorator for tracking performance of test methods.
-    
+
     Args:
         baseline_file: Path to baseline performance data
     """
+
     def decorator(cls):
         original_setUp = cls.setUp
         original_tearDown = cls.tearDown
-        
+
         def new_setUp(self):
             self._benchmark = PerformanceBenchmark(cls.__name__, baseline_file)
-            if hasattr(original_setUp, '__func__'):
+            if hasattr(original_setUp, "__func__"):
                 original_setUp(self)
-        
+
         def new_tearDown(self):
             # Generate and print report
             report = self._benchmark.generate_report()
             print("\n" + report)
-            
+
             # Check for regressions
             regressions = []
             for test_name in self._benchmark.results:
                 comparison = self._benchmark.compare_to_baseline(test_name)
-                if comparison and comparison['regression']:
+                if comparison and comparison["regression"]:
                     regressions.append(test_name)
-            
+
             if regressions:
                 print(f"\n⚠️  Performance regressions detected in: {', '.join(regressions)}")
-            
-            if hasattr(original_tearDown, '__func__'):
+
+            if hasattr(original_tearDown, "__func__"):
                 original_tearDown(self)
-        
+
         cls.setUp = new_setUp
         cls.tearDown = new_tearDown
-        
+
         # Wrap test methods
         for attr_name in dir(cls):
-            if attr_name.startswith('test_'):
+            if attr_name.startswith("test_"):
                 attr = getattr(cls, attr_name)
                 if callable(attr):
                     wrapped = performance_wrapper(attr)
                     setattr(cls, attr_name, wrapped)
-        
+
         return cls
-    
+
     def performance_wrapper(method):
         @functools.wraps(method)
         def wrapper(self, *args, **kwargs):
-            return self._benchmark.measure(
-                method.__name__, method, self, *args, **kwargs
-            )[0]
+            return self._benchmark.measure(method.__name__, method, self, *args, **kwargs)[0]
+
         return wrapper
-    
+
     return decorator
 
 
@@ -294,43 +284,44 @@ def measure_import_time(module_name: str) -> float:
     """Measure the import time of a module."""
     import importlib
     import sys
-    
+
     # Remove from sys.modules if already imported
     if module_name in sys.modules:
         del sys.modules[module_name]
-    
+
     start = time.perf_counter()
     importlib.import_module(module_name)
     end = time.perf_counter()
-    
+
     return end - start
 
 
 def measure_memory_usage(func: Callable, *args, **kwargs) -> Tuple[Any, Dict[str, float]]:
     """
     Measure memory usage of a function.
-    
+
     Note: Requires psutil to be installed.
     """
     try:
-        import psutil
         import os
-        
+
+        import psutil
+
         process = psutil.Process(os.getpid())
-        
+
         # Get initial memory
         initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-        
+
         # Run function
         result = func(*args, **kwargs)
-        
+
         # Get final memory
         final_memory = process.memory_info().rss / 1024 / 1024  # MB
-        
+
         return result, {
             "initial_mb": initial_memory,
             "final_mb": final_memory,
-            "used_mb": final_memory - initial_memory
+            "used_mb": final_memory - initial_memory,
         }
     except ImportError:
         # psutil not available
@@ -338,30 +329,296 @@ def measure_memory_usage(func: Callable, *args, **kwargs) -> Tuple[Any, Dict[str
         return result, {"error": "psutil not installed"}
 
 
+# Entry points whose start-up is benchmarked: name -> interpreter arguments
+ENTRY_POINTS: Dict[str, List[str]] = {
+    "import panflow": ["-c", "import panflow"],
+    "panflow.cli:app": ["-c", "from panflow.cli import app; app(['--help'], prog_name='panflow')"],
+    "optimized_launcher.py": ["optimized_launcher.py", "--help"],
+    "completion_aware_launcher.py": ["completion_aware_launcher.py", "--help"],
+}
+
+# Standard library imports timed next to every entry point, so baselines
+# recorded on another machine can be scaled to this one
+REFERENCE_ARGS = ["-c", "import json, logging, typing, xml.etree.ElementTree"]
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+STARTUP_BASELINE_FILE = str(PROJECT_ROOT / "tests" / "performance_baselines" / "startup.json")
+
+
+class ImportProfile:
+    """Import times of one interpreter run, parsed from ``-X importtime`` output."""
+
+    def __init__(self, stderr: str):
+        """
+        Parse the import time tree written to stderr.
+
+        Args:
+            stderr: Standard error of an interpreter run with ``-X importtime``
+        """
+        # Module -> own import time and time including its imports, in seconds
+        self.self_times: Dict[str, float] = {}
+        self.cumulative_times: Dict[str, float] = {}
+        # Module -> module whose import imported it
+        self.parents: Dict[str, str] = {}
+
+        entries = []
+        for line in stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+            depth = (len(name) - len(name.lstrip())) // 2
+            entries.append((depth, name.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6))
+
+        # Imports are listed after the modules they import, one level deeper
+        pending: Dict[int, List[str]] = {}
+        for depth, name, self_time, cumulative_time in entries:
+            self.self_times[name] = self.self_times.get(name, 0.0) + self_time
+            self.cumulative_times[name] = max(self.cumulative_times.get(name, 0.0), cumulative_time)
+            for child in pending.pop(depth + 1, []):
+                self.parents[child] = name
+            pending.setdefault(depth, []).append(name)
+
+    @property
+    def total(self) -> float:
+        """Total import time of the run in seconds."""
+        return sum(self.self_times.values())
+
+    def top(self, count: int = 10) -> List[Tuple[str, float]]:
+        """Get the modules with the largest own import times."""
+        return sorted(self.self_times.items(), key=lambda item: item[1], reverse=True)[:count]
+
+
+class StartupBenchmark(PerformanceBenchmark):
+    """
+    Benchmark for the start-up of PANFlow entry points.
+
+    Each entry point runs in fresh interpreters with ``-X importtime``. The
+    first run starts from an empty bytecode cache (cold start), the following
+    runs reuse the bytecode it wrote (warm start). Wall times are recorded as
+    ``"<entry> [cold]"`` and ``"<entry> [warm]"`` and import times as
+    ``"<entry> [imports]"``. Every warm start is paired with a run importing
+    only standard library modules, and the ratio of their import times is
+    recorded as ``"<entry> [relative]"``; :meth:`save_baseline` keeps the
+    import times alone, and :meth:`check_import_regressions` compares the
+    ratios, which do not depend on the speed of the machine.
+    """
+
+    def __init__(
+        self,
+        baseline_file: Optional[str] = STARTUP_BASELINE_FILE,
+        entry_points: Optional[Dict[str, List[str]]] = None,
+    ):
+        """
+        Initialize the start-up benchmark.
+
+        Args:
+            baseline_file: Path to baseline performance data
+            entry_points: Entry points to measure (defaults to ENTRY_POINTS)
+        """
+        super().__init__("startup", baseline_file)
+        self.entry_points = entry_points or ENTRY_POINTS
+        self.profiles: Dict[str, ImportProfile] = {}
+        # Entry point -> reference run paired with its median warm start
+        self.references: Dict[str, ImportProfile] = {}
+
+    def run(self, arguments: List[str], env: Dict[str, str]) -> Tuple[float, ImportProfile]:
+        """
+        Start an interpreter once.
+
+        Args:
+            arguments: Interpreter arguments of the entry point
+            env: Environment of the interpreter
+
+        Returns:
+            Tuple of (wall time, import profile)
+        """
+        import subprocess
+        import sys
+
+        command = [sys.executable, "-X", "importtime", *arguments]
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            raise RuntimeError(f"{arguments} exited with {result.returncode}: {result.stderr}")
+        return elapsed, ImportProfile(result.stderr)
+
+    def profile(self, entry: str, runs: int = 5) -> ImportProfile:
+        """
+        Measure the cold and warm start of an entry point.
+
+        Args:
+            entry: Name of the entry point
+            runs: Number of warm starts
+
+        Returns:
+            Import profile of the warm start with the median import time
+        """
+        import tempfile
+
+        arguments = self.entry_points[entry]
+        with tempfile.TemporaryDirectory() as pycache:
+            # The first runs write the bytecode the warm starts read
+            env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache)
+            env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+            elapsed, _ = self.run(arguments, env)
+            self.results.setdefault(f"{entry} [cold]", []).append(elapsed)
+            self.run(REFERENCE_ARGS, env)
+
+            pairs = []
+            for _ in range(runs):
+                elapsed, profile = self.run(arguments, env)
+                _, reference = self.run(REFERENCE_ARGS, env)
+                self.results.setdefault(f"{entry} [warm]", []).append(elapsed)
+                self.results.setdefault(f"{entry} [imports]", []).append(profile.total)
+                self.results.setdefault(f"{entry} [relative]", []).append(
+                    profile.total / reference.total
+                )
+                pairs.append((profile, reference))
+
+        pairs.sort(key=lambda pair: pair[0].total / pair[1].total)
+        self.profiles[entry], self.references[entry] = pairs[len(pairs) // 2]
+        return self.profiles[entry]
+
+    def profile_all(self, runs: int = 5) -> Dict[str, ImportProfile]:
+        """Measure the cold and warm start of every entry point."""
+        for entry in self.entry_points:
+            self.profile(entry, runs)
+        return self.profiles
+
+    def save_baseline(self):
+        """Save the import times of the entry points as baseline."""
+        if not self.baseline_file:
+            return
+
+        self.baseline_data = {
+            name: {
+                "mean": round(statistics.mean(times), 6),
+                "median": round(statistics.median(times), 6),
+                "samples": len(times),
+            }
+            for name, times in self.results.items()
+            if name.endswith((" [imports]", " [relative]"))
+        }
+        os.makedirs(os.path.dirname(self.baseline_file), exist_ok=True)
+        with open(self.baseline_file, "w") as f:
+            json.dump(self.baseline_data, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    def check_import_regressions(
+        self, threshold: float = 0.25, min_increase: float = 0.01, count: int = 10
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Find entry points whose import cost grew past a threshold.
+
+        The expected import time is the baseline ratio to the standard library
+        reference run times the reference run paired with the current start,
+        so a uniformly slower or faster machine does not count as a regression.
+
+        Args:
+            threshold: Allowed growth of the import time, as a fraction
+            min_increase: Growth in seconds below which nothing is reported
+            count: Number of responsible modules to report per entry point
+
+        Returns:
+            Regressions keyed by entry point, with the expected and current
+            import time and the modules responsible
+        """
+        regressions = {}
+        for entry, profile in self.profiles.items():
+            ratio = self.baseline_data.get(f"{entry} [relative]", {}).get("median")
+            reference = self.references.get(entry)
+            if not ratio or not reference:
+                continue
+
+            expected = ratio * reference.total
+            increase = profile.total - expected
+            if profile.total <= expected * (1 + threshold) or increase < min_increase:
+                continue
+
+            # The baseline keeps no module times; the largest imports the
+            # reference run does not share are the likely culprits
+            modules = sorted(
+                (
+                    (module, self_time)
+                    for module, self_time in profile.self_times.items()
+                    if module not in reference.self_times
+                ),
+                key=lambda item: item[1],
+                reverse=True,
+            )[:count]
+            regressions[entry] = {
+                "expected": expected,
+                "current": profile.total,
+                "modules": [
+                    {
+                        "module": module,
+                        "time": self_time,
+                        "imported_by": profile.parents.get(module),
+                    }
+                    for module, self_time in modules
+                ],
+            }
+        return regressions
+
+    def generate_import_report(self, regressions: Dict[str, Dict[str, Any]]) -> str:
+        """
+        Generate a report of import time regressions.
+
+        Args:
+            regressions: Result of check_import_regressions()
+
+        Returns:
+            Report naming the largest imports of each regressed entry point
+        """
+        report_lines = []
+        for entry, regression in regressions.items():
+            report_lines.append(
+                f"{entry}: imports take {regression['current'] * 1000:.1f}ms, "
+                f"expected {regression['expected'] * 1000:.1f}ms"
+            )
+            for module in regression["modules"]:
+                report_lines.append(
+                    f"  {module['time'] * 1000:.1f}ms {module['module']} "
+                    f"(imported by {module['imported_by'] or 'the entry point'})"
+                )
+        return "\n".join(report_lines)
+
+
 class PerformanceBaseline:
     """Manage performance baselines for the entire test suite."""
-    
+
     def __init__(self, baseline_dir: str = "tests/performance_baselines"):
         """Initialize baseline manager."""
         self.baseline_dir = Path(baseline_dir)
         self.baseline_dir.mkdir(parents=True, exist_ok=True)
-    
+
     def get_baseline_file(self, test_name: str) -> str:
         """Get the baseline file path for a test."""
         return str(self.baseline_dir / f"{test_name}.json")
-    
+
     def update_all_baselines(self):
         """Update all baseline files with current performance data."""
         # This would be called after confirming performance is acceptable
         pass
-    
+
     def check_all_regressions(self) -> List[str]:
         """Check all tests for performance regressions."""
         regressions = []
-        
+
         for baseline_file in self.baseline_dir.glob("*.json"):
             test_name = baseline_file.stem
             # Load and check each baseline
             # Add to regressions if threshold exceeded
-        
-        return regressions
\ No newline at end of file
+
+        return regressions
+
+
+if __name__ == "__main__":
+    # Record the start-up baseline: python -m tests.common.benchmarks
+    startup = StartupBenchmark()
+    startup.profile_all()
+    startup.save_baseline()
+    print(startup.generate_report())
@@ -0,0 +1,69 @@
+"""
+Tests for the help manifest the launchers serve --help and --version from.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tomllib
+
+import panflow
+from panflow.core.help_manifest import HELP_MANIFEST_PATH, load_help_manifest, lookup_help
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+
+def _run(code):
+    """Run Python code in a fresh interpreter and return its standard output."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+def test_help_manifest_matches_the_app():
+    """Test that the help manifest matches the help rendered by the live app."""
+    with open(HELP_MANIFEST_PATH, encoding="utf-8") as f:
+        manifest = json.load(f)
+    # Built in a fresh interpreter, unaffected by commands other tests register
+    stdout = _run(
+        "import json; from panflow.cli.registry import build_help_manifest; "
+        "print(json.dumps(build_help_manifest()))"
+    )
+    assert manifest == json.loads(stdout), "Regenerate with: python -m panflow.cli.registry"
+
+
+def test_version_matches_pyproject():
+    """Test that the package version and the --version output follow pyproject.toml."""
+    with open(os.path.join(PROJECT_ROOT, "pyproject.toml"), "rb") as f:
+        version = tomllib.load(f)["tool"]["poetry"]["version"]
+    assert panflow.__version__ == version
+    assert load_help_manifest()["version_output"] == f"PANFlow v{version}\n"
+
+
+def test_lookup_help_covers_only_help_and_version():
+    """Test which command lines are answered from the manifest."""
+    manifest = load_help_manifest()
+    pages = manifest["pages"]
+    assert lookup_help([], manifest) == pages[""]["help"]
+    assert lookup_help(["--help"], manifest) == pages[""]["help"]
+    assert lookup_help(["-V"], manifest) == manifest["version_output"]
+    assert lookup_help(["policy", "nat", "--help"], manifest) == pages["policy nat"]["help"]
+    assert lookup_help(["object"], manifest) == pages["object"]["help"]
+    # Commands, options before the command and unknown groups go to the CLI
+    assert lookup_help(["object", "list", "--help"], manifest) is None
+    assert lookup_help(["-v", "object", "--help"], manifest) is None
+    assert lookup_help(["nothing", "--help"], manifest) is None
+
+
+def test_run_help_does_not_import_the_cli():
+    """Test that help is printed without importing the CLI."""
+    stdout = _run(
+        "import sys\n"
+        "from panflow.core.help_manifest import run_help\n"
+        "assert run_help(['object', '--help'])\n"
+        "assert not [m for m in sys.modules if m.startswith('panflow.cli')]\n"
+    )
+    assert stdout == load_help_manifest()["pages"]["object"]["help"]
+    assert " Usage: panflow object [OPTIONS] COMMAND [ARGS]..." in stdout
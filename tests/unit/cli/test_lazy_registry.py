@@ -0,0 +1,94 @@
+"""
+Tests for the lazy command registry of the panflow CLI.
+"""
+
+import json
+import subprocess
+import sys
+
+import typer
+from typer.testing import CliRunner
+
+from panflow.cli.app import app
+from panflow.cli.registry import COMMANDS, MANIFEST_PATH
+from tests.common.benchmarks import ImportProfile
+
+# Budget for importing the CLI on top of the panflow package, in milliseconds.
+# Importing every command module took about 250ms more than this before the
+# registry; the budget leaves room for slow CI machines.
+STARTUP_BUDGET_MS = 400
+
+
+def _run(code):
+    """Run Python code in a fresh interpreter and return its output."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout, result.stderr
+
+
+def _loaded_command_modules(args):
+    """Get the command modules imported to run the CLI with the given arguments."""
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from panflow.cli import app\n"
+        f"result = CliRunner().invoke(app, {args!r})\n"
+        "assert result.exit_code == 0, result.output\n"
+        "print(sorted(m for m in sys.modules if m.startswith('panflow.cli.commands.')))\n"
+    )
+    stdout, _ = _run(code)
+    return set(eval(stdout.strip().splitlines()[-1]))
+
+
+def test_manifest_is_up_to_date():
+    """Test that the generated manifest matches the declared commands."""
+    with open(MANIFEST_PATH, encoding="utf-8") as f:
+        manifest = json.load(f)
+    # Built in a fresh interpreter, unaffected by commands other tests register
+    stdout, _ = _run(
+        "import json; from panflow.cli.registry import build_manifest; "
+        "print(json.dumps(build_manifest()))"
+    )
+    assert manifest == json.loads(stdout), "Regenerate with: python -m panflow.cli.registry"
+
+
+def test_help_does_not_import_command_modules():
+    """Test that only the dispatched command's modules are imported."""
+    assert _loaded_command_modules(["--help"]) == set()
+    assert _loaded_command_modules(["object", "--help"]) == {"panflow.cli.commands.object_commands"}
+    assert _loaded_command_modules(["policy", "nat", "--help"]) == {
+        "panflow.cli.commands.policy_commands",
+        "panflow.cli.commands.nat_commands",
+    }
+
+
+def test_commands_are_dispatched():
+    """Test the top-level help and dispatch to lazily loaded commands."""
+    runner = CliRunner()
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    for name in COMMANDS:
+        assert (name in result.output) != name.startswith("__")
+
+    result = runner.invoke(app, ["deduplicate", "--help"])
+    assert result.exit_code == 0
+    assert "Find and merge duplicate objects" in result.output
+
+    result = runner.invoke(app, ["batch", "--help"])
+    assert result.exit_code == 0
+    assert "--pipeline" in result.output
+    assert "--install-completion" not in result.output
+
+    group = typer.main.get_command(app)
+    assert group.list_commands(None) == sorted(COMMANDS)
+
+
+def test_cli_startup_budget():
+    """Time importing the CLI with python -X importtime."""
+    _, stderr = _run("import panflow; import panflow.cli")
+    profile = ImportProfile(stderr)
+
+    startup = profile.cumulative_times["panflow.cli"] * 1000
+    assert "panflow.cli.commands.nlq_commands" not in profile.self_times
+    assert startup < STARTUP_BUDGET_MS, f"panflow.cli imported in {startup:.0f}ms"
@@ -0,0 +1,92 @@
+"""
+Tests for the start-up cost of the PANFlow entry points.
+
+The baseline is recorded with ``python -m tests.common.benchmarks``; record it
+again after a change that is meant to alter what the entry points import.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tests.common.benchmarks import STARTUP_BASELINE_FILE, ImportProfile, StartupBenchmark
+
+
+def _importtime(*modules):
+    """Build -X importtime output for (depth, name, self_us, cumulative_us) tuples."""
+    lines = ["import time: self [us] | cumulative | imported package"]
+    for depth, name, self_us, cumulative_us in modules:
+        lines.append(f"import time: {self_us:>9} | {cumulative_us:>10} | {'  ' * depth}{name}")
+    return "\n".join(lines)
+
+
+@pytest.mark.skipif(not Path(STARTUP_BASELINE_FILE).exists(), reason="no start-up baseline")
+def test_entry_point_import_budget():
+    """Test that no entry point imports much more than its baseline."""
+    startup = StartupBenchmark()
+    startup.profile_all(runs=3)
+    regressions = startup.check_import_regressions()
+    assert not regressions, startup.generate_import_report(regressions)
+
+
+def test_import_regressions_name_responsible_modules():
+    """Test that a grown import cost is reported with the modules responsible."""
+    startup = StartupBenchmark(baseline_file=None, entry_points={"import panflow": []})
+    startup.baseline_data = {"import panflow [relative]": {"median": 8 / 3}}
+    # Twice as slow a machine, plus a new heavy import below panflow
+    startup.references = {
+        "import panflow": ImportProfile(
+            _importtime((1, "json.decoder", 4000, 4000), (0, "json", 2000, 6000))
+        )
+    }
+    startup.profiles = {
+        "import panflow": ImportProfile(
+            _importtime(
+                (1, "json.decoder", 4000, 4000),
+                (0, "json", 2000, 6000),
+                (1, "networkx", 60000, 60000),
+                (0, "panflow", 10000, 70000),
+            )
+        )
+    }
+    assert startup.profiles["import panflow"].parents == {
+        "json.decoder": "json",
+        "networkx": "panflow",
+    }
+    regressions = startup.check_import_regressions(count=1)
+
+    assert regressions["import panflow"]["expected"] == pytest.approx(0.016)
+    assert regressions["import panflow"]["modules"] == [
+        {"module": "networkx", "time": 0.06, "imported_by": "panflow"}
+    ]
+    report = startup.generate_import_report(regressions)
+    assert "60.0ms networkx (imported by panflow)" in report
+
+    # The slower machine alone is not a regression
+    startup.profiles["import panflow"] = ImportProfile(
+        _importtime(
+            (1, "json.decoder", 4000, 4000), (0, "json", 2000, 6000), (0, "panflow", 10000, 10000)
+        )
+    )
+    assert startup.check_import_regressions() == {}
+
+
+def test_startup_baseline_keeps_import_times_only(tmp_path):
+    """Test that the saved baseline holds one import total per entry point."""
+    baseline_file = tmp_path / "startup.json"
+    startup = StartupBenchmark(
+        baseline_file=str(baseline_file), entry_points={"import panflow": []}
+    )
+    startup.results = {
+        "import panflow [cold]": [0.5],
+        "import panflow [warm]": [0.1, 0.12],
+        "import panflow [imports]": [0.02, 0.03, 0.025],
+        "import panflow [relative]": [2.0, 2.5, 3.0],
+    }
+    startup.save_baseline()
+
+    assert json.loads(baseline_file.read_text()) == {
+        "import panflow [imports]": {"mean": 0.025, "median": 0.025, "samples": 3},
+        "import panflow [relative]": {"mean": 2.5, "median": 2.5, "samples": 3},
+    }
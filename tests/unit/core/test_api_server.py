@@ -0,0 +1,230 @@
+"""
+Tests for the local HTTP/JSON API.
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+from lxml import etree
+
+from panflow.core.api_server import APIError, APIServer, PANFlowAPI, load_token
+
+
+def _config_tree(address_count, rule_count=0):
+    """Build a firewall configuration with host-N addresses and rule-N rules."""
+    addresses = "".join(
+        f'<entry name="host-{i}"><ip-netmask>10.0.{i % 10}.1/32</ip-netmask></entry>'
+        for i in range(address_count)
+    )
+    rules = "".join(
+        f'<entry name="rule-{i}"><source><member>host-{i}</member></source>'
+        "<action>allow</action></entry>"
+        for i in range(rule_count)
+    )
+    return etree.ElementTree(
+        etree.fromstring(
+            '<config version="10.1.0"><devices><entry name="localhost.localdomain"><vsys>'
+            f'<entry name="vsys1"><address>{addresses}</address>'
+            f"<rulebase><security><rules>{rules}</rules></security></rulebase>"
+            "</entry></vsys></entry></devices></config>"
+        )
+    )
+
+
+VSYS = {"context_type": "vsys", "vsys": "vsys1"}
+
+TOKEN = "test-token"
+
+HEADERS = {
+    "Host": "localhost",
+    "Authorization": f"Bearer {TOKEN}",
+    "Content-Type": "application/json",
+}
+
+
+async def _request(port, method, path, body=None, headers=HEADERS):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    data = json.dumps(body).encode() if body is not None else b""
+    head = f"{method} {path} HTTP/1.1\r\nContent-Length: {len(data)}\r\n"
+    head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+    writer.write(f"{head}\r\n".encode() + data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload)
+
+
+async def _serve(scenario):
+    server = APIServer(PANFlowAPI(save=False), port=0, token=TOKEN)
+    await server.start()
+    serving = asyncio.ensure_future(server.serve())
+    try:
+        return await scenario(server.port)
+    finally:
+        serving.cancel()
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "firewall.xml"
+    _config_tree(30, rule_count=5).write(str(path))
+    return str(path)
+
+
+def test_concurrent_reads_are_coalesced(config_file):
+    """Test that identical concurrent reads share one execution."""
+
+    async def scenario():
+        api = PANFlowAPI(workers=4)
+        request = {"config": config_file, "object_type": "address", **VSYS}
+        responses = await asyncio.gather(
+            *(api.call("get_objects", dict(request)) for _ in range(8))
+        )
+        duplicates = await api.call(
+            "find_duplicates", {"config": config_file, "object_type": "address"}
+        )
+        api.close()
+        return api, responses, duplicates
+
+    api, responses, duplicates = asyncio.run(scenario())
+    assert all(response == responses[0] for response in responses)
+    assert responses[0]["revision"] == 1
+    assert len(responses[0]["result"]) == 30
+    assert api.stats["executed"] + api.stats["coalesced"] == 9
+    assert api.stats["coalesced"] >= 1
+    assert duplicates["result"]
+
+
+def test_writes_are_serialized_and_versioned(config_file):
+    """Test queued writes, optimistic versioning and saving the configuration."""
+
+    async def scenario():
+        api = PANFlowAPI()
+        addresses = {"config": config_file, "object_type": "address", **VSYS}
+        before = await api.call("get_objects", addresses)
+        writes = [
+            api.call(
+                "update_object",
+                {
+                    "config": config_file,
+                    "object_type": "address",
+                    "name": f"host-{i}",
+                    "properties": {"description": f"updated {i}"},
+                    "expected_revision": 1 if i == 0 else None,
+                    **VSYS,
+                },
+            )
+            for i in range(3)
+        ]
+        results = await asyncio.gather(*writes)
+        with pytest.raises(APIError) as conflict:
+            await api.call("delete_object", {**addresses, "name": "host-5", "expected_revision": 1})
+        after = await api.call("get_objects", addresses)
+        api.close()
+        return before, results, conflict.value, after
+
+    before, results, conflict, after = asyncio.run(scenario())
+    assert [result["revision"] for result in results] == [2, 3, 4]
+    assert conflict.status == 409
+    assert "description" not in before["result"]["host-1"]
+    assert after["revision"] == 4
+    assert after["result"]["host-1"]["description"] == "updated 1"
+    assert len(after["result"]) == 30
+
+    saved = etree.parse(config_file)
+    assert saved.findtext(".//address/entry[@name='host-2']/description") == "updated 2"
+
+
+def test_clients_cannot_enable_saving(config_file):
+    """Test that the save parameter can only turn saving off."""
+    original = open(config_file, "rb").read()
+    update = {
+        "config": config_file,
+        "object_type": "address",
+        "name": "host-1",
+        "properties": {"description": "changed"},
+        **VSYS,
+    }
+
+    async def scenario(api, save):
+        result = await api.call("update_object", {**update, "save": save})
+        api.close()
+        return result
+
+    # A server started without saving never writes the file
+    assert asyncio.run(scenario(PANFlowAPI(save=False), True))["revision"] == 2
+    assert open(config_file, "rb").read() == original
+
+    # A client may keep a write in memory on a saving server
+    assert asyncio.run(scenario(PANFlowAPI(), False))["revision"] == 2
+    assert open(config_file, "rb").read() == original
+
+
+def test_http_requests(config_file):
+    """Test the HTTP front end, including errors."""
+
+    async def scenario(port):
+        policies = {"config": config_file, "policy_type": "security_rules", **VSYS}
+        query = {"config": config_file, "query": "MATCH (a:address) RETURN a.name", **VSYS}
+        responses = await asyncio.gather(
+            _request(port, "POST", "/v1/get_policies", policies),
+            _request(port, "POST", "/v1/query", query),
+            _request(port, "POST", "/v1/get_objects", {"config": config_file}),
+            _request(port, "POST", "/v1/explode", {"config": config_file}),
+        )
+        return responses + [await _request(port, "GET", "/v1/status")]
+
+    policies, query, missing, unknown, status = asyncio.run(_serve(scenario))
+    assert policies[0] == 200 and len(policies[1]["result"]) == 5
+    assert query[0] == 200 and len(query[1]["result"]) == 30
+    assert missing == (400, {"error": "Missing parameter: object_type"})
+    assert unknown[0] == 404
+    assert status[0] == 200 and status[1]["configs"][0]["revision"] == 1
+
+
+def test_browser_and_unauthenticated_requests_are_rejected(config_file):
+    """Test that requests a web page could send, or without the token, are refused."""
+    delete = {"config": config_file, "object_type": "address", "name": "host-1", **VSYS}
+    rejected = {
+        # A "simple" cross-origin POST from a web page
+        "text/plain": ({**HEADERS, "Content-Type": "text/plain"}, 415),
+        "origin": ({**HEADERS, "Origin": "http://example.com"}, 403),
+        # DNS rebinding: the page's own host name resolved to the loopback address
+        "rebinding": ({**HEADERS, "Host": "attacker.example.com:8780"}, 403),
+        "no token": ({k: v for k, v in HEADERS.items() if k != "Authorization"}, 401),
+        "wrong token": ({**HEADERS, "Authorization": "Bearer guess"}, 401),
+    }
+
+    async def scenario(port):
+        responses = {
+            case: await _request(port, "POST", "/v1/delete_object", delete, headers)
+            for case, (headers, _) in rejected.items()
+        }
+        responses["ipv6"] = await _request(
+            port, "GET", "/v1/status", headers={**HEADERS, "Host": "[::1]:8780"}
+        )
+        return responses
+
+    responses = asyncio.run(_serve(scenario))
+    for case, (_, status) in rejected.items():
+        assert responses[case][0] == status, case
+    assert responses["ipv6"][0] == 200
+    assert etree.parse(config_file).find(".//address/entry[@name='host-1']") is not None
+
+
+def test_token_file(tmp_path):
+    """Test that the token file is created private and refused when others can read it."""
+    path = str(tmp_path / "api" / "token")
+    token = load_token(path, create=True)
+    assert len(token) >= 32
+    assert os.stat(path).st_mode & 0o777 == 0o600
+    assert load_token(path) == token
+
+    os.chmod(path, 0o644)
+    with pytest.raises(APIError, match="chmod 600"):
+        load_token(path)
+    with pytest.raises(APIError, match="Cannot read"):
+        load_token(str(tmp_path / "missing"))
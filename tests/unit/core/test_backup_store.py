@@ -0,0 +1,225 @@
+"""
+Tests for the content-addressed configuration backup store.
+"""
+
+import os
+import time
+
+import pytest
+
+from panflow.core.backup_store import BackupStore, BackupStoreError, split_config_chunks
+from panflow.core.config_saver import ConfigSaver, ConfigSaverError
+
+
+def _panorama_config(dg2_address="10.2.0.1/32"):
+    """Return a pretty-printed Panorama configuration with two device groups."""
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<config version="10.1.0">
+  <devices>
+    <entry name="localhost.localdomain">
+      <device-group>
+        <entry name="DG1">
+          <address>
+            <entry name="dg1-host">
+              <ip-netmask>10.1.0.1/32</ip-netmask>
+            </entry>
+          </address>
+          <pre-rulebase>
+            <security>
+              <rules>
+                <entry name="allow-dg1">
+                  <action>allow</action>
+                </entry>
+              </rules>
+            </security>
+          </pre-rulebase>
+        </entry>
+        <entry name="DG2">
+          <address>
+            <entry name="dg2-host">
+              <ip-netmask>{dg2_address}</ip-netmask>
+            </entry>
+          </address>
+        </entry>
+      </device-group>
+    </entry>
+  </devices>
+  <shared>
+    <address>
+      <entry name="shared-host">
+        <ip-netmask>192.168.1.1/32</ip-netmask>
+      </entry>
+    </address>
+  </shared>
+</config>
+""".encode(
+        "utf-8"
+    )
+
+
+def test_split_config_chunks_round_trip():
+    """Test that chunks concatenate back to the original bytes."""
+    data = _panorama_config()
+    chunks = split_config_chunks(data)
+
+    assert b"".join(chunks) == data
+    assert len(chunks) > 5
+    # Each device group section starts its own chunk, indentation included
+    assert any(chunk.startswith(b'        <entry name="DG2">') for chunk in chunks)
+    assert any(chunk.startswith(b"          <pre-rulebase>") for chunk in chunks)
+
+
+def test_split_config_chunks_large_sections():
+    """Test that oversized sections are split at entry boundaries."""
+    entries = "".join(
+        f'<entry name="h{i}"><ip-netmask>10.0.{i // 256}.{i % 256}</ip-netmask></entry>'
+        for i in range(500)
+    )
+    data = f"<config><shared><address>{entries}</address></shared></config>".encode("utf-8")
+
+    chunks = split_config_chunks(data, max_chunk_size=1024)
+    assert b"".join(chunks) == data
+    assert len(chunks) > 10
+
+
+def test_split_config_chunks_boundaries_follow_content():
+    """Test that inserting an entry near the top of a section only changes nearby chunks."""
+
+    def rulebase(names):
+        rules = "".join(
+            f'\n        <entry name="{name}">\n          <action>allow</action>\n'
+            f"          <source><member>{name}-src</member></source>\n        </entry>"
+            for name in names
+        )
+        return f"<config><shared><rules>{rules}\n</rules></shared></config>".encode("utf-8")
+
+    names = [f"rule-{i}" for i in range(2000)]
+    before = split_config_chunks(rulebase(names), max_chunk_size=8192)
+    after = split_config_chunks(rulebase(names[:3] + ["inserted"] + names[3:]), max_chunk_size=8192)
+
+    assert len(before) > 30
+    assert len(set(after) - set(before)) <= 2
+
+
+def _age_chunks(store, seconds):
+    for directory, _, files in os.walk(store.objects_dir):
+        for name in files:
+            path = os.path.join(directory, name)
+            os.utime(path, (time.time() - seconds, time.time() - seconds))
+
+
+def test_store_deduplicates_unchanged_sections(tmp_path):
+    """Test that a second version only stores the chunks that changed."""
+    config = tmp_path / "panorama.xml"
+    store = BackupStore(str(tmp_path / "backups"))
+
+    config.write_bytes(_panorama_config())
+    first = store.add(str(config))
+    chunks_after_first = store.stats()["chunks"]
+
+    config.write_bytes(_panorama_config(dg2_address="10.2.0.2/32"))
+    second = store.add(str(config))
+    stats = store.stats()
+
+    assert stats["versions"] == 2
+    assert stats["chunks"] == chunks_after_first + 1
+    assert len(set(second["chunks"]) - set(first["chunks"])) == 1
+
+    assert store.read("panorama.xml", first["version"]) == _panorama_config()
+    assert store.read("panorama.xml") == _panorama_config(dg2_address="10.2.0.2/32")
+
+
+def test_store_restore_and_garbage_collection(tmp_path):
+    """Test restoring a version and removing unreferenced chunks."""
+    config = tmp_path / "panorama.xml"
+    store = BackupStore(str(tmp_path / "backups"))
+
+    config.write_bytes(_panorama_config())
+    first = store.add(str(config))
+    config.write_bytes(_panorama_config(dg2_address="10.2.0.2/32"))
+    store.add(str(config))
+
+    target = tmp_path / "restored.xml"
+    store.restore("panorama.xml", str(target), first["version"])
+    assert target.read_bytes() == _panorama_config()
+
+    store.remove_version("panorama.xml", first["version"])
+    # Recently used chunks are kept in case a concurrent backup reuses them
+    assert store.collect_garbage() == 0
+    _age_chunks(store, 2 * 3600)
+    assert store.collect_garbage() == 1
+    assert store.read("panorama.xml") == _panorama_config(dg2_address="10.2.0.2/32")
+
+    with pytest.raises(BackupStoreError):
+        store.read("panorama.xml", first["version"])
+
+
+def test_garbage_collection_keeps_chunks_reused_by_new_backups(tmp_path):
+    """Test that adding a backup marks the chunks it reuses as recently used."""
+    config = tmp_path / "panorama.xml"
+    store = BackupStore(str(tmp_path / "backups"))
+    config.write_bytes(_panorama_config())
+    first = store.add(str(config))
+    _age_chunks(store, 2 * 3600)
+
+    # The version is removed while another backup of the same content is added
+    store.remove_version("panorama.xml", first["version"])
+    chunks = store.stats()["chunks"]
+    store._write_chunk(first["chunks"][0], b"")
+    assert store.collect_garbage() == chunks - 1
+    assert os.path.exists(store._object_path(first["chunks"][0]))
+
+    second = store.add(str(config))
+    assert store.read("panorama.xml", second["version"]) == _panorama_config()
+
+
+def test_config_saver_backups(tmp_path, sample_xml_tree):
+    """Test that ConfigSaver backups go through the store and can be listed and restored."""
+    saver = ConfigSaver(config_dir=str(tmp_path))
+    path = saver.save(sample_xml_tree, "running")
+    with open(path, "rb") as f:
+        original = f.read()
+
+    saver.save(sample_xml_tree, "running")
+    saver.save(sample_xml_tree, "running")
+
+    backups = saver.get_saved_configs(include_backups=True)
+    backup_ids = [b for b in backups if b.endswith(".bak")]
+    assert len(backup_ids) == 2
+    assert all(os.path.basename(b).startswith("running.xml.") for b in backup_ids)
+    # Identical saves share every chunk
+    first, second = saver._get_backup_store().list_versions("running.xml")
+    assert first["chunks"] == second["chunks"]
+
+    restored = saver.restore_backup(backup_ids[0], str(tmp_path / "restored.xml"))
+    with open(restored, "rb") as f:
+        assert f.read() == original
+
+    with pytest.raises(ConfigSaverError):
+        saver.restore_backup(
+            os.path.join(saver.backup_dir, "running.xml.20000101_000000_000000.bak")
+        )
+
+
+def test_config_saver_cleanup_backups(tmp_path, sample_xml_tree):
+    """Test cleaning up backups by count, including plain backup files."""
+    saver = ConfigSaver(config_dir=str(tmp_path))
+    for _ in range(4):
+        saver.save(sample_xml_tree, "running")
+
+    legacy = os.path.join(saver.backup_dir, "old.xml.bak")
+    with open(legacy, "w") as f:
+        f.write("<config/>")
+    os.utime(legacy, (0, 0))
+
+    would_delete = saver.cleanup_backups(max_files=2, dry_run=True)
+    assert len(would_delete) == 2
+    assert would_delete[0] == legacy
+    assert len(saver.get_saved_configs(include_backups=True)) == 5
+
+    deleted = saver.cleanup_backups(max_files=2)
+    assert deleted == would_delete
+    assert not os.path.exists(legacy)
+    backups = saver.get_saved_configs(include_backups=True)
+    assert len([backup for backup in backups if backup.endswith(".bak")]) == 2
+    assert saver.cleanup_backups(max_age_days=1) == []
@@ -0,0 +1,191 @@
+"""
+Tests for multi-file batch pipeline processing.
+"""
+
+import json
+import os
+
+import pytest
+
+from panflow.core import batch as batch_module
+from panflow.core.batch import (
+    BatchError,
+    BatchRunner,
+    build_step_argv,
+    expand_config_files,
+    load_pipeline_spec,
+    parse_pipeline_spec,
+)
+
+
+@pytest.fixture
+def batch_dir(tmp_path, sample_xml_string):
+    """Create a directory with two valid configs, one broken config and a pipeline spec."""
+    for name in ("fw1.xml", "fw2.xml"):
+        (tmp_path / name).write_text(sample_xml_string)
+    (tmp_path / "broken.xml").write_text("<config><shared>")
+
+    (tmp_path / "pipeline.yaml").write_text(
+        """
+steps:
+  - command: config export
+    options:
+      output: "{output_dir}/{stem}.jsonl"
+      format: jsonl
+  - command: config export
+    options:
+      output: "{output_dir}/{stem}.json"
+"""
+    )
+    return tmp_path
+
+
+def test_load_pipeline_spec(batch_dir):
+    """Test loading and normalizing a pipeline spec."""
+    steps = load_pipeline_spec(str(batch_dir / "pipeline.yaml"))
+
+    assert len(steps) == 2
+    assert steps[0]["command"] == "config export"
+    assert steps[0]["options"]["format"] == "jsonl"
+    assert steps[0]["args"] == []
+
+
+def test_load_pipeline_spec_invalid(tmp_path):
+    """Test that invalid specs are rejected."""
+    spec = tmp_path / "bad.yaml"
+    spec.write_text("steps:\n  - options: {dry-run: true}\n")
+    with pytest.raises(BatchError):
+        load_pipeline_spec(str(spec))
+
+    spec.write_text("steps: []\n")
+    with pytest.raises(BatchError):
+        load_pipeline_spec(str(spec))
+
+
+def test_pipeline_placeholders(batch_dir, monkeypatch):
+    """Test that bad placeholders are rejected on load and fail only their file when run."""
+    with pytest.raises(BatchError, match=r"Unknown placeholder \{nope\}"):
+        parse_pipeline_spec("config export --output {nope}.json")
+    with pytest.raises(BatchError, match="Step 2.*literal braces"):
+        parse_pipeline_spec("config export\nquery --query 'MATCH (a) {'")
+    steps = parse_pipeline_spec("- {command: query, options: {query: 'MATCH (a {{name: 1}})'}}")
+    assert build_step_argv(steps[0], {"config": "fw.xml"})[2] == "MATCH (a {name: 1})"
+
+    monkeypatch.setattr(batch_module, "_run_cli", lambda argv: 0)
+    steps = [{"command": "config export", "options": {"output": "{nope}.json"}, "args": []}]
+    files = [str(batch_dir / "fw1.xml"), str(batch_dir / "fw2.xml")]
+    summary = BatchRunner(steps, str(batch_dir / "out"), workers=1).run(files)
+    assert summary["failed"] == 2
+    assert "Unknown placeholder {nope}" in summary["files"][0]["error"]
+
+
+def test_build_step_argv():
+    """Test converting a step into CLI arguments."""
+    step = {
+        "command": "cleanup unused-objects",
+        "options": {"type": ["address", "service"], "dry-run": True, "exclude_file": None},
+        "args": [],
+    }
+    argv = build_step_argv(step, {"config": "/cfg/fw.xml"})
+
+    assert argv == [
+        "cleanup",
+        "unused-objects",
+        "--type",
+        "address",
+        "--type",
+        "service",
+        "--dry-run",
+        "--config",
+        "/cfg/fw.xml",
+    ]
+
+
+def test_expand_config_files(batch_dir):
+    """Test glob expansion of configuration files."""
+    files = expand_config_files([str(batch_dir / "fw*.xml"), str(batch_dir / "fw1.xml")])
+    assert [os.path.basename(f) for f in files] == ["fw1.xml", "fw2.xml"]
+
+
+def test_batch_runner(batch_dir):
+    """Test running a pipeline with per-file isolation and an aggregate summary."""
+    steps = load_pipeline_spec(str(batch_dir / "pipeline.yaml"))
+    output_dir = batch_dir / "out"
+    files = expand_config_files([str(batch_dir / "*.xml")])
+    progress = []
+
+    runner = BatchRunner(steps, str(output_dir), workers=2)
+    summary = runner.run(files, progress_callback=lambda r, done, total: progress.append(done))
+
+    assert summary["total_files"] == 3
+    assert summary["succeeded"] == 2
+    assert summary["failed"] == 1
+    assert sorted(progress) == [1, 2, 3]
+    assert summary["steps"]["config export"]["succeeded"] == 4
+
+    broken = next(r for r in summary["files"] if r["file"].endswith("broken.xml"))
+    assert broken["status"] == "failed"
+    assert "Step 1" in broken["error"]
+
+    assert (output_dir / "fw1.json").exists()
+    assert (output_dir / "fw2.jsonl").exists()
+    # Worker logs go to each file's log, not to the console
+    for stem in ("fw1", "fw2", "broken"):
+        log = (output_dir / f"{stem}.log").read_text()
+        assert f"{stem}.xml" in log, stem
+    with open(output_dir / "batch-summary.json") as f:
+        assert json.load(f)["succeeded"] == 2
+
+
+def test_batch_runner_resume(batch_dir):
+    """Test that completed files are skipped when resuming from a checkpoint."""
+    steps = load_pipeline_spec(str(batch_dir / "pipeline.yaml"))
+    files = expand_config_files([str(batch_dir / "*.xml")])
+    output_dir = str(batch_dir / "out")
+
+    BatchRunner(steps, output_dir, workers=2).run(files)
+    summary = BatchRunner(steps, output_dir, workers=2).run(files)
+
+    assert summary["skipped"] == 2
+    # The failed file is retried rather than skipped
+    assert summary["failed"] == 1
+
+    # A changed pipeline invalidates the checkpoint
+    changed = steps[:1]
+    summary = BatchRunner(changed, output_dir, workers=2).run(files)
+    assert summary["skipped"] == 0
+
+    # Disabling resume reprocesses everything
+    summary = BatchRunner(changed, output_dir, workers=2).run(files, resume=False)
+    assert summary["skipped"] == 0
+
+
+def test_in_process_runner_chains_outputs(tmp_path, monkeypatch, sample_xml_string):
+    """Test that steps run in order, chain outputs and stop at the first failure."""
+    config = tmp_path / "fw.xml"
+    config.write_text(sample_xml_string)
+    calls = []
+
+    def fake_run_cli(argv):
+        calls.append(argv)
+        if argv[0] == "write":
+            with open(argv[argv.index("--output") + 1], "w") as f:
+                f.write(sample_xml_string)
+        return 2 if argv[0] == "fail" else 0
+
+    monkeypatch.setattr(batch_module, "_run_cli", fake_run_cli)
+    steps = [
+        {"command": "write", "options": {"output": "{output_dir}/{stem}.out.xml"}, "args": []},
+        {"command": "read", "options": {}, "args": []},
+        {"command": "fail", "options": {}, "args": []},
+        {"command": "never", "options": {}, "args": []},
+    ]
+
+    summary = BatchRunner(steps, str(tmp_path / "out"), workers=1).run([str(config)])
+    result = summary["files"][0]
+
+    assert [argv[0] for argv in calls] == ["write", "read", "fail"]
+    assert calls[1][-1] == str(tmp_path / "out" / "fw.out.xml")
+    assert result["status"] == "failed"
+    assert "Step 3" in result["error"]
+    assert summary["steps"]["fail"]["failed"] == 1
@@ -0,0 +1,203 @@
+"""
+Tests for the completion index of configuration files.
+"""
+
+import os
+import time
+
+import pytest
+from lxml import etree
+from typer.testing import CliRunner
+
+from panflow import PANFlowConfig
+from panflow.cli.app import app
+from panflow.core.completion_index import (
+    CompletionIndex,
+    complete_command_line,
+    index_path,
+    load_completion_index,
+    write_completion_index,
+)
+from tests.common.benchmarks import PerformanceBenchmark
+
+
+def _config_tree(address_count, rule_count=0):
+    """Build a firewall configuration with host-N addresses and rule-N rules."""
+    addresses = "".join(
+        f'<entry name="host-{i}"><ip-netmask>10.0.{i % 10}.1/32</ip-netmask></entry>'
+        for i in range(address_count)
+    )
+    rules = "".join(
+        f'<entry name="rule-{i}"><source><member>host-{i}</member></source>'
+        "<action>allow</action></entry>"
+        for i in range(rule_count)
+    )
+    return etree.ElementTree(
+        etree.fromstring(
+            '<config version="10.1.0"><devices><entry name="localhost.localdomain"><vsys>'
+            f'<entry name="vsys1"><address>{addresses}</address>'
+            f"<rulebase><security><rules>{rules}</rules></security></rulebase>"
+            "</entry></vsys></entry></devices></config>"
+        )
+    )
+
+
+def _panorama_tree(regions=2, sites_per_region=2, object_count=20):
+    """
+    Build a Panorama configuration with region and site device groups.
+
+    Shared defines obj-0 .. obj-N. A shared rule uses obj-0, the rule of
+    site s uses obj-(1 + s) and the region object obj-(1 + sites + r), and
+    every site defines local-dns with the same value.
+    """
+    root = etree.fromstring(
+        """
+        <config version="10.1.0">
+          <devices>
+            <entry name="localhost.localdomain"><device-group/></entry>
+          </devices>
+          <shared>
+            <address/>
+            <pre-rulebase><security><rules/></security></pre-rulebase>
+          </shared>
+        </config>
+        """
+    )
+    site_count = regions * sites_per_region
+    shared = root.find("shared")
+    for i in range(object_count):
+        address = etree.SubElement(shared.find("address"), "entry", name=f"obj-{i}")
+        ip = f"10.{i // 65536}.{i // 256 % 256}.{i % 256}/32"
+        etree.SubElement(address, "ip-netmask").text = ip
+
+    def add_rule(rules, name, source, destination):
+        rule = etree.SubElement(rules, "entry", name=name)
+        for field, members in (("source", source), ("destination", destination)):
+            element = etree.SubElement(rule, field)
+            for member in members:
+                etree.SubElement(element, "member").text = member
+        etree.SubElement(etree.SubElement(rule, "service"), "member").text = "any"
+        etree.SubElement(rule, "action").text = "allow"
+
+    add_rule(shared.find("pre-rulebase/security/rules"), "shared-rule", ["obj-0"], ["any"])
+
+    device_groups = root.find("devices/entry/device-group")
+    for r in range(regions):
+        etree.SubElement(device_groups, "entry", name=f"region-{r}")
+    for s in range(site_count):
+        r = s // sites_per_region
+        site = etree.SubElement(device_groups, "entry", name=f"site-{s}")
+        etree.SubElement(site, "parent-dg").text = f"region-{r}"
+        address = etree.SubElement(etree.SubElement(site, "address"), "entry", name="local-dns")
+        etree.SubElement(address, "ip-netmask").text = "10.255.0.53/32"
+        rulebase = etree.SubElement(site, "pre-rulebase")
+        rules = etree.SubElement(etree.SubElement(rulebase, "security"), "rules")
+        destination = [f"obj-{1 + site_count + r}", "local-dns"]
+        add_rule(rules, f"site-{s}-rule", [f"obj-{1 + s}"], destination)
+    return etree.ElementTree(root)
+
+
+@pytest.fixture(autouse=True)
+def completion_cache(tmp_path, monkeypatch):
+    """Keep the completion indexes of the tests in a temporary directory."""
+    cache_dir = tmp_path / "completion-cache"
+    monkeypatch.setenv("PANFLOW_COMPLETION_CACHE", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture
+def panorama_file(tmp_path):
+    tree = _panorama_tree(regions=2, sites_per_region=2, object_count=10)
+    path = tmp_path / "panorama.xml"
+    tree.write(str(path))
+    return str(path)
+
+
+def test_index_names_and_prefix_search():
+    """Test the names collected per kind and context and the prefix search."""
+    tree = _panorama_tree(regions=1, sites_per_region=2, object_count=12)
+    index = CompletionIndex.from_tree(tree)
+
+    assert index.complete("device-group") == ["region-0", "site-0", "site-1"]
+    assert index.complete("device_group", "si") == ["site-0", "site-1"]
+    assert index.complete("address", "obj-1") == ["obj-1", "obj-10", "obj-11"]
+    assert index.complete("address", "obj-1", limit=2) == ["obj-1", "obj-10"]
+
+    # local-dns is defined in both sites but listed once
+    assert index.complete("address", "loc") == ["local-dns"]
+    assert index.complete("address", "loc", context="region-0") == []
+    assert index.complete("address", "obj-2", context="site-0") == ["obj-2"]
+    assert index.complete_objects(None, "obj-11") == ["obj-11"]
+    assert index.complete("rule", context="shared")
+
+
+def test_index_is_invalidated_when_config_changes(panorama_file, completion_cache):
+    """Test that PANFlowConfig writes the index and a changed file ignores it."""
+    assert load_completion_index(panorama_file) is None
+
+    PANFlowConfig(config_file=panorama_file)
+    assert os.path.dirname(index_path(panorama_file)) == str(completion_cache)
+    assert load_completion_index(panorama_file).complete("device-group", "region") == [
+        "region-0",
+        "region-1",
+    ]
+
+    tree = etree.parse(panorama_file)
+    etree.SubElement(tree.find(".//device-group"), "entry", name="region-9")
+    tree.write(panorama_file)
+    os.utime(panorama_file, ns=(time.time_ns(), time.time_ns() + 10**9))
+    assert load_completion_index(panorama_file) is None
+
+    write_completion_index(panorama_file)
+    assert "region-9" in load_completion_index(panorama_file).complete("device-group", "region")
+
+
+def test_complete_command_line(panorama_file):
+    """Test completing option values from the index of the --config file."""
+    command_line = ["object", "list", "-c", panorama_file, "--device-group", "si"]
+    assert complete_command_line(command_line) == []
+
+    write_completion_index(panorama_file)
+    assert complete_command_line(
+        ["object", "list", "-c", panorama_file, "--device-group", "site-"]
+    ) == [("plain", f"site-{i}") for i in range(4)]
+    assert complete_command_line(
+        ["object", "find", f"--config={panorama_file}", "-t", "address", "--name", "obj-9"]
+    ) == [("plain", "obj-9")]
+    assert complete_command_line(["object", "list", "--config", "pano"]) == [("file", "pano")]
+    assert complete_command_line(["object", "list", "-c", panorama_file, "--format", ""]) == []
+
+
+def test_completion_commands(panorama_file):
+    """Test the completion index command and the __complete fallback to the CLI."""
+    runner = CliRunner()
+    result = runner.invoke(app, ["completion", "index", "--config", panorama_file])
+    assert result.exit_code == 0, result.output
+    assert load_completion_index(panorama_file) is not None
+
+    result = runner.invoke(
+        app, ["__complete", "object", "list", "-c", panorama_file, "--device-group", "region-"]
+    )
+    assert result.output.split() == ["plain,region-0", "plain,region-1"]
+
+    result = runner.invoke(app, ["__complete", "dedup"])
+    assert result.output.split() == ["plain,deduplicate"]
+
+
+def test_completion_index_benchmark(tmp_path):
+    """Time index lookups for a configuration with 200k objects."""
+    tree = _config_tree(200000, rule_count=100)
+    path = tmp_path / "large.xml"
+    tree.write(str(path))
+
+    benchmark = PerformanceBenchmark("completion_index")
+    benchmark.measure("200k objects, build", write_completion_index, str(path), tree)
+    completions, _ = benchmark.measure(
+        "200k objects, complete",
+        complete_command_line,
+        ["object", "find", "-c", str(path), "--name", "host-1999"],
+    )
+    benchmark.print_report()
+
+    assert len(completions) == 111
+    assert completions[0] == ("plain", "host-1999")
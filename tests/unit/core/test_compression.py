@@ -0,0 +1,164 @@
+"""
+Tests for reading and writing compressed configuration files.
+"""
+
+import gzip
+import os
+
+import pytest
+import typer
+from lxml import etree
+
+from panflow.cli import common as cli_common
+from panflow.core import compression
+from panflow.core.compression import (
+    detect_compression,
+    open_config_input,
+    open_config_output,
+    split_compression_suffix,
+)
+from panflow.core.config_loader import load_config_from_file, save_config
+from panflow.core.config_saver import ConfigSaver
+from panflow.core.exceptions import ParseError
+from panflow.core.xml.base import parse_xml
+from tests.common.benchmarks import PerformanceBenchmark
+
+requires_zstd = pytest.mark.skipif(not compression.HAVE_ZSTD, reason="zstd support not installed")
+
+
+@pytest.fixture
+def gzip_config(tmp_path, sample_xml_string):
+    """Write the sample configuration gzip compressed."""
+    path = tmp_path / "config.xml.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(sample_xml_string.strip())
+    return str(path)
+
+
+def test_split_compression_suffix():
+    """Test splitting compression suffixes off file names."""
+    assert split_compression_suffix("fw.xml.gz") == ("fw.xml", "gzip")
+    assert split_compression_suffix("fw.xml.ZST") == ("fw.xml", "zstd")
+    assert split_compression_suffix("fw.xml") == ("fw.xml", None)
+
+
+def test_detect_compression_uses_contents(tmp_path, gzip_config):
+    """Test that compression is detected from magic bytes rather than the suffix."""
+    renamed = tmp_path / "archived.xml"
+    os.rename(gzip_config, renamed)
+    assert detect_compression(str(renamed)) == "gzip"
+
+    plain = tmp_path / "plain.xml"
+    plain.write_text("<config/>")
+    assert detect_compression(str(plain)) is None
+
+
+def test_parse_xml_gzip(gzip_config):
+    """Test parsing a gzip compressed file with parse_xml."""
+    tree, root = parse_xml(gzip_config)
+    assert root.tag == "config"
+    assert root.xpath("//address/entry/@name") == ["test-address"]
+
+
+def test_parse_xml_decompressed_size_limit(tmp_path):
+    """Test that the size limit also applies to the decompressed stream."""
+    path = tmp_path / "bomb.xml.gz"
+    with gzip.open(path, "wb") as f:
+        f.write(b"<config>" + b" " * 200_000 + b"</config>")
+
+    assert os.path.getsize(path) < 10_000
+    with pytest.raises(ParseError):
+        parse_xml(str(path), max_file_size=10_000)
+
+
+def test_load_config_from_file_gzip(gzip_config):
+    """Test loading a gzip compressed file with version detection."""
+    tree, version = load_config_from_file(gzip_config)
+    assert tree.getroot().tag == "config"
+    assert version == "10.1"
+
+
+def test_save_config_compressed(tmp_path, sample_xml_tree):
+    """Test that save_config compresses based on the output suffix."""
+    path = str(tmp_path / "out.xml.gz")
+    assert save_config(sample_xml_tree, path)
+    assert detect_compression(path) == "gzip"
+
+    tree, _ = load_config_from_file(path)
+    assert tree.xpath("//address/entry/@name") == ["test-address"]
+
+
+def test_config_saver_compressed_output(tmp_path, sample_xml_tree):
+    """Test that ConfigSaver writes the same XML compressed as uncompressed."""
+    saver = ConfigSaver(config_dir=str(tmp_path), create_backup=False)
+    plain = saver.save(sample_xml_tree, "running")
+    compressed = saver.save(sample_xml_tree, "running.gz")
+
+    assert compressed.endswith("running.xml.gz")
+    with open(plain, "rb") as f, open_config_input(compressed) as g:
+        assert g.read() == f.read()
+
+    default_saver = ConfigSaver(config_dir=str(tmp_path), create_backup=False, compression="gzip")
+    assert default_saver.save(sample_xml_tree, "candidate").endswith("candidate.xml.gz")
+    assert str(tmp_path / "candidate.xml.gz") in default_saver.get_saved_configs()
+
+
+@requires_zstd
+def test_zstd_round_trip(tmp_path, sample_xml_tree):
+    """Test writing and reading zstd compressed configurations."""
+    path = str(tmp_path / "config.xml.zst")
+    assert save_config(sample_xml_tree, path)
+    assert detect_compression(path) == "zstd"
+
+    tree, root = parse_xml(path)
+    assert root.xpath("//address/entry/@name") == ["test-address"]
+
+
+def test_file_callback_zstd_support(tmp_path, monkeypatch):
+    """Test that the CLI rejects zstd inputs when zstd support is missing."""
+    path = tmp_path / "config.xml.zst"
+    path.write_bytes(b"\x28\xb5\x2f\xfd" + b"\x00" * 8)
+
+    monkeypatch.setattr(cli_common, "HAVE_ZSTD", False)
+    with pytest.raises(typer.BadParameter):
+        cli_common.file_callback(str(path))
+
+    monkeypatch.setattr(cli_common, "HAVE_ZSTD", True)
+    assert cli_common.file_callback(str(path)) == str(path)
+
+
+def test_compressed_input_benchmark(tmp_path):
+    """Compare bytes read from storage and parse time for plain and compressed configs."""
+    root = etree.Element("config", version="10.1.0")
+    shared = etree.SubElement(root, "shared")
+    address = etree.SubElement(shared, "address")
+    for i in range(20000):
+        entry = etree.SubElement(address, "entry", name=f"host-{i}")
+        etree.SubElement(entry, "ip-netmask").text = (
+            f"10.{i // 65536}.{i // 256 % 256}.{i % 256}/32"
+        )
+        etree.SubElement(entry, "description").text = f"Server {i} in the data center"
+    tree = etree.ElementTree(root)
+
+    plain = str(tmp_path / "large.xml")
+    compressed = str(tmp_path / "large.xml.gz")
+    tree.write(plain, encoding="utf-8", pretty_print=True)
+    with open_config_output(compressed) as f:
+        tree.write(f, encoding="utf-8", pretty_print=True)
+
+    benchmark = PerformanceBenchmark("compressed_config_input")
+    plain_stats = benchmark.measure_repeated("plain_parse", lambda: parse_xml(plain), iterations=3)
+    gzip_stats = benchmark.measure_repeated(
+        "gzip_parse", lambda: parse_xml(compressed), iterations=3
+    )
+
+    plain_size = os.path.getsize(plain)
+    compressed_size = os.path.getsize(compressed)
+    benchmark.print_report()
+
+    assert compressed_size * 5 < plain_size, (
+        f"Bytes read from storage: plain={plain_size / 1024:.0f}KiB "
+        f"gzip={compressed_size / 1024:.0f}KiB"
+    )
+    assert len(parse_xml(compressed)[1].xpath("//address/entry")) == 20000
+    assert plain_stats["mean"] > 0 and gzip_stats["mean"] > 0
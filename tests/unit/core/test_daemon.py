@@ -0,0 +1,251 @@
+"""
+Tests for the configuration cache and the PANFlow daemon.
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from lxml import etree
+
+from panflow.core import config_cache
+from panflow.core.config_cache import ConfigCache, derived
+from panflow.core.config_loader import load_config_from_file
+from panflow.core.daemon import (
+    PANFlowDaemon,
+    absolute_paths,
+    forward_command,
+    is_local,
+    is_read_only,
+    send_request,
+)
+from panflow.core.graph_service import GraphService
+from panflow.core.logging_utils import (
+    log_level_callback,
+    thread_log_levels,
+    verbose_callback,
+)
+from tests.common.benchmarks import PerformanceBenchmark
+
+
+def _config_tree(address_count, rule_count=0):
+    """Build a firewall configuration with host-N addresses and rule-N rules."""
+    addresses = "".join(
+        f'<entry name="host-{i}"><ip-netmask>10.0.{i % 10}.1/32</ip-netmask></entry>'
+        for i in range(address_count)
+    )
+    rules = "".join(
+        f'<entry name="rule-{i}"><source><member>host-{i}</member></source>'
+        "<action>allow</action></entry>"
+        for i in range(rule_count)
+    )
+    return etree.ElementTree(
+        etree.fromstring(
+            '<config version="10.1.0"><devices><entry name="localhost.localdomain"><vsys>'
+            f'<entry name="vsys1"><address>{addresses}</address>'
+            f"<rulebase><security><rules>{rules}</rules></security></rulebase>"
+            "</entry></vsys></entry></devices></config>"
+        )
+    )
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "firewall.xml"
+    _config_tree(50, rule_count=5).write(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def active_cache():
+    cache = ConfigCache()
+    config_cache.activate(cache)
+    yield cache
+    config_cache.activate(None)
+
+
+def _touch(path, seconds=1):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 10**9))
+
+
+def test_cache_reloads_changed_files(config_file):
+    """Test hits, reloads of changed files and keeping touched but unchanged files."""
+    cache = ConfigCache()
+    entry = cache.get(config_file)
+    assert cache.get(config_file) is entry
+    assert (cache.loads, cache.hits) == (1, 1)
+
+    _touch(config_file)
+    assert cache.get(config_file) is entry
+
+    tree = etree.parse(config_file)
+    etree.SubElement(tree.find(".//vsys/entry/address"), "entry", name="added")
+    tree.write(config_file)
+    _touch(config_file, 2)
+    changed = cache.get(config_file)
+    assert changed is not entry and changed.digest != entry.digest
+    assert changed.tree.find(".//address/entry[@name='added']") is not None
+    assert cache.loads == 2
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Test that the memory budget evicts the least recently used configurations."""
+    files = []
+    for i in range(3):
+        path = tmp_path / f"config-{i}.xml"
+        _config_tree(20).write(str(path))
+        files.append(str(path))
+    size = os.path.getsize(files[0]) * config_cache.MEMORY_PER_BYTE
+
+    cache = ConfigCache(memory_budget=int(size * 2.5))
+    for path in files[:2]:
+        cache.get(path)
+    cache.get(files[0])
+    cache.get(files[2])
+
+    assert [config["path"] for config in cache.stats()["configs"]] == [files[0], files[2]]
+    assert cache.evictions == 1
+
+
+def test_loader_shares_trees_only_with_read_only_requests(config_file, active_cache):
+    """Test the trees and derived data handed out for read-only and other requests."""
+    with active_cache.request(read_only=True):
+        first, version = load_config_from_file(config_file)
+        second, _ = load_config_from_file(config_file)
+        context = {"device_type": "firewall", "context_type": "vsys", "vsys": "vsys1"}
+        graph = GraphService().get_graph(first, **context)
+        assert GraphService().get_graph(second, **context) is graph
+    assert first is second
+    assert version == "10.1"
+
+    copy, _ = load_config_from_file(config_file)
+    assert copy is not first
+    assert etree.tostring(copy) == etree.tostring(first)
+    assert derived(copy, "key", object) is not derived(copy, "key", object)
+    assert derived(first, "key", object) is derived(first, "key", object)
+
+
+def test_command_line_helpers(tmp_path):
+    """Test the command classification and the path rewriting of forwarded commands."""
+    assert is_read_only(["object", "list", "-c", "x.xml"])
+    assert not is_read_only(["object", "delete", "-c", "x.xml"])
+    assert is_local(["serve", "--status"]) and is_local(["query", "interactive"]) and is_local([])
+    assert is_local(["nlq", "interactive", "-c", "x.xml"])
+    assert not is_local(["query", "execute"])
+
+    # bulk-delete asks for confirmation on stdin unless it is forced or a dry run
+    bulk_delete = ["object", "bulk-delete", "-c", "x.xml", "-t", "address"]
+    assert is_local(bulk_delete)
+    assert not is_local(bulk_delete + ["--force"])
+    assert not is_local(bulk_delete + ["--dry-run"])
+
+    (tmp_path / "config.xml").write_text("<config/>")
+    argv = ["object", "list", "-c", "config.xml", "--output=out.json", "-t", "address"]
+    assert absolute_paths(argv, str(tmp_path)) == [
+        "object",
+        "list",
+        "-c",
+        str(tmp_path / "config.xml"),
+        f"--output={tmp_path / 'out.json'}",
+        "-t",
+        "address",
+    ]
+
+
+def test_values_naming_files_are_not_rewritten(tmp_path):
+    """Test that only path option values are made absolute, not values that match a file."""
+    for name in ("web", "address", "get"):
+        (tmp_path / name).write_text("")
+    argv = ["object", "get", "--config", "c.xml", "--type", "address", "--name", "web"]
+    assert absolute_paths(argv, str(tmp_path)) == [
+        "object",
+        "get",
+        "--config",
+        str(tmp_path / "c.xml"),
+        "--type",
+        "address",
+        "--name",
+        "web",
+    ]
+
+
+def test_log_levels_are_scoped_to_the_request_thread():
+    """Test that a request's log level options do not change the level of other requests."""
+    records = []
+    handler = logging.Handler()
+    handler.emit = lambda record: records.append((record.threadName, record.getMessage()))
+    panflow_logger = logging.getLogger("panflow")
+    panflow_logger.addHandler(handler)
+    level = panflow_logger.level
+    try:
+        with thread_log_levels():
+            barrier = threading.Barrier(2)
+
+            def request(verbose):
+                # The CLI callbacks run for every command with the option defaults
+                log_level_callback("info")
+                verbose_callback(verbose)
+                barrier.wait()
+                panflow_logger.debug("debug")
+                panflow_logger.info("info")
+
+            threads = [
+                threading.Thread(target=request, args=(False,), name="plain"),
+                threading.Thread(target=request, args=(True,), name="verbose"),
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(10)
+        assert panflow_logger.level == level
+    finally:
+        panflow_logger.removeHandler(handler)
+
+    assert sorted(records) == [("plain", "info"), ("verbose", "debug"), ("verbose", "info")]
+
+
+@pytest.fixture
+def daemon():
+    # Unix socket paths are limited to about 100 characters
+    directory = tempfile.mkdtemp(prefix="pf")
+    server = PANFlowDaemon(os.path.join(directory, "panflow.sock"))
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join(10)
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_daemon_runs_commands(daemon, config_file, tmp_path, capsys):
+    """Test commands run by the daemon, concurrently and forwarded from the CLI."""
+    assert os.stat(daemon.path).st_mode & 0o077 == 0
+    argv = ["policy", "list", "-c", config_file, "-t", "security_rules", "--context", "vsys"]
+
+    def run(i):
+        output = str(tmp_path / f"out-{i}.json")
+        return send_request({"op": "run", "argv": argv + ["-o", output]}, daemon.path)
+
+    responses = list(ThreadPoolExecutor(4).map(run, range(4)))
+    assert [response["exit_code"] for response in responses] == [0] * 4
+    for i in range(4):
+        assert len(json.loads((tmp_path / f"out-{i}.json").read_text())) == 5
+
+    status = send_request({"op": "status"}, daemon.path)
+    assert status["requests"] == 5
+    assert status["cache"]["loads"] == 1
+
+    assert forward_command(["policy", "bulk-update", "-c", config_file], daemon.path) == 2
+    assert "Missing option" in capsys.readouterr().err
+    assert forward_command(["serve", "--status"], daemon.path) is None
+
+    benchmark = PerformanceBenchmark("daemon")
+    response, _ = benchmark.measure("warm policy list", run, 5)
+    benchmark.print_report()
+    assert response["exit_code"] == 0
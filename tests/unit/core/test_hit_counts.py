@@ -0,0 +1,251 @@
+"""
+Tests for hit-count ingestion and the hit-count join in policy analysis.
+"""
+
+import gzip
+import json
+
+import pytest
+from lxml import etree
+from typer.testing import CliRunner
+
+from panflow.cli.app import app
+from panflow.core.exceptions import ParseError
+from panflow.reporting import HitCountTable, generate_security_policy_analysis_data
+from panflow.reporting.reports.hit_counts import age_buckets, parse_timestamp, stale_rules
+from tests.common.benchmarks import PerformanceBenchmark
+
+NOW = 1_700_000_000
+DAY = 86400
+
+FIREWALL_XML = """
+<response status="success"><result><rule-hit-count><vsys><entry name="vsys1"><rule-base>
+  <entry name="security"><rules>
+    <entry name="allow-web"><latest>yes</latest><hit-count>150</hit-count>
+      <last-hit-timestamp>{recent}</last-hit-timestamp>
+      <first-hit-timestamp>{old}</first-hit-timestamp></entry>
+    <entry name="old-rule"><hit-count>0</hit-count>
+      <last-hit-timestamp>0</last-hit-timestamp></entry>
+  </rules></entry>
+  <entry name="nat"><rules>
+    <entry name="allow-web"><hit-count>999</hit-count></entry>
+  </rules></entry>
+</rule-base></entry></vsys></rule-hit-count></result></response>
+"""
+
+PANORAMA_XML = """
+<response status="success"><result><rule-hit-count><device-group><entry name="dg1"><rule-base>
+  <entry name="security"><rules>
+    <entry name="allow-web"><device-vsys>
+      <entry name="0071/vsys1"><hit-count>10</hit-count>
+        <last-hit-timestamp>{stale}</last-hit-timestamp></entry>
+      <entry name="0072/vsys1"><hit-count>0</hit-count></entry>
+    </device-vsys></entry>
+  </rules></entry>
+</rule-base></entry></device-group></rule-hit-count></result></response>
+"""
+
+
+@pytest.fixture
+def exports(tmp_path):
+    """Write a firewall XML, a gzip Panorama XML and a CSV export."""
+    firewall = tmp_path / "fw1.xml"
+    firewall.write_text(FIREWALL_XML.format(recent=NOW - DAY, old=NOW - 400 * DAY))
+
+    panorama = tmp_path / "panorama.xml.gz"
+    with gzip.open(panorama, "wt") as f:
+        f.write(PANORAMA_XML.format(stale=NOW - 120 * DAY))
+
+    csv_export = tmp_path / "fw2.csv"
+    csv_export.write_text(
+        "Device,Name,Hit Count,Last Hit\n"
+        "fw2,allow-web,5,2023-11-10 00:00:00\n"
+        "fw2,allow-dns,2000,-\n"
+        "fw3,allow-dns,0,never\n"
+    )
+    return [str(firewall), str(panorama), str(csv_export)]
+
+
+def _policy_tree(firewall_xml_tree, names):
+    rules = firewall_xml_tree.find(".//rulebase/security/rules")
+    for name in names:
+        entry = etree.SubElement(rules, "entry", name=name)
+        etree.SubElement(entry, "action").text = "allow"
+    return firewall_xml_tree
+
+
+def test_parse_timestamp():
+    """Test the timestamp formats found in hit-count exports."""
+    assert parse_timestamp("1700000000") == NOW
+    assert parse_timestamp("2023-11-14T22:13:20") == NOW
+    assert parse_timestamp("Tue Nov 14 22:13:20 2023") == NOW
+    assert parse_timestamp("2023/11/14 22:13:20") == NOW
+    assert parse_timestamp("never") == parse_timestamp("") == parse_timestamp("garbage") == 0
+
+
+def test_aggregate_devices(exports):
+    """Test that records from several devices and formats are summed per rule."""
+    table = HitCountTable.from_files(exports)
+
+    data = table.to_dict()
+    assert set(data) == {"allow-web", "old-rule", "allow-dns"}
+    # The NAT rulebase entry of the firewall export is ignored
+    assert data["allow-web"]["hit_count"] == 150 + 10 + 5
+    assert data["allow-web"]["devices"] == 4
+    assert data["allow-web"]["devices_hit"] == 3
+    assert data["allow-web"]["last_hit"] == NOW - DAY
+    assert data["allow-web"]["first_hit"] == NOW - 400 * DAY
+    assert data["allow-dns"] == {
+        "hit_count": 2000,
+        "last_hit": 0,
+        "first_hit": 0,
+        "devices": 2,
+        "devices_hit": 1,
+    }
+    assert {"0071/vsys1", "0072/vsys1", "fw2", "fw3"} <= table.device_names
+
+
+def test_load_csv_requires_columns(tmp_path):
+    """Test that CSV exports without rule and hit count columns are rejected."""
+    path = tmp_path / "bad.csv"
+    path.write_text("Rule,Packets\nallow-web,5\n")
+    with pytest.raises(ParseError):
+        HitCountTable().load(str(path))
+
+
+def test_invalid_hit_counts_are_skipped(tmp_path, caplog):
+    """Test that negative or malformed hit counts skip the record instead of failing the load."""
+    csv_export = tmp_path / "fw.csv"
+    csv_export.write_text("Name,Hit Count\nallow-web,5\nbad-negative,-3\nbad-text,lots\n")
+    xml_export = tmp_path / "fw.xml"
+    xml_export.write_text(
+        "<response><result><rule-hit-count><rules>"
+        "<entry name='allow-dns'><hit-count>2</hit-count></entry>"
+        "<entry name='bad-huge'><hit-count>%d</hit-count></entry>"
+        "</rules></rule-hit-count></result></response>" % 2**64
+    )
+
+    table = HitCountTable.from_files([str(csv_export), str(xml_export)])
+
+    assert table.names == ["allow-web", "allow-dns"]
+    assert "line 3 with invalid hit count '-3' for rule bad-negative" in caplog.text
+    assert "bad-huge" in caplog.text
+    assert HitCountTable.from_dict({"a": {"hit_count": -1}, "b": {"hit_count": 1}}).names == ["b"]
+
+
+def test_age_buckets_and_stale_rules():
+    """Test age bucketing and stale rule detection on aligned columns."""
+    names = ["recent", "month", "stale", "never", "no-data", "no-timestamp"]
+    hits = [5, 5, 5, 0, -1, 7]
+    last_hit = [NOW - DAY, NOW - 20 * DAY, NOW - 100 * DAY, 0, 0, 0]
+
+    assert age_buckets(hits, last_hit, NOW) == [
+        "0-7d",
+        "8-30d",
+        "91-180d",
+        "never",
+        None,
+        "unknown",
+    ]
+    assert stale_rules(names, hits, last_hit, 90, NOW) == ["stale", "never"]
+    assert stale_rules(names, hits, last_hit, 10, NOW) == ["month", "stale", "never"]
+
+
+def test_policy_analysis_join(firewall_xml_tree, exports):
+    """Test that the analysis joins the aggregated table with the policies."""
+    tree = _policy_tree(firewall_xml_tree, ["allow-web", "old-rule", "allow-dns", "unmonitored"])
+    table = HitCountTable.from_files(exports)
+
+    analysis = generate_security_policy_analysis_data(
+        tree,
+        "firewall",
+        "vsys",
+        "10.1",
+        include_hit_counts=True,
+        hit_count_data=table,
+        reference_time=NOW,
+        vsys="vsys1",
+    )
+
+    assert analysis["categories"]["by_hit_count"] == {
+        "zero": ["old-rule"],
+        "low": [],
+        "medium": ["allow-web"],
+        "high": ["allow-dns"],
+    }
+    assert analysis["categories"]["stale"] == ["old-rule"]
+    assert analysis["categories"]["by_last_hit_age"]["0-7d"] == ["allow-web"]
+    assert analysis["categories"]["by_last_hit_age"]["unknown"] == ["allow-dns"]
+    assert analysis["policies"]["allow-web"]["devices_hit"] == 3
+    assert "hit_count" not in analysis["policies"]["unmonitored"]
+    assert analysis["statistics"]["hit_counts"]["total"] == 2165
+    assert analysis["summary"]["stale_count"] == 1
+
+    # The dictionary format is still accepted
+    legacy = generate_security_policy_analysis_data(
+        tree,
+        "firewall",
+        "vsys",
+        "10.1",
+        include_hit_counts=True,
+        hit_count_data={"allow-web": {"hit_count": 0}, "old-rule": {"hit_count": 50}},
+        vsys="vsys1",
+    )
+    assert legacy["categories"]["by_hit_count"]["zero"] == ["allow-web"]
+    assert legacy["categories"]["by_hit_count"]["low"] == ["old-rule"]
+    assert legacy["statistics"]["hit_counts"]["median"] == 25
+
+
+def test_policy_analysis_command(firewall_xml_tree, exports, tmp_path):
+    """Test that --hit-counts joins the exports into the policy analysis report."""
+    config_file = tmp_path / "firewall.xml"
+    tree = _policy_tree(firewall_xml_tree, ["allow-web", "old-rule", "allow-dns"])
+    tree.write(str(config_file))
+    output = tmp_path / "analysis.json"
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "report",
+            "policy-analysis",
+            "--config",
+            str(config_file),
+            "--context",
+            "vsys",
+            "--hit-counts",
+            exports[0],
+            "--hit-counts",
+            exports[2],
+            "--output",
+            str(output),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "rules without hits in 90 days" in result.output
+    analysis = json.loads(output.read_text())
+    assert analysis["categories"]["by_hit_count"]["zero"] == ["old-rule"]
+    assert analysis["categories"]["by_hit_count"]["high"] == ["allow-dns"]
+    assert analysis["policies"]["allow-web"]["hit_count"] == 155
+
+
+def test_hit_count_ingestion_benchmark(tmp_path):
+    """Check aggregation throughput for many devices with 10k rules each."""
+    device_count, rule_count = 50, 10000
+    rows = "".join(f"rule-{i},{i % 7},{NOW - i}\n" for i in range(rule_count))
+    paths = []
+    for device in range(device_count):
+        path = tmp_path / f"device-{device}.csv"
+        path.write_text("Name,Hit Count,Last Hit\n" + rows)
+        paths.append(str(path))
+
+    records = device_count * rule_count
+    benchmark = PerformanceBenchmark("hit_count_ingestion")
+    table, duration = benchmark.measure(f"{records} records", HitCountTable.from_files, paths)
+    benchmark.print_report()
+
+    assert len(table) == rule_count
+    assert table.record_count == records
+    assert table.hits[7] == 0 and table.hits[8] == device_count
+    assert table.hits.itemsize * len(table.hits) == 8 * rule_count
+    assert duration < 60
@@ -0,0 +1,175 @@
+"""
+Tests for incremental report regeneration.
+"""
+
+import copy
+
+import pytest
+from lxml import etree
+
+from panflow.core.exceptions import CacheError
+from panflow.reporting import (
+    generate_duplicate_objects_report_data,
+    generate_security_policy_analysis_data,
+    generate_unused_objects_report_data,
+)
+from panflow.reporting.reports.incremental import IncrementalReportIndex
+from tests.common.benchmarks import PerformanceBenchmark
+
+
+def _config_tree(object_count=40, rule_count=20):
+    """Build a firewall configuration with used, unused and duplicate objects."""
+    root = etree.fromstring(
+        """
+        <config version="10.1.0">
+          <devices>
+            <entry name="localhost.localdomain">
+              <vsys>
+                <entry name="vsys1">
+                  <address/>
+                  <address-group/>
+                  <service/>
+                  <service-group/>
+                  <rulebase><security><rules/></security></rulebase>
+                </entry>
+              </vsys>
+            </entry>
+          </devices>
+        </config>
+        """
+    )
+    vsys = root.find(".//vsys/entry")
+    for i in range(object_count):
+        address = etree.SubElement(vsys.find("address"), "entry", name=f"host-{i}")
+        etree.SubElement(address, "ip-netmask").text = f"10.0.{i % 10}.1/32"
+        service = etree.SubElement(vsys.find("service"), "entry", name=f"svc-{i}")
+        tcp = etree.SubElement(etree.SubElement(service, "protocol"), "tcp")
+        etree.SubElement(tcp, "port").text = str(8000 + i % 5)
+
+    group = etree.SubElement(vsys.find("address-group"), "entry", name="hosts")
+    static = etree.SubElement(group, "static")
+    for i in range(3):
+        etree.SubElement(static, "member").text = f"host-{i}"
+
+    rules = vsys.find("rulebase/security/rules")
+    for i in range(rule_count):
+        rule = etree.SubElement(rules, "entry", name=f"rule-{i}")
+        for field, value in (
+            ("from", "trust"),
+            ("to", "untrust"),
+            ("source", "hosts" if i == 0 else f"host-{i}"),
+            ("destination", "any"),
+            ("application", "any"),
+            ("service", f"svc-{i}"),
+        ):
+            etree.SubElement(etree.SubElement(rule, field), "member").text = value
+        etree.SubElement(rule, "action").text = "allow"
+    return etree.ElementTree(root)
+
+
+REPORTS = [
+    (generate_unused_objects_report_data, {"object_type": "address"}),
+    (generate_unused_objects_report_data, {"object_type": "service"}),
+    (generate_duplicate_objects_report_data, {"object_type": "address"}),
+    (generate_security_policy_analysis_data, {}),
+]
+
+
+def _reports(tree, index=None):
+    results = []
+    for builder, params in REPORTS:
+        data = builder(tree, "firewall", "vsys", "10.1", index=index, vsys="vsys1", **params)
+        data.get("summary", {}).pop("generation_time", None)
+        results.append(data)
+    return results
+
+
+def _change(tree):
+    """Apply a change window: edit, add, remove and reorder rules and objects."""
+    tree = copy.deepcopy(tree)
+    vsys = tree.find(".//vsys/entry")
+    rules = vsys.find("rulebase/security/rules")
+
+    rules.find("entry[@name='rule-3']/source/member").text = "host-30"
+    rules.find("entry[@name='rule-5']/action").text = "deny"
+    rules.remove(rules.find("entry[@name='rule-7']"))
+    rules.insert(0, rules.find("entry[@name='rule-9']"))
+    new_rule = copy.deepcopy(rules.find("entry[@name='rule-1']"))
+    new_rule.set("name", "rule-new")
+    new_rule.find("service/member").text = "svc-39"
+    rules.append(new_rule)
+
+    addresses = vsys.find("address")
+    addresses.remove(addresses.find("entry[@name='host-35']"))
+    addresses.find("entry[@name='host-36']/ip-netmask").text = "10.0.6.1/32"
+    return tree
+
+
+def test_update_matches_full_regeneration():
+    """Test that reports over an updated index equal freshly generated reports."""
+    old_tree = _config_tree()
+    index = IncrementalReportIndex(old_tree)
+    assert _reports(old_tree, index) == _reports(old_tree)
+
+    new_tree = _change(old_tree)
+    delta = index.update(new_tree)
+    assert _reports(new_tree, index) == _reports(new_tree)
+
+    rules = delta["policies:security_rules:vsys:vsys=vsys1"]
+    assert rules["added"] == ["rule-new"]
+    assert rules["removed"] == ["rule-7"]
+    assert set(rules["changed"]) == {"rule-3", "rule-5"}
+    assert rules["changed"]["rule-5"] == ["action[1]/text()"]
+    assert delta["objects:address:vsys:vsys=vsys1"]["removed"] == ["host-35"]
+    assert "objects:service:vsys:vsys=vsys1" not in delta
+
+    # Only the changed entries were rebuilt; the others are the same objects
+    policies = index.get_policies(
+        new_tree, "security_rules", "firewall", "vsys", "10.1", vsys="vsys1"
+    )
+    assert list(policies)[0] == "rule-9"
+    assert index.update(copy.deepcopy(new_tree)) == {}
+    assert (
+        index.get_policies(index.tree, "security_rules", "firewall", "vsys", "10.1", vsys="vsys1")[
+            "rule-1"
+        ]
+        is policies["rule-1"]
+    )
+
+
+def test_save_and_load(tmp_path):
+    """Test that a saved state is updated to a later revision after loading."""
+    old_tree = _config_tree()
+    index = IncrementalReportIndex(old_tree)
+    _reports(old_tree, index)
+    state_file = str(tmp_path / "state.json.gz")
+    index.save(state_file)
+
+    loaded = IncrementalReportIndex.load(state_file)
+    assert loaded.section_labels == index.section_labels
+    new_tree = _change(old_tree)
+    loaded.update(new_tree)
+    assert _reports(new_tree, loaded) == _reports(new_tree)
+
+    (tmp_path / "bad.json").write_text('{"format_version": 0}')
+    with pytest.raises(CacheError):
+        IncrementalReportIndex.load(str(tmp_path / "bad.json"))
+
+
+def test_incremental_update_benchmark():
+    """Compare an incremental update with a full regeneration for a small change."""
+    old_tree = _config_tree(5000, 5000)
+    index = IncrementalReportIndex(old_tree)
+    _reports(old_tree, index)
+    new_tree = _change(old_tree)
+
+    def incremental_update():
+        index.update(new_tree)
+        return _reports(new_tree, index)
+
+    benchmark = PerformanceBenchmark("incremental_reports")
+    incremental, _ = benchmark.measure("5000 rules, incremental", incremental_update)
+    full, _ = benchmark.measure("5000 rules, full", _reports, new_tree)
+    benchmark.print_report()
+
+    assert incremental == full
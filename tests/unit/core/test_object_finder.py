@@ -101,11 +101,11 @@ class TestObjectLocation:
 
 
 @patch("panflow.core.object_finder.xpath_search")
-@patch("panflow.core.object_finder.get_object_xpath")
+@patch("panflow.core.object_finder.find_object_elements")
 class TestFindObjectsByName:
     """Tests for find_objects_by_name function."""
 
-    def test_find_objects_by_name_panorama(self, mock_get_xpath, mock_xpath_search):
+    def test_find_objects_by_name_panorama(self, mock_find_elements, mock_xpath_search):
         """Test finding objects by name in a Panorama configuration."""
         # Mock the XML tree
         tree = etree.ElementTree(etree.Element("config"))
@@ -114,19 +114,19 @@ class TestFindObjectsByName:
         mock_xpath_search.side_effect = lambda tree, xpath: (
             [etree.Element("entry", name="DG1"), etree.Element("entry", name="DG2")]
             if "device-group" in xpath
-            else [etree.Element("entry", name="T1")]
-            if "template" in xpath
-            else [etree.Element("entry", name="test-object")]
+            else [etree.Element("entry", name="T1")] if "template" in xpath else []
         )
 
-        # Mock get_object_xpath to return a path
-        mock_get_xpath.return_value = "/path/to/object"
+        # Mock the compiled object search to find the object in every context
+        mock_find_elements.side_effect = lambda *args, **kwargs: [
+            etree.Element("entry", name="test-object")
+        ]
 
         # Call the function
         results = find_objects_by_name(tree, "address", "test-object", "panorama", "10.1.0")
 
         # Expect calls for shared, device groups, and templates
-        assert mock_get_xpath.call_count == 4  # shared + 2 device groups + 1 template
+        assert mock_find_elements.call_count == 4  # shared + 2 device groups + 1 template
         assert len(results) == 4  # One result for each context
 
         # Check contexts
@@ -135,7 +135,7 @@ class TestFindObjectsByName:
         assert "device_group" in contexts
         assert "template" in contexts
 
-    def test_find_objects_by_name_firewall(self, mock_get_xpath, mock_xpath_search):
+    def test_find_objects_by_name_firewall(self, mock_find_elements, mock_xpath_search):
         """Test finding objects by name in a firewall configuration."""
         # Mock the XML tree
         tree = etree.ElementTree(etree.Element("config"))
@@ -144,17 +144,19 @@ class TestFindObjectsByName:
         mock_xpath_search.side_effect = lambda tree, xpath: (
             [etree.Element("entry", name="vsys1"), etree.Element("entry", name="vsys2")]
             if "vsys" in xpath
-            else [etree.Element("entry", name="test-object")]
+            else []
         )
 
-        # Mock get_object_xpath to return a path
-        mock_get_xpath.return_value = "/path/to/object"
+        # Mock the compiled object search to find the object in every vsys
+        mock_find_elements.side_effect = lambda *args, **kwargs: [
+            etree.Element("entry", name="test-object")
+        ]
 
         # Call the function
         results = find_objects_by_name(tree, "address", "test-object", "firewall", "10.1.0")
 
         # Expect calls for each vsys
-        assert mock_get_xpath.call_count == 2  # 2 vsys
+        assert mock_find_elements.call_count == 2  # 2 vsys
         assert len(results) == 2  # One result for each vsys
 
         # Check contexts
@@ -163,11 +165,11 @@ class TestFindObjectsByName:
 
 
 @patch("panflow.core.object_finder.xpath_search")
-@patch("panflow.core.object_finder.get_object_xpath")
+@patch("panflow.core.object_finder.find_object_elements")
 class TestFindObjectsByValue:
     """Tests for find_objects_by_value function."""
 
-    def test_find_objects_by_value(self, mock_get_xpath, mock_xpath_search):
+    def test_find_objects_by_value(self, mock_find_elements, mock_xpath_search):
         """Test finding objects by value criteria."""
         # Mock the XML tree
         tree = etree.ElementTree(etree.Element("config"))
@@ -183,17 +185,15 @@ class TestFindObjectsByValue:
         element3 = etree.Element("entry", name="obj3")
         etree.SubElement(element3, "ip-netmask").text = "192.168.1.0/24"
 
-        # Mock xpath_search to return elements
+        # Mock xpath_search to return the device groups
         mock_xpath_search.side_effect = lambda tree, xpath: (
-            [etree.Element("entry", name="DG1")]
-            if "device-group" in xpath
-            else [element1, element2, element3]
-            if "/entry" in xpath
-            else []
+            [etree.Element("entry", name="DG1")] if "device-group" in xpath else []
         )
 
-        # Mock get_object_xpath to return a path
-        mock_get_xpath.return_value = "/path/to/objects"
+        # Mock the compiled object search to return the elements of the device group
+        mock_find_elements.side_effect = lambda tree, object_type, device, context, *a, **k: (
+            [element1, element2, element3] if context == "device_group" else []
+        )
 
         # Set up the criteria
         value_criteria = {"ip-netmask": "10.0.0.0/24"}
@@ -212,11 +212,11 @@ class TestFindObjectsByValue:
 
 
 @patch("panflow.core.object_finder.xpath_search")
-@patch("panflow.core.object_finder.get_object_xpath")
+@patch("panflow.core.object_finder.find_object_elements")
 class TestFindAllLocations:
     """Tests for find_all_locations function."""
 
-    def test_find_all_locations(self, mock_get_xpath, mock_xpath_search):
+    def test_find_all_locations(self, mock_find_elements, mock_xpath_search):
         """Test finding all object locations."""
         # Mock the XML tree
         tree = etree.ElementTree(etree.Element("config"))
@@ -226,19 +226,17 @@ class TestFindAllLocations:
         address2 = etree.Element("entry", name="db-server")
         service1 = etree.Element("entry", name="http")
 
-        # Mock xpath_search to return contexts and elements
+        # Mock xpath_search to return the device groups
         mock_xpath_search.side_effect = lambda tree, xpath: (
-            [etree.Element("entry", name="DG1")]
-            if "device-group" in xpath and not "/entry" in xpath
-            else [address1, address2]
-            if "address" in xpath and "/entry" in xpath
-            else [service1]
-            if "service" in xpath and "/entry" in xpath
-            else []
+            [etree.Element("entry", name="DG1")] if "device-group" in xpath else []
         )
 
-        # Mock get_object_xpath to return a path
-        mock_get_xpath.return_value = "/path/to/objects"
+        # Mock the compiled object search to return the objects of each type
+        mock_find_elements.side_effect = lambda tree, object_type, *args, **kwargs: (
+            [address1, address2]
+            if object_type == "address"
+            else [service1] if object_type == "service" else []
+        )
 
         # Call the function
         results = find_all_locations(tree, "panorama", "10.1.0")
@@ -0,0 +1,181 @@
+"""
+Tests for the object x device-group usage report.
+"""
+
+import csv
+import json
+
+from lxml import etree
+
+from panflow.cli.commands.report_commands import report_object_usage
+from panflow.reporting import ReportingEngine, generate_object_usage_report_data
+from panflow.reporting.reports.report_index import ReportIndex
+from tests.common.benchmarks import PerformanceBenchmark
+
+
+def _panorama_tree(regions=2, sites_per_region=2, object_count=20):
+    """
+    Build a Panorama configuration with region and site device groups.
+
+    Shared defines obj-0 .. obj-N. A shared rule uses obj-0, the rule of
+    site s uses obj-(1 + s) and the region object obj-(1 + sites + r), and
+    every site defines local-dns with the same value.
+    """
+    root = etree.fromstring(
+        """
+        <config version="10.1.0">
+          <devices>
+            <entry name="localhost.localdomain"><device-group/></entry>
+          </devices>
+          <shared>
+            <address/>
+            <pre-rulebase><security><rules/></security></pre-rulebase>
+          </shared>
+        </config>
+        """
+    )
+    site_count = regions * sites_per_region
+    shared = root.find("shared")
+    for i in range(object_count):
+        address = etree.SubElement(shared.find("address"), "entry", name=f"obj-{i}")
+        ip = f"10.{i // 65536}.{i // 256 % 256}.{i % 256}/32"
+        etree.SubElement(address, "ip-netmask").text = ip
+
+    def add_rule(rules, name, source, destination):
+        rule = etree.SubElement(rules, "entry", name=name)
+        for field, members in (("source", source), ("destination", destination)):
+            element = etree.SubElement(rule, field)
+            for member in members:
+                etree.SubElement(element, "member").text = member
+        etree.SubElement(etree.SubElement(rule, "service"), "member").text = "any"
+        etree.SubElement(rule, "action").text = "allow"
+
+    add_rule(shared.find("pre-rulebase/security/rules"), "shared-rule", ["obj-0"], ["any"])
+
+    device_groups = root.find("devices/entry/device-group")
+    for r in range(regions):
+        etree.SubElement(device_groups, "entry", name=f"region-{r}")
+    for s in range(site_count):
+        r = s // sites_per_region
+        site = etree.SubElement(device_groups, "entry", name=f"site-{s}")
+        etree.SubElement(site, "parent-dg").text = f"region-{r}"
+        address = etree.SubElement(etree.SubElement(site, "address"), "entry", name="local-dns")
+        etree.SubElement(address, "ip-netmask").text = "10.255.0.53/32"
+        rulebase = etree.SubElement(site, "pre-rulebase")
+        rules = etree.SubElement(etree.SubElement(rulebase, "security"), "rules")
+        destination = [f"obj-{1 + site_count + r}", "local-dns"]
+        add_rule(rules, f"site-{s}-rule", [f"obj-{1 + s}"], destination)
+    return etree.ElementTree(root)
+
+
+def _recommendations(data):
+    return {(r["object"], r["action"]): r["target"] for r in data["recommendations"]}
+
+
+def test_usage_matrix_and_recommendations():
+    """Test the usage matrix and the move down, consolidate and unused recommendations."""
+    tree = _panorama_tree(regions=2, sites_per_region=2, object_count=10)
+    data = generate_object_usage_report_data(tree, "panorama", "shared", "10.1")
+
+    rows = {(row["context"], row["name"]): row for row in data["objects"]}
+    assert rows[("shared", "obj-0")]["device_groups"] == {"shared": 1}
+    assert rows[("shared", "obj-5")]["device_groups"] == {"site-0": 1, "site-1": 1}
+    assert rows[("site-2", "local-dns")]["device_groups"] == {"site-2": 1}
+
+    recommendations = _recommendations(data)
+    assert recommendations[("obj-1", "move_down")] == "site-0"
+    assert recommendations[("obj-5", "move_down")] == "region-0"
+    assert recommendations[("obj-9", "unused")] is None
+    assert recommendations[("local-dns", "consolidate")] == "shared"
+    assert ("obj-0", "move_down") not in recommendations
+
+    assert data["summary"]["device_groups"] == 6
+    assert data["summary"]["cells"] == sum(len(row["device_groups"]) for row in data["objects"])
+    depths = {group["name"]: group["depth"] for group in data["device_groups"]}
+    assert depths == {
+        "shared": 0,
+        "region-0": 1,
+        "region-1": 1,
+        "site-0": 2,
+        "site-1": 2,
+        "site-2": 2,
+        "site-3": 2,
+    }
+
+
+def test_references_resolve_to_nearest_definition():
+    """Test that a device group object hides a shared object of the same name."""
+    tree = _panorama_tree(regions=1, sites_per_region=2, object_count=6)
+    region = tree.find(".//device-group/entry[@name='region-0']")
+    address = etree.SubElement(etree.SubElement(region, "address"), "entry", name="obj-1")
+    etree.SubElement(address, "ip-netmask").text = "192.0.2.1/32"
+
+    data = generate_object_usage_report_data(tree, "panorama", "shared", "10.1")
+    rows = {(row["context"], row["name"]): row for row in data["objects"]}
+
+    assert rows[("region-0", "obj-1")]["device_groups"] == {"site-0": 1}
+    assert rows[("shared", "obj-1")]["device_groups"] == {}
+    recommendations = _recommendations(data)
+    assert recommendations[("obj-1", "unused")] is None
+    assert recommendations[("obj-1", "move_down")] == "site-0"
+    assert recommendations[("local-dns", "consolidate")] == "region-0"
+
+    # The site copies cannot replace a region definition with another value
+    region_dns = etree.SubElement(region.find("address"), "entry", name="local-dns")
+    etree.SubElement(region_dns, "ip-netmask").text = "192.0.2.53/32"
+    data = generate_object_usage_report_data(tree, "panorama", "shared", "10.1")
+    assert ("local-dns", "consolidate") not in _recommendations(data)
+
+
+def test_object_usage_outputs(tmp_path, capsys):
+    """Test the CSV and JSON Lines output and the CLI command."""
+    tree = _panorama_tree()
+    engine = ReportingEngine(tree, "panorama", "shared", "10.1")
+
+    csv_file = str(tmp_path / "usage.csv")
+    data = engine.generate_object_usage_report(output_file=csv_file, output_format="csv")
+    with open(tmp_path / "usage.csv", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0][:4] == ["Object Name", "Context", "References", "Device Groups"]
+    assert ["obj-5", "shared", "2", "site-0:1, site-1:1", "move_down", "region-0"] in rows
+    assert len(rows) == len(data["objects"]) + 1
+
+    jsonl_file = str(tmp_path / "usage.jsonl")
+    engine.generate_object_usage_report(output_file=jsonl_file, output_format="jsonl")
+    lines = (tmp_path / "usage.jsonl").read_text().splitlines()
+    assert [json.loads(line) for line in lines] == data["objects"]
+
+    index = ReportIndex(tree)
+    shared = generate_object_usage_report_data(tree, "panorama", "shared", "10.1", index=index)
+    assert shared == data
+
+    config = tmp_path / "panorama.xml"
+    tree.write(str(config))
+    report_object_usage(
+        config_file=str(config), object_type="address", output_file=None, output_format="json"
+    )
+    assert "24 address objects, 11 used across 6 device groups" in capsys.readouterr().out
+
+
+def test_object_usage_requires_panorama(firewall_xml_tree):
+    """Test that firewall configurations are rejected."""
+    data = generate_object_usage_report_data(firewall_xml_tree, "firewall", "vsys", "10.1")
+    assert "error" in data
+
+
+def test_object_usage_benchmark():
+    """Time the report for a hierarchy of 110 device groups and 20k shared objects."""
+    tree = _panorama_tree(regions=10, sites_per_region=10, object_count=20000)
+
+    benchmark = PerformanceBenchmark("object_usage")
+    data, duration = benchmark.measure(
+        "110 device groups x 20000 objects",
+        generate_object_usage_report_data,
+        tree,
+        "panorama",
+        "shared",
+        "10.1",
+    )
+    benchmark.print_report()
+
+    assert data["summary"]["move_down_count"] == 110
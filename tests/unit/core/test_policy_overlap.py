@@ -0,0 +1,136 @@
+"""
+Tests for the indexed policy overlap engine.
+"""
+
+import random
+
+from panflow.reporting.reports.policy_analysis import (
+    _check_policy_overlap,
+    _generate_policy_visualization,
+)
+from panflow.reporting.reports.policy_overlap import PolicyOverlapIndex
+from tests.common.benchmarks import PerformanceBenchmark
+
+
+def _random_policies(count, seed=7):
+    """Build policies with a mix of specific members, shared members and 'any'."""
+    rng = random.Random(seed)
+    zones = ["trust", "untrust", "dmz", "guest"]
+    policies = {}
+    for i in range(count):
+        policy = {
+            "from": rng.sample(zones, rng.randint(1, 2)),
+            "to": ["any"] if rng.random() < 0.1 else rng.sample(zones, 1),
+            "source": ["any"] if rng.random() < 0.2 else [f"src-{rng.randint(0, 30)}"],
+            "destination": [f"dst-{rng.randint(0, 30)}", f"dst-{rng.randint(0, 30)}"],
+            "service": ["any"] if rng.random() < 0.3 else [f"svc-{rng.randint(0, 5)}"],
+            "action": rng.choice(["allow", "deny"]),
+        }
+        if rng.random() < 0.5:
+            policy["application"] = ["any"] if rng.random() < 0.5 else [f"app-{rng.randint(0, 3)}"]
+        if rng.random() < 0.1:
+            policy["disabled"] = "yes"
+        policies[f"rule-{i}"] = policy
+    return policies
+
+
+def _pairwise_visualization(policies):
+    """Reference implementation comparing every pair of enabled policies."""
+    matrix = []
+    links = []
+    for name1, policy1 in policies.items():
+        if policy1.get("disabled", "no") == "yes":
+            continue
+        row = {"name": name1, "overlaps": []}
+        for name2, policy2 in policies.items():
+            if name1 == name2 or policy2.get("disabled", "no") == "yes":
+                continue
+            overlap = _check_policy_overlap(policy1, policy2)
+            if overlap["has_overlap"]:
+                row["overlaps"].append(
+                    {"policy": name2, "type": overlap["type"], "fields": overlap["fields"]}
+                )
+                links.append(
+                    {
+                        "source": name1,
+                        "target": name2,
+                        "type": overlap["type"],
+                        "weight": len(overlap["fields"]),
+                    }
+                )
+        matrix.append(row)
+    return matrix, links
+
+
+def test_indexed_overlaps_match_pairwise():
+    """Test that the indexed engine reproduces the pairwise comparison exactly."""
+    policies = _random_policies(150)
+    visualization = _generate_policy_visualization(policies)
+    matrix, links = _pairwise_visualization(policies)
+
+    assert visualization["policy_matrix"] == matrix
+    assert visualization["overlap_graph"]["links"] == links
+    assert len(visualization["overlap_graph"]["nodes"]) == len(policies)
+    assert {link["type"] for link in links} == {"partial", "duplicate", "conflict"}
+
+
+def test_overlap_types():
+    """Test duplicate, conflict and partial classification."""
+    base = {
+        "from": ["trust"],
+        "to": ["untrust"],
+        "source": ["any"],
+        "destination": ["web"],
+        "service": ["tcp-443"],
+        "application": ["ssl"],
+        "action": "allow",
+    }
+    policies = {
+        "a": base,
+        "b": dict(base),
+        "c": dict(base, action="deny"),
+        "d": dict(base, destination=["db"], service=["tcp-1433"]),
+        "e": {"from": ["guest"], "action": "allow"},
+    }
+    index = PolicyOverlapIndex(policies)
+    overlaps = [(index.names[i], kind, fields) for i, kind, fields in index.overlaps_for(0)]
+
+    assert overlaps == [
+        ("b", "duplicate", ["source", "destination", "service", "application", "from", "to"]),
+        ("c", "conflict", ["source", "destination", "service", "application", "from", "to"]),
+        ("d", "partial", ["source", "application", "from", "to"]),
+    ]
+
+
+def test_max_links_per_rule_prefers_full_overlaps():
+    """Test that capped output keeps duplicates and conflicts ahead of partial overlaps."""
+    shared = {"from": ["trust"], "to": ["untrust"], "source": ["any"], "action": "allow"}
+    policies = {f"partial-{i}": dict(shared, destination=[f"d{i}"]) for i in range(5)}
+    policies["target"] = dict(shared, destination=["web"])
+    policies["copy"] = dict(shared, destination=["web"], action="deny")
+
+    fields = ["source", "destination", "from", "to"]
+    index = PolicyOverlapIndex(policies, fields=fields)
+    target = index.names.index("target")
+
+    capped = index.overlaps_for(target, max_links=2)
+    assert [index.names[i] for i, _, _ in capped] == ["partial-0", "copy"]
+    assert capped[1][1] == "conflict"
+
+    visualization = _generate_policy_visualization(_random_policies(200), max_links_per_rule=3)
+    assert all(len(row["overlaps"]) <= 3 for row in visualization["policy_matrix"])
+
+
+def test_overlap_engine_benchmark():
+    """Check that 8k rules with a per-rule link cap finish quickly."""
+    policies = _random_policies(8000)
+
+    benchmark = PerformanceBenchmark("policy_overlap")
+    visualization, duration = benchmark.measure(
+        "8000 rules", _generate_policy_visualization, policies, max_links_per_rule=25
+    )
+    benchmark.print_report()
+
+    link_count = len(visualization["overlap_graph"]["links"])
+    assert link_count <= 25 * len(visualization["policy_matrix"])
+    assert duration < 60
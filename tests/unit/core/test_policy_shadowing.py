@@ -0,0 +1,240 @@
+"""
+Tests for rule resolution and the rule shadowing analysis.
+"""
+
+from lxml import etree
+
+from panflow.core.rule_resolver import (
+    ANY_MEMBERS,
+    IntervalIndex,
+    IntervalSet,
+    MemberSet,
+    RuleResolver,
+    parse_address_value,
+)
+from panflow.reporting import ReportingEngine, generate_policy_shadowing_report_data
+from panflow.reporting.reports.policy_shadowing import ShadowAnalyzer
+from tests.common.benchmarks import PerformanceBenchmark
+
+VSYS_PATH = "/config/devices/entry[@name='localhost.localdomain']/vsys/entry[@name='vsys1']"
+
+
+def _rule(name, action="allow", **fields):
+    """Build a rule entry; fields default to 'any' and zones to trust -> untrust."""
+    entry = etree.Element("entry", name=name)
+    members = {"from": ["trust"], "to": ["untrust"], "application": ["any"], "service": ["any"]}
+    members.update({key.rstrip("_"): value for key, value in fields.items()})
+    for field in ("from", "to", "source", "destination", "application", "service"):
+        element = etree.SubElement(entry, field)
+        for value in members.get(field, ["any"]):
+            etree.SubElement(element, "member").text = value
+    etree.SubElement(entry, "action").text = action
+    return entry
+
+
+def _firewall_config(rules):
+    """Build a firewall configuration with a few objects and the given rules."""
+    root = etree.fromstring(
+        """
+        <config version="10.1.0">
+          <devices>
+            <entry name="localhost.localdomain">
+              <vsys>
+                <entry name="vsys1">
+                  <address>
+                    <entry name="net-10"><ip-netmask>10.0.0.0/8</ip-netmask></entry>
+                    <entry name="web-1"><ip-netmask>10.1.1.10/32</ip-netmask></entry>
+                    <entry name="web-2"><ip-netmask>10.1.1.11</ip-netmask></entry>
+                    <entry name="web-range"><ip-range>10.1.1.10-10.1.1.11</ip-range></entry>
+                    <entry name="lower-half"><ip-netmask>192.168.0.0/25</ip-netmask></entry>
+                    <entry name="upper-half"><ip-netmask>192.168.0.128/25</ip-netmask></entry>
+                    <entry name="lan"><ip-netmask>192.168.0.0/24</ip-netmask></entry>
+                    <entry name="portal"><fqdn>portal.example.com</fqdn></entry>
+                  </address>
+                  <address-group>
+                    <entry name="web-servers">
+                      <static><member>web-1</member><member>web-2</member></static>
+                    </entry>
+                    <entry name="dynamic-hosts">
+                      <dynamic><filter>'tag1'</filter></dynamic>
+                    </entry>
+                  </address-group>
+                  <service>
+                    <entry name="tcp-443"><protocol><tcp><port>443</port></tcp></protocol></entry>
+                    <entry name="web-ports">
+                      <protocol><tcp><port>80,443,8000-8080</port></tcp></protocol>
+                    </entry>
+                  </service>
+                  <service-group>
+                    <entry name="https-group"><members><member>tcp-443</member></members></entry>
+                  </service-group>
+                  <rulebase><security><rules/></security></rulebase>
+                </entry>
+              </vsys>
+            </entry>
+          </devices>
+        </config>
+        """
+    )
+    container = root.find(".//rulebase/security/rules")
+    for rule in rules:
+        container.append(rule)
+    return etree.ElementTree(root)
+
+
+def _analyze(rules):
+    tree = _firewall_config(rules)
+    data = generate_policy_shadowing_report_data(tree, "firewall", "vsys", "10.1", vsys="vsys1")
+    return {finding["rule"]: finding for finding in data["findings"]}, data
+
+
+def test_interval_and_member_sets():
+    """Test interval normalization and member set coverage."""
+    intervals = IntervalSet([(5, 9), (1, 3), (4, 4), (20, 30)])
+    assert intervals.intervals == ((1, 9), (20, 30))
+    assert 25 in intervals and 10 not in intervals
+    assert intervals.covers(IntervalSet([(2, 8), (21, 22)]))
+    assert not intervals.covers(IntervalSet([(8, 12)]))
+    assert intervals.union(IntervalSet([(10, 19)])).intervals == ((1, 30),)
+
+    host = MemberSet(ranges=IntervalSet([parse_address_value("10.1.1.1")]))
+    network = MemberSet(ranges=IntervalSet([parse_address_value("10.0.0.0/8")]))
+    opaque = MemberSet(names=frozenset(["address:portal"]))
+    assert network.covers(host) and not host.covers(network)
+    assert ANY_MEMBERS.covers(opaque) and not network.covers(opaque)
+    assert not network.intersects(opaque)
+
+
+def test_interval_index_matches_brute_force():
+    """Test containing and overlapping queries against a linear scan."""
+    sets = [IntervalSet([(i * 7 % 50, i * 7 % 50 + i % 9)]) for i in range(60)]
+    index = IntervalIndex(enumerate(sets))
+    for low, high in ((0, 0), (10, 12), (33, 40), (55, 70)):
+        span = IntervalSet([(low, high)])
+        assert index.containing(low, high) == {i for i, s in enumerate(sets) if s.covers(span)}
+        assert index.overlapping(low, high) == {i for i, s in enumerate(sets) if s.intersects(span)}
+
+
+def test_resolver_expands_objects_by_value():
+    """Test that groups, ranges and services resolve to comparable values."""
+    tree = _firewall_config([])
+    resolver = RuleResolver(tree, "firewall", "vsys", "10.1", vsys="vsys1")
+
+    group = resolver.resolve_field("destination", ["web-servers"])
+    assert group == resolver.resolve_field("destination", ["web-range"])
+    assert resolver.resolve_address("net-10").covers(group)
+    assert resolver.resolve_address("portal").names == frozenset(["address:portal"])
+    assert resolver.resolve_address("dynamic-hosts").ranges == IntervalSet()
+
+    assert resolver.resolve_service("https-group") == resolver.resolve_service("tcp-443")
+    assert resolver.resolve_service("web-ports").covers(resolver.resolve_service("https-group"))
+    assert resolver.resolve_service("application-default").names
+
+
+def test_resolver_groups_in_a_cycle_resolve_completely():
+    """Test that a group first reached inside a cycle is not cached truncated."""
+    tree = _firewall_config([])
+    groups = tree.find(".//address-group")
+    for name, members in (("ring-a", ["web-1", "ring-b"]), ("ring-b", ["web-2", "ring-a"])):
+        static = etree.SubElement(etree.SubElement(groups, "entry", name=name), "static")
+        for member in members:
+            etree.SubElement(static, "member").text = member
+    resolver = RuleResolver(tree, "firewall", "vsys", "10.1", vsys="vsys1")
+
+    web_servers = resolver.resolve_address("web-servers")
+    assert resolver.resolve_address("ring-a") == web_servers
+    assert resolver.resolve_address("ring-b") == web_servers
+
+
+def test_single_rule_shadowing():
+    """Test redundant and shadowed rules covered by one earlier rule."""
+    findings, data = _analyze(
+        [
+            _rule("allow-net", source=["net-10"], service=["web-ports"]),
+            _rule("allow-host", source=["10.1.2.3"], service=["https-group"]),
+            _rule("deny-web", action="deny", source=["web-servers"], service=["tcp-443"]),
+            _rule("allow-portal", destination=["portal"]),
+            _rule("allow-portal-again", destination=["portal"], service=["tcp-443"]),
+        ]
+    )
+
+    assert findings["allow-host"]["type"] == "redundant"
+    assert findings["allow-host"]["covered_by"] == ["allow-net"]
+    assert findings["deny-web"]["type"] == "shadowed"
+    assert findings["deny-web"]["coverage"] == "single"
+    # FQDN objects are only covered by the same object
+    assert findings["allow-portal"]["type"] == "partially_shadowed"
+    assert findings["allow-portal-again"]["covered_by"] == ["allow-portal"]
+    assert data["summary"]["shadowed_count"] == 1
+    assert data["summary"]["redundant_count"] == 2
+
+
+def test_combined_and_partial_shadowing():
+    """Test coverage by several earlier rules and partial shadowing."""
+    findings, _ = _analyze(
+        [
+            _rule("lower", source=["lower-half"]),
+            _rule("upper", source=["upper-half"]),
+            _rule("lan", action="deny", source=["lan"]),
+            _rule("deny-web", action="deny", destination=["web-1"]),
+            _rule("allow-all-web", destination=["web-servers"]),
+        ]
+    )
+
+    assert findings["lan"]["type"] == "shadowed"
+    assert findings["lan"]["coverage"] == "combined"
+    assert findings["lan"]["covered_by"] == ["lower", "upper"]
+    assert findings["allow-all-web"]["type"] == "partially_shadowed"
+    assert "deny-web" in findings["allow-all-web"]["overlapping_rules"]
+
+
+def test_engine_saves_csv(tmp_path):
+    """Test the shadowing report through the reporting engine."""
+    tree = _firewall_config(
+        [_rule("first", source=["net-10"]), _rule("second", source=["10.9.9.9"])]
+    )
+    engine = ReportingEngine(tree, "firewall", "vsys", "10.1", vsys="vsys1")
+    output_file = str(tmp_path / "shadowing.csv")
+    data = engine.generate_policy_shadowing_report(output_file=output_file, output_format="csv")
+
+    assert data["findings"][0]["rule"] == "second"
+    with open(output_file) as f:
+        assert "second,1,allow,redundant,single,first" in f.read()
+
+
+def test_shadowing_benchmark():
+    """Check that 20k rules are analyzed in under a minute."""
+    rules = []
+    for i in range(20000):
+        kind = i % 4
+        if kind == 0:
+            source = f"10.{i // 256 % 256}.{i % 256}.0/24"
+        elif kind == 1:
+            # Host inside an earlier /24
+            source = f"10.{(i - 1) // 256 % 256}.{(i - 1) % 256}.7"
+        else:
+            source = f"172.{i // 256 % 32 + 16}.{i % 256}.{i % 200}"
+        rules.append(
+            _rule(
+                f"rule-{i}",
+                action="deny" if i % 3 == 0 else "allow",
+                from_=[f"zone-{i // 4 % 8}"],
+                source=[source],
+                destination=[f"192.168.{i // 4 % 256}.0/24"],
+                service=["tcp-443" if i % 2 else "web-ports"],
+            )
+        )
+    tree = _firewall_config(rules)
+
+    def analyze():
+        resolver = RuleResolver(tree, "firewall", "vsys", "10.1", vsys="vsys1")
+        resolved = resolver.resolve_rules("security_rules")
+        return resolved, ShadowAnalyzer(resolved).analyze()
+
+    benchmark = PerformanceBenchmark("policy_shadowing")
+    (resolved, findings), duration = benchmark.measure("20000 rules", analyze)
+    benchmark.print_report()
+
+    assert len(resolved) == 20000
+    assert findings
+    assert duration < 60
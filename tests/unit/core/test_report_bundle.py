@@ -0,0 +1,212 @@
+"""
+Tests for concurrent report bundle generation.
+"""
+
+import json
+import os
+
+import pytest
+from lxml import etree
+
+from panflow.cli.commands.report_commands import report_bundle
+from panflow.reporting import (
+    ReportingEngine,
+    generate_duplicate_objects_report_data,
+    generate_unused_objects_report_data,
+)
+from panflow.reporting.engine import DEFAULT_BUNDLE_SECTIONS
+from panflow.reporting.reports.report_index import ReportIndex
+from tests.common.benchmarks import PerformanceBenchmark
+
+
+def _config_tree(object_count=40, rule_count=20):
+    """Build a firewall configuration with used, unused and duplicate objects."""
+    root = etree.fromstring(
+        """
+        <config version="10.1.0">
+          <devices>
+            <entry name="localhost.localdomain">
+              <vsys>
+                <entry name="vsys1">
+                  <address/>
+                  <address-group/>
+                  <service/>
+                  <service-group/>
+                  <rulebase><security><rules/></security></rulebase>
+                </entry>
+              </vsys>
+            </entry>
+          </devices>
+        </config>
+        """
+    )
+    vsys = root.find(".//vsys/entry")
+    for i in range(object_count):
+        address = etree.SubElement(vsys.find("address"), "entry", name=f"host-{i}")
+        etree.SubElement(address, "ip-netmask").text = f"10.0.{i % 10}.1/32"
+        service = etree.SubElement(vsys.find("service"), "entry", name=f"svc-{i}")
+        tcp = etree.SubElement(etree.SubElement(service, "protocol"), "tcp")
+        etree.SubElement(tcp, "port").text = str(8000 + i % 5)
+
+    group = etree.SubElement(vsys.find("address-group"), "entry", name="hosts")
+    static = etree.SubElement(group, "static")
+    for i in range(3):
+        etree.SubElement(static, "member").text = f"host-{i}"
+
+    rules = vsys.find("rulebase/security/rules")
+    for i in range(rule_count):
+        rule = etree.SubElement(rules, "entry", name=f"rule-{i}")
+        for field, value in (
+            ("from", "trust"),
+            ("to", "untrust"),
+            ("source", "hosts" if i == 0 else f"host-{i}"),
+            ("destination", "any"),
+            ("application", "any"),
+            ("service", f"svc-{i}"),
+        ):
+            etree.SubElement(etree.SubElement(rule, field), "member").text = value
+        etree.SubElement(rule, "action").text = "allow"
+    return etree.ElementTree(root)
+
+
+@pytest.fixture
+def engine():
+    return ReportingEngine(_config_tree(), "firewall", "vsys", "10.1", vsys="vsys1")
+
+
+def test_bundle_matches_sequential_reports(engine, tmp_path):
+    """Test that bundle sections equal the reports generated one by one."""
+    bundle = engine.generate_bundle(output_dir=str(tmp_path), max_workers=4)
+
+    assert bundle["errors"] == {}
+    assert set(bundle["sections"]) == {section["name"] for section in DEFAULT_BUNDLE_SECTIONS}
+    assert bundle["sections"]["unused-address"] == generate_unused_objects_report_data(
+        engine.tree, "firewall", "vsys", "10.1", object_type="address", vsys="vsys1"
+    )
+    assert bundle["sections"]["duplicate-service"] == generate_duplicate_objects_report_data(
+        engine.tree, "firewall", "vsys", "10.1", object_type="service", vsys="vsys1"
+    )
+    assert "host-25" in [
+        obj["name"] for obj in bundle["sections"]["unused-address"]["unused_objects"]
+    ]
+
+    for name, path in bundle["files"].items():
+        assert path == os.path.join(str(tmp_path), f"{name}.json")
+        with open(path) as f:
+            json.load(f)
+    assert len(bundle["files"]) == len(DEFAULT_BUNDLE_SECTIONS)
+
+
+def test_bundle_shares_index(engine):
+    """Test that sections reuse the lookups of other sections."""
+    bundle = engine.generate_bundle(max_workers=1)
+    separate = [
+        engine.generate_bundle(sections=[section])["index"]["misses"]
+        for section in DEFAULT_BUNDLE_SECTIONS
+    ]
+
+    # Every unused objects section reads the same rulebases
+    assert bundle["index"]["misses"] < sum(separate) / 2
+
+    index = ReportIndex(engine.tree)
+    first = index.get_objects(engine.tree, "address", "firewall", "vsys", "10.1", vsys="vsys1")
+    assert (
+        index.get_objects(engine.tree, "address", "firewall", "vsys", "10.1", vsys="vsys1") is first
+    )
+    assert (index.hits, index.misses) == (1, 1)
+    with pytest.raises(ValueError):
+        index.get_objects(_config_tree(), "address", "firewall", "vsys", "10.1", vsys="vsys1")
+
+
+def test_bundle_section_errors(engine, tmp_path):
+    """Test that a failing section is reported without stopping the others."""
+    calls = []
+    bundle = engine.generate_bundle(
+        sections=[
+            {"name": "addresses", "report": "unused_objects", "object_type": "address"},
+            {"name": "broken", "report": "duplicate_objects", "object_type": "no-such-type"},
+        ],
+        output_dir=str(tmp_path),
+        output_format="html",
+        on_section=lambda name, data: calls.append(name),
+    )
+
+    assert calls == ["addresses"]
+    assert set(bundle["errors"]) == {"broken"}
+    assert bundle["files"] == {"addresses": os.path.join(str(tmp_path), "addresses.html")}
+
+    with pytest.raises(ValueError):
+        engine.generate_bundle(sections=[{"name": "x", "report": "unknown"}])
+
+
+def test_bundle_processes(engine, tmp_path):
+    """Test generating sections in worker processes."""
+    sections = DEFAULT_BUNDLE_SECTIONS[:2]
+    bundle = engine.generate_bundle(
+        sections=sections, output_dir=str(tmp_path), use_processes=True, max_workers=2
+    )
+
+    assert bundle["errors"] == {}
+    threaded = engine.generate_bundle(sections=sections)
+    assert bundle["sections"] == threaded["sections"]
+
+
+def test_report_bundle_command(tmp_path, capsys):
+    """Test the report bundle CLI command."""
+    config = tmp_path / "config.xml"
+    _config_tree().write(str(config))
+    output_dir = tmp_path / "reports"
+
+    report_bundle(
+        config_file=str(config),
+        output_dir=str(output_dir),
+        output_format="csv",
+        sections="unused-address,duplicate-address",
+        workers=2,
+        processes=False,
+        state_file=None,
+        context="vsys",
+        device_group=None,
+        vsys="vsys1",
+    )
+
+    assert sorted(os.listdir(output_dir)) == ["duplicate-address.csv", "unused-address.csv"]
+    assert "Generated 2 of 2 reports" in capsys.readouterr().out
+
+    # With a state file, the second run only re-reads what changed
+    state_file = str(tmp_path / "state.json")
+    for _ in range(2):
+        report_bundle(
+            config_file=str(config),
+            output_dir=str(output_dir),
+            output_format="json",
+            sections="unused-address",
+            workers=None,
+            processes=False,
+            state_file=state_file,
+            context="vsys",
+            device_group=None,
+            vsys="vsys1",
+        )
+    assert "0 entries changed in 0 sections" in capsys.readouterr().out
+
+
+def test_report_bundle_benchmark():
+    """Compare bundle generation with generating each report sequentially."""
+    engine = ReportingEngine(_config_tree(2000, 500), "firewall", "vsys", "10.1", vsys="vsys1")
+    sections = [
+        section for section in DEFAULT_BUNDLE_SECTIONS if section["report"] != "policy_shadowing"
+    ]
+
+    def sequential():
+        for section in sections:
+            engine.generate_bundle(sections=[section], max_workers=1)
+
+    benchmark = PerformanceBenchmark("report_bundle")
+    benchmark.measure(f"{len(sections)} sections, sequential", sequential)
+    bundle, _ = benchmark.measure(
+        f"{len(sections)} sections, bundle", engine.generate_bundle, sections=sections
+    )
+    benchmark.print_report()
+
+    assert bundle["errors"] == {}
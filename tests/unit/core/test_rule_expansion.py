@@ -0,0 +1,298 @@
+"""
+Tests for the rule expansion cost report.
+"""
+
+import csv
+
+from lxml import etree
+
+from panflow.cli.commands.report_commands import report_rule_expansion
+from panflow.core.rule_resolver import RuleResolver
+from panflow.reporting import ReportingEngine, generate_rule_expansion_report_data
+from panflow.reporting.reports.rule_expansion import GroupExpander, SizeSketch
+from tests.common.benchmarks import PerformanceBenchmark
+
+
+def _config_tree(object_count=40, rule_count=20):
+    """Build a firewall configuration with used, unused and duplicate objects."""
+    root = etree.fromstring(
+        """
+        <config version="10.1.0">
+          <devices>
+            <entry name="localhost.localdomain">
+              <vsys>
+                <entry name="vsys1">
+                  <address/>
+                  <address-group/>
+                  <service/>
+                  <service-group/>
+                  <rulebase><security><rules/></security></rulebase>
+                </entry>
+              </vsys>
+            </entry>
+          </devices>
+        </config>
+        """
+    )
+    vsys = root.find(".//vsys/entry")
+    for i in range(object_count):
+        address = etree.SubElement(vsys.find("address"), "entry", name=f"host-{i}")
+        etree.SubElement(address, "ip-netmask").text = f"10.0.{i % 10}.1/32"
+        service = etree.SubElement(vsys.find("service"), "entry", name=f"svc-{i}")
+        tcp = etree.SubElement(etree.SubElement(service, "protocol"), "tcp")
+        etree.SubElement(tcp, "port").text = str(8000 + i % 5)
+
+    group = etree.SubElement(vsys.find("address-group"), "entry", name="hosts")
+    static = etree.SubElement(group, "static")
+    for i in range(3):
+        etree.SubElement(static, "member").text = f"host-{i}"
+
+    rules = vsys.find("rulebase/security/rules")
+    for i in range(rule_count):
+        rule = etree.SubElement(rules, "entry", name=f"rule-{i}")
+        for field, value in (
+            ("from", "trust"),
+            ("to", "untrust"),
+            ("source", "hosts" if i == 0 else f"host-{i}"),
+            ("destination", "any"),
+            ("application", "any"),
+            ("service", f"svc-{i}"),
+        ):
+            etree.SubElement(etree.SubElement(rule, field), "member").text = value
+        etree.SubElement(rule, "action").text = "allow"
+    return etree.ElementTree(root)
+
+
+def _panorama_tree(regions=2, sites_per_region=2, object_count=20):
+    """
+    Build a Panorama configuration with region and site device groups.
+
+    Shared defines obj-0 .. obj-N. A shared rule uses obj-0, the rule of
+    site s uses obj-(1 + s) and the region object obj-(1 + sites + r), and
+    every site defines local-dns with the same value.
+    """
+    root = etree.fromstring(
+        """
+        <config version="10.1.0">
+          <devices>
+            <entry name="localhost.localdomain"><device-group/></entry>
+          </devices>
+          <shared>
+            <address/>
+            <pre-rulebase><security><rules/></security></pre-rulebase>
+          </shared>
+        </config>
+        """
+    )
+    site_count = regions * sites_per_region
+    shared = root.find("shared")
+    for i in range(object_count):
+        address = etree.SubElement(shared.find("address"), "entry", name=f"obj-{i}")
+        ip = f"10.{i // 65536}.{i // 256 % 256}.{i % 256}/32"
+        etree.SubElement(address, "ip-netmask").text = ip
+
+    def add_rule(rules, name, source, destination):
+        rule = etree.SubElement(rules, "entry", name=name)
+        for field, members in (("source", source), ("destination", destination)):
+            element = etree.SubElement(rule, field)
+            for member in members:
+                etree.SubElement(element, "member").text = member
+        etree.SubElement(etree.SubElement(rule, "service"), "member").text = "any"
+        etree.SubElement(rule, "action").text = "allow"
+
+    add_rule(shared.find("pre-rulebase/security/rules"), "shared-rule", ["obj-0"], ["any"])
+
+    device_groups = root.find("devices/entry/device-group")
+    for r in range(regions):
+        etree.SubElement(device_groups, "entry", name=f"region-{r}")
+    for s in range(site_count):
+        r = s // sites_per_region
+        site = etree.SubElement(device_groups, "entry", name=f"site-{s}")
+        etree.SubElement(site, "parent-dg").text = f"region-{r}"
+        address = etree.SubElement(etree.SubElement(site, "address"), "entry", name="local-dns")
+        etree.SubElement(address, "ip-netmask").text = "10.255.0.53/32"
+        rulebase = etree.SubElement(site, "pre-rulebase")
+        rules = etree.SubElement(etree.SubElement(rulebase, "security"), "rules")
+        destination = [f"obj-{1 + site_count + r}", "local-dns"]
+        add_rule(rules, f"site-{s}-rule", [f"obj-{1 + s}"], destination)
+    return etree.ElementTree(root)
+
+
+def _with_groups(tree, groups, rule_members):
+    """Add address groups to the vsys and set the members of rules."""
+    vsys = tree.find(".//vsys/entry")
+    for name, members in groups.items():
+        entry = etree.SubElement(vsys.find("address-group"), "entry", name=name)
+        static = etree.SubElement(entry, "static")
+        for member in members:
+            etree.SubElement(static, "member").text = member
+    for rule_name, fields in rule_members.items():
+        rule = vsys.find(f"rulebase/security/rules/entry[@name='{rule_name}']")
+        for field, members in fields.items():
+            element = rule.find(field)
+            for member in list(element):
+                element.remove(member)
+            for member in members:
+                etree.SubElement(element, "member").text = member
+    return tree
+
+
+def test_rule_costs_and_ranking():
+    """Test expanded counts of nested and overlapping groups and the ranking."""
+    tree = _with_groups(
+        _config_tree(object_count=40, rule_count=5),
+        {
+            "web": ["host-10", "host-11", "host-12"],
+            "app": ["host-12", "host-13", "web"],
+            "all": ["web", "app", "all"],
+        },
+        {
+            "rule-1": {
+                "source": ["all", "host-20"],
+                "destination": ["web"],
+                "from": ["trust", "dmz"],
+            },
+            "rule-2": {"source": ["app"], "service": ["svc-1", "svc-2"]},
+        },
+    )
+    data = generate_rule_expansion_report_data(tree, "firewall", "vsys", "10.1", vsys="vsys1")
+
+    rules = {row["name"]: row for row in data["rules"]}
+    assert rules["rule-1"]["counts"] == {
+        "from": 2,
+        "to": 1,
+        "source": 5,
+        "destination": 3,
+        "service": 1,
+        "application": 1,
+    }
+    assert rules["rule-1"]["cost"] == 30
+    assert rules["rule-2"]["cost"] == 8
+    assert rules["rule-3"]["cost"] == 1
+    assert [row["name"] for row in data["rules"][:2]] == ["rule-1", "rule-2"]
+    assert data["contexts"] == [
+        {"name": "vsys1", "rules": 5, "total_cost": 43, "max_cost": 30, "costliest_rule": "rule-1"}
+    ]
+    assert data["summary"]["groups_expanded"] == 4
+
+    top = generate_rule_expansion_report_data(tree, "firewall", "vsys", "10.1", top=1, vsys="vsys1")
+    assert top["rules"] == data["rules"][:1]
+
+
+def test_group_expansion_is_memoized():
+    """Test that each group is expanded once for all rules using it."""
+    tree = _with_groups(
+        _config_tree(object_count=10, rule_count=3),
+        {"inner": ["host-1", "host-2"], "outer": ["inner", "host-3"]},
+        {},
+    )
+    expander = GroupExpander(RuleResolver(tree, "firewall", "vsys", "10.1", vsys="vsys1"))
+    for _ in range(3):
+        assert expander.count("source", ["outer", "inner"]) == (3, False)
+    assert expander.groups_expanded == 2
+
+
+def test_groups_in_a_cycle_are_expanded_completely():
+    """Test that a group first reached inside a cycle is not memoized truncated."""
+    tree = _with_groups(
+        _config_tree(object_count=10, rule_count=3),
+        {"a": ["host-1", "b"], "b": ["host-2", "a"], "c": ["b", "host-3"]},
+        {},
+    )
+    expected = frozenset(["address:host-1", "address:host-2"])
+    for approximate in (False, True):
+        expander = GroupExpander(
+            RuleResolver(tree, "firewall", "vsys", "10.1", vsys="vsys1"), approximate=approximate
+        )
+        assert expander.count("source", ["a"]) == (2, False)
+        assert expander.count("source", ["b"]) == (2, False)
+        assert expander.count("source", ["c"]) == (3, False)
+        assert expander.count("source", ["a", "b"]) == (2, False)
+    assert expander.expand("address", "b").estimate() == 2
+    assert GroupExpander(expander.resolver).expand("address", "c") == expected | {"address:host-3"}
+
+
+def test_size_sketch():
+    """Test that sketches are exact for small sets and close for large ones."""
+    small = SizeSketch.of(f"m{i}" for i in range(100))
+    assert small.exact and small.estimate() == 100
+
+    halves = [SizeSketch.of(f"m{i}" for i in range(start, start + 60000)) for start in (0, 40000)]
+    union = SizeSketch.merge(halves)
+    assert not union.exact
+    assert abs(union.estimate() - 100000) < 10000
+
+
+def test_panorama_device_group_totals(tmp_path, capsys):
+    """Test per device group totals, the CSV output and the CLI command."""
+    tree = _panorama_tree(regions=1, sites_per_region=2, object_count=6)
+    engine = ReportingEngine(tree, "panorama", "shared", "10.1")
+    data = engine.generate_rule_expansion_report(
+        output_file=str(tmp_path / "expansion.csv"), output_format="csv"
+    )
+
+    assert {row["name"] for row in data["contexts"]} == {"shared", "site-0", "site-1"}
+    assert {row["context"]: row["cost"] for row in data["rules"]} == {
+        "shared": 1,
+        "site-0": 2,
+        "site-1": 2,
+    }
+
+    with open(tmp_path / "expansion.csv", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0][:4] == ["Rule Name", "Context", "Policy Type", "Cost"]
+    assert len(rows) == 4
+
+    config = tmp_path / "panorama.xml"
+    tree.write(str(config))
+    report_rule_expansion(
+        config_file=str(config),
+        output_file=None,
+        output_format="json",
+        approximate=True,
+        top=2,
+        context="shared",
+        device_group=None,
+        vsys="vsys1",
+    )
+    assert "3 rules, total expansion cost 5" in capsys.readouterr().out
+
+
+def test_rule_expansion_benchmark():
+    """Compare exact and approximate mode on rules combining large groups."""
+    tree = _config_tree(object_count=50000, rule_count=300)
+    groups = {
+        f"block-{k}": [f"host-{i}" for i in range(k * 1000, (k + 1) * 1000)] for k in range(50)
+    }
+    for r in range(5):
+        groups[f"region-{r}"] = [f"block-{k}" for k in range(r * 10, r * 10 + 15) if k < 50]
+    tree = _with_groups(
+        tree,
+        groups,
+        {
+            f"rule-{i}": {
+                "source": [f"region-{i % 5}", f"region-{(i + 2) % 5}"],
+                "destination": [f"block-{i % 50}"],
+            }
+            for i in range(300)
+        },
+    )
+
+    benchmark = PerformanceBenchmark("rule_expansion")
+    results = {}
+    for approximate in (False, True):
+        results[approximate], _ = benchmark.measure(
+            f"300 rules over 50k addresses, {'approximate' if approximate else 'exact'}",
+            generate_rule_expansion_report_data,
+            tree,
+            "firewall",
+            "vsys",
+            "10.1",
+            approximate=approximate,
+            vsys="vsys1",
+        )
+    benchmark.print_report()
+
+    exact = results[False]["summary"]["total_cost"]
+    estimate = results[True]["summary"]["total_cost"]
+    assert abs(estimate - exact) / exact < 0.15, f"total cost {exact} vs {estimate}"
@@ -0,0 +1,227 @@
+"""
+Tests for the security rule match engine.
+"""
+
+import csv
+import json
+import random
+
+import pytest
+from lxml import etree
+
+from panflow.cli.commands.policy_commands import match_policy
+from panflow.core.exceptions import ValidationError
+from panflow.core.rule_match import RuleMatcher, load_rulebase, match_flow_file
+from tests.common.benchmarks import PerformanceBenchmark
+
+
+def _rule(name, action="allow", **fields):
+    """Build a rule entry; unspecified fields are 'any'."""
+    entry = etree.Element("entry", name=name)
+    for field in ("from", "to", "source", "destination", "application", "service"):
+        element = etree.SubElement(entry, field)
+        for value in fields.get(field.replace("from", "from_"), ["any"]):
+            etree.SubElement(element, "member").text = value
+    for option in ("negate_source", "disabled"):
+        if fields.get(option):
+            etree.SubElement(entry, option.replace("_", "-")).text = "yes"
+    etree.SubElement(entry, "action").text = action
+    return entry
+
+
+def _firewall_tree(rules):
+    root = etree.fromstring(
+        """
+        <config version="10.1.0">
+          <devices>
+            <entry name="localhost.localdomain">
+              <vsys>
+                <entry name="vsys1">
+                  <address>
+                    <entry name="servers"><ip-netmask>10.1.0.0/16</ip-netmask></entry>
+                    <entry name="v6-net"><ip-netmask>2001:db8::/32</ip-netmask></entry>
+                  </address>
+                  <service>
+                    <entry name="web"><protocol><tcp><port>80,443</port></tcp></protocol></entry>
+                    <entry name="dns"><protocol><udp><port>53</port></udp></protocol></entry>
+                  </service>
+                  <rulebase><security><rules/></security></rulebase>
+                </entry>
+              </vsys>
+            </entry>
+          </devices>
+        </config>
+        """
+    )
+    root.find(".//rulebase/security/rules").extend(rules)
+    return etree.ElementTree(root)
+
+
+@pytest.fixture
+def matcher():
+    tree = _firewall_tree(
+        [
+            _rule("disabled", action="deny", disabled=True),
+            _rule("block-bad", action="deny", source=["192.0.2.66"]),
+            _rule("web", from_=["trust"], to=["dmz"], destination=["servers"], service=["web"]),
+            _rule("dns", from_=["trust"], to=["untrust"], service=["dns"]),
+            _rule("browsing", from_=["trust"], to=["untrust"], application=["ssl", "web-browsing"]),
+            _rule("not-lab", from_=["lab"], source=["10.9.0.0/16"], negate_source=True),
+            _rule("v6", from_=["trust"], destination=["v6-net"], service=["application-default"]),
+        ]
+    )
+    return RuleMatcher.from_config(tree, "firewall", "vsys", "10.1", vsys="vsys1")
+
+
+def _name(match):
+    return match[1].name if match else None
+
+
+def test_lookup_respects_rule_order(matcher):
+    """Test first-match semantics over zones, addresses and ports."""
+    assert _name(matcher.lookup("trust", "dmz", "10.0.0.1", "10.1.2.3", "tcp", 443)) == "web"
+    assert (
+        _name(matcher.lookup("trust", "dmz", "192.0.2.66", "10.1.2.3", "tcp", 443)) == "block-bad"
+    )
+    assert matcher.lookup("trust", "dmz", "10.0.0.1", "10.2.0.1", "tcp", 443) is None
+    assert matcher.lookup("trust", "dmz", "10.0.0.1", "10.1.2.3", "tcp", 22) is None
+    assert _name(matcher.lookup("trust", "untrust", "10.0.0.1", "8.8.8.8", "udp", 53)) == "dns"
+    assert _name(matcher.lookup("trust", "untrust", "10.0.0.1", "8.8.8.8", "tcp", 53)) == "browsing"
+    assert matcher.lookup("trust", "untrust", "10.0.0.1", "1.1.1.1", "tcp", 25, "smtp") is None
+    assert _name(matcher.lookup("trust", "dmz", "10.0.0.1", "2001:db8::5", "tcp", 8443)) == "v6"
+
+
+def test_negated_source(matcher):
+    """Test that a negated source matches addresses outside the listed ones."""
+    assert _name(matcher.lookup("lab", "dmz", "10.8.0.1", "10.1.0.1")) == "not-lab"
+    assert matcher.lookup("lab", "dmz", "10.9.0.1", "10.1.0.1") is None
+
+
+def test_invalid_values(matcher):
+    """Test that invalid addresses and ports are rejected."""
+    with pytest.raises(ValidationError):
+        matcher.lookup("trust", "dmz", "not-an-ip")
+    with pytest.raises(ValidationError):
+        matcher.lookup("trust", "dmz", port=70000)
+
+
+def test_panorama_evaluation_order(panorama_xml_tree):
+    """Test pre-rules from shared down and post-rules from the device group up."""
+    root = panorama_xml_tree.getroot()
+    shared = root.find("shared")
+    device_group = root.find("devices/entry/device-group/entry")
+    for parent, rulebase, name in (
+        (shared, "pre-rulebase", "shared-pre"),
+        (device_group, "pre-rulebase", "dg-pre"),
+        (device_group, "post-rulebase", "dg-post"),
+        (shared, "post-rulebase", "shared-post"),
+    ):
+        container = parent
+        for tag in (rulebase, "security", "rules"):
+            child = container.find(tag)
+            container = etree.SubElement(container, tag) if child is None else child
+        container.append(_rule(name))
+
+    rules = load_rulebase(
+        panorama_xml_tree,
+        "panorama",
+        "device_group",
+        "10.1",
+        device_group=device_group.get("name"),
+    )
+    names = [rule.name for _, rule in rules]
+    assert names.index("shared-pre") < names.index("dg-pre") < names.index("dg-post")
+    assert names.index("dg-post") < names.index("shared-post")
+    assert rules[0][0] == "pre:shared" and rules[-1][0] == "post:shared"
+
+
+def test_match_flow_file(tmp_path, matcher):
+    """Test batch matching of a flow CSV."""
+    flows = tmp_path / "flows.csv"
+    flows.write_text(
+        "from,to,source,destination,protocol,port,id\n"
+        "trust,dmz,10.0.0.1,10.1.2.3,tcp,443,1\n"
+        "trust,trust,10.0.0.1,10.0.0.2,tcp,22,2\n"
+        "trust,dmz,bogus,10.1.2.3,tcp,443,3\n"
+    )
+    output = tmp_path / "matches.csv"
+    stats = match_flow_file(matcher, str(flows), str(output))
+
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert stats == {"flows": 3, "matched": 1, "invalid": 1}
+    assert [(row["id"], row["rule"], row["action"]) for row in rows] == [
+        ("1", "web", "allow"),
+        ("2", "intrazone-default", "allow"),
+        ("3", "", ""),
+    ]
+    assert rows[2]["error"]
+
+
+def test_policy_match_command(tmp_path, capsys):
+    """Test the policy match CLI command."""
+    config = tmp_path / "config.xml"
+    _firewall_tree([_rule("web", from_=["trust"], service=["web"])]).write(str(config))
+
+    match_policy(
+        config_file=str(config),
+        from_zone="trust",
+        to_zone="dmz",
+        source="10.0.0.1",
+        destination="10.1.2.3",
+        protocol="tcp",
+        port=80,
+        application=None,
+        flows_file=None,
+        output=None,
+        context="vsys",
+        device_group=None,
+        vsys="vsys1",
+    )
+    output = capsys.readouterr().out
+    assert json.loads(output[output.index("{") :])["rule"] == "web"
+
+
+def test_rule_match_benchmark():
+    """Check lookup latency on a large rulebase."""
+    rng = random.Random(3)
+    zones = [f"zone-{i}" for i in range(6)]
+    rules = [
+        _rule(
+            f"rule-{i}",
+            action=rng.choice(["allow", "deny"]),
+            from_=[rng.choice(zones)],
+            to=[rng.choice(zones)],
+            source=[f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.0/24"],
+            destination=[f"172.16.{rng.randint(0, 255)}.{rng.randint(0, 255)}"],
+            service=["web" if i % 3 else "dns"],
+        )
+        for i in range(10000)
+    ]
+    matcher = RuleMatcher.from_config(
+        _firewall_tree(rules), "firewall", "vsys", "10.1", vsys="vsys1"
+    )
+    flows = [
+        (
+            rng.choice(zones),
+            rng.choice(zones),
+            f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.1",
+            f"172.16.{rng.randint(0, 255)}.{rng.randint(0, 255)}",
+            rng.choice([80, 443, 53]),
+        )
+        for _ in range(20000)
+    ]
+    for from_zone in zones:
+        for to_zone in zones:
+            matcher.compile(from_zone, to_zone)
+
+    def lookup_all():
+        for from_zone, to_zone, source, destination, port in flows:
+            matcher.lookup(from_zone, to_zone, source, destination, "tcp", port)
+
+    benchmark = PerformanceBenchmark("rule_match")
+    _, duration = benchmark.measure("10000 rules, 20000 lookups", lookup_all)
+    benchmark.print_report()
+
+    per_lookup = duration / len(flows)
+    assert per_lookup < 0.001
@@ -0,0 +1,154 @@
+"""
+Tests for pipeline sessions running commands against one in-memory configuration.
+"""
+
+import json
+import os
+
+import pytest
+from lxml import etree
+from typer.testing import CliRunner
+
+from panflow.cli.app import app
+from panflow.core import config_loader, session
+from panflow.core.batch import parse_pipeline_spec
+from panflow.core.session import ConfigSession
+
+
+def _config_tree(object_count=40, rule_count=20):
+    """Build a firewall configuration with used, unused and duplicate objects."""
+    root = etree.fromstring(
+        """
+        <config version="10.1.0">
+          <devices>
+            <entry name="localhost.localdomain">
+              <vsys>
+                <entry name="vsys1">
+                  <address/>
+                  <address-group/>
+                  <service/>
+                  <service-group/>
+                  <rulebase><security><rules/></security></rulebase>
+                </entry>
+              </vsys>
+            </entry>
+          </devices>
+        </config>
+        """
+    )
+    vsys = root.find(".//vsys/entry")
+    for i in range(object_count):
+        address = etree.SubElement(vsys.find("address"), "entry", name=f"host-{i}")
+        etree.SubElement(address, "ip-netmask").text = f"10.0.{i % 10}.1/32"
+        service = etree.SubElement(vsys.find("service"), "entry", name=f"svc-{i}")
+        tcp = etree.SubElement(etree.SubElement(service, "protocol"), "tcp")
+        etree.SubElement(tcp, "port").text = str(8000 + i % 5)
+
+    group = etree.SubElement(vsys.find("address-group"), "entry", name="hosts")
+    static = etree.SubElement(group, "static")
+    for i in range(3):
+        etree.SubElement(static, "member").text = f"host-{i}"
+
+    rules = vsys.find("rulebase/security/rules")
+    for i in range(rule_count):
+        rule = etree.SubElement(rules, "entry", name=f"rule-{i}")
+        for field, value in (
+            ("from", "trust"),
+            ("to", "untrust"),
+            ("source", "hosts" if i == 0 else f"host-{i}"),
+            ("destination", "any"),
+            ("application", "any"),
+            ("service", f"svc-{i}"),
+        ):
+            etree.SubElement(etree.SubElement(rule, field), "member").text = value
+        etree.SubElement(rule, "action").text = "allow"
+    return etree.ElementTree(root)
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "firewall.xml"
+    _config_tree(object_count=20, rule_count=5).write(str(path))
+    return str(path)
+
+
+def _steps(tmp_path, save_to="cleaned.xml"):
+    return parse_pipeline_spec(
+        f"""
+        steps:
+          - command: deduplicate merge
+            options: {{type: address, context: vsys, output: "{{config}}"}}
+          - command: cleanup unused-objects
+            options: {{type: [address, service], context: vsys, output: "{{config}}"}}
+          - command: save
+            options: {{output: {tmp_path / save_to}}}
+        """
+    )
+
+
+def test_session_loads_and_saves_once(config_file, tmp_path, monkeypatch):
+    """Test that every step shares the in-memory tree and the result is written once."""
+    parses, saves = [], []
+    parse, save = config_loader.parse_config_file, config_loader.save_config
+    monkeypatch.setattr(
+        config_loader, "parse_config_file", lambda *a, **k: parses.append(a) or parse(*a, **k)
+    )
+    monkeypatch.setattr(
+        config_loader, "save_config", lambda *a, **k: saves.append(a[1]) or save(*a, **k)
+    )
+    original = open(config_file, "rb").read()
+
+    result = ConfigSession(config_file).run(_steps(tmp_path))
+
+    assert result["status"] == "ok", result
+    assert [step["command"] for step in result["steps"]] == [
+        "deduplicate merge",
+        "cleanup unused-objects",
+        "save",
+    ]
+    assert all(step["duration"] >= 0 for step in result["steps"])
+    assert len(parses) == 1
+    # Both commands saved to the input path, but only the end of the session wrote a file
+    assert saves == [str(tmp_path / "cleaned.xml")]
+    assert open(config_file, "rb").read() == original
+    assert session.active_session() is None
+
+    # 20 addresses with 10 distinct values, then unused services and addresses removed
+    cleaned = etree.parse(str(tmp_path / "cleaned.xml"))
+    assert len(cleaned.findall(".//address/entry")) < 10
+    assert len(cleaned.findall(".//service/entry")) == 5
+
+
+def test_dry_run_and_failed_steps_do_not_save(config_file, tmp_path):
+    """Test that dry runs and failing pipelines leave no output behind."""
+    result = ConfigSession(config_file).run(_steps(tmp_path), dry_run=True)
+    assert result["status"] == "ok" and not result["saved"]
+    assert not os.path.exists(tmp_path / "cleaned.xml")
+
+    steps = _steps(tmp_path)
+    steps.insert(1, parse_pipeline_spec("deduplicate merge --type no-such-type")[0])
+    result = ConfigSession(config_file).run(steps)
+    assert result["status"] == "failed"
+    assert result["error"].startswith("Step 2 (deduplicate merge --type no-such-type)")
+    assert len(result["steps"]) == 2
+    assert not os.path.exists(tmp_path / "cleaned.xml")
+
+
+def test_pipeline_command_reads_steps_from_stdin(config_file, tmp_path):
+    """Test the pipeline command with command lines on standard input."""
+    report = tmp_path / "report.json"
+    commands = (
+        "# merge duplicate addresses, then write the result\n"
+        "deduplicate merge --type address --context vsys --output {config}\n"
+    )
+    output = str(tmp_path / "out.xml")
+    result = CliRunner().invoke(
+        app,
+        ["pipeline", "run", "-", "-c", config_file, "-o", output, "-r", str(report)],
+        input=commands,
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Pipeline Steps" in result.output
+    assert json.loads(report.read_text())["saved"] is True
+    assert len(etree.parse(output).findall(".//address/entry")) == 10
@@ -0,0 +1,272 @@
+"""
+Tests for binary columnar configuration snapshots.
+"""
+
+import pytest
+from lxml import etree
+
+from panflow.core.config_saver import ConfigSaver
+from panflow.core.snapshot import ConfigSnapshot, SnapshotError, write_snapshot
+from panflow.reporting import (
+    generate_unused_objects_report_data,
+    generate_unused_objects_report_data_from_snapshot,
+)
+
+
+@pytest.fixture
+def snapshot_xml_tree():
+    """Return a Panorama configuration with objects, groups and rules."""
+    xml_str = """
+    <config version="10.1.0">
+      <devices>
+        <entry name="localhost.localdomain">
+          <device-group>
+            <entry name="DG1">
+              <address>
+                <entry name="dg-used"><ip-netmask>10.1.0.0/16</ip-netmask></entry>
+                <entry name="dg-unused"><fqdn>example.com</fqdn></entry>
+              </address>
+              <pre-rulebase>
+                <security>
+                  <rules>
+                    <entry name="allow-web">
+                      <from><member>trust</member></from>
+                      <to><member>untrust</member></to>
+                      <source><member>dg-used</member><member>web-servers</member></source>
+                      <destination><member>any</member></destination>
+                      <service><member>tcp-8443</member></service>
+                      <action>allow</action>
+                    </entry>
+                    <entry name="deny-all">
+                      <source><member>any</member></source>
+                      <action>deny</action>
+                      <disabled>yes</disabled>
+                    </entry>
+                  </rules>
+                </security>
+              </pre-rulebase>
+            </entry>
+          </device-group>
+        </entry>
+      </devices>
+      <shared>
+        <address>
+          <entry name="web-1">
+            <ip-netmask>192.168.1.10/32</ip-netmask>
+            <description>Web</description>
+          </entry>
+          <entry name="orphan"><ip-range>10.0.0.1-10.0.0.9</ip-range></entry>
+        </address>
+        <address-group>
+          <entry name="web-servers"><static><member>web-1</member></static></entry>
+        </address-group>
+        <service>
+          <entry name="tcp-8443"><protocol><tcp><port>8443</port></tcp></protocol></entry>
+          <entry name="udp-53"><protocol><udp><port>53</port></udp></protocol></entry>
+        </service>
+      </shared>
+    </config>
+    """
+    return etree.ElementTree(etree.fromstring(xml_str.encode("utf-8")))
+
+
+@pytest.fixture
+def snapshot_file(tmp_path, snapshot_xml_tree):
+    """Write the snapshot fixture to disk and return its path."""
+    path = str(tmp_path / "config.pfsnap")
+    write_snapshot(snapshot_xml_tree, path, device_type="panorama", version="10.1")
+    return path
+
+
+def test_write_snapshot_row_counts(tmp_path, snapshot_xml_tree):
+    """Test that every table receives the expected number of rows."""
+    counts = write_snapshot(snapshot_xml_tree, str(tmp_path / "config.pfsnap"))
+
+    assert counts["addresses"] == 4
+    assert counts["services"] == 2
+    assert counts["groups"] == 1
+    assert counts["rules"] == 2
+    assert counts["references"] == 1
+    assert counts["rule_members"] == 7
+
+
+def test_snapshot_round_trip(snapshot_file):
+    """Test reading tables back from a memory-mapped snapshot."""
+    with ConfigSnapshot(snapshot_file) as snapshot:
+        assert snapshot.device_type == "panorama"
+        assert snapshot.version == "10.1"
+
+        addresses = snapshot.table("addresses")
+        rows = {row["name"]: row for row in addresses.rows()}
+        assert rows["web-1"] == {
+            "name": "web-1",
+            "context_type": "shared",
+            "context_name": "",
+            "kind": "ip-netmask",
+            "value": "192.168.1.10/32",
+            "description": "Web",
+        }
+        assert rows["dg-used"]["context_name"] == "DG1"
+
+        rules = list(snapshot.table("rules").rows())
+        assert [(rule["name"], rule["position"]) for rule in rules] == [
+            ("allow-web", 0),
+            ("deny-all", 1),
+        ]
+        assert rules[1]["disabled"] == 1
+        assert rules[0]["rulebase"] == "pre-rulebase"
+        assert rules[0]["rule_type"] == "security"
+
+        services = {row["name"]: row for row in snapshot.table("services").rows()}
+        assert services["udp-53"]["protocol"] == "udp"
+        assert services["udp-53"]["port"] == "53"
+
+
+def test_snapshot_columns_are_integer_encoded(snapshot_file):
+    """Test that string columns are stored as ids into the string dictionary."""
+    with ConfigSnapshot(snapshot_file) as snapshot:
+        names = snapshot.table("addresses").column("name")
+        assert names.format == "i"
+        assert snapshot.string(names[0]) == "dg-used"
+        assert snapshot.string_id("dg-used") == names[0]
+        assert snapshot.string_id("missing") is None
+
+
+def test_snapshot_where(snapshot_file):
+    """Test filtering rows by column values."""
+    with ConfigSnapshot(snapshot_file) as snapshot:
+        addresses = snapshot.table("addresses")
+        shared = addresses.where(context_type="shared")
+        assert sorted(addresses.row(i)["name"] for i in shared) == ["orphan", "web-1"]
+        assert addresses.where(context_name="no-such-dg") == []
+
+        members = snapshot.table("rule_members")
+        rows = [members.row(i) for i in members.where(field="source")]
+        assert {row["member"] for row in rows} == {"dg-used", "web-servers", "any"}
+
+
+def test_snapshot_unused_objects(snapshot_file):
+    """Test finding unused objects directly from the snapshot."""
+    with ConfigSnapshot(snapshot_file) as snapshot:
+        shared = [row["name"] for row in snapshot.find_unused_objects("address")]
+        assert shared == ["orphan"]
+
+        dg = snapshot.find_unused_objects("address", "device_group", "DG1")
+        assert [row["name"] for row in dg] == ["dg-unused"]
+
+        services = [row["name"] for row in snapshot.find_unused_objects("service")]
+        assert services == ["udp-53"]
+
+        with pytest.raises(SnapshotError):
+            snapshot.find_unused_objects("tag")
+
+
+def test_unused_objects_report_from_snapshot(snapshot_file):
+    """Test that the snapshot report matches the XML report shape."""
+    with ConfigSnapshot(snapshot_file) as snapshot:
+        report = generate_unused_objects_report_data_from_snapshot(snapshot, "shared")
+
+    assert report == {
+        "unused_objects": [
+            {
+                "name": "orphan",
+                "properties": {"ip-range": "10.0.0.1-10.0.0.9"},
+                "context_type": "shared",
+                "context_name": "Shared",
+            }
+        ]
+    }
+
+
+def test_unused_objects_match_xml_report_on_nat_rules(tmp_path):
+    """Test that the snapshot and XML reports agree on NAT translations and name collisions."""
+    nat = "<source><member>any</member></source><destination><member>any</member></destination>"
+    xml_str = f"""
+    <config version="10.1.0"><devices><entry name="localhost.localdomain"><vsys>
+      <entry name="vsys1">
+        <address>
+          <entry name="src"><ip-netmask>10.0.0.1</ip-netmask></entry>
+          <entry name="dnat-target"><ip-netmask>10.0.0.2</ip-netmask></entry>
+          <entry name="static-target"><ip-netmask>10.0.0.3</ip-netmask></entry>
+          <entry name="dipp-member"><ip-netmask>10.0.0.4</ip-netmask></entry>
+          <entry name="grouped"><ip-netmask>10.0.0.5</ip-netmask></entry>
+          <entry name="trust"><ip-netmask>10.0.0.6</ip-netmask></entry>
+          <entry name="web"><ip-netmask>10.0.0.7</ip-netmask></entry>
+          <entry name="tagged"><ip-netmask>10.0.0.8</ip-netmask></entry>
+          <entry name="in-service-group"><ip-netmask>10.0.0.9</ip-netmask></entry>
+        </address>
+        <address-group>
+          <entry name="grp"><static><member>grouped</member></static></entry>
+        </address-group>
+        <service>
+          <entry name="web"><protocol><tcp><port>80</port></tcp></protocol></entry>
+          <entry name="nat-svc"><protocol><tcp><port>8080</port></tcp></protocol></entry>
+          <entry name="src"><protocol><tcp><port>81</port></tcp></protocol></entry>
+        </service>
+        <service-group>
+          <entry name="svc-grp"><members><member>in-service-group</member></members></entry>
+        </service-group>
+        <rulebase>
+          <security><rules><entry name="allow">
+            <from><member>trust</member></from><to><member>any</member></to>
+            <source><member>src</member></source><destination><member>any</member></destination>
+            <service><member>web</member></service><tag><member>tagged</member></tag>
+          </entry></rules></security>
+          <nat><rules>
+            <entry name="dnat">{nat}<service>nat-svc</service>
+              <destination-translation>
+                <translated-address>dnat-target</translated-address>
+                <translated-port>8080</translated-port>
+              </destination-translation>
+            </entry>
+            <entry name="static">{nat}<service>any</service>
+              <source-translation><static-ip>
+                <translated-address>static-target</translated-address>
+              </static-ip></source-translation>
+            </entry>
+            <entry name="dipp">{nat}<service>any</service>
+              <source-translation><dynamic-ip-and-port>
+                <translated-address><member>dipp-member</member></translated-address>
+              </dynamic-ip-and-port></source-translation>
+            </entry>
+          </rules></nat>
+        </rulebase>
+      </entry>
+    </vsys></entry></devices><shared/></config>
+    """
+    tree = etree.ElementTree(etree.fromstring(xml_str.encode("utf-8")))
+    path = str(tmp_path / "nat.pfsnap")
+    write_snapshot(tree, path, device_type="firewall", version="10.1")
+
+    expected = {
+        "address": ["in-service-group", "tagged", "trust", "web"],
+        "service": ["src"],
+    }
+    with ConfigSnapshot(path) as snapshot:
+        for object_type, unused in expected.items():
+            xml_report = generate_unused_objects_report_data(
+                tree, "firewall", "vsys", "10.1", object_type, vsys="vsys1"
+            )
+            snapshot_report = generate_unused_objects_report_data_from_snapshot(
+                snapshot, "vsys", object_type, vsys="vsys1"
+            )
+            assert sorted(o["name"] for o in xml_report["unused_objects"]) == unused
+            assert sorted(o["name"] for o in snapshot_report["unused_objects"]) == unused
+
+
+def test_invalid_snapshot(tmp_path):
+    """Test that non-snapshot files are rejected."""
+    path = tmp_path / "bogus.pfsnap"
+    path.write_bytes(b"<config/>" * 4)
+    with pytest.raises(SnapshotError):
+        ConfigSnapshot(str(path))
+
+
+def test_config_saver_snapshot(tmp_path, snapshot_xml_tree):
+    """Test saving a snapshot through ConfigSaver."""
+    saver = ConfigSaver(config_dir=str(tmp_path), create_backup=False)
+    path = saver.save_as_snapshot(snapshot_xml_tree, "config", device_type="panorama")
+
+    assert path.endswith(".pfsnap")
+    with ConfigSnapshot(path) as snapshot:
+        assert snapshot.row_counts()["rules"] == 2
@@ -0,0 +1,243 @@
+"""
+Tests for streaming CSV and JSON report output.
+"""
+
+import csv
+import gzip
+import io
+import json
+import tracemalloc
+
+import pytest
+from lxml import etree
+
+from panflow.reporting import (
+    ReportingEngine,
+    generate_unused_objects_report_data,
+    iter_object_references,
+    iter_unused_objects,
+)
+from panflow.reporting.formatters.csv import OBJECT_REFERENCE_COLUMNS, CSVFormatter
+from panflow.reporting.formatters.json import JSONFormatter
+from tests.common.benchmarks import PerformanceBenchmark
+
+
+def _config_tree(object_count=40, rule_count=20):
+    """Build a firewall configuration with used, unused and duplicate objects."""
+    root = etree.fromstring(
+        """
+        <config version="10.1.0">
+          <devices>
+            <entry name="localhost.localdomain">
+              <vsys>
+                <entry name="vsys1">
+                  <address/>
+                  <address-group/>
+                  <service/>
+                  <service-group/>
+                  <rulebase><security><rules/></security></rulebase>
+                </entry>
+              </vsys>
+            </entry>
+          </devices>
+        </config>
+        """
+    )
+    vsys = root.find(".//vsys/entry")
+    for i in range(object_count):
+        address = etree.SubElement(vsys.find("address"), "entry", name=f"host-{i}")
+        etree.SubElement(address, "ip-netmask").text = f"10.0.{i % 10}.1/32"
+        service = etree.SubElement(vsys.find("service"), "entry", name=f"svc-{i}")
+        tcp = etree.SubElement(etree.SubElement(service, "protocol"), "tcp")
+        etree.SubElement(tcp, "port").text = str(8000 + i % 5)
+
+    group = etree.SubElement(vsys.find("address-group"), "entry", name="hosts")
+    static = etree.SubElement(group, "static")
+    for i in range(3):
+        etree.SubElement(static, "member").text = f"host-{i}"
+
+    rules = vsys.find("rulebase/security/rules")
+    for i in range(rule_count):
+        rule = etree.SubElement(rules, "entry", name=f"rule-{i}")
+        for field, value in (
+            ("from", "trust"),
+            ("to", "untrust"),
+            ("source", "hosts" if i == 0 else f"host-{i}"),
+            ("destination", "any"),
+            ("application", "any"),
+            ("service", f"svc-{i}"),
+        ):
+            etree.SubElement(etree.SubElement(rule, field), "member").text = value
+        etree.SubElement(rule, "action").text = "allow"
+    return etree.ElementTree(root)
+
+
+@pytest.fixture
+def engine():
+    return ReportingEngine(_config_tree(), "firewall", "vsys", "10.1", vsys="vsys1")
+
+
+@pytest.mark.parametrize("indent", [None, 0, 2, 4])
+def test_json_matches_json_dumps(indent):
+    """Test that streamed JSON is identical to json.dumps."""
+    data = {
+        "summary": {"total": 3, "nested": {"a": [1, 2, {"b": None}]}},
+        "empty": {},
+        "rows": [],
+        1: True,
+        None: "x",
+        "text": 'quoted "value" é',
+    }
+    assert JSONFormatter(indent=indent).format(data) == json.dumps(data, indent=indent)
+
+
+def test_json_streams_generators():
+    """Test that generators are written as arrays one item at a time."""
+    produced = []
+
+    def rows():
+        for i in range(3):
+            produced.append(i)
+            yield {"row": i}
+
+    output = io.StringIO()
+    JSONFormatter().write({"rows": rows(), "keys": {"a": 1}.keys()}, output)
+
+    assert json.loads(output.getvalue()) == {
+        "rows": [{"row": 0}, {"row": 1}, {"row": 2}],
+        "keys": ["a"],
+    }
+    assert produced == [0, 1, 2]
+
+
+def test_json_lines_and_gzip(tmp_path):
+    """Test JSON Lines output with and without compression."""
+    formatter = JSONFormatter()
+    records = [{"name": f"host-{i}", "tags": {"b", "a"}} for i in range(5)]
+
+    plain = tmp_path / "rows.jsonl"
+    compressed = tmp_path / "rows.jsonl.gz"
+    assert formatter.save_lines(iter(records), str(plain))
+    assert formatter.save_lines(iter(records), str(compressed))
+
+    lines = plain.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"name": f"host-{i}", "tags": ["a", "b"]} for i in range(5)
+    ]
+    with gzip.open(compressed, "rt") as f:
+        assert f.read().splitlines() == lines
+
+    assert formatter.save({"rows": iter(records[:1])}, str(tmp_path / "report.json.gz"))
+    with gzip.open(tmp_path / "report.json.gz", "rt") as f:
+        assert json.load(f) == {"rows": [{"name": "host-0", "tags": ["a", "b"]}]}
+
+
+def test_csv_rows_and_gzip(engine, tmp_path):
+    """Test that CSV rows stream to plain and compressed files."""
+    formatter = CSVFormatter()
+    data = engine.generate_unused_objects_report("address")
+    expected = formatter.format_unused_objects_report(data)
+
+    assert formatter.save(
+        formatter.report_rows("unused_objects", data), str(tmp_path / "unused.csv")
+    )
+    assert formatter.save(
+        formatter.report_rows("unused_objects", data), str(tmp_path / "unused.csv.gz")
+    )
+
+    with open(tmp_path / "unused.csv", newline="") as f:
+        assert f.read() == expected
+    with gzip.open(tmp_path / "unused.csv.gz", "rt", newline="") as f:
+        assert f.read() == expected
+
+    with pytest.raises(ValueError):
+        formatter.report_rows("unknown", data)
+
+
+def test_row_generators_match_report(engine):
+    """Test that the row generators agree with the unused objects report."""
+    args = (engine.tree, "firewall", "vsys", "10.1")
+    for object_type in ["address", "service"]:
+        report = generate_unused_objects_report_data(*args, object_type=object_type, vsys="vsys1")
+        assert (
+            list(iter_unused_objects(*args, object_type=object_type, vsys="vsys1"))
+            == report["unused_objects"]
+        )
+
+        references = list(iter_object_references(*args, object_type=object_type, vsys="vsys1"))
+        referenced = {reference["object"] for reference in references}
+        unused = {obj["name"] for obj in report["unused_objects"]}
+        assert referenced and not referenced & unused
+
+    references = list(iter_object_references(*args, object_type="address", vsys="vsys1"))
+    assert references[0] == {
+        "object": "host-1",
+        "context": "vsys1",
+        "referenced_by": "rule-1",
+        "reference_type": "security_rules",
+        "reference_context": "vsys1",
+        "field": "source",
+    }
+    # Group members are references too
+    assert {"object": "host-0", "referenced_by": "hosts", "field": "static"}.items() <= references[
+        -3
+    ].items()
+
+
+def test_engine_streaming_outputs(engine, tmp_path):
+    """Test the JSON Lines report format and the object references report."""
+    path = tmp_path / "unused.jsonl"
+    data = engine.generate_unused_objects_report(
+        "address", output_file=str(path), output_format="jsonl"
+    )
+    assert [json.loads(line) for line in path.read_text().splitlines()] == data["unused_objects"]
+
+    assert engine.generate_object_references_report(
+        str(tmp_path / "refs.csv.gz"), output_format="csv"
+    )
+    with gzip.open(tmp_path / "refs.csv.gz", "rt", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == OBJECT_REFERENCE_COLUMNS
+    assert ["host-1", "vsys1", "rule-1", "security_rules", "vsys1", "source"] in rows
+
+    assert engine.generate_object_references_report(
+        str(tmp_path / "refs.json"), output_format="json"
+    )
+    with open(tmp_path / "refs.json") as f:
+        assert len(json.load(f)["references"]) == len(rows) - 1
+
+
+def test_streaming_memory_benchmark(tmp_path):
+    """Compare peak memory of streamed and materialized output for 200k rows."""
+    count = 200_000
+
+    def rows():
+        for i in range(count):
+            yield {"object": f"host-{i}", "referenced_by": f"rule-{i % 500}", "field": "source"}
+
+    def materialize():
+        with open(tmp_path / "materialized.json", "w") as f:
+            f.write(json.dumps({"references": list(rows())}))
+
+    def peak_memory(name, func, *args):
+        tracemalloc.start()
+        try:
+            benchmark.measure(name, func, *args)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    benchmark = PerformanceBenchmark("streaming_formatters")
+    streamed_peak = peak_memory(
+        f"{count} rows, streamed",
+        JSONFormatter().save_lines,
+        rows(),
+        str(tmp_path / "streamed.jsonl.gz"),
+    )
+    materialized_peak = peak_memory(f"{count} rows, materialized", materialize)
+    benchmark.print_report()
+
+    assert streamed_peak * 20 < materialized_peak, (
+        f"Peak memory: streamed={streamed_peak / 2**20:.1f}MiB "
+        f"materialized={materialized_peak / 2**20:.1f}MiB"
+    )
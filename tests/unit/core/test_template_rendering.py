@@ -8,15 +8,18 @@ import re
 from unittest.mock import patch, MagicMock
 
 from panflow.core.template_loader import TemplateLoader
+from tests.common.benchmarks import PerformanceBenchmark
 
 
 @pytest.fixture
 def template_loader():
     """Create a template loader for testing."""
     # Get the package template directory
-    package_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    package_dir = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
     template_dir = os.path.join(package_dir, "panflow", "templates")
-    
+
     return TemplateLoader(template_dir=template_dir)
 
 
@@ -32,9 +35,9 @@ def test_template_loader_initialization():
 def test_render_template_with_timestamp(template_loader):
     """Test that the render_template method adds a timestamp to the context."""
     result = template_loader.render_template("reports/components/base_template.html", {})
-    
+
     # Check for timestamp in output
-    assert re.search(r'Report generated on \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', result)
+    assert re.search(r"Report generated on \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", result)
 
 
 def test_render_unused_objects_report(template_loader):
@@ -46,28 +49,24 @@ def test_render_unused_objects_report(template_loader):
             "ip-netmask": "10.0.0.1/24",
             "context_type": "device_group",
             "context_name": "test-dg",
-            "context": "Device Group: test-dg"
+            "context": "Device Group: test-dg",
         },
         {
             "name": "test-service",
             "protocol": {"tcp": {"port": "443"}},
             "context_type": "shared",
-            "context": "Shared"
-        }
+            "context": "Shared",
+        },
     ]
-    
+
     # Create report info
-    report_info = {
-        "Query": "show me unused objects",
-        "Configuration": "test-config.xml"
-    }
-    
+    report_info = {"Query": "show me unused objects", "Configuration": "test-config.xml"}
+
     # Render the report
     result = template_loader.render_unused_objects_report(
-        {"unused_objects": test_objects},
-        report_info
+        {"unused_objects": test_objects}, report_info
     )
-    
+
     # Check that the HTML contains important elements
     assert "<title>Unused Objects Report</title>" in result
     assert "Found 2 Unused Objects" in result
@@ -90,42 +89,34 @@ def test_render_duplicate_objects_report(template_loader):
                 "name": "dup-address1",
                 "context_type": "device_group",
                 "context_name": "dg1",
-                "context": "Device Group: dg1"
+                "context": "Device Group: dg1",
             },
             {
                 "name": "dup-address2",
                 "context_type": "device_group",
                 "context_name": "dg2",
-                "context": "Device Group: dg2"
-            }
+                "context": "Device Group: dg2",
+            },
         ],
         "fqdn:example.com": [
-            {
-                "name": "example-fqdn1",
-                "context_type": "shared",
-                "context": "Shared"
-            },
+            {"name": "example-fqdn1", "context_type": "shared", "context": "Shared"},
             {
                 "name": "example-fqdn2",
                 "context_type": "vsys",
                 "context_name": "vsys1",
-                "context": "VSYS: vsys1"
-            }
-        ]
+                "context": "VSYS: vsys1",
+            },
+        ],
     }
-    
+
     # Create report info
-    report_info = {
-        "Query": "find duplicate objects",
-        "Configuration": "test-config.xml"
-    }
-    
+    report_info = {"Query": "find duplicate objects", "Configuration": "test-config.xml"}
+
     # Render the report
     result = template_loader.render_duplicate_objects_report(
-        {"duplicate_objects": test_duplicates},
-        report_info
+        {"duplicate_objects": test_duplicates}, report_info
     )
-    
+
     # Check that the HTML contains important elements
     assert "<title>Duplicate Objects Report</title>" in result
     assert "dup-address1" in result
@@ -144,10 +135,109 @@ def test_render_template_error_handling():
     """Test that template rendering errors are handled properly."""
     # Create a template loader with a non-existent template directory
     loader = TemplateLoader(template_dir="/path/does/not/exist")
-    
+
     # Attempt to render a template that doesn't exist
     result = loader.render_template("non_existent_template.html", {})
-    
+
     # Check that an error page is returned
     assert "<title>Error Rendering Report</title>" in result
-    assert "Error Rendering Template" in result
\ No newline at end of file
+    assert "Error Rendering Template" in result
+
+
+def test_environment_shared_between_loaders(template_loader):
+    """Test that loaders for the same directories share compiled templates."""
+    other = TemplateLoader(template_dir=template_loader.template_dir)
+
+    assert other.env is template_loader.env
+    template = template_loader.env.get_template("reports/unused_objects.html")
+    assert other.env.get_template("reports/unused_objects.html") is template
+
+
+def test_bytecode_cache(tmp_path, monkeypatch):
+    """Test that compiled templates are written to the bytecode cache directory."""
+    from panflow.core.template_loader import clear_environment_cache
+
+    monkeypatch.setenv("PANFLOW_TEMPLATE_CACHE", str(tmp_path))
+    clear_environment_cache()
+    try:
+        loader = TemplateLoader()
+        loader.render_unused_objects_report({"unused_objects": []})
+        assert os.listdir(tmp_path)
+    finally:
+        clear_environment_cache()
+
+
+def _policy_analysis(count):
+    policies = {
+        f"rule-{i}": {"action": "allow", "disabled": i % 2 == 0, "source_count": 1}
+        for i in range(count)
+    }
+    return {
+        "summary": {"total_policies": count},
+        "statistics": {"actions": {"allow": count}},
+        "policies": policies,
+    }
+
+
+def test_stream_paginated_policy_analysis(template_loader, tmp_path):
+    """Test that streamed output matches rendering and large tables are paginated."""
+    context = {
+        "analysis": _policy_analysis(25),
+        "include_hit_counts": False,
+        "page_size": 10,
+        "timestamp": "2024-01-01 00:00:00",
+    }
+    output_file = tmp_path / "report.html"
+
+    assert template_loader.stream_template(
+        "reports/security_policy_analysis.html", dict(context), str(output_file)
+    )
+    html = output_file.read_text()
+    assert html.count('<tbody class="report-page"') == 3
+    assert html.count('<tbody class="report-page" hidden>') == 2
+    assert html.count("</tbody>") == 3
+    assert "rule-24" in html
+    assert "Page 1 of 3 (25 rows)" in html
+    assert html == template_loader.render_template("reports/security_policy_analysis.html", context)
+
+    # Small tables have no pager
+    assert "report-pager" not in template_loader.render_template(
+        "reports/unused_objects.html", {"unused_objects": [{"name": "a"}]}
+    )
+
+
+def test_html_formatter_save(tmp_path):
+    """Test that the HTML formatter streams reports to files."""
+    from panflow.reporting.formatters.html import HTMLFormatter
+
+    formatter = HTMLFormatter()
+    output_file = tmp_path / "unused.html"
+    data = {"unused_objects": [{"name": "unused-host"}]}
+    assert formatter.save(data, str(output_file), "unused_objects")
+    assert "unused-host" in output_file.read_text()
+    assert not formatter.save({}, str(tmp_path / "shadowing.html"), "policy_shadowing")
+
+
+def test_stream_large_report_memory(template_loader, tmp_path):
+    """Check that streaming a large report does not build the document in memory."""
+    import tracemalloc
+
+    analysis = _policy_analysis(20000)
+    output_file = tmp_path / "large.html"
+    benchmark = PerformanceBenchmark("template_streaming")
+
+    tracemalloc.start()
+    streamed, _ = benchmark.measure(
+        "20000 policies",
+        template_loader.stream_template,
+        "reports/security_policy_analysis.html",
+        {"analysis": analysis, "include_hit_counts": True},
+        str(output_file),
+    )
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    benchmark.print_report()
+
+    size = output_file.stat().st_size
+    assert streamed
+    assert peak < size / 4, f"Peak memory {peak / 1e6:.1f} MB for {size / 1e6:.1f} MB of HTML"
@@ -0,0 +1,185 @@
+"""
+Tests for the streaming XML serialization utilities.
+"""
+
+import io
+import json
+import sys
+import tracemalloc
+
+import pytest
+from lxml import etree
+
+from panflow.core.config_saver import ConfigSaver
+from panflow.core.xml.base import element_to_dict
+from panflow.core.xml.stream import (
+    iter_element_json,
+    iter_entry_records,
+    write_element_json,
+    write_element_json_lines,
+)
+from tests.common.benchmarks import PerformanceBenchmark
+
+
+def _build_large_config(object_count: int, rule_count: int) -> etree._Element:
+    """Build a Panorama-style configuration with many objects and rules."""
+    root = etree.Element("config", version="10.1.0")
+    devices = etree.SubElement(root, "devices")
+    localhost = etree.SubElement(devices, "entry", name="localhost.localdomain")
+    device_group = etree.SubElement(localhost, "device-group")
+    dg = etree.SubElement(device_group, "entry", name="DG1")
+
+    addresses = etree.SubElement(dg, "address")
+    for i in range(object_count):
+        entry = etree.SubElement(addresses, "entry", name=f"addr-{i}")
+        etree.SubElement(entry, "ip-netmask").text = (
+            f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}/32"
+        )
+        etree.SubElement(entry, "description").text = f"Address object {i}"
+
+    rules = etree.SubElement(
+        etree.SubElement(etree.SubElement(dg, "pre-rulebase"), "security"), "rules"
+    )
+    for i in range(rule_count):
+        entry = etree.SubElement(rules, "entry", name=f"rule-{i}")
+        for field in ("from", "to", "source", "destination"):
+            container = etree.SubElement(entry, field)
+            etree.SubElement(container, "member").text = "any"
+            etree.SubElement(container, "member").text = f"addr-{i}"
+        etree.SubElement(entry, "action").text = "allow"
+
+    shared = etree.SubElement(root, "shared")
+    service = etree.SubElement(shared, "service")
+    entry = etree.SubElement(service, "entry", name="tcp-443")
+    tcp = etree.SubElement(etree.SubElement(entry, "protocol"), "tcp")
+    etree.SubElement(tcp, "port").text = "443"
+    return root
+
+
+@pytest.mark.parametrize("indent", [2, 4, None])
+def test_streamed_json_matches_element_to_dict(sample_xml_element, indent):
+    """Test that streamed JSON is identical to json.dumps of element_to_dict."""
+    expected = json.dumps(element_to_dict(sample_xml_element), indent=indent)
+    assert "".join(iter_element_json(sample_xml_element, indent)) == expected
+
+
+def test_streamed_json_handles_special_cases():
+    """Test empty elements, repeated tags, attributes and escaping."""
+    xml = """<root a="1" b="x&quot;y"><empty/><m>one</m><other>é</other><m>two</m>
+        <!-- comment --><m><nested k="v"/></m></root>"""
+    element = etree.fromstring(xml)
+    for comment in element.xpath("//comment()"):
+        comment.getparent().remove(comment)
+
+    expected = json.dumps(element_to_dict(element), indent=2)
+    assert "".join(iter_element_json(element)) == expected
+
+
+def test_streamed_json_skips_comments():
+    """Test that comments are skipped rather than breaking serialization."""
+    element = etree.fromstring("<root><!-- note --><child>value</child></root>")
+    assert json.loads("".join(iter_element_json(element))) == {"child": {"#text": "value"}}
+
+
+def test_element_to_dict_handles_deep_nesting():
+    """Test that deep trees exceed the recursion limit without failing."""
+    depth = sys.getrecursionlimit() + 100
+    root = etree.Element("level")
+    current = root
+    for _ in range(depth):
+        current = etree.SubElement(current, "level")
+    current.text = "leaf"
+
+    result = element_to_dict(root)
+    for _ in range(depth):
+        result = result["level"]
+    assert result == {"#text": "leaf"}
+
+    buffer = io.StringIO()
+    write_element_json(root, buffer, indent=None)
+    assert buffer.getvalue().count("{") == depth + 1
+
+
+def test_iter_entry_records(panorama_xml_tree):
+    """Test that objects are found with their context."""
+    records = [metadata for metadata, _ in iter_entry_records(panorama_xml_tree)]
+
+    assert {
+        "type": "address",
+        "name": "test-address",
+        "context_type": "device_group",
+        "context_name": "test-dg",
+    } in records
+    assert {"type": "address", "name": "shared-address", "context_type": "shared"} in records
+    assert len(records) == 2
+
+
+def test_write_json_lines_rules(firewall_xml_tree):
+    """Test that rules are emitted with rulebase information."""
+    buffer = io.StringIO()
+    count = write_element_json_lines(firewall_xml_tree, buffer)
+    lines = [json.loads(line) for line in buffer.getvalue().splitlines()]
+
+    assert count == len(lines)
+    rule = next(line for line in lines if line["name"] == "test-rule")
+    assert rule["type"] == "security"
+    assert rule["rulebase"] == "rulebase"
+    assert rule["context_type"] == "vsys"
+    assert rule["context_name"] == "vsys1"
+    assert rule["data"]["action"] == {"#text": "allow"}
+
+
+def test_config_saver_json_and_json_lines(tmp_path, sample_xml_tree):
+    """Test ConfigSaver JSON and JSON Lines output."""
+    saver = ConfigSaver(config_dir=str(tmp_path), create_backup=False)
+
+    json_path = saver.save_as_json(sample_xml_tree, "config")
+    with open(json_path) as f:
+        assert json.load(f) == element_to_dict(sample_xml_tree.getroot())
+
+    jsonl_path = saver.save_as_json_lines(sample_xml_tree, "config")
+    assert jsonl_path.endswith(".jsonl")
+    with open(jsonl_path) as f:
+        records = [json.loads(line) for line in f]
+    assert [record["name"] for record in records] == ["test-address"]
+
+
+def test_streaming_json_benchmark():
+    """Compare speed and peak memory of streamed JSON against the dict approach."""
+    root = _build_large_config(object_count=5000, rule_count=2000)
+    benchmark = PerformanceBenchmark("xml_json_export")
+
+    def dict_export():
+        buffer = io.StringIO()
+        json.dump(element_to_dict(root), buffer, indent=2)
+        return buffer
+
+    def streamed_export():
+        buffer = io.StringIO()
+        write_element_json(root, buffer, indent=2)
+        return buffer
+
+    def peak_memory(func):
+        tracemalloc.start()
+        try:
+            result = func()
+            # Exclude the shared output buffer from the comparison
+            peak = tracemalloc.get_traced_memory()[1] - sys.getsizeof(result.getvalue())
+        finally:
+            tracemalloc.stop()
+        return peak
+
+    dict_stats = benchmark.measure_repeated("dict_export", dict_export, iterations=3, warmup=1)
+    stream_stats = benchmark.measure_repeated(
+        "stream_export", streamed_export, iterations=3, warmup=1
+    )
+    dict_peak = peak_memory(dict_export)
+    stream_peak = peak_memory(streamed_export)
+
+    benchmark.print_report()
+
+    assert dict_export().getvalue() == streamed_export().getvalue()
+    assert (
+        stream_peak < dict_peak
+    ), f"Peak memory: dict={dict_peak / 1024:.0f}KiB stream={stream_peak / 1024:.0f}KiB"
+    assert stream_stats["mean"] > 0 and dict_stats["mean"] > 0
@@ -6,6 +6,8 @@ import os
 import pytest
 from unittest import mock
 
+from lxml import etree
+
 from panflow.core.xpath_resolver import (
     get_context_xpath,
     get_object_xpath,
@@ -13,10 +15,35 @@ from panflow.core.xpath_resolver import (
     load_xpath_mappings,
     get_all_versions,
     determine_version_from_config,
+    compile_object_xpath,
+    find_object_elements,
+    find_policy_elements,
 )
+from tests.common.factories import ConfigFactory
 
 
 # Test get_context_xpath
+def _config_tree(address_count, rule_count=0):
+    """Build a firewall configuration with host-N addresses and rule-N rules."""
+    addresses = "".join(
+        f'<entry name="host-{i}"><ip-netmask>10.0.{i % 10}.1/32</ip-netmask></entry>'
+        for i in range(address_count)
+    )
+    rules = "".join(
+        f'<entry name="rule-{i}"><source><member>host-{i}</member></source>'
+        "<action>allow</action></entry>"
+        for i in range(rule_count)
+    )
+    return etree.ElementTree(
+        etree.fromstring(
+            '<config version="10.1.0"><devices><entry name="localhost.localdomain"><vsys>'
+            f'<entry name="vsys1"><address>{addresses}</address>'
+            f"<rulebase><security><rules>{rules}</rules></security></rulebase>"
+            "</entry></vsys></entry></devices></config>"
+        )
+    )
+
+
 def test_get_context_xpath_panorama_shared():
     """Test getting context XPath for Panorama shared."""
     result = get_context_xpath("panorama", "shared", "10.1")
@@ -155,6 +182,96 @@ def test_load_xpath_mappings_cache(mock_yaml_load):
     assert mock_yaml_load.call_count == 1  # Still only called once
 
 
+def test_mapping_bundle_is_up_to_date():
+    """Test that the precompiled mapping bundle matches the YAML files."""
+    from panflow.core.mapping_bundle import BUNDLE_PATH, build_mapping_bundle
+
+    with open(BUNDLE_PATH, encoding="utf-8") as f:
+        bundle = f.read()
+    assert bundle == build_mapping_bundle(), "Regenerate: python -m panflow.core.mapping_bundle"
+
+
+def test_mapping_bundle_is_black_formatted():
+    """Test that black leaves the generated bundle unchanged."""
+    black = pytest.importorskip("black")
+    from panflow.core.mapping_bundle import build_mapping_bundle
+
+    bundle = build_mapping_bundle()
+    assert black.format_str(bundle, mode=black.Mode(line_length=100)) == bundle
+
+
+@mock.patch("panflow.core.xpath_resolver._xpath_cache", {})
+def test_load_xpath_mappings_uses_bundle(tmp_path):
+    """Test that shipped versions skip YAML parsing and changed files are parsed."""
+    import yaml
+    from panflow.core import xpath_resolver
+
+    with mock.patch("yaml.safe_load", side_effect=AssertionError("YAML parsed")):
+        mappings = load_xpath_mappings("11.1")
+    with open(os.path.join(xpath_resolver.XPATH_DIR, "panos_11_1.yaml")) as f:
+        assert mappings == yaml.safe_load(f)
+
+    # A customized mapping file is parsed instead of using the bundle
+    custom = dict(mappings, objects={"address": "{base_path}/custom/entry[@name='{name}']"})
+    (tmp_path / "panos_11_1.yaml").write_text(yaml.safe_dump(custom))
+    with mock.patch("panflow.core.xpath_resolver.XPATH_DIR", str(tmp_path)):
+        xpath_resolver._xpath_cache.clear()
+        assert load_xpath_mappings("11.1")["objects"] == custom["objects"]
+        # Bundled versions are available without their mapping files
+        assert load_xpath_mappings("10.2") == xpath_resolver._bundled_mappings("10.2", None)
+
+
+# Test compiled XPaths
+def test_find_object_elements_matches_string_xpath():
+    """Test that compiled object searches find what the formatted XPaths find."""
+    tree = ConfigFactory.panorama_with_objects()
+    for context_type, params in (("shared", {}), ("device_group", {"device_group": "DG1"})):
+        for object_type in ("address", "service", "address-group", "service-group"):
+            xpath = get_object_xpath(object_type, "panorama", context_type, "10.1", **params)
+            expected = tree.xpath(xpath)
+            assert (
+                find_object_elements(tree, object_type, "panorama", context_type, "10.1", **params)
+                == expected
+            )
+            for element in expected:
+                name = element.get("name")
+                assert find_object_elements(
+                    tree, object_type, "panorama", context_type, "10.1", name, **params
+                ) == [element]
+
+
+def test_find_elements_firewall_defaults_to_vsys1():
+    """Test compiled searches on a firewall, including the vsys1 default and policies."""
+    tree = _config_tree(5, rule_count=3)
+    addresses = find_object_elements(tree, "address", "firewall", "vsys", "10.1")
+    assert len(addresses) == 5
+    assert addresses == find_object_elements(
+        tree, "address", "firewall", "vsys", "10.1", vsys="vsys1"
+    )
+    rule_xpath = get_policy_xpath("security_rules", "firewall", "vsys", "10.1", name="rule-1")
+    rules = find_policy_elements(tree, "security_rules", "firewall", "vsys", "10.1", "rule-1")
+    assert rules == tree.xpath(rule_xpath) and len(rules) == 1
+
+
+def test_compiled_xpath_is_reused_and_quotes_names():
+    """Test that compiled XPaths are cached and take any name as a variable."""
+    first = compile_object_xpath("address", "panorama", "device_group", "10.1")
+    assert compile_object_xpath("address", "panorama", "device_group", "10.1") is first
+    assert compile_object_xpath("address", "panorama", "device_group", "10.1", False) is not first
+
+    tree = ConfigFactory.minimal_panorama()
+    shared = tree.find("shared")
+    address = shared.makeelement("address")
+    shared.append(address)
+    entry = address.makeelement("entry", name='it\'s "quoted"')
+    address.append(entry)
+    name = entry.get("name")
+    assert find_object_elements(tree, "address", "panorama", "shared", "10.1", name) == [entry]
+
+    with pytest.raises(ValueError, match="Invalid object type"):
+        find_object_elements(tree, "no-such-type", "panorama", "shared", "10.1")
+
+
 # Test determine_version_from_config
 def test_determine_version_from_config_with_version():
     """Test determining version from config with version attribute."""
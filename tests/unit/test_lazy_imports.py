@@ -0,0 +1,60 @@
+"""
+Tests for the lazily imported top-level panflow API.
+"""
+
+import subprocess
+import sys
+
+import panflow
+
+
+def test_import_panflow_loads_no_heavy_dependencies():
+    """Test that importing the package does not import the API modules and their dependencies."""
+    code = (
+        "import sys, panflow\n"
+        "loaded = [m for m in ('lxml', 'networkx', 'jinja2', 'yaml', 'rich', 'typer') "
+        "if m in sys.modules]\n"
+        "loaded += [m for m in sys.modules if m.startswith('panflow.')]\n"
+        "print(' '.join(loaded))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_subpackages_import_in_a_fresh_interpreter():
+    """Test that the reporting package and its commands import without the package API."""
+    code = "import panflow.reporting, panflow.modules as m; print(m.generate_unused_objects_report)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+    # The panflow entry point, panflow.cli:app, rather than the help manifest
+    code = "from panflow.cli import app; app(prog_name='panflow')"
+    for args in (["report", "--help"], ["report", "bundle", "--help"]):
+        result = subprocess.run([sys.executable, "-c", code, *args], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr + result.stdout
+        assert f"Usage: panflow {' '.join(args[:-1])}" in result.stdout
+
+
+def test_public_names_resolve():
+    """Test that every exported name resolves to the object of its module."""
+    from panflow.config import PANFlowConfig
+    from panflow.core.exceptions import PANFlowError
+
+    for name in panflow.__all__:
+        assert getattr(panflow, name) is not None, name
+    assert panflow.PANFlowConfig is PANFlowConfig
+    assert panflow.PANFlowError is PANFlowError
+    assert "PANFlowConfig" in dir(panflow)
+    assert panflow.core.xml.XmlQuery is panflow.XmlQuery
+
+
+def test_unknown_name_raises_attribute_error():
+    """Test that a name outside the public API is not importable."""
+    try:
+        from panflow import no_such_name  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        raise AssertionError("no_such_name was imported")